@@ -0,0 +1,35 @@
+"""Store large action results out of line."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260223_0004"
+down_revision = "20260223_0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("actions", sa.Column("result_bytes", sa.Integer(), nullable=True))
+    op.add_column(
+        "actions",
+        sa.Column("result_external", sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+    op.create_table(
+        "action_result_blobs",
+        sa.Column("action_id", sa.String(length=36), nullable=False),
+        sa.Column("encoding", sa.String(length=16), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("raw_bytes", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("action_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("action_result_blobs")
+    op.drop_column("actions", "result_external")
+    op.drop_column("actions", "result_bytes")
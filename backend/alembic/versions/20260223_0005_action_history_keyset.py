@@ -0,0 +1,25 @@
+"""Widen action indexes for keyset history pagination."""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260223_0005"
+down_revision = "20260223_0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_actions_type_status", table_name="actions")
+    op.drop_index("ix_actions_created_at", table_name="actions")
+    op.create_index("ix_actions_created_at", "actions", ["created_at", "id"])
+    op.create_index("ix_actions_type_status", "actions", ["type", "status", "created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_actions_type_status", table_name="actions")
+    op.drop_index("ix_actions_created_at", table_name="actions")
+    op.create_index("ix_actions_created_at", "actions", ["created_at"])
+    op.create_index("ix_actions_type_status", "actions", ["type", "status"])
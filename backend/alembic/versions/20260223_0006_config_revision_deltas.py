@@ -0,0 +1,31 @@
+"""Store config revisions as deltas with periodic full snapshots."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260223_0006"
+down_revision = "20260223_0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "config_revisions",
+        sa.Column("payload_encoding", sa.String(length=16), nullable=False, server_default="full"),
+    )
+    op.add_column("config_revisions", sa.Column("base_revision", sa.Integer(), nullable=True))
+    op.create_index(
+        "ix_config_revisions_encoding_revision",
+        "config_revisions",
+        ["payload_encoding", "revision"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_config_revisions_encoding_revision", table_name="config_revisions")
+    op.drop_column("config_revisions", "base_revision")
+    op.drop_column("config_revisions", "payload_encoding")
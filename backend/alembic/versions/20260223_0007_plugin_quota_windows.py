@@ -0,0 +1,29 @@
+"""Shared per-window counters for cluster-wide plugin storage quotas."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260223_0007"
+down_revision = "20260223_0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "plugin_quota_windows",
+        sa.Column("plugin_id", sa.String(length=128), nullable=False),
+        sa.Column("op", sa.String(length=64), nullable=False),
+        sa.Column("window_start", sa.BigInteger(), nullable=False),
+        sa.Column("used", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("plugin_id", "op", "window_start", name="pk_plugin_quota_windows"),
+    )
+    op.create_index("ix_plugin_quota_windows_start", "plugin_quota_windows", ["window_start"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_plugin_quota_windows_start", table_name="plugin_quota_windows")
+    op.drop_table("plugin_quota_windows")
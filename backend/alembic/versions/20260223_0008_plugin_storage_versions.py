@@ -0,0 +1,26 @@
+"""Per-table version counters for the plugin storage read cache."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260223_0008"
+down_revision = "20260223_0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "plugin_storage_versions",
+        sa.Column("plugin_id", sa.String(length=128), nullable=False),
+        sa.Column("scope", sa.String(length=128), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("plugin_id", "scope", name="pk_plugin_storage_versions"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("plugin_storage_versions")
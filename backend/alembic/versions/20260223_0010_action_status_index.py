@@ -0,0 +1,19 @@
+"""Index actions by status for status-only history pages and retention."""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260223_0010"
+down_revision = "20260223_0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_actions_status_created_at", "actions", ["status", "created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_actions_status_created_at", table_name="actions")
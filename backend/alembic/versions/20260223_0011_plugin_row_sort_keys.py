@@ -0,0 +1,72 @@
+"""Order-preserving sort keys on plugin rows for primary key ranges and ordered scans."""
+
+from __future__ import annotations
+
+import json
+import struct
+from typing import Any
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260223_0011"
+down_revision = "20260223_0010"
+branch_labels = None
+depends_on = None
+
+_BACKFILL_BATCH = 1000
+
+_plugin_rows = sa.table(
+    "plugin_rows",
+    sa.column("plugin_id", sa.String),
+    sa.column("table", sa.String),
+    sa.column("pk", sa.String),
+    sa.column("sort_key", sa.String),
+)
+
+
+# Frozen copy of core.storage.universal._encode_sort_key at this revision.
+def _encode_sort_key(value: Any) -> str | None:
+    if isinstance(value, bool):
+        return f"1{int(value)}"
+    if isinstance(value, int | float):
+        bits = struct.unpack(">Q", struct.pack(">d", float(value)))[0]
+        bits = bits ^ 0xFFFF_FFFF_FFFF_FFFF if bits >> 63 else bits | 1 << 63
+        return f"2{bits:016x}"
+    if isinstance(value, str):
+        return f"3{value}"
+    return None
+
+
+def upgrade() -> None:
+    op.add_column("plugin_rows", sa.Column("sort_key", sa.String(length=512), nullable=True))
+    op.create_index("ix_plugin_rows_sort", "plugin_rows", ["plugin_id", "table", "sort_key", "pk"])
+
+    connection = op.get_bind()
+    key_columns = (_plugin_rows.c.plugin_id, _plugin_rows.c.table, _plugin_rows.c.pk)
+    after: tuple[str, str, str] | None = None
+    while True:
+        statement = sa.select(*key_columns).order_by(*key_columns).limit(_BACKFILL_BATCH)
+        if after is not None:
+            statement = statement.where(sa.tuple_(*key_columns) > sa.tuple_(*after))
+        rows = connection.execute(statement).all()
+        if not rows:
+            break
+        for plugin_id, table, pk in rows:
+            connection.execute(
+                sa.update(_plugin_rows)
+                .where(
+                    _plugin_rows.c.plugin_id == plugin_id,
+                    _plugin_rows.c.table == table,
+                    _plugin_rows.c.pk == pk,
+                )
+                .values(sort_key=_encode_sort_key(json.loads(pk)))
+            )
+        plugin_id, table, pk = rows[-1]
+        after = (plugin_id, table, pk)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_plugin_rows_sort", table_name="plugin_rows")
+    op.drop_column("plugin_rows", "sort_key")
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+from uuid import UUID
+
+from core.contracts.errors import ApiError
 from core.contracts.models import (
+    ActionBatchExecuteRequest,
+    ActionBatchExecuteResponse,
     ActionEnvelope,
     ActionExecutionResponse,
+    ActionHistoryPage,
     ActionRegistryEntry,
     ActionStatus,
     ActionValidationResponse,
@@ -48,6 +54,16 @@ async def execute_action(
     return await action_rpc_client.execute(action=payload, actor=actor)
 
 
+@actions_router.post("/actions/execute/batch", response_model=ActionBatchExecuteResponse)
+async def execute_actions_batch(
+    payload: ActionBatchExecuteRequest,
+    action_rpc_client: ActionRpcClientDep,
+    actor: ActorDep,
+    _capability: str = require_actions_execute,
+) -> ActionBatchExecuteResponse:
+    return await action_rpc_client.execute_batch(actions=payload.actions, actor=actor)
+
+
 @actions_router.get("/actions/history", response_model=list[ActionStatus])
 async def get_actions_history(
     action_repository: ActionRepositoryDep,
@@ -57,4 +73,41 @@ async def get_actions_history(
     return await action_repository.list_history(limit=limit)
 
 
+@actions_router.get("/actions/history/page", response_model=ActionHistoryPage)
+async def get_actions_history_page(
+    action_repository: ActionRepositoryDep,
+    _capability: str = require_actions_history,
+    limit: int = Query(default=50, ge=1, le=500),
+    action_type: str | None = Query(default=None, alias="type", min_length=1),
+    status: str | None = Query(default=None, min_length=1),
+    cursor: str | None = Query(default=None, min_length=1),
+) -> ActionHistoryPage:
+    try:
+        items, next_cursor = await action_repository.list_history_page(
+            limit=limit,
+            action_type=action_type,
+            status=status,
+            cursor=cursor,
+        )
+    except ValueError as exc:
+        raise ApiError(status_code=422, code="invalid_cursor", message=str(exc)) from exc
+    return ActionHistoryPage(items=items, next_cursor=next_cursor)
+
+
+@actions_router.get("/actions/{action_id}", response_model=ActionStatus)
+async def get_action(
+    action_id: UUID,
+    action_repository: ActionRepositoryDep,
+    _capability: str = require_actions_history,
+) -> ActionStatus:
+    status = await action_repository.get(action_id)
+    if status is None:
+        raise ApiError(
+            status_code=404,
+            code="action_not_found",
+            message=f"Action '{action_id}' not found",
+        )
+    return status
+
+
 __all__ = ["actions_router"]
@@ -4,26 +4,34 @@ import asyncio
 import hashlib
 import ssl
 from collections.abc import AsyncIterator
+from dataclasses import asdict
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import Annotated
 from urllib.parse import urlparse
 from uuid import uuid4
 
 import httpx
+from core.contracts.errors import ApiError
 from core.contracts.models import (
+    ConfigFragment,
     ConfigImportRequest,
     ConfigPatchRequest,
     ConfigRevision,
+    ConfigRevisionMeta,
     ConfigRollbackRequest,
     ConfigStateResponse,
     ConfigValidateRequest,
     ConfigValidationResponse,
+    DashboardBootstrapResponse,
     EventEnvelope,
     WidgetRegistryEntry,
 )
-from core.events.sse import format_sse_event
+from core.events.bus import RESYNC_EVENT_TYPE, EventFilter
+from core.events.sse import EventCoalescer, format_sse_batch, format_sse_event
 from core.security import (
     ActorDep,
+    require_actions_registry,
     require_config,
     require_config_import,
     require_config_patch,
@@ -34,18 +42,37 @@ from core.security import (
     require_widgets_registry,
 )
 from depends.v1.core_deps import ConfigServiceDep, ContainerDep
-from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response
 from fastapi.responses import RedirectResponse, StreamingResponse
 
 core_router = APIRouter(tags=["core"])
 
+_SLOW_SUBSCRIBERS_LIMIT = 10
+
 
 @core_router.get("/health")
 async def get_health(container: ContainerDep) -> dict[str, object]:
+    stats = container.event_stream_stats
+    subscribers = container.event_bus.subscriber_stats()
+    slow = sorted(
+        (item for item in subscribers if item.resyncs or item.lag * 2 >= item.queue_size),
+        key=lambda item: (item.resyncs, item.lag),
+        reverse=True,
+    )
     return {
         "ok": True,
         "role": container.settings.runtime_role,
         "ts": datetime.now(UTC).isoformat(),
+        "events": {
+            "dropped": container.event_bus.dropped,
+            "coalesced_events": stats.events_in,
+            "coalesced_frames": stats.frames_out,
+            "coalescing_ratio": stats.coalescing_ratio,
+            "subscribers": len(subscribers),
+            "max_lag": max((item.lag for item in subscribers), default=0),
+            "resyncs": sum(item.resyncs for item in subscribers),
+            "slow_subscribers": [asdict(item) for item in slow[:_SLOW_SUBSCRIBERS_LIMIT]],
+        },
     }
 
 
@@ -234,21 +261,109 @@ async def get_favicon(
     return RedirectResponse(url=_media_url(cached_path, media_dir), status_code=307)
 
 
-@core_router.get("/state")
+def _config_etag(kind: str, state: ConfigStateResponse) -> str:
+    if kind == "state":
+        return f'"state-{state.active_state.state_seq}"'
+    return f'"{kind}-{state.revision.revision}-{state.revision.sha256[:20]}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {token.strip() for token in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _if_match_revision(if_match: str | None) -> int | None:
+    """Map an ``If-Match`` config ETag to the active revision the client expects to overwrite."""
+    if not if_match or if_match.strip() == "*":
+        return None
+    revisions: set[int] = set()
+    for token in (candidate.strip() for candidate in if_match.split(",")):
+        kind, _, rest = token.strip('"').partition("-")
+        revision, _, _ = rest.partition("-")
+        if token.startswith('"') and kind in {"config", "widgets"} and revision.isdigit():
+            revisions.add(int(revision))
+    if len(revisions) != 1:
+        raise ApiError(
+            status_code=412,
+            code="config_revision_conflict",
+            message="If-Match must carry exactly one config ETag",
+        )
+    return revisions.pop()
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"etag": etag, "cache-control": "private, no-cache"})
+
+
+def _set_etag(response: Response, etag: str) -> None:
+    response.headers["etag"] = etag
+    response.headers["cache-control"] = "private, no-cache"
+
+
+@core_router.get("/state", response_model=None)
 async def get_state(
+    request: Request,
+    response: Response,
     config_service: ConfigServiceDep,
     _capability: str = require_state,
-) -> dict[str, object]:
+) -> dict[str, object] | Response:
     state = await config_service.get_active_state()
+    etag = _config_etag("state", state)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    _set_etag(response, etag)
     return state.active_state.model_dump(mode="json")
 
 
-@core_router.get("/config")
+@core_router.get("/config", response_model=None)
 async def get_config(
+    request: Request,
+    response: Response,
     config_service: ConfigServiceDep,
     _capability: str = require_config,
-) -> dict[str, object]:
-    return await config_service.get_active_revision()
+    path: str | None = Query(default=None, description="JSON pointer of the subtree to return"),
+    group: str | None = Query(default=None, min_length=1),
+    item: str | None = Query(default=None, min_length=1),
+) -> dict[str, object] | Response:
+    if path is None and group is None and item is None:
+        state = await config_service.get_active_state()
+        etag = _config_etag("config", state)
+        if _etag_matches(request, etag):
+            return _not_modified(etag)
+        _set_etag(response, etag)
+        return state.revision.payload
+
+    fragment = await config_service.get_config_fragment(path=path, group_id=group, item_id=item)
+    pointer_digest = hashlib.sha256(fragment.path.encode("utf-8")).hexdigest()[:12]
+    etag = f'"config-{fragment.revision}-{fragment.sha256[:20]}-{pointer_digest}"'
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    _set_etag(response, etag)
+    return fragment.model_dump(mode="json")
+
+
+@core_router.patch("/config", response_model=ConfigFragment)
+async def patch_config_fragment(
+    payload: ConfigPatchRequest,
+    config_service: ConfigServiceDep,
+    actor: ActorDep,
+    _capability: str = require_config_patch,
+    path: str | None = Query(default=None, description="JSON pointer of the subtree to patch"),
+    group: str | None = Query(default=None, min_length=1),
+    item: str | None = Query(default=None, min_length=1),
+    if_match: str | None = Header(default=None),
+) -> ConfigFragment:
+    return await config_service.patch_config_fragment(
+        request=payload,
+        actor=actor,
+        path=path,
+        group_id=group,
+        item_id=item,
+        expected_revision=_if_match_revision(if_match),
+    )
 
 
 @core_router.post("/config/import", response_model=ConfigStateResponse)
@@ -276,8 +391,13 @@ async def patch_config(
     config_service: ConfigServiceDep,
     actor: ActorDep,
     _capability: str = require_config_patch,
+    if_match: str | None = Header(default=None),
 ) -> ConfigStateResponse:
-    return await config_service.patch_config(request=payload, actor=actor)
+    return await config_service.patch_config(
+        request=payload,
+        actor=actor,
+        expected_revision=_if_match_revision(if_match),
+    )
 
 
 @core_router.post("/config/rollback", response_model=ConfigStateResponse)
@@ -290,64 +410,125 @@ async def rollback_config(
     return await config_service.rollback(request=payload, actor=actor)
 
 
-@core_router.get("/config/revisions", response_model=list[ConfigRevision])
+@core_router.get("/config/revisions", response_model=list[ConfigRevisionMeta])
 async def get_config_revisions(
     config_service: ConfigServiceDep,
     _capability: str = require_config_revisions,
     limit: int = Query(default=50, ge=1, le=500),
-) -> list[ConfigRevision]:
+) -> list[ConfigRevisionMeta]:
     rows = await config_service.list_revisions(limit=limit)
-    return [ConfigRevision.model_validate(row) for row in rows]
+    return [ConfigRevisionMeta.model_validate(row) for row in rows]
+
+
+@core_router.get("/config/revisions/{revision}", response_model=ConfigRevision)
+async def get_config_revision(
+    revision: int,
+    config_service: ConfigServiceDep,
+    _capability: str = require_config_revisions,
+) -> ConfigRevision:
+    return await config_service.get_revision(revision)
 
 
 @core_router.get("/widgets/registry", response_model=list[WidgetRegistryEntry])
 async def get_widgets_registry(
+    request: Request,
+    response: Response,
     config_service: ConfigServiceDep,
     _capability: str = require_widgets_registry,
-) -> list[WidgetRegistryEntry]:
+) -> list[WidgetRegistryEntry] | Response:
+    state = await config_service.get_active_state()
+    etag = _config_etag("widgets", state)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    _set_etag(response, etag)
     return await config_service.widgets_registry()
 
 
+@core_router.get("/bootstrap", response_model=DashboardBootstrapResponse)
+async def get_dashboard_bootstrap(
+    container: ContainerDep,
+    _state: str = require_state,
+    _config: str = require_config,
+    _widgets: str = require_widgets_registry,
+    _plugins: str = require_actions_registry,
+    _events: str = require_events,
+) -> DashboardBootstrapResponse:
+    # Taken first: anything published while the rest is gathered is replayed to a stream resuming from here.
+    event_revision = container.event_bus.revision
+    state = await container.config_service.get_active_state()
+    widgets = await container.config_service.widgets_registry()
+    plugins = container.plugin_service.registry_entries() if container.plugin_service else []
+    health = await container.health_snapshot.items()
+    return DashboardBootstrapResponse(
+        event_revision=event_revision,
+        active_state=state.active_state,
+        config=state.revision.payload,
+        widgets=widgets,
+        plugins=plugins,
+        health=health,
+    )
+
+
+def _split_csv(values: list[str] | None) -> list[str]:
+    return [chunk.strip() for value in values or () for chunk in value.split(",") if chunk.strip()]
+
+
+def _event_filter(
+    *,
+    types: list[str] | None,
+    prefixes: list[str] | None,
+    items: list[str] | None,
+) -> EventFilter | None:
+    event_filter = EventFilter(
+        types=frozenset(_split_csv(types)),
+        prefixes=tuple(_split_csv(prefixes)),
+        item_ids=frozenset(_split_csv(items)),
+    )
+    if not (event_filter.types or event_filter.prefixes or event_filter.item_ids):
+        return None
+    return event_filter
+
+
 @core_router.get("/events/stream")
 async def stream_events(
     request: Request,
     container: ContainerDep,
     _capability: str = require_events,
-    once: bool = Query(default=False, description="Return initial snapshot event and close"),
+    once: bool = Query(default=False, description="Return initial snapshot (or replayed events) and close"),
+    since: int | None = Query(default=None, ge=0, description="Resume after this event revision"),
+    last_event_id: str | None = Header(default=None),
+    types: Annotated[list[str] | None, Query(description="Event types to deliver (comma separated)")] = None,
+    prefixes: Annotated[list[str] | None, Query(description="Event type prefixes to deliver")] = None,
+    items: Annotated[list[str] | None, Query(description="Only deliver item events for these item ids")] = None,
+    coalesce_ms: Annotated[int | None, Query(ge=0, le=5000, description="Coalescing window, 0 disables")] = None,
 ) -> StreamingResponse:
-    queue = container.event_bus.subscribe()
+    if since is None and last_event_id is not None and last_event_id.strip().isdigit():
+        since = int(last_event_id.strip())
+    event_filter = _event_filter(types=types, prefixes=prefixes, items=items)
+    label = f"{request.client.host}:{request.client.port}" if request.client else ""
+    queue = (
+        container.event_bus.resume(since=since, event_filter=event_filter, label=label) if since is not None else None
+    )
+    resumed = queue is not None
+    if queue is None:
+        queue = container.event_bus.subscribe(event_filter=event_filter, label=label)
+    # Snapshot frames carry the cursor they were taken at, so a reconnect resumes right after them;
+    # 0 means no event was seen yet and resumes from the start of the replay buffer.
+    cursor = container.event_bus.revision
+    settings = container.settings
+    window_ms = settings.event_coalesce_ms if coalesce_ms is None else coalesce_ms
+    window_sec = max(window_ms / 1000, 1 / settings.event_max_frames_per_sec) if window_ms > 0 else 0.0
+    stats = container.event_stream_stats
 
     async def _stream() -> AsyncIterator[str]:
         try:
             yield f"retry: {container.settings.event_stream_retry_ms}\n\n"
-            active = await container.config_service.get_active_state()
-            initial = EventEnvelope(
-                id=uuid4(),
-                type="core.state.snapshot",
-                event_version=1,
-                revision=active.active_state.state_seq,
-                ts=datetime.now(UTC),
-                source="core.events",
-                payload={
-                    "active_revision": active.active_state.active_revision,
-                    "state_seq": active.active_state.state_seq,
-                },
-            )
-            yield format_sse_event(initial)
-            health_items = await container.health_repository.list_snapshot_items()
-            health_snapshot = EventEnvelope(
-                id=uuid4(),
-                type="health.state.snapshot",
-                event_version=1,
-                revision=initial.revision,
-                ts=datetime.now(UTC),
-                source="apps.health.snapshot",
-                payload={
-                    "items": health_items,
-                },
-            )
-            yield format_sse_event(health_snapshot)
+            if not resumed:
+                async for chunk in _snapshot_events(cursor):
+                    yield chunk
             if once:
+                while resumed and not queue.empty():
+                    yield format_sse_event(queue.get_nowait())
                 return
 
             while True:
@@ -358,10 +539,69 @@ async def stream_events(
                 except TimeoutError:
                     yield ": keepalive\n\n"
                     continue
-                yield format_sse_event(event)
+                if event.type == RESYNC_EVENT_TYPE:
+                    yield await _resync_frames(event)
+                    continue
+                if window_sec <= 0:
+                    yield format_sse_event(event)
+                    continue
+                yield await _coalesced_frame(event)
         finally:
             container.event_bus.unsubscribe(queue)
 
+    async def _coalesced_frame(first: EventEnvelope) -> str:
+        coalescer = EventCoalescer()
+        coalescer.add(first)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + window_sec
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=remaining)
+            except TimeoutError:
+                break
+            if event.type == RESYNC_EVENT_TYPE:
+                return await _resync_frames(event)
+            coalescer.add(event)
+        stats.record(events=coalescer.received)
+        return format_sse_batch(coalescer.drain())
+
+    async def _resync_frames(marker: EventEnvelope) -> str:
+        frames = [format_sse_event(marker)]
+        async for chunk in _snapshot_events(marker.revision):
+            frames.append(chunk)
+        return "".join(frames)
+
+    async def _snapshot_events(revision: int) -> AsyncIterator[str]:
+        active = await container.config_service.get_active_state()
+        initial = EventEnvelope(
+            id=uuid4(),
+            type="core.state.snapshot",
+            event_version=1,
+            revision=revision,
+            ts=datetime.now(UTC),
+            source="core.events",
+            payload={
+                "active_revision": active.active_state.active_revision,
+                "state_seq": active.active_state.state_seq,
+            },
+        )
+        yield format_sse_event(initial)
+        health_items = await container.health_snapshot.items()
+        if event_filter is not None and event_filter.item_ids:
+            health_items = [item for item in health_items if str(item.get("item_id")) in event_filter.item_ids]
+        health_snapshot = EventEnvelope(
+            id=uuid4(),
+            type="health.state.snapshot",
+            event_version=1,
+            revision=initial.revision,
+            ts=datetime.now(UTC),
+            source="apps.health.snapshot",
+            payload={
+                "items": health_items,
+            },
+        )
+        yield format_sse_event(health_snapshot)
+
     return StreamingResponse(
         _stream(),
         media_type="text/event-stream",
@@ -184,28 +184,7 @@ async def get_plugins_registry(
     if not container.plugin_service:
         return {"plugins": [], "total": 0}
 
-    plugins = container.plugin_service.list_plugins()
-    registry = []
-
-    for plugin in plugins:
-        registry.append(
-            {
-                "id": plugin.id,
-                "name": plugin.manifest.name,
-                "version": plugin.manifest.version,
-                "capabilities": list(plugin.manifest.capabilities),
-                "actions": list(plugin.manifest.actions),
-                "events": list(plugin.manifest.events),
-                "ui_config": {
-                    "has_page": plugin.ui_config.has_page if plugin.ui_config else False,
-                    "page_path": plugin.ui_config.page_path if plugin.ui_config else None,
-                    "show_in_menu": plugin.ui_config.show_in_menu if plugin.ui_config else True,
-                }
-                if plugin.ui_config
-                else None,
-            }
-        )
-
+    registry = container.plugin_service.registry_entries()
     return {
         "plugins": registry,
         "total": len(registry),
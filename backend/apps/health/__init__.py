@@ -4,6 +4,7 @@ from .bus_handlers.check_request_consumer import HealthCheckRequestConsumer
 from .bus_handlers.check_result_consumer import HealthCheckResultConsumer
 from .service.checkers import HealthChecker
 from .service.repository import HealthRepository
+from .service.snapshot import HealthSnapshotCache
 from .worker.scheduler import HealthScheduler
 
 __all__ = [
@@ -12,4 +13,5 @@ __all__ = [
     "HealthChecker",
     "HealthRepository",
     "HealthScheduler",
+    "HealthSnapshotCache",
 ]
@@ -4,6 +4,7 @@ from aio_pika import IncomingMessage
 from apps.health.model.contracts import HealthCheckRequestedV1
 from apps.health.service.checkers import HealthChecker
 from core.bus.client import BusClient
+from core.bus.codec import decode_message
 from core.contracts.bus import BusMessageV1
 
 
@@ -25,7 +26,7 @@ class HealthCheckRequestConsumer:
 
     async def _on_message(self, incoming: IncomingMessage) -> None:
         async with incoming.process(ignore_processed=True):
-            message = BusMessageV1.model_validate_json(incoming.body.decode("utf-8"))
+            message = decode_message(incoming)
             if message.type != "health.check.request":
                 return
             if message.plugin_id != "core.health":
@@ -1,14 +1,31 @@
 from __future__ import annotations
 
+import time
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from uuid import UUID
 
 from aio_pika import IncomingMessage
 from apps.health.model.contracts import HealthCheckResultV1, HealthStatusChangedV1
 from apps.health.service.repository import HealthRepository
 from apps.health.service.status import evaluate_health
 from core.bus.client import BusClient
-from core.contracts.bus import BusMessageV1
+from core.bus.codec import decode_message
+from core.contracts.models import EventEnvelope
+from core.events.bus import EventBus
 from core.events.protocols import EventPublisher
+from pydantic import ValidationError
+
+_RATE_EPSILON = 1e-9
+_STATUS_EVENT_TYPES = frozenset({"health.status.changed", "health.status.updated"})
+
+
+@dataclass(frozen=True, slots=True)
+class _EmittedState:
+    status: str
+    avg_latency_ms: float | None
+    success_rate: float
+    emitted_at: float
 
 
 class HealthCheckResultConsumer:
@@ -19,13 +36,32 @@ class HealthCheckResultConsumer:
         repository: HealthRepository,
         event_publisher: EventPublisher,
         window_size: int,
+        latency_delta_ms: float = 50.0,
+        success_rate_delta: float = 0.05,
+        keepalive_sec: float = 300.0,
+        event_bus: EventBus | None = None,
     ) -> None:
         self._bus_client = bus_client
         self._repository = repository
         self._event_publisher = event_publisher
         self._window_size = max(1, window_size)
+        self._latency_delta_ms = max(0.0, latency_delta_ms)
+        self._success_rate_delta = max(0.0, success_rate_delta)
+        self._keepalive_sec = max(1.0, keepalive_sec)
+        self._event_bus = event_bus
+        self._emitted: dict[UUID, _EmittedState] = {}
+        self._pruned_at = time.monotonic()
+        self._suppressed = 0
+
+    @property
+    def suppressed(self) -> int:
+        return self._suppressed
 
     async def start(self) -> None:
+        # Replicas compete for check results, so each one also learns what the others published:
+        # significance is judged against the last event subscribers saw, not the last one sent here.
+        if self._event_bus is not None:
+            self._event_bus.add_listener(self._on_event)
         await self._bus_client.consume(
             queue_name="oko.bus.health.check.result",
             binding_keys=("health.check.result",),
@@ -34,11 +70,21 @@ class HealthCheckResultConsumer:
         )
 
     async def stop(self) -> None:
-        return
+        if self._event_bus is not None:
+            self._event_bus.remove_listener(self._on_event)
+
+    def _on_event(self, envelope: EventEnvelope) -> None:
+        if envelope.type not in _STATUS_EVENT_TYPES:
+            return
+        try:
+            event = HealthStatusChangedV1.model_validate(envelope.payload)
+        except ValidationError:
+            return
+        self._remember(event)
 
     async def _on_message(self, incoming: IncomingMessage) -> None:
         async with incoming.process(ignore_processed=True):
-            message = BusMessageV1.model_validate_json(incoming.body.decode("utf-8"))
+            message = decode_message(incoming)
             if message.type != "health.check.result":
                 return
             if message.plugin_id != "core.health":
@@ -48,6 +94,7 @@ class HealthCheckResultConsumer:
             await self._repository.insert_sample(result)
             service = await self._repository.get_service(result.service_id)
             if service is None:
+                self._emitted.pop(result.service_id, None)
                 return
             samples = await self._repository.list_latest_samples(result.service_id, limit=self._window_size)
             evaluated = evaluate_health(
@@ -92,14 +139,54 @@ class HealthCheckResultConsumer:
                     payload=event.model_dump(mode="json"),
                     correlation_id=message.correlation_id,
                 )
+                self._remember(event)
                 return
 
+            if not self._is_significant(event):
+                self._suppressed += 1
+                return
             await self._event_publisher.publish(
                 event_type="health.status.updated",
                 source="apps.health.aggregator",
                 payload=event.model_dump(mode="json"),
                 correlation_id=message.correlation_id,
             )
+            self._remember(event)
+
+    def _is_significant(self, event: HealthStatusChangedV1) -> bool:
+        last = self._emitted.get(event.service_id)
+        if last is None or last.status != event.current_status:
+            return True
+        if time.monotonic() - last.emitted_at >= self._keepalive_sec:
+            return True
+        if abs(event.success_rate - last.success_rate) >= self._success_rate_delta - _RATE_EPSILON:
+            return True
+        if (event.avg_latency_ms is None) != (last.avg_latency_ms is None):
+            return True
+        if event.avg_latency_ms is not None and last.avg_latency_ms is not None:
+            return abs(event.avg_latency_ms - last.avg_latency_ms) >= self._latency_delta_ms
+        return False
+
+    def _remember(self, event: HealthStatusChangedV1) -> None:
+        now = time.monotonic()
+        self._emitted[event.service_id] = _EmittedState(
+            status=event.current_status,
+            avg_latency_ms=event.avg_latency_ms,
+            success_rate=event.success_rate,
+            emitted_at=now,
+        )
+        if now - self._pruned_at >= self._keepalive_sec:
+            self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        # Past the keepalive an entry no longer suppresses anything, so services that stopped
+        # reporting (removed or disabled) drop out instead of accumulating.
+        self._pruned_at = now
+        expired = [
+            service_id for service_id, state in self._emitted.items() if now - state.emitted_at >= self._keepalive_sec
+        ]
+        for service_id in expired:
+            del self._emitted[service_id]
 
 
 __all__ = ["HealthCheckResultConsumer"]
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from .checkers import HealthChecker
-from .config_sync import extract_service_specs_from_config
+from .config_sync import extract_service_specs_from_config, extract_service_specs_from_items
 from .repository import HealthRepository
+from .snapshot import HealthSnapshotCache
 from .status import evaluate_health
 from .validators import (
     clamp_interval_sec,
@@ -15,11 +16,13 @@ from .validators import (
 __all__ = [
     "HealthChecker",
     "HealthRepository",
+    "HealthSnapshotCache",
     "clamp_interval_sec",
     "clamp_latency_threshold_ms",
     "clamp_timeout_ms",
     "evaluate_health",
     "extract_service_specs_from_config",
+    "extract_service_specs_from_items",
     "parse_tcp_target",
     "validate_target",
 ]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import ipaddress
+from collections.abc import Iterable, Mapping
 from typing import Any
 from urllib.parse import urlsplit
 from uuid import NAMESPACE_URL, UUID, uuid5
@@ -12,6 +13,7 @@ from apps.health.service.validators import (
     clamp_timeout_ms,
     validate_target,
 )
+from core.storage.config_views import ConfigItemRef, iter_config_items
 
 
 def extract_service_specs_from_config(
@@ -21,50 +23,45 @@ def extract_service_specs_from_config(
     default_timeout_ms: int,
     default_latency_threshold_ms: int,
 ) -> list[MonitoredServiceSpec]:
-    groups = config_payload.get("groups")
-    if not isinstance(groups, list):
-        return []
+    return extract_service_specs_from_items(
+        items=iter_config_items(config_payload),
+        default_interval_sec=default_interval_sec,
+        default_timeout_ms=default_timeout_ms,
+        default_latency_threshold_ms=default_latency_threshold_ms,
+    )
+
 
+def extract_service_specs_from_items(
+    *,
+    items: Iterable[ConfigItemRef],
+    default_interval_sec: int,
+    default_timeout_ms: int,
+    default_latency_threshold_ms: int,
+) -> list[MonitoredServiceSpec]:
     specs: list[MonitoredServiceSpec] = []
     seen: set[UUID] = set()
 
-    for group in groups:
-        if not isinstance(group, dict):
+    for ref in items:
+        spec = _item_to_spec(
+            item=ref.item,
+            group_id=ref.group_id,
+            subgroup_id=ref.subgroup_id,
+            default_interval_sec=default_interval_sec,
+            default_timeout_ms=default_timeout_ms,
+            default_latency_threshold_ms=default_latency_threshold_ms,
+        )
+        if spec is None:
             continue
-        group_id = str(group.get("id") or "")
-        subgroups = group.get("subgroups")
-        if not isinstance(subgroups, list):
+        if spec.id in seen:
             continue
-        for subgroup in subgroups:
-            if not isinstance(subgroup, dict):
-                continue
-            subgroup_id = str(subgroup.get("id") or "")
-            items = subgroup.get("items")
-            if not isinstance(items, list):
-                continue
-            for item in items:
-                if not isinstance(item, dict):
-                    continue
-                spec = _item_to_spec(
-                    item=item,
-                    group_id=group_id,
-                    subgroup_id=subgroup_id,
-                    default_interval_sec=default_interval_sec,
-                    default_timeout_ms=default_timeout_ms,
-                    default_latency_threshold_ms=default_latency_threshold_ms,
-                )
-                if spec is None:
-                    continue
-                if spec.id in seen:
-                    continue
-                seen.add(spec.id)
-                specs.append(spec)
+        seen.add(spec.id)
+        specs.append(spec)
     return specs
 
 
 def _item_to_spec(
     *,
-    item: dict[str, Any],
+    item: Mapping[str, Any],
     group_id: str,
     subgroup_id: str,
     default_interval_sec: int,
@@ -79,7 +76,7 @@ def _item_to_spec(
         return None
 
     health_cfg_raw = item.get("healthcheck")
-    health_cfg = health_cfg_raw if isinstance(health_cfg_raw, dict) else {}
+    health_cfg = health_cfg_raw if isinstance(health_cfg_raw, Mapping) else {}
 
     enabled: bool
     if "monitor_health" in item:
@@ -145,7 +142,7 @@ def _as_bool(value: Any, *, default: bool) -> bool:
     return default
 
 
-def _resolve_target(*, item: dict[str, Any], health_cfg: dict[str, Any], check_type: str) -> str:
+def _resolve_target(*, item: Mapping[str, Any], health_cfg: Mapping[str, Any], check_type: str) -> str:
     if check_type == "http":
         check_url = str(item.get("check_url") or "").strip()
         if check_url:
@@ -163,7 +160,7 @@ def _resolve_target(*, item: dict[str, Any], health_cfg: dict[str, Any], check_t
     return str(item.get("url") or "").strip()
 
 
-def _resolve_tls_verify(*, health_cfg: dict[str, Any], check_type: str, target: str) -> bool:
+def _resolve_tls_verify(*, health_cfg: Mapping[str, Any], check_type: str, target: str) -> bool:
     if "tls_verify" in health_cfg:
         return _as_bool(health_cfg.get("tls_verify"), default=True)
     if "verify_tls" in health_cfg:
@@ -190,4 +187,4 @@ def _is_private_network_url(url: str) -> bool:
     return bool(host_ip.is_private or host_ip.is_loopback or host_ip.is_link_local)
 
 
-__all__ = ["extract_service_specs_from_config"]
+__all__ = ["extract_service_specs_from_config", "extract_service_specs_from_items"]
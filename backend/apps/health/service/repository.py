@@ -26,6 +26,30 @@ def _as_utc(value: datetime) -> datetime:
     return value.astimezone(UTC)
 
 
+def build_snapshot_item(
+    *,
+    item_id: str,
+    status: str | None,
+    avg_latency: float | None,
+    success_rate: float,
+    consecutive_failures: int,
+) -> dict[str, object]:
+    normalized = str(status or "unknown").strip().lower()
+    if normalized not in {"online", "degraded", "down", "unknown"}:
+        normalized = "unknown"
+    return {
+        "item_id": item_id,
+        "ok": normalized in {"online", "degraded"},
+        "status": normalized,
+        "level": normalized,
+        "latency_ms": round(avg_latency) if avg_latency is not None else None,
+        "success_rate": float(success_rate),
+        "consecutive_failures": int(consecutive_failures),
+        "error": "check failed" if normalized == "down" else None,
+        "reason": None,
+    }
+
+
 class HealthRepository:
     def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
         self._session_factory = session_factory
@@ -179,6 +203,9 @@ class HealthRepository:
         return [self._to_sample(row) for row in rows]
 
     async def list_snapshot_items(self) -> list[dict[str, object]]:
+        return [item for _, item in await self.list_snapshot_entries()]
+
+    async def list_snapshot_entries(self) -> list[tuple[UUID, dict[str, object]]]:
         statement = (
             select(MonitoredServiceRow, ServiceHealthStateRow)
             .join(
@@ -190,25 +217,19 @@ class HealthRepository:
         async with self._session_factory() as session:
             rows = (await session.execute(statement)).all()
 
-        payload: list[dict[str, object]] = []
-        for service_row, state_row in rows:
-            status = str(state_row.current_status or "unknown").strip().lower()
-            if status not in {"online", "degraded", "down", "unknown"}:
-                status = "unknown"
-            payload.append(
-                {
-                    "item_id": str(service_row.item_id),
-                    "ok": status in {"online", "degraded"},
-                    "status": status,
-                    "level": status,
-                    "latency_ms": round(state_row.avg_latency) if state_row.avg_latency is not None else None,
-                    "success_rate": float(state_row.success_rate),
-                    "consecutive_failures": int(state_row.consecutive_failures),
-                    "error": "check failed" if status == "down" else None,
-                    "reason": None,
-                }
+        return [
+            (
+                UUID(str(service_row.id)),
+                build_snapshot_item(
+                    item_id=str(service_row.item_id),
+                    status=state_row.current_status,
+                    avg_latency=state_row.avg_latency,
+                    success_rate=state_row.success_rate,
+                    consecutive_failures=state_row.consecutive_failures,
+                ),
             )
-        return payload
+            for service_row, state_row in rows
+        ]
 
     async def get_state(self, service_id: UUID) -> ServiceHealthState | None:
         async with self._session_factory() as session:
@@ -300,4 +321,4 @@ class HealthRepository:
         )
 
 
-__all__ = ["HealthRepository"]
+__all__ = ["HealthRepository", "build_snapshot_item"]
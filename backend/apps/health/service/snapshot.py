@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from uuid import UUID
+
+from apps.health.service.repository import HealthRepository, build_snapshot_item
+from core.contracts.models import EventEnvelope
+from core.events.bus import EventBus
+
+HEALTH_STATUS_EVENTS = frozenset({"health.status.changed", "health.status.updated"})
+
+
+class HealthSnapshotCache:
+    def __init__(self, *, repository: HealthRepository, event_bus: EventBus, max_age_sec: float = 60.0) -> None:
+        self._repository = repository
+        self._event_bus = event_bus
+        self._max_age_sec = max(1.0, max_age_sec)
+        self._items: dict[UUID, dict[str, object]] | None = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+        self._pending: list[EventEnvelope] | None = None
+        self._generation = 0
+
+    async def start(self) -> None:
+        self._event_bus.add_listener(self._on_event)
+
+    async def stop(self) -> None:
+        self._event_bus.remove_listener(self._on_event)
+        self._items = None
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._items = None
+
+    async def items(self) -> list[dict[str, object]]:
+        items = self._fresh_items()
+        if items is not None:
+            return list(items.values())
+        async with self._lock:
+            items = self._fresh_items()
+            if items is None:
+                items = await self._rebuild()
+        return list(items.values())
+
+    def _fresh_items(self) -> dict[UUID, dict[str, object]] | None:
+        if self._items is None or time.monotonic() - self._loaded_at >= self._max_age_sec:
+            return None
+        return self._items
+
+    async def _rebuild(self) -> dict[UUID, dict[str, object]]:
+        generation = self._generation
+        self._pending = []
+        try:
+            entries = await self._repository.list_snapshot_entries()
+            items = dict(entries)
+            # Events published while the query was in flight are newer than what it returned.
+            for event in self._pending:
+                self._apply(items, event)
+        finally:
+            self._pending = None
+        if generation == self._generation:
+            self._items = items
+            self._loaded_at = time.monotonic()
+        return items
+
+    def _on_event(self, event: EventEnvelope) -> None:
+        if event.type.startswith("core.config."):
+            # Config changes add or disable monitored services; let the next reader rebuild.
+            self.invalidate()
+            return
+        if event.type not in HEALTH_STATUS_EVENTS:
+            return
+        if self._pending is not None:
+            self._pending.append(event)
+        if self._items is not None:
+            self._apply(self._items, event)
+
+    @staticmethod
+    def _apply(items: dict[UUID, dict[str, object]], event: EventEnvelope) -> None:
+        payload = event.payload
+        try:
+            service_id = UUID(str(payload["service_id"]))
+            item = build_snapshot_item(
+                item_id=str(payload["item_id"]),
+                status=str(payload.get("current_status") or "unknown"),
+                avg_latency=payload.get("avg_latency_ms"),
+                success_rate=float(payload.get("success_rate") or 0.0),
+                consecutive_failures=int(payload.get("consecutive_failures") or 0),
+            )
+        except (KeyError, TypeError, ValueError):
+            return
+        items[service_id] = item
+
+
+__all__ = ["HEALTH_STATUS_EVENTS", "HealthSnapshotCache"]
@@ -6,8 +6,8 @@ from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
-from apps.health.model.contracts import HealthCheckRequestedV1, MonitoredService
-from apps.health.service.config_sync import extract_service_specs_from_config
+from apps.health.model.contracts import HealthCheckRequestedV1, MonitoredService, MonitoredServiceSpec
+from apps.health.service.config_sync import extract_service_specs_from_items
 from apps.health.service.repository import HealthRepository
 from core.bus.client import BusClient
 from core.contracts.bus import BusMessageV1
@@ -46,6 +46,7 @@ class HealthScheduler:
         self._next_due: dict[UUID, datetime] = {}
         self._next_retention_at = datetime.now(UTC)
         self._next_heartbeat_at = datetime.now(UTC)
+        self._synced_specs: tuple[MonitoredServiceSpec, ...] | None = None
 
     async def start(self) -> None:
         if self._task is not None and not self._task.done():
@@ -73,34 +74,36 @@ class HealthScheduler:
                 services = await self._repository.list_enabled_services()
                 enabled_ids = {service.id for service in services}
                 due_now_item_ids: list[str] = []
-                emitted_count = 0
+                requests: list[tuple[BusMessageV1, str]] = []
                 retention_pruned = 0
 
-                for service in services:
-                    due_at = self._next_due.get(service.id, now)
-                    if due_at > now:
-                        continue
+                due_services = [service for service in services if self._next_due.get(service.id, now) <= now]
+                for service in due_services:
                     due_now_item_ids.append(service.item_id)
-                    await self._bus_client.emit(
-                        message=BusMessageV1(
-                            type="health.check.request",
-                            plugin_id="core.health",
-                            payload=HealthCheckRequestedV1(
-                                service_id=service.id,
-                                item_id=service.item_id,
-                                check_type=service.check_type,
-                                target=service.target,
-                                timeout_ms=service.timeout_ms,
-                                latency_threshold_ms=service.latency_threshold_ms,
-                                tls_verify=service.tls_verify,
-                                window_size=self._window_size,
-                                ts=now,
-                            ).model_dump(mode="json"),
-                        ),
-                        routing_key="health.check.request",
+                    requests.append(
+                        (
+                            BusMessageV1(
+                                type="health.check.request",
+                                plugin_id="core.health",
+                                payload=HealthCheckRequestedV1(
+                                    service_id=service.id,
+                                    item_id=service.item_id,
+                                    check_type=service.check_type,
+                                    target=service.target,
+                                    timeout_ms=service.timeout_ms,
+                                    latency_threshold_ms=service.latency_threshold_ms,
+                                    tls_verify=service.tls_verify,
+                                    window_size=self._window_size,
+                                    ts=now,
+                                ).model_dump(mode="json"),
+                            ),
+                            "health.check.request",
+                        )
                     )
+                await self._bus_client.emit_many(requests)
+                for service in due_services:
                     self._next_due[service.id] = now + timedelta(seconds=service.interval_sec)
-                    emitted_count += 1
+                emitted_count = len(requests)
 
                 for service_id in list(self._next_due):
                     if service_id not in enabled_ids:
@@ -139,15 +142,29 @@ class HealthScheduler:
                 continue
 
     async def _sync_services_from_active_config(self) -> None:
-        snapshot = await self._config_repository.fetch_active()
-        payload = snapshot.revision.payload if snapshot is not None else {}
-        specs = extract_service_specs_from_config(
-            config_payload=payload,
-            default_interval_sec=self._default_interval_sec,
-            default_timeout_ms=self._default_timeout_ms,
-            default_latency_threshold_ms=self._default_latency_threshold_ms,
-        )
-        await self._repository.sync_services(specs)
+        views = await self._config_repository.fetch_active_views()
+        specs: tuple[MonitoredServiceSpec, ...] = ()
+        if views is not None:
+            specs = views.projection(
+                (
+                    "health.service_specs",
+                    self._default_interval_sec,
+                    self._default_timeout_ms,
+                    self._default_latency_threshold_ms,
+                ),
+                lambda: tuple(
+                    extract_service_specs_from_items(
+                        items=views.items,
+                        default_interval_sec=self._default_interval_sec,
+                        default_timeout_ms=self._default_timeout_ms,
+                        default_latency_threshold_ms=self._default_latency_threshold_ms,
+                    )
+                ),
+            )
+        if self._synced_specs is not None and specs is self._synced_specs:
+            return
+        await self._repository.sync_services(list(specs))
+        self._synced_specs = specs
 
     def _format_schedule_preview(self, *, now: datetime, services: Sequence[MonitoredService]) -> str:
         if not services:
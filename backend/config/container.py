@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 from contextlib import suppress
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from apps.health import (
@@ -12,13 +12,15 @@ from apps.health import (
     HealthCheckResultConsumer,
     HealthRepository,
     HealthScheduler,
+    HealthSnapshotCache,
 )
 from apps.health.model import HealthSampleRow, MonitoredServiceRow, ServiceHealthStateRow
 from config.settings import AppSettings, load_app_settings
-from core.bus import ActionBusConsumer, BrokerActionRPC, BrokerStorageRPC, BusClient, StorageBusConsumer
-from core.config import ConfigService
+from core.bus import ActionBusConsumer, BrokerActionRPC, BrokerStorageRPC, BusClient, BusCodec, StorageBusConsumer
+from core.config import BrokerConfigChangeNotifier, ConfigChangedConsumer, ConfigService
 from core.contracts.storage import PluginStorageConfig, StorageDDLTableSpec, StorageLimits, StorageTableSpec
 from core.events import BrokerEventPublisher, EventBus, EventPublishConsumer, EventPublisher
+from core.events.sse import EventStreamStats
 from core.gateway import ActionGateway
 from core.plugins import PluginService as CorePluginService
 from core.plugins.migrations import (
@@ -27,15 +29,28 @@ from core.plugins.migrations import (
     register_storage_migration_action,
 )
 from core.plugins.store import PluginInstaller, StoreClient
-from core.storage import PhysicalStorage, StorageModeRouter, UniversalStorage, load_storage_ddl_specs
+from core.storage import (
+    HistoryRetentionWorker,
+    LocalQuota,
+    PhysicalStorage,
+    PluginQuota,
+    SharedQuota,
+    StorageModeRouter,
+    StorageReadCache,
+    UniversalStorage,
+    load_storage_ddl_specs,
+)
 from core.storage.models import (
+    ActionResultBlobRow,
     ActionRow,
     AppStateRow,
     AuditLogRow,
     ConfigRevisionRow,
     PluginIndexRow,
     PluginKvRow,
+    PluginQuotaWindowRow,
     PluginRow,
+    PluginStorageVersionRow,
 )
 from core.storage.repositories import ActionRepository, AuditRepository, ConfigRepository
 from db.base import Base
@@ -71,9 +86,13 @@ class AppContainer:
     storage_bus_consumer: StorageBusConsumer
     action_bus_consumer: ActionBusConsumer
     event_publish_consumer: EventPublishConsumer
+    config_changed_consumer: ConfigChangedConsumer
     health_check_request_consumer: HealthCheckRequestConsumer
     health_check_result_consumer: HealthCheckResultConsumer
     health_scheduler: HealthScheduler
+    health_snapshot: HealthSnapshotCache
+    history_retention: HistoryRetentionWorker
+    event_stream_stats: EventStreamStats = field(default_factory=EventStreamStats)
     plugin_service: CorePluginService | None = None
     plugin_store_client: StoreClient | None = None
     plugin_installer: PluginInstaller | None = None
@@ -107,6 +126,7 @@ class AppContainer:
         async with self.db_engine.begin() as connection:
             await connection.run_sync(Base.metadata.create_all)
         await ensure_runtime_schema_compatibility(self.db_engine)
+        await self.config_changed_consumer.start()
 
         is_memory_bus = self.settings.broker_url.startswith("memory://")
         run_backend_local_consumers = self.settings.runtime_role == "backend" and (
@@ -118,12 +138,16 @@ class AppContainer:
             await self.storage_bus_consumer.start()
             await self.action_bus_consumer.start()
             await self.health_check_request_consumer.start()
+            # Workers compete for check results; the event fan-out shows each one what the others published.
+            await self.event_publish_consumer.start()
             await self.health_check_result_consumer.start()
             await self.health_scheduler.start()
+            await self.history_retention.start()
             if self.plugin_service:
                 await self.plugin_service.startup()
             return
 
+        await self.health_snapshot.start()
         if run_backend_local_consumers:
             await self.event_publish_consumer.start()
             await self.physical_storage.install_all()
@@ -132,6 +156,7 @@ class AppContainer:
             await self.health_check_request_consumer.start()
             await self.health_check_result_consumer.start()
             await self.health_scheduler.start()
+            await self.history_retention.start()
             await self.config_service.startup_bootstrap()
             if self.plugin_service:
                 await self.plugin_service.startup()
@@ -154,12 +179,15 @@ class AppContainer:
         )
 
         if self.settings.runtime_role == "worker":
+            await self.history_retention.stop()
             await self.health_scheduler.stop()
             await self.health_check_result_consumer.stop()
+            await self.event_publish_consumer.stop()
             await self.health_check_request_consumer.stop()
             await self.action_bus_consumer.stop()
             await self.storage_bus_consumer.stop()
         elif run_backend_local_consumers:
+            await self.history_retention.stop()
             await self.health_scheduler.stop()
             await self.health_check_result_consumer.stop()
             await self.health_check_request_consumer.stop()
@@ -169,6 +197,8 @@ class AppContainer:
         else:
             await self.event_publish_consumer.stop()
 
+        await self.health_snapshot.stop()
+        await self.config_changed_consumer.stop()
         await self.bus_client.close()
         await self.db_engine.dispose()
 
@@ -230,6 +260,7 @@ def _default_storage_capabilities(plugin_configs: dict[str, PluginStorageConfig]
         "storage.table.upsert",
         "storage.table.delete",
         "storage.table.query",
+        "storage.table.scan",
     }
     return {plugin_id: set(allowed_ops) for plugin_id in plugin_configs}
 
@@ -239,10 +270,13 @@ def _ensure_core_models_loaded() -> None:
         ConfigRevisionRow,
         AppStateRow,
         ActionRow,
+        ActionResultBlobRow,
         AuditLogRow,
         PluginKvRow,
         PluginRow,
         PluginIndexRow,
+        PluginQuotaWindowRow,
+        PluginStorageVersionRow,
         MonitoredServiceRow,
         HealthSampleRow,
         ServiceHealthStateRow,
@@ -268,25 +302,46 @@ def build_container(base_dir: Path | None = None) -> AppContainer:
 
     _ensure_core_models_loaded()
 
-    config_repository = ConfigRepository(db_session_factory)
-    action_repository = ActionRepository(db_session_factory)
+    config_repository = ConfigRepository(
+        db_session_factory,
+        cache_revalidate_sec=settings.config_cache_revalidate_sec,
+        snapshot_interval=settings.config_snapshot_interval,
+    )
+    action_repository = ActionRepository(
+        db_session_factory,
+        result_inline_max_bytes=settings.action_result_inline_max_bytes,
+    )
     audit_repository = AuditRepository(db_session_factory)
     health_repository = HealthRepository(db_session_factory)
 
     bus_client = BusClient(
         broker_url=settings.broker_url,
         prefetch_count=settings.broker_prefetch_count,
+        publisher_channels=settings.broker_publish_channels,
+        memory_queue_size=settings.broker_memory_queue_size,
+        codec=BusCodec(
+            compress_min_bytes=settings.broker_compress_min_bytes,
+            compress_requests=settings.broker_compress_requests,
+        ),
     )
-    event_bus = EventBus()
+    event_bus = EventBus(replay_size=settings.event_replay_size)
     event_publisher: EventPublisher = BrokerEventPublisher(bus_client=bus_client)
 
+    # With a real broker several workers serve the same plugins, so max_qps must be enforced cluster-wide.
+    storage_quota: PluginQuota = (
+        SharedQuota(session_factory=db_session_factory)
+        if settings.storage_shared_quotas and not settings.broker_url.startswith("memory://")
+        else LocalQuota()
+    )
     universal_storage = UniversalStorage(
         session_factory=db_session_factory,
         plugin_configs=plugin_storage_configs,
+        quota=storage_quota,
     )
     physical_storage = PhysicalStorage(
         session_factory=db_session_factory,
         plugin_configs=physical_configs,
+        quota=storage_quota,
     )
     storage_migration_lock_manager = StorageMigrationLockManager()
     plugin_storage = StorageModeRouter(
@@ -294,6 +349,14 @@ def build_container(base_dir: Path | None = None) -> AppContainer:
         universal_storage=universal_storage,
         physical_storage=physical_storage,
         lock_manager=storage_migration_lock_manager,
+        read_cache=(
+            StorageReadCache(
+                session_factory=db_session_factory,
+                revalidate_sec=settings.storage_read_cache_revalidate_sec,
+            )
+            if settings.storage_read_cache
+            else None
+        ),
     )
 
     storage_rpc_client = BrokerStorageRPC(
@@ -303,18 +366,21 @@ def build_container(base_dir: Path | None = None) -> AppContainer:
     action_rpc_client = BrokerActionRPC(
         bus_client=bus_client,
         timeout_sec=settings.action_rpc_timeout_sec,
+        batch_concurrency=settings.actions_batch_concurrency,
     )
 
     config_service = ConfigService(
         repository=config_repository,
         event_bus=event_publisher,
         bootstrap_file=settings.config_file,
+        change_notifier=BrokerConfigChangeNotifier(bus_client=bus_client),
     )
     gateway = ActionGateway(
         actions=action_repository,
         audit=audit_repository,
         events=event_publisher,
         execute_enabled=settings.actions_execute_enabled,
+        batch_concurrency=settings.actions_batch_concurrency,
     )
     register_system_actions(gateway)
     storage_migration_runner = register_storage_migration_action(
@@ -340,6 +406,10 @@ def build_container(base_dir: Path | None = None) -> AppContainer:
         bus_client=bus_client,
         event_bus=event_bus,
     )
+    config_changed_consumer = ConfigChangedConsumer(
+        bus_client=bus_client,
+        repository=config_repository,
+    )
     health_checker = HealthChecker(icmp_enabled=settings.health_icmp_enabled)
     health_check_request_consumer = HealthCheckRequestConsumer(
         bus_client=bus_client,
@@ -350,6 +420,10 @@ def build_container(base_dir: Path | None = None) -> AppContainer:
         repository=health_repository,
         event_publisher=event_publisher,
         window_size=settings.health_window_size,
+        latency_delta_ms=settings.health_event_latency_delta_ms,
+        success_rate_delta=settings.health_event_success_rate_delta,
+        keepalive_sec=settings.health_event_keepalive_sec,
+        event_bus=event_bus,
     )
     health_scheduler = HealthScheduler(
         bus_client=bus_client,
@@ -363,6 +437,19 @@ def build_container(base_dir: Path | None = None) -> AppContainer:
         default_timeout_ms=settings.health_default_timeout_ms,
         default_latency_threshold_ms=settings.health_default_latency_threshold_ms,
     )
+    health_snapshot = HealthSnapshotCache(
+        repository=health_repository,
+        event_bus=event_bus,
+        max_age_sec=settings.health_snapshot_max_age_sec,
+    )
+    history_retention = HistoryRetentionWorker(
+        action_repository=action_repository,
+        audit_repository=audit_repository,
+        actions_retention_days=settings.actions_retention_days,
+        audit_retention_days=settings.audit_retention_days,
+        batch_size=settings.history_retention_batch_size,
+        interval_sec=settings.history_retention_interval_sec,
+    )
 
     # Initialize plugin service
     plugin_dirs = (settings.base_dir / "plugins",)  # Production plugins
@@ -414,9 +501,12 @@ def build_container(base_dir: Path | None = None) -> AppContainer:
         storage_bus_consumer=storage_bus_consumer,
         action_bus_consumer=action_bus_consumer,
         event_publish_consumer=event_publish_consumer,
+        config_changed_consumer=config_changed_consumer,
         health_check_request_consumer=health_check_request_consumer,
         health_check_result_consumer=health_check_result_consumer,
         health_scheduler=health_scheduler,
+        health_snapshot=health_snapshot,
+        history_retention=history_retention,
         plugin_service=plugin_service,
         plugin_store_client=plugin_store_client,
         plugin_installer=plugin_installer,
@@ -51,11 +51,82 @@ class AppSettings(BaseSettings):
         le=1024,
         validation_alias="OKO_BROKER_PREFETCH_COUNT",
     )
+    broker_publish_channels: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        validation_alias="OKO_BROKER_PUBLISH_CHANNELS",
+    )
+    broker_memory_queue_size: int = Field(
+        default=1000,
+        ge=1,
+        le=1_000_000,
+        validation_alias="OKO_BROKER_MEMORY_QUEUE_SIZE",
+    )
+    broker_compress_min_bytes: int = Field(
+        default=32_768,
+        ge=0,
+        le=64 * 1024 * 1024,
+        validation_alias="OKO_BROKER_COMPRESS_MIN_BYTES",
+    )
+    broker_compress_requests: bool = Field(default=False, validation_alias="OKO_BROKER_COMPRESS_REQUESTS")
     event_stream_keepalive_sec: float = Field(default=15.0, validation_alias="OKO_EVENTS_KEEPALIVE_SEC")
     event_stream_retry_ms: int = Field(default=2000, ge=100, le=60_000, validation_alias="OKO_EVENTS_RETRY_MS")
+    event_replay_size: int = Field(default=512, ge=1, le=100_000, validation_alias="OKO_EVENTS_REPLAY_SIZE")
+    event_coalesce_ms: int = Field(default=0, ge=0, le=5000, validation_alias="OKO_EVENTS_COALESCE_MS")
+    event_max_frames_per_sec: float = Field(
+        default=20.0,
+        ge=0.1,
+        le=1000.0,
+        validation_alias="OKO_EVENTS_MAX_FRAMES_PER_SEC",
+    )
+    config_cache_revalidate_sec: float = Field(
+        default=30.0,
+        ge=0.0,
+        le=3600.0,
+        validation_alias="OKO_CONFIG_CACHE_REVALIDATE_SEC",
+    )
+    config_snapshot_interval: int = Field(
+        default=16,
+        ge=1,
+        le=1000,
+        validation_alias="OKO_CONFIG_SNAPSHOT_INTERVAL",
+    )
     actions_execute_enabled: bool = Field(default=True, validation_alias="OKO_ACTIONS_EXECUTE_ENABLED")
     storage_rpc_timeout_sec: float = Field(default=5.0, validation_alias="OKO_STORAGE_RPC_TIMEOUT_SEC")
+    storage_shared_quotas: bool = Field(default=True, validation_alias="OKO_STORAGE_SHARED_QUOTAS")
+    storage_read_cache: bool = Field(default=False, validation_alias="OKO_STORAGE_READ_CACHE")
+    storage_read_cache_revalidate_sec: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=3600.0,
+        validation_alias="OKO_STORAGE_READ_CACHE_REVALIDATE_SEC",
+    )
     action_rpc_timeout_sec: float = Field(default=5.0, validation_alias="OKO_ACTION_RPC_TIMEOUT_SEC")
+    actions_batch_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=256,
+        validation_alias="OKO_ACTIONS_BATCH_CONCURRENCY",
+    )
+    action_result_inline_max_bytes: int = Field(
+        default=16_384,
+        ge=256,
+        le=10_485_760,
+        validation_alias="OKO_ACTION_RESULT_INLINE_MAX_BYTES",
+    )
+    actions_retention_days: int = Field(default=30, ge=1, le=3650, validation_alias="OKO_ACTIONS_RETENTION_DAYS")
+    audit_retention_days: int = Field(default=90, ge=1, le=3650, validation_alias="OKO_AUDIT_RETENTION_DAYS")
+    history_retention_batch_size: int = Field(
+        default=1000,
+        ge=1,
+        le=100_000,
+        validation_alias="OKO_HISTORY_RETENTION_BATCH_SIZE",
+    )
+    history_retention_interval_sec: float = Field(
+        default=600.0,
+        validation_alias="OKO_HISTORY_RETENTION_INTERVAL_SEC",
+    )
     health_window_size: int = Field(default=10, ge=1, le=500, validation_alias="OKO_HEALTH_WINDOW_SIZE")
     health_retention_days: int = Field(default=7, ge=1, le=365, validation_alias="OKO_HEALTH_RETENTION_DAYS")
     health_icmp_enabled: bool = Field(default=False, validation_alias="OKO_HEALTH_ICMP_ENABLED")
@@ -72,6 +143,30 @@ class AppSettings(BaseSettings):
         le=120_000,
         validation_alias="OKO_HEALTH_LATENCY_THRESHOLD_MS",
     )
+    health_event_latency_delta_ms: float = Field(
+        default=50.0,
+        ge=0.0,
+        le=60_000.0,
+        validation_alias="OKO_HEALTH_EVENT_LATENCY_DELTA_MS",
+    )
+    health_event_success_rate_delta: float = Field(
+        default=0.05,
+        ge=0.0,
+        le=1.0,
+        validation_alias="OKO_HEALTH_EVENT_SUCCESS_RATE_DELTA",
+    )
+    health_event_keepalive_sec: float = Field(
+        default=300.0,
+        ge=1.0,
+        le=86_400.0,
+        validation_alias="OKO_HEALTH_EVENT_KEEPALIVE_SEC",
+    )
+    health_snapshot_max_age_sec: float = Field(
+        default=60.0,
+        ge=1.0,
+        le=3600.0,
+        validation_alias="OKO_HEALTH_SNAPSHOT_MAX_AGE_SEC",
+    )
     favicon_timeout_sec: float = Field(default=4.0, ge=0.5, le=30.0, validation_alias="OKO_FAVICON_TIMEOUT_SEC")
     favicon_max_bytes: int = Field(default=262_144, ge=1024, le=1_048_576, validation_alias="OKO_FAVICON_MAX_BYTES")
     favicon_tls_verify: bool = Field(default=True, validation_alias="OKO_FAVICON_TLS_VERIFY")
@@ -96,8 +191,12 @@ class AppSettings(BaseSettings):
     def _apply_minimums(self) -> AppSettings:
         object.__setattr__(self, "event_stream_keepalive_sec", max(2.0, self.event_stream_keepalive_sec))
         object.__setattr__(self, "event_stream_retry_ms", max(100, self.event_stream_retry_ms))
+        object.__setattr__(self, "event_replay_size", max(1, self.event_replay_size))
+        object.__setattr__(self, "event_coalesce_ms", max(0, self.event_coalesce_ms))
+        object.__setattr__(self, "event_max_frames_per_sec", max(0.1, self.event_max_frames_per_sec))
         object.__setattr__(self, "storage_rpc_timeout_sec", max(0.05, self.storage_rpc_timeout_sec))
         object.__setattr__(self, "action_rpc_timeout_sec", max(0.05, self.action_rpc_timeout_sec))
+        object.__setattr__(self, "history_retention_interval_sec", max(1.0, self.history_retention_interval_sec))
         object.__setattr__(self, "health_scheduler_tick_sec", max(0.2, self.health_scheduler_tick_sec))
         object.__setattr__(
             self,
@@ -111,6 +210,8 @@ class AppSettings(BaseSettings):
             "health_default_latency_threshold_ms",
             max(1, self.health_default_latency_threshold_ms),
         )
+        object.__setattr__(self, "health_snapshot_max_age_sec", max(1.0, self.health_snapshot_max_age_sec))
+        object.__setattr__(self, "health_event_keepalive_sec", max(1.0, self.health_event_keepalive_sec))
         object.__setattr__(self, "favicon_timeout_sec", max(0.5, self.favicon_timeout_sec))
         object.__setattr__(self, "favicon_max_bytes", max(1024, self.favicon_max_bytes))
         object.__setattr__(self, "favicon_cache_ttl_days", max(1, self.favicon_cache_ttl_days))
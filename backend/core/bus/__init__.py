@@ -2,41 +2,61 @@ from __future__ import annotations
 
 from .actions import ActionBusConsumer, BrokerActionRPC
 from .client import BusClient, BusRpcTimeoutError
+from .codec import BusCodec, BusCodecError
 from .constants import (
     BUS_EXCHANGE,
     QUEUE_ACTIONS,
+    QUEUE_CONFIG_CHANGED,
     QUEUE_EVENTS,
     QUEUE_HEALTH_CHECK_REQUEST,
     QUEUE_HEALTH_CHECK_RESULT,
     QUEUE_RPC_REPLY,
     QUEUE_STORAGE,
+    QUEUE_STORAGE_BULK,
     ROUTING_ACTION_EXECUTE,
+    ROUTING_ACTION_EXECUTE_BATCH,
+    ROUTING_CONFIG_CHANGED,
     ROUTING_EVENT_PUBLISH,
     ROUTING_HEALTH_CHECK_REQUEST,
     ROUTING_HEALTH_CHECK_RESULT,
+    STORAGE_BULK_ROUTING_KEYS,
+    STORAGE_INTERACTIVE_ROUTING_KEYS,
     STORAGE_ROUTING_KEYS,
 )
+from .memory import MemoryBroker
+from .policy import DeliveryPolicy, delivery_policy_for
 from .quota import PluginQuotaGuard
 from .storage import BrokerStorageRPC, StorageBusConsumer
 
 __all__ = [
     "BUS_EXCHANGE",
     "QUEUE_ACTIONS",
+    "QUEUE_CONFIG_CHANGED",
     "QUEUE_EVENTS",
     "QUEUE_HEALTH_CHECK_REQUEST",
     "QUEUE_HEALTH_CHECK_RESULT",
     "QUEUE_RPC_REPLY",
     "QUEUE_STORAGE",
+    "QUEUE_STORAGE_BULK",
     "ROUTING_ACTION_EXECUTE",
+    "ROUTING_ACTION_EXECUTE_BATCH",
+    "ROUTING_CONFIG_CHANGED",
     "ROUTING_EVENT_PUBLISH",
     "ROUTING_HEALTH_CHECK_REQUEST",
     "ROUTING_HEALTH_CHECK_RESULT",
+    "STORAGE_BULK_ROUTING_KEYS",
+    "STORAGE_INTERACTIVE_ROUTING_KEYS",
     "STORAGE_ROUTING_KEYS",
     "ActionBusConsumer",
     "BrokerActionRPC",
     "BrokerStorageRPC",
     "BusClient",
+    "BusCodec",
+    "BusCodecError",
     "BusRpcTimeoutError",
+    "DeliveryPolicy",
+    "MemoryBroker",
     "PluginQuotaGuard",
     "StorageBusConsumer",
+    "delivery_policy_for",
 ]
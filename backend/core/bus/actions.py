@@ -1,15 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import math
 from typing import Any
 
 from aio_pika import IncomingMessage
-from core.contracts.bus import ActionExecutePayload, BusMessageV1, BusReplyV1
+from core.contracts.bus import (
+    ActionBusMessageV1,
+    ActionExecuteBatchPayload,
+    ActionExecutePayload,
+    BusMessageV1,
+    BusReplyV1,
+)
 from core.contracts.errors import ApiError
-from core.contracts.models import ActionEnvelope, ActionExecutionResponse
+from core.contracts.models import ActionBatchExecuteResponse, ActionEnvelope, ActionExecutionResponse
 from core.gateway import ActionGateway
+from pydantic import TypeAdapter
 
-from .client import BusClient, BusRpcTimeoutError
-from .constants import QUEUE_ACTIONS, ROUTING_ACTION_EXECUTE
+from .client import BusClient, BusRpcTimeoutError, LocalHandler
+from .codec import decode_body, decode_typed_message, typed_payload
+from .constants import QUEUE_ACTIONS, ROUTING_ACTION_EXECUTE, ROUTING_ACTION_EXECUTE_BATCH
+
+_ACTION_MESSAGES: TypeAdapter[ActionBusMessageV1] = TypeAdapter(ActionBusMessageV1)
 
 
 def _api_error_payload(error: ApiError) -> dict[str, Any]:
@@ -18,48 +30,98 @@ def _api_error_payload(error: ApiError) -> dict[str, Any]:
     return payload
 
 
+def _rpc_timeout_error() -> ApiError:
+    return ApiError(
+        status_code=504,
+        code="action_rpc_timeout",
+        message="Action execution timed out waiting for worker reply",
+        retryable=True,
+    )
+
+
+async def _call_local(handler: LocalHandler, *, timeout_sec: float, **kwargs: Any) -> Any:
+    # Same deadline as the broker round trip, so co-located workers cannot hold a request longer.
+    try:
+        return await asyncio.wait_for(handler(**kwargs), timeout=timeout_sec)
+    except TimeoutError as exc:
+        raise _rpc_timeout_error() from exc
+    except ApiError:
+        raise
+    except Exception as exc:  # pragma: no cover - defensive
+        raise ApiError(status_code=500, code="action_execute_failed", message=str(exc)) from exc
+
+
 class BrokerActionRPC:
-    def __init__(self, *, bus_client: BusClient, timeout_sec: float = 5.0) -> None:
+    def __init__(self, *, bus_client: BusClient, timeout_sec: float = 5.0, batch_concurrency: int = 8) -> None:
         self._bus_client = bus_client
         self._timeout_sec = timeout_sec
+        self._batch_concurrency = max(1, batch_concurrency)
 
     async def execute(self, *, action: ActionEnvelope, actor: str) -> ActionExecutionResponse:
+        handler = self._bus_client.local_handler(ROUTING_ACTION_EXECUTE)
+        if handler is not None:
+            return await _call_local(handler, timeout_sec=self._timeout_sec, action=action, actor=actor)
         message = BusMessageV1(
             type="action.execute",
             plugin_id="core",
-            payload=ActionExecutePayload(action=action.model_dump(mode="json"), actor=actor).model_dump(mode="json"),
+            payload=ActionExecutePayload(action=action, actor=actor).model_dump(mode="json"),
+        )
+        result = await self._call(message=message, routing_key=ROUTING_ACTION_EXECUTE)
+        return ActionExecutionResponse.model_validate(result)
+
+    async def execute_batch(self, *, actions: list[ActionEnvelope], actor: str) -> ActionBatchExecuteResponse:
+        handler = self._bus_client.local_handler(ROUTING_ACTION_EXECUTE_BATCH)
+        if handler is not None:
+            return await _call_local(
+                handler,
+                timeout_sec=self._batch_timeout_sec(len(actions)),
+                actions=actions,
+                actor=actor,
+            )
+        message = BusMessageV1(
+            type="action.execute.batch",
+            plugin_id="core",
+            payload=ActionExecuteBatchPayload(actions=actions, actor=actor).model_dump(mode="json"),
+        )
+        result = await self._call(
+            message=message,
+            routing_key=ROUTING_ACTION_EXECUTE_BATCH,
+            timeout_sec=self._batch_timeout_sec(len(actions)),
         )
+        return ActionBatchExecuteResponse.model_validate(result)
+
+    def _batch_timeout_sec(self, size: int) -> float:
+        # The worker runs a batch in waves of ``batch_concurrency``; give each wave a full action timeout.
+        return self._timeout_sec * max(1, math.ceil(size / self._batch_concurrency))
+
+    async def _call(
+        self, *, message: BusMessageV1, routing_key: str, timeout_sec: float | None = None
+    ) -> dict[str, Any]:
         try:
             reply = await self._bus_client.call(
                 message=message,
-                routing_key=ROUTING_ACTION_EXECUTE,
-                timeout_sec=self._timeout_sec,
+                routing_key=routing_key,
+                timeout_sec=self._timeout_sec if timeout_sec is None else timeout_sec,
             )
         except BusRpcTimeoutError as exc:
-            raise ApiError(
-                status_code=504,
-                code="action_rpc_timeout",
-                message="Action execution timed out waiting for worker reply",
-                retryable=True,
-            ) from exc
+            raise _rpc_timeout_error() from exc
 
         if not reply.ok:
             error_payload = dict(reply.error or {})
             status_code = int(error_payload.pop("status_code", 500))
             code = str(error_payload.get("code", "action_rpc_failed"))
-            message = str(error_payload.get("message", "Action execution failed"))
+            message_text = str(error_payload.get("message", "Action execution failed"))
             details = error_payload.get("details")
             if not isinstance(details, list):
                 details = []
             raise ApiError(
                 status_code=status_code,
                 code=code,
-                message=message,
+                message=message_text,
                 details=[item for item in details if isinstance(item, dict)],
             )
 
-        result = reply.result or {}
-        return ActionExecutionResponse.model_validate(result)
+        return reply.result or {}
 
 
 class ActionBusConsumer:
@@ -70,20 +132,27 @@ class ActionBusConsumer:
     async def start(self) -> None:
         await self._bus_client.consume(
             queue_name=QUEUE_ACTIONS,
-            binding_keys=(ROUTING_ACTION_EXECUTE,),
+            binding_keys=(ROUTING_ACTION_EXECUTE, ROUTING_ACTION_EXECUTE_BATCH),
             callback=self._on_message,
             durable=True,
         )
+        self._bus_client.register_local_handler((ROUTING_ACTION_EXECUTE,), self._gateway.execute_action)
+        self._bus_client.register_local_handler((ROUTING_ACTION_EXECUTE_BATCH,), self.execute_batch)
 
     async def stop(self) -> None:
-        return
+        self._bus_client.unregister_local_handler((ROUTING_ACTION_EXECUTE,), self._gateway.execute_action)
+        self._bus_client.unregister_local_handler((ROUTING_ACTION_EXECUTE_BATCH,), self.execute_batch)
+
+    async def execute_batch(self, *, actions: list[ActionEnvelope], actor: str) -> ActionBatchExecuteResponse:
+        results = await self._gateway.execute_batch(actions=actions, actor=actor)
+        return ActionBatchExecuteResponse(results=results)
 
     async def _on_message(self, incoming: IncomingMessage) -> None:
         async with incoming.process(ignore_processed=True):
-            message = BusMessageV1.model_validate_json(incoming.body.decode("utf-8"))
+            message = decode_typed_message(decode_body(incoming), _ACTION_MESSAGES)
             correlation_id = message.correlation_id or str(message.id)
 
-            if message.type != "action.execute":
+            if message.type not in {"action.execute", "action.execute.batch"}:
                 await self._bus_client.reply(
                     incoming,
                     BusReplyV1(
@@ -95,9 +164,12 @@ class ActionBusConsumer:
                 return
 
             try:
-                payload = ActionExecutePayload.model_validate(message.payload)
-                action = ActionEnvelope.model_validate(payload.action)
-                response = await self._gateway.execute_action(action=action, actor=payload.actor)
+                if message.type == "action.execute.batch":
+                    batch = typed_payload(ActionExecuteBatchPayload, message.payload)
+                    response = await self.execute_batch(actions=batch.actions, actor=batch.actor)
+                else:
+                    payload = typed_payload(ActionExecutePayload, message.payload)
+                    response = await self._gateway.execute_action(action=payload.action, actor=payload.actor)
                 reply = BusReplyV1(
                     correlation_id=correlation_id,
                     ok=True,
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import asyncio
-from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable, Sequence
+from contextlib import suppress
 from typing import Any
 from uuid import uuid4
 
@@ -12,6 +12,7 @@ from aio_pika.abc import AbstractChannel, AbstractConnection, AbstractExchange,
 from aio_pika.exceptions import QueueEmpty
 from core.contracts.bus import BusMessageV1, BusReplyV1
 
+from .codec import ACCEPT_ENCODING_HEADER, BusCodec, accepted_encoding, decode_reply
 from .constants import (
     BUS_EXCHANGE,
     BUS_EXCHANGE_TYPE,
@@ -21,10 +22,14 @@ from .constants import (
     QUEUE_HEALTH_CHECK_RESULT,
     QUEUE_STORAGE,
     ROUTING_ACTION_EXECUTE,
-    ROUTING_EVENT_PUBLISH,
+    ROUTING_ACTION_EXECUTE_BATCH,
     ROUTING_HEALTH_CHECK_REQUEST,
     ROUTING_HEALTH_CHECK_RESULT,
 )
+from .memory import MemoryBroker, MemoryIncomingMessage
+from .policy import REPLY_POLICY, STORAGE_LANES, DeliveryPolicy, delivery_policy_for
+
+LocalHandler = Callable[..., Awaitable[Any]]
 
 
 class BusRpcTimeoutError(TimeoutError):
@@ -32,16 +37,31 @@ class BusRpcTimeoutError(TimeoutError):
 
 
 class BusClient:
-    def __init__(self, *, broker_url: str, prefetch_count: int = 32) -> None:
+    def __init__(
+        self,
+        *,
+        broker_url: str,
+        prefetch_count: int = 32,
+        memory_queue_size: int = 1000,
+        memory_broker: MemoryBroker | None = None,
+        codec: BusCodec | None = None,
+        publisher_channels: int = 4,
+    ) -> None:
         self._broker_url = broker_url
         self._prefetch_count = prefetch_count
+        self._publisher_channel_count = max(1, publisher_channels)
+        self._publishers: list[tuple[AbstractChannel, AbstractExchange]] = []
+        self._next_publisher = 0
         self._memory_mode = broker_url.startswith("memory://")
         self._connection: AbstractConnection | None = None
         self._channel: AbstractChannel | None = None
         self._exchange: AbstractExchange | None = None
+        self._consumer_channels: list[AbstractChannel] = []
         self._lock = asyncio.Lock()
-        self._memory_consumers: list[tuple[str, Any]] = []
-        self._memory_reply_queues: dict[str, asyncio.Queue[BusReplyV1]] = {}
+        self._memory_broker = memory_broker or MemoryBroker(queue_size=memory_queue_size)
+        self._memory_reply_queues = self._memory_broker.reply_queues
+        self._codec = codec or BusCodec()
+        self._local_handlers: dict[str, LocalHandler] = {}
 
     async def connect(self) -> None:
         if self._memory_mode:
@@ -59,13 +79,28 @@ class BusClient:
                 durable=True,
             )
             await self._declare_topology(channel=self._channel, exchange=self._exchange)
+            await self._retire_shared_events_queue(connection=self._connection)
+            # Consumers keep the first channel; publishes spread over a small pool of confirm-mode
+            # channels so concurrent publishers do not serialize on one channel's confirms.
+            for _ in range(self._publisher_channel_count):
+                channel = await self._connection.channel(publisher_confirms=True)
+                exchange = await channel.declare_exchange(
+                    BUS_EXCHANGE,
+                    type=ExchangeType(BUS_EXCHANGE_TYPE),
+                    durable=True,
+                )
+                self._publishers.append((channel, exchange))
 
     async def close(self) -> None:
         if self._memory_mode:
-            self._memory_consumers = []
-            self._memory_reply_queues = {}
+            await self._memory_broker.close(owner=self)
             return
         async with self._lock:
+            for channel in [*self._consumer_channels, *(channel for channel, _ in self._publishers)]:
+                if not channel.is_closed:
+                    await channel.close()
+            self._consumer_channels = []
+            self._publishers = []
             if self._channel is not None and not self._channel.is_closed:
                 await self._channel.close()
             self._channel = None
@@ -75,30 +110,39 @@ class BusClient:
             self._connection = None
 
     async def emit(self, *, message: BusMessageV1, routing_key: str) -> None:
+        policy = delivery_policy_for(routing_key)
         if self._memory_mode:
             await self._dispatch_memory(
                 routing_key=routing_key,
-                incoming=_MemoryIncomingMessage(
+                incoming=MemoryIncomingMessage(
                     body=message.model_dump_json().encode("utf-8"),
                     correlation_id=message.correlation_id,
                     reply_to=message.reply_to,
+                    expiration=policy.ttl_sec,
                 ),
             )
             return
-        exchange = await self._require_exchange()
-        body = message.model_dump_json().encode("utf-8")
-        outgoing = Message(
-            body=body,
-            content_type="application/json",
-            delivery_mode=DeliveryMode.PERSISTENT,
-            correlation_id=message.correlation_id,
-            reply_to=message.reply_to,
-            message_id=str(message.id),
-            timestamp=message.ts,
+        await self._publish(self._outgoing(message, policy=policy), routing_key=routing_key)
+
+    async def emit_many(self, messages: Sequence[tuple[BusMessageV1, str]]) -> None:
+        if self._memory_mode:
+            for message, routing_key in messages:
+                await self.emit(message=message, routing_key=routing_key)
+            return
+        await asyncio.gather(
+            *(
+                self._publish(
+                    self._outgoing(message, policy=delivery_policy_for(routing_key)),
+                    routing_key=routing_key,
+                )
+                for message, routing_key in messages
+            )
         )
-        await exchange.publish(outgoing, routing_key=routing_key)
 
     async def call(self, *, message: BusMessageV1, routing_key: str, timeout_sec: float) -> BusReplyV1:
+        policy = delivery_policy_for(routing_key)
+        # A request nobody is waiting for any more is dropped by the broker instead of processed.
+        expiration = min(max(0.05, timeout_sec), policy.ttl_sec or timeout_sec)
         if self._memory_mode:
             correlation_id = message.correlation_id or str(message.id)
             reply_to = f"memory.reply.{uuid4()}"
@@ -107,10 +151,11 @@ class BusClient:
             request = message.model_copy(update={"reply_to": reply_to, "correlation_id": correlation_id})
             await self._dispatch_memory(
                 routing_key=routing_key,
-                incoming=_MemoryIncomingMessage(
+                incoming=MemoryIncomingMessage(
                     body=request.model_dump_json().encode("utf-8"),
                     correlation_id=correlation_id,
                     reply_to=reply_to,
+                    expiration=expiration,
                 ),
             )
             try:
@@ -133,17 +178,21 @@ class BusClient:
 
         correlation_id = message.correlation_id or str(message.id)
         request = message.model_copy(update={"reply_to": reply_queue.name, "correlation_id": correlation_id})
-        body = request.model_dump_json().encode("utf-8")
+        accept_encoding = self._codec.accept_encoding
+        encoded = self._codec.encode(request, accept_encoding=self._codec.request_encoding)
         outgoing = Message(
-            body=body,
-            content_type="application/json",
-            delivery_mode=DeliveryMode.PERSISTENT,
+            body=encoded.body,
+            content_type=encoded.content_type,
+            content_encoding=encoded.content_encoding,
+            headers={ACCEPT_ENCODING_HEADER: accept_encoding} if accept_encoding else None,
+            delivery_mode=_delivery_mode(policy),
+            expiration=expiration,
             correlation_id=correlation_id,
             reply_to=reply_queue.name,
             message_id=str(request.id),
             timestamp=request.ts,
         )
-        await exchange.publish(outgoing, routing_key=routing_key)
+        await self._publish(outgoing, routing_key=routing_key)
 
         loop = asyncio.get_running_loop()
         deadline = loop.time() + max(0.05, timeout_sec)
@@ -160,7 +209,7 @@ class BusClient:
             except TimeoutError:
                 continue
             async with incoming.process(ignore_processed=True):
-                reply = BusReplyV1.model_validate_json(incoming.body.decode("utf-8"))
+                reply = decode_reply(incoming)
                 if reply.correlation_id != correlation_id:
                     continue
                 return reply
@@ -172,20 +221,45 @@ class BusClient:
         binding_keys: tuple[str, ...],
         callback: Any,
         durable: bool = True,
+        exclusive: bool = False,
+        prefetch_count: int | None = None,
     ) -> AbstractQueue:
         if self._memory_mode:
-            for binding_key in binding_keys:
-                self._memory_consumers.append((binding_key, callback))
-            return _MemoryQueue()
+            return self._memory_broker.consume(  # type: ignore[return-value]
+                queue_name=queue_name,
+                binding_keys=binding_keys,
+                callback=callback,
+                owner=self,
+                exclusive=exclusive,
+                prefetch_count=prefetch_count or 1,
+            )
 
         channel = await self._require_channel()
         exchange = await self._require_exchange()
-        queue = await channel.declare_queue(queue_name, durable=durable)
+        if prefetch_count is not None and prefetch_count != self._prefetch_count:
+            channel = await self._open_consumer_channel(prefetch_count=prefetch_count)
+        if exclusive:
+            queue = await channel.declare_queue(name="", durable=False, exclusive=True, auto_delete=True)
+        else:
+            queue = await channel.declare_queue(queue_name, durable=durable)
         for binding_key in binding_keys:
             await queue.bind(exchange=exchange, routing_key=binding_key)
         await queue.consume(callback)
         return queue
 
+    def register_local_handler(self, routing_keys: Sequence[str], handler: LocalHandler) -> None:
+        """Expose an in-process consumer so co-located callers can skip the broker round trip."""
+        for routing_key in routing_keys:
+            self._local_handlers[routing_key] = handler
+
+    def unregister_local_handler(self, routing_keys: Sequence[str], handler: LocalHandler) -> None:
+        for routing_key in routing_keys:
+            if self._local_handlers.get(routing_key) == handler:
+                del self._local_handlers[routing_key]
+
+    def local_handler(self, routing_key: str) -> LocalHandler | None:
+        return self._local_handlers.get(routing_key)
+
     async def reply(self, incoming: IncomingMessage, reply: BusReplyV1) -> None:
         if self._memory_mode:
             reply_queue = self._memory_reply_queues.get(str(incoming.reply_to))
@@ -198,15 +272,57 @@ class BusClient:
 
         if not incoming.reply_to:
             return
-        channel = await self._require_channel()
+        channel, _exchange = await self._publisher()
+        encoded = self._codec.encode(reply, accept_encoding=accepted_encoding(incoming.headers))
         outgoing = Message(
-            body=reply.model_dump_json().encode("utf-8"),
-            content_type="application/json",
-            delivery_mode=DeliveryMode.PERSISTENT,
+            body=encoded.body,
+            content_type=encoded.content_type,
+            content_encoding=encoded.content_encoding,
+            delivery_mode=_delivery_mode(REPLY_POLICY),
+            expiration=REPLY_POLICY.ttl_sec,
             correlation_id=reply.correlation_id,
         )
         await channel.default_exchange.publish(outgoing, routing_key=incoming.reply_to)
 
+    def _outgoing(self, message: BusMessageV1, *, policy: DeliveryPolicy) -> Message:
+        encoded = self._codec.encode(message, accept_encoding=self._codec.request_encoding)
+        return Message(
+            body=encoded.body,
+            content_type=encoded.content_type,
+            content_encoding=encoded.content_encoding,
+            delivery_mode=_delivery_mode(policy),
+            expiration=policy.ttl_sec,
+            correlation_id=message.correlation_id,
+            reply_to=message.reply_to,
+            message_id=str(message.id),
+            timestamp=message.ts,
+        )
+
+    async def _publish(self, outgoing: Message, *, routing_key: str) -> None:
+        _channel, exchange = await self._publisher()
+        await exchange.publish(outgoing, routing_key=routing_key)
+
+    async def _publisher(self) -> tuple[AbstractChannel, AbstractExchange]:
+        if not self._publishers:
+            await self.connect()
+        if not self._publishers:
+            raise RuntimeError("AMQP publisher channels are not initialized")
+        index = self._next_publisher % len(self._publishers)
+        self._next_publisher = index + 1
+        return self._publishers[index]
+
+    async def drain(self) -> None:
+        if self._memory_mode:
+            await self._memory_broker.join()
+
+    async def _open_consumer_channel(self, *, prefetch_count: int) -> AbstractChannel:
+        if self._connection is None:
+            raise RuntimeError("AMQP connection is not initialized")
+        channel = await self._connection.channel()
+        await channel.set_qos(prefetch_count=prefetch_count)
+        self._consumer_channels.append(channel)
+        return channel
+
     async def _require_channel(self) -> AbstractChannel:
         if self._channel is None or self._channel.is_closed:
             await self.connect()
@@ -223,15 +339,19 @@ class BusClient:
 
     @staticmethod
     async def _declare_topology(*, channel: AbstractChannel, exchange: AbstractExchange) -> None:
-        storage_queue = await channel.declare_queue(QUEUE_STORAGE, durable=True)
+        lane_queues: dict[str, AbstractQueue] = {}
+        for lane in STORAGE_LANES:
+            lane_queues[lane.queue_name] = await channel.declare_queue(lane.queue_name, durable=True)
+            for key in lane.binding_keys:
+                await lane_queues[lane.queue_name].bind(exchange=exchange, routing_key=key)
+        # Storage traffic used to share one queue bound by wildcard; drop those bindings so bulk
+        # operations only reach the bulk lane.
         for key in ("storage.kv.*", "storage.table.*"):
-            await storage_queue.bind(exchange=exchange, routing_key=key)
+            await lane_queues[QUEUE_STORAGE].unbind(exchange=exchange, routing_key=key)
 
         actions_queue = await channel.declare_queue(QUEUE_ACTIONS, durable=True)
         await actions_queue.bind(exchange=exchange, routing_key=ROUTING_ACTION_EXECUTE)
-
-        events_queue = await channel.declare_queue(QUEUE_EVENTS, durable=True)
-        await events_queue.bind(exchange=exchange, routing_key=ROUTING_EVENT_PUBLISH)
+        await actions_queue.bind(exchange=exchange, routing_key=ROUTING_ACTION_EXECUTE_BATCH)
 
         health_check_queue = await channel.declare_queue(QUEUE_HEALTH_CHECK_REQUEST, durable=True)
         await health_check_queue.bind(exchange=exchange, routing_key=ROUTING_HEALTH_CHECK_REQUEST)
@@ -239,51 +359,24 @@ class BusClient:
         health_result_queue = await channel.declare_queue(QUEUE_HEALTH_CHECK_RESULT, durable=True)
         await health_result_queue.bind(exchange=exchange, routing_key=ROUTING_HEALTH_CHECK_RESULT)
 
-    async def _dispatch_memory(self, *, routing_key: str, incoming: _MemoryIncomingMessage) -> None:
-        for binding_key, callback in tuple(self._memory_consumers):
-            if _routing_key_matches(binding_key, routing_key):
-                await callback(incoming)
-
-
-@dataclass
-class _MemoryQueue:
-    consumer_tags: tuple[str, ...] = ()
-
-
-class _MemoryIncomingMessage:
-    def __init__(self, *, body: bytes, correlation_id: str | None, reply_to: str | None) -> None:
-        self.body = body
-        self.correlation_id = correlation_id
-        self.reply_to = reply_to
-
-    @asynccontextmanager
-    async def process(self, ignore_processed: bool = True):
-        _ = ignore_processed
-        yield self
-
+    @staticmethod
+    async def _retire_shared_events_queue(*, connection: AbstractConnection) -> None:
+        # Events are fanned out to one exclusive queue per backend replica; the old shared
+        # queue made replicas compete for them. Drop it once no consumer is attached.
+        with suppress(Exception):
+            channel = await connection.channel()
+            try:
+                await channel.queue_delete(QUEUE_EVENTS, if_unused=True)
+            finally:
+                if not channel.is_closed:
+                    await channel.close()
 
-def _routing_key_matches(pattern: str, key: str) -> bool:
-    pattern_parts = pattern.split(".")
-    key_parts = key.split(".")
+    async def _dispatch_memory(self, *, routing_key: str, incoming: MemoryIncomingMessage) -> None:
+        await self._memory_broker.dispatch(routing_key=routing_key, incoming=incoming)
 
-    i = 0
-    j = 0
-    while i < len(pattern_parts) and j < len(key_parts):
-        token = pattern_parts[i]
-        if token == "#":
-            return True
-        if token == "*":
-            i += 1
-            j += 1
-            continue
-        if token != key_parts[j]:
-            return False
-        i += 1
-        j += 1
 
-    if i < len(pattern_parts) and pattern_parts[i] == "#":
-        return True
-    return i == len(pattern_parts) and j == len(key_parts)
+def _delivery_mode(policy: DeliveryPolicy) -> DeliveryMode:
+    return DeliveryMode.PERSISTENT if policy.persistent else DeliveryMode.NOT_PERSISTENT
 
 
-__all__ = ["BusClient", "BusRpcTimeoutError"]
+__all__ = ["BusClient", "BusRpcTimeoutError", "LocalHandler", "MemoryBroker"]
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import zlib
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Protocol, TypeVar
+
+from core.contracts.bus import BusMessageV1, BusReplyV1
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+JSON_CONTENT_TYPE = "application/json"
+DEFLATE_ENCODING = "deflate"
+ACCEPT_ENCODING_HEADER = "x-oko-accept-encoding"
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+MessageT = TypeVar("MessageT")
+
+
+class BusCodecError(ValueError):
+    pass
+
+
+class IncomingBody(Protocol):
+    body: bytes
+    content_type: str | None
+    content_encoding: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedBody:
+    body: bytes
+    content_type: str = JSON_CONTENT_TYPE
+    content_encoding: str | None = None
+
+
+class BusCodec:
+    """JSON bodies, deflated above ``compress_min_bytes`` (``0`` never compresses).
+
+    Only bodies whose receiver is known to decode deflate are compressed: RPC replies to callers that sent
+    ``x-oko-accept-encoding``, and requests/emits once ``compress_requests`` says every consumer is upgraded.
+    """
+
+    def __init__(
+        self, *, compress_min_bytes: int = 0, compress_level: int = 6, compress_requests: bool = False
+    ) -> None:
+        self._compress_min_bytes = max(0, compress_min_bytes)
+        self._compress_level = compress_level
+        self._compress_requests = compress_requests
+
+    @property
+    def accept_encoding(self) -> str | None:
+        return DEFLATE_ENCODING if self._compress_min_bytes else None
+
+    @property
+    def request_encoding(self) -> str | None:
+        return self.accept_encoding if self._compress_requests else None
+
+    def encode(self, model: BaseModel, *, accept_encoding: str | None = None) -> EncodedBody:
+        body = model.model_dump_json().encode("utf-8")
+        if (
+            self._compress_min_bytes
+            and len(body) >= self._compress_min_bytes
+            and _accepts(accept_encoding, DEFLATE_ENCODING)
+        ):
+            compressed = zlib.compress(body, self._compress_level)
+            if len(compressed) < len(body):
+                return EncodedBody(body=compressed, content_encoding=DEFLATE_ENCODING)
+        return EncodedBody(body=body)
+
+
+def decode_body(incoming: IncomingBody) -> bytes:
+    content_type = getattr(incoming, "content_type", None)
+    if content_type not in (None, "", JSON_CONTENT_TYPE):
+        raise BusCodecError(f"Unsupported bus content type: {content_type}")
+    content_encoding = getattr(incoming, "content_encoding", None)
+    if not content_encoding:
+        return incoming.body
+    if content_encoding == DEFLATE_ENCODING:
+        try:
+            return zlib.decompress(incoming.body)
+        except zlib.error as exc:
+            raise BusCodecError("Corrupted deflate bus body") from exc
+    raise BusCodecError(f"Unsupported bus content encoding: {content_encoding}")
+
+
+def decode_model(incoming: IncomingBody, model: type[ModelT]) -> ModelT:
+    return model.model_validate_json(decode_body(incoming))
+
+
+def decode_message(incoming: IncomingBody) -> BusMessageV1:
+    return decode_model(incoming, BusMessageV1)
+
+
+def decode_reply(incoming: IncomingBody) -> BusReplyV1:
+    return decode_model(incoming, BusReplyV1)
+
+
+def decode_typed_message(body: bytes, adapter: TypeAdapter[MessageT]) -> MessageT | BusMessageV1:
+    """Parse ``body`` straight into its typed message; fall back to the loose envelope when it does not fit."""
+    try:
+        return adapter.validate_json(body)
+    except ValidationError:
+        return BusMessageV1.model_validate_json(body)
+
+
+def typed_payload(model: type[ModelT], payload: BaseModel | Mapping[str, Any]) -> ModelT:
+    if isinstance(payload, model):
+        return payload
+    return model.model_validate(payload)
+
+
+def accepted_encoding(headers: Mapping[str, Any] | None) -> str | None:
+    if not headers:
+        return None
+    value = headers.get(ACCEPT_ENCODING_HEADER)
+    if isinstance(value, bytes):
+        value = value.decode("ascii", "ignore")
+    return str(value) if value else None
+
+
+def _accepts(accept_encoding: str | None, encoding: str) -> bool:
+    if not accept_encoding:
+        return False
+    return encoding in {token.strip() for token in accept_encoding.split(",")}
+
+
+__all__ = [
+    "ACCEPT_ENCODING_HEADER",
+    "DEFLATE_ENCODING",
+    "JSON_CONTENT_TYPE",
+    "BusCodec",
+    "BusCodecError",
+    "EncodedBody",
+    "accepted_encoding",
+    "decode_body",
+    "decode_message",
+    "decode_model",
+    "decode_reply",
+    "decode_typed_message",
+    "typed_payload",
+]
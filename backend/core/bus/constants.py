@@ -4,8 +4,10 @@ BUS_EXCHANGE = "oko.bus"
 BUS_EXCHANGE_TYPE = "topic"
 
 QUEUE_STORAGE = "oko.bus.storage"
+QUEUE_STORAGE_BULK = "oko.bus.storage.bulk"
 QUEUE_ACTIONS = "oko.bus.actions"
 QUEUE_EVENTS = "oko.bus.events"
+QUEUE_CONFIG_CHANGED = "oko.bus.config.changed"
 QUEUE_RPC_REPLY = "oko.bus.rpc.reply"
 QUEUE_HEALTH_CHECK_REQUEST = "oko.bus.health.check.request"
 QUEUE_HEALTH_CHECK_RESULT = "oko.bus.health.check.result"
@@ -13,7 +15,9 @@ QUEUE_HEALTH_CHECK_RESULT = "oko.bus.health.check.result"
 ROUTING_STORAGE_KV_PREFIX = "storage.kv."
 ROUTING_STORAGE_TABLE_PREFIX = "storage.table."
 ROUTING_ACTION_EXECUTE = "action.execute"
+ROUTING_ACTION_EXECUTE_BATCH = "action.execute.batch"
 ROUTING_EVENT_PUBLISH = "event.publish"
+ROUTING_CONFIG_CHANGED = "config.changed"
 ROUTING_HEALTH_CHECK_REQUEST = "health.check.request"
 ROUTING_HEALTH_CHECK_RESULT = "health.check.result"
 
@@ -25,22 +29,36 @@ STORAGE_ROUTING_KEYS = (
     "storage.table.upsert",
     "storage.table.delete",
     "storage.table.query",
+    "storage.table.scan",
 )
+STORAGE_BULK_ROUTING_KEYS = (
+    "storage.kv.set",
+    "storage.table.upsert",
+    "storage.table.query",
+    "storage.table.scan",
+)
+STORAGE_INTERACTIVE_ROUTING_KEYS = tuple(key for key in STORAGE_ROUTING_KEYS if key not in STORAGE_BULK_ROUTING_KEYS)
 
 __all__ = [
     "BUS_EXCHANGE",
     "BUS_EXCHANGE_TYPE",
     "QUEUE_ACTIONS",
+    "QUEUE_CONFIG_CHANGED",
     "QUEUE_EVENTS",
     "QUEUE_HEALTH_CHECK_REQUEST",
     "QUEUE_HEALTH_CHECK_RESULT",
     "QUEUE_RPC_REPLY",
     "QUEUE_STORAGE",
+    "QUEUE_STORAGE_BULK",
     "ROUTING_ACTION_EXECUTE",
+    "ROUTING_ACTION_EXECUTE_BATCH",
+    "ROUTING_CONFIG_CHANGED",
     "ROUTING_EVENT_PUBLISH",
     "ROUTING_HEALTH_CHECK_REQUEST",
     "ROUTING_HEALTH_CHECK_RESULT",
     "ROUTING_STORAGE_KV_PREFIX",
     "ROUTING_STORAGE_TABLE_PREFIX",
+    "STORAGE_BULK_ROUTING_KEYS",
+    "STORAGE_INTERACTIVE_ROUTING_KEYS",
     "STORAGE_ROUTING_KEYS",
 ]
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager, suppress
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import uuid4
+
+from core.contracts.bus import BusReplyV1
+
+from .topic import TopicTrie
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MemoryQueueHandle:
+    consumer_tags: tuple[str, ...] = ()
+
+
+class MemoryIncomingMessage:
+    def __init__(
+        self,
+        *,
+        body: bytes,
+        correlation_id: str | None,
+        reply_to: str | None,
+        expiration: float | None = None,
+    ) -> None:
+        self.body = body
+        self.correlation_id = correlation_id
+        self.reply_to = reply_to
+        self.content_type = "application/json"
+        self.content_encoding: str | None = None
+        self.headers: dict[str, Any] = {}
+        self.expiration = expiration
+        self._expires_at = time.monotonic() + expiration if expiration is not None else None
+
+    @property
+    def expired(self) -> bool:
+        return self._expires_at is not None and time.monotonic() >= self._expires_at
+
+    @asynccontextmanager
+    async def process(self, ignore_processed: bool = True):
+        _ = ignore_processed
+        yield self
+
+
+@dataclass(eq=False)
+class _MemoryConsumer:
+    owner: object
+    tasks: list[asyncio.Task[None]] = field(default_factory=list)
+
+
+@dataclass(eq=False)
+class _MemoryQueue:
+    name: str
+    queue: asyncio.Queue[MemoryIncomingMessage]
+    exclusive_owner: object | None = None
+    binding_keys: set[str] = field(default_factory=set)
+    consumers: list[_MemoryConsumer] = field(default_factory=list)
+    in_flight: int = 0
+    deferred: int = 0
+
+    @property
+    def busy(self) -> bool:
+        return self.in_flight > 0 or self.deferred > 0 or not self.queue.empty()
+
+
+_consuming: ContextVar[_MemoryQueue | None] = ContextVar("memory_bus_consuming", default=None)
+
+
+class MemoryBroker:
+    """In-process topic exchange with bounded per-queue buffers drained by consumer tasks."""
+
+    def __init__(self, *, queue_size: int = 1000) -> None:
+        self._queue_size = max(1, queue_size)
+        self._queues: dict[str, _MemoryQueue] = {}
+        self._routes: TopicTrie[_MemoryQueue] = TopicTrie()
+        self.reply_queues: dict[str, asyncio.Queue[BusReplyV1]] = {}
+        self.expired = 0
+        self._deferred_puts: set[asyncio.Task[None]] = set()
+
+    def consume(
+        self,
+        *,
+        queue_name: str,
+        binding_keys: tuple[str, ...],
+        callback: Any,
+        owner: object,
+        exclusive: bool = False,
+        prefetch_count: int = 1,
+    ) -> MemoryQueueHandle:
+        name = f"memory.exclusive.{uuid4()}" if exclusive else queue_name
+        state = self._queues.get(name)
+        if state is None:
+            state = _MemoryQueue(
+                name=name,
+                queue=asyncio.Queue(maxsize=self._queue_size),
+                exclusive_owner=owner if exclusive else None,
+            )
+            self._queues[name] = state
+        for binding_key in set(binding_keys) - state.binding_keys:
+            self._routes.add(binding_key, state)
+            state.binding_keys.add(binding_key)
+        # One task per consumer keeps deliveries in order; more only when the caller asks for them.
+        consumer = _MemoryConsumer(owner=owner)
+        consumer.tasks = [
+            asyncio.create_task(self._run_consumer(state, callback), name=f"memory-bus:{name}")
+            for _ in range(max(1, prefetch_count))
+        ]
+        state.consumers.append(consumer)
+        return MemoryQueueHandle(consumer_tags=(f"memory.ctag.{id(consumer)}",))
+
+    async def close(self, *, owner: object) -> None:
+        tasks: list[asyncio.Task[None]] = []
+        for name, state in tuple(self._queues.items()):
+            owned = [consumer for consumer in state.consumers if consumer.owner is owner]
+            for consumer in owned:
+                tasks.extend(consumer.tasks)
+            state.consumers = [consumer for consumer in state.consumers if consumer.owner is not owner]
+            # Without a broker process nothing outlives its consumers: dropping orphaned queues
+            # keeps publishers from blocking on buffers that will never drain.
+            if state.exclusive_owner is owner or not state.consumers:
+                self._queues.pop(name, None)
+                for binding_key in state.binding_keys:
+                    self._routes.discard(binding_key, state)
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+
+    async def dispatch(self, *, routing_key: str, incoming: MemoryIncomingMessage) -> None:
+        for state in self._routes.match(routing_key):
+            if state.queue.full() and _consuming.get() is state:
+                # The consumer publishing into its own full queue would wait for itself forever.
+                self._defer_put(state, incoming)
+                continue
+            await state.queue.put(incoming)
+
+    async def join(self) -> None:
+        while busy := [state for state in self._queues.values() if state.consumers and state.busy]:
+            await asyncio.gather(*(state.queue.join() for state in busy))
+
+    def _defer_put(self, state: _MemoryQueue, incoming: MemoryIncomingMessage) -> None:
+        state.deferred += 1
+        task = asyncio.create_task(self._put_deferred(state, incoming), name=f"memory-bus-put:{state.name}")
+        self._deferred_puts.add(task)
+        task.add_done_callback(self._deferred_puts.discard)
+
+    @staticmethod
+    async def _put_deferred(state: _MemoryQueue, incoming: MemoryIncomingMessage) -> None:
+        try:
+            await state.queue.put(incoming)
+        finally:
+            state.deferred -= 1
+
+    async def _run_consumer(self, state: _MemoryQueue, callback: Any) -> None:
+        _consuming.set(state)
+        while True:
+            incoming = await state.queue.get()
+            if incoming.expired:
+                self.expired += 1
+                state.queue.task_done()
+                continue
+            state.in_flight += 1
+            try:
+                await callback(incoming)
+            except Exception:
+                logger.exception("Memory bus consumer failed on queue %s", state.name)
+            finally:
+                state.in_flight -= 1
+                state.queue.task_done()
+
+
+__all__ = ["MemoryBroker", "MemoryIncomingMessage", "MemoryQueueHandle"]
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+from .constants import (
+    QUEUE_STORAGE,
+    QUEUE_STORAGE_BULK,
+    ROUTING_ACTION_EXECUTE,
+    ROUTING_ACTION_EXECUTE_BATCH,
+    ROUTING_CONFIG_CHANGED,
+    ROUTING_EVENT_PUBLISH,
+    ROUTING_HEALTH_CHECK_REQUEST,
+    ROUTING_HEALTH_CHECK_RESULT,
+    STORAGE_BULK_ROUTING_KEYS,
+    STORAGE_INTERACTIVE_ROUTING_KEYS,
+)
+from .topic import routing_key_matches
+
+HEALTH_CHECK_REQUEST_TTL_SEC = 30.0
+REPLY_TTL_SEC = 30.0
+
+
+@dataclass(frozen=True, slots=True)
+class DeliveryPolicy:
+    persistent: bool = True
+    ttl_sec: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ConsumerLane:
+    queue_name: str
+    binding_keys: tuple[str, ...]
+    prefetch_count: int | None = None
+
+
+PERSISTENT = DeliveryPolicy()
+TRANSIENT = DeliveryPolicy(persistent=False)
+
+# First matching pattern wins. Request/reply traffic is transient: nobody waits for it after a
+# broker restart, and RPC requests additionally expire with the caller's timeout.
+DELIVERY_POLICIES: tuple[tuple[str, DeliveryPolicy], ...] = (
+    (ROUTING_HEALTH_CHECK_REQUEST, DeliveryPolicy(persistent=False, ttl_sec=HEALTH_CHECK_REQUEST_TTL_SEC)),
+    (ROUTING_HEALTH_CHECK_RESULT, TRANSIENT),
+    (ROUTING_EVENT_PUBLISH, TRANSIENT),
+    (ROUTING_CONFIG_CHANGED, TRANSIENT),
+    ("storage.#", TRANSIENT),
+    (ROUTING_ACTION_EXECUTE, TRANSIENT),
+    (ROUTING_ACTION_EXECUTE_BATCH, TRANSIENT),
+)
+
+REPLY_POLICY = DeliveryPolicy(persistent=False, ttl_sec=REPLY_TTL_SEC)
+
+STORAGE_LANES = (
+    ConsumerLane(queue_name=QUEUE_STORAGE, binding_keys=STORAGE_INTERACTIVE_ROUTING_KEYS),
+    ConsumerLane(queue_name=QUEUE_STORAGE_BULK, binding_keys=STORAGE_BULK_ROUTING_KEYS, prefetch_count=4),
+)
+
+
+@lru_cache(maxsize=1024)
+def delivery_policy_for(routing_key: str) -> DeliveryPolicy:
+    for pattern, policy in DELIVERY_POLICIES:
+        if routing_key_matches(pattern, routing_key):
+            return policy
+    return PERSISTENT
+
+
+__all__ = [
+    "DELIVERY_POLICIES",
+    "PERSISTENT",
+    "REPLY_POLICY",
+    "STORAGE_LANES",
+    "TRANSIENT",
+    "ConsumerLane",
+    "DeliveryPolicy",
+    "delivery_policy_for",
+]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from collections.abc import Mapping
 from datetime import UTC, datetime
@@ -9,12 +10,14 @@ from aio_pika import IncomingMessage
 from core.contracts.bus import (
     BusMessageV1,
     BusReplyV1,
+    StorageBusMessageV1,
     StorageKvDeletePayload,
     StorageKvGetPayload,
     StorageKvSetPayload,
     StorageTableDeletePayload,
     StorageTableGetPayload,
     StorageTableQueryPayload,
+    StorageTableScanPayload,
     StorageTableUpsertPayload,
 )
 from core.contracts.storage import (
@@ -33,13 +36,20 @@ from core.storage.errors import (
     StorageRpcTimeout,
 )
 from core.storage.protocols import PluginStorage
-
-from .client import BusClient, BusRpcTimeoutError
-from .constants import QUEUE_STORAGE
+from core.storage.query import parse_where
+from core.storage.quota import PluginQuota
+from pydantic import BaseModel, TypeAdapter
+
+from .client import BusClient, BusRpcTimeoutError, LocalHandler
+from .codec import decode_body, decode_typed_message, typed_payload
+from .constants import STORAGE_ROUTING_KEYS
+from .policy import STORAGE_LANES
 from .quota import PluginQuotaGuard
 
 logger = logging.getLogger(__name__)
 
+_STORAGE_MESSAGES: TypeAdapter[StorageBusMessageV1] = TypeAdapter(StorageBusMessageV1)
+
 
 def _error_payload(error: StorageError) -> dict[str, Any]:
     return {
@@ -65,24 +75,55 @@ def _error_to_exception(payload: Mapping[str, Any] | None) -> StorageError:
     return StorageError(message)
 
 
-def _ensure_ok(reply: BusReplyV1) -> Mapping[str, Any]:
-    if reply.ok:
-        result = reply.result or {}
+def _ensure_response_ok(response: StorageRpcResponse) -> Mapping[str, Any]:
+    if response.ok:
+        result = response.result or {}
         if isinstance(result, dict):
             return result
         raise StorageError("Storage response payload is invalid")
-    raise _error_to_exception(reply.error)
+    raise _error_to_exception(response.error)
 
 
-def _ensure_response_ok(response: StorageRpcResponse) -> Mapping[str, Any]:
-    return _ensure_ok(
-        BusReplyV1(
-            correlation_id=str(response.id),
-            ok=response.ok,
-            error=response.error,
-            result=response.result,
-        )
+def _timeout_response(request: StorageRpcRequest, *, timeout_sec: float) -> StorageRpcResponse:
+    logger.warning(
+        "Storage RPC timeout op=%s plugin=%s timeout_sec=%.2f routing_key=storage.%s",
+        request.op,
+        request.plugin_id,
+        timeout_sec,
+        request.op,
     )
+    timeout_error = StorageRpcTimeout(f"Storage RPC timeout waiting for '{request.op}'")
+    return StorageRpcResponse(id=request.id, ok=False, error=_error_payload(timeout_error))
+
+
+def _request_model(request: StorageRpcRequest) -> BaseModel:
+    if request.op == "kv.get":
+        return StorageKvGetPayload(key=str(request.key), secret=bool(request.secret))
+    if request.op == "kv.set":
+        row = dict(request.row or {})
+        if "value" not in row:
+            raise StorageQueryNotAllowed("kv.set requires row.value")
+        return StorageKvSetPayload(key=str(request.key), value=row["value"], secret=bool(request.secret))
+    if request.op == "kv.delete":
+        return StorageKvDeletePayload(key=str(request.key))
+    if request.op == "table.get":
+        return StorageTableGetPayload(table=str(request.table), key=request.key)
+    if request.op == "table.upsert":
+        return StorageTableUpsertPayload(table=str(request.table), row=dict(request.row or {}))
+    if request.op == "table.delete":
+        return StorageTableDeletePayload(table=str(request.table), key=request.key)
+    if request.op == "table.query":
+        return StorageTableQueryPayload(table=str(request.table), where=dict(request.where or {}), limit=request.limit)
+    if request.op == "table.scan":
+        return StorageTableScanPayload(
+            table=str(request.table),
+            where=dict(request.where or {}),
+            order_by=request.order_by,
+            descending=bool(request.descending),
+            cursor=request.cursor,
+            limit=request.limit,
+        )
+    raise StorageQueryNotAllowed(f"Unsupported storage operation: {request.op}")
 
 
 class BrokerStorageRPC:
@@ -91,12 +132,17 @@ class BrokerStorageRPC:
         self._timeout_sec = timeout_sec
 
     async def call(self, request: StorageRpcRequest) -> StorageRpcResponse:
+        routing_key = f"storage.{request.op}"
+        handler = self._bus_client.local_handler(routing_key)
+        if handler is not None:
+            return await self._call_local(handler, request, timeout_sec=self._timeout_sec)
+
         message = BusMessageV1(
             id=request.id,
             ts=request.ts,
-            type=f"storage.{request.op}",
+            type=routing_key,
             plugin_id=request.plugin_id,
-            payload=self._request_payload(request),
+            payload=_request_model(request).model_dump(mode="json"),
         )
         try:
             reply = await self._bus_client.call(
@@ -105,15 +151,7 @@ class BrokerStorageRPC:
                 timeout_sec=self._timeout_sec,
             )
         except BusRpcTimeoutError:
-            logger.warning(
-                "Storage RPC timeout op=%s plugin=%s timeout_sec=%.2f routing_key=%s",
-                request.op,
-                request.plugin_id,
-                self._timeout_sec,
-                message.type,
-            )
-            timeout_error = StorageRpcTimeout(f"Storage RPC timeout waiting for '{request.op}'")
-            return StorageRpcResponse(id=request.id, ok=False, error=_error_payload(timeout_error))
+            return _timeout_response(request, timeout_sec=self._timeout_sec)
         return StorageRpcResponse(id=request.id, ok=reply.ok, error=reply.error, result=reply.result)
 
     async def kv_get(self, *, plugin_id: str, key: str, secret: bool = False) -> Any | None:
@@ -180,37 +218,53 @@ class BrokerStorageRPC:
             raise StorageError("Invalid table.query response payload")
         return [item for item in rows if isinstance(item, dict)]
 
+    async def table_scan(
+        self,
+        *,
+        plugin_id: str,
+        table: str,
+        where: Mapping[str, Any] | None = None,
+        order_by: str | None = None,
+        descending: bool = False,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        response = await self.call(
+            StorageRpcRequest(
+                plugin_id=plugin_id,
+                op="table.scan",
+                table=table,
+                where=dict(where or {}),
+                order_by=order_by,
+                descending=descending,
+                cursor=cursor,
+                limit=limit,
+            )
+        )
+        payload = _ensure_response_ok(response)
+        rows = payload.get("rows", [])
+        next_cursor = payload.get("next_cursor")
+        if not isinstance(rows, list) or not (next_cursor is None or isinstance(next_cursor, str)):
+            raise StorageError("Invalid table.scan response payload")
+        return [item for item in rows if isinstance(item, dict)], next_cursor
+
     @staticmethod
-    def _request_payload(request: StorageRpcRequest) -> dict[str, Any]:
-        if request.op == "kv.get":
-            return StorageKvGetPayload(key=str(request.key), secret=bool(request.secret)).model_dump(mode="json")
-        if request.op == "kv.set":
-            row = dict(request.row or {})
-            if "value" not in row:
-                raise StorageQueryNotAllowed("kv.set requires row.value")
-            return StorageKvSetPayload(
-                key=str(request.key),
-                value=row["value"],
-                secret=bool(request.secret),
-            ).model_dump(mode="json")
-        if request.op == "kv.delete":
-            return StorageKvDeletePayload(key=str(request.key)).model_dump(mode="json")
-        if request.op == "table.get":
-            return StorageTableGetPayload(table=str(request.table), key=request.key).model_dump(mode="json")
-        if request.op == "table.upsert":
-            return StorageTableUpsertPayload(
-                table=str(request.table),
-                row=dict(request.row or {}),
-            ).model_dump(mode="json")
-        if request.op == "table.delete":
-            return StorageTableDeletePayload(table=str(request.table), key=request.key).model_dump(mode="json")
-        if request.op == "table.query":
-            return StorageTableQueryPayload(
-                table=str(request.table),
-                where=dict(request.where or {}),
-                limit=request.limit,
-            ).model_dump(mode="json")
-        raise StorageQueryNotAllowed(f"Unsupported storage operation: {request.op}")
+    async def _call_local(
+        handler: LocalHandler, request: StorageRpcRequest, *, timeout_sec: float
+    ) -> StorageRpcResponse:
+        # Co-located consumer: same checks and deadline, but no envelope, encoding or reply round trip.
+        try:
+            result = await asyncio.wait_for(handler(request), timeout=timeout_sec)
+        except TimeoutError:
+            return _timeout_response(request, timeout_sec=timeout_sec)
+        except StorageError as exc:
+            return StorageRpcResponse.model_construct(id=request.id, ok=False, error=_error_payload(exc), result=None)
+        except Exception as exc:  # pragma: no cover - defensive
+            wrapped = StorageError(str(exc))
+            return StorageRpcResponse.model_construct(
+                id=request.id, ok=False, error=_error_payload(wrapped), result=None
+            )
+        return StorageRpcResponse.model_construct(id=request.id, ok=True, error=None, result=result)
 
 
 class StorageBusConsumer:
@@ -221,31 +275,51 @@ class StorageBusConsumer:
         storage: PluginStorage,
         plugin_configs: Mapping[str, PluginStorageConfig],
         capabilities: Mapping[str, set[str]] | None = None,
+        quota: PluginQuota | None = None,
     ) -> None:
         self._bus_client = bus_client
         self._storage = storage
         self._plugin_configs = dict(plugin_configs)
         self._capabilities = {plugin_id: set(values) for plugin_id, values in (capabilities or {}).items()}
-        self._quota = PluginQuotaGuard()
+        # Without an explicit quota, max_qps is left to the storage backend, which charges every call itself.
+        self._quota = PluginQuotaGuard(quota=quota)
+        self._enforce_qps = quota is not None
 
     async def start(self) -> None:
-        await self._bus_client.consume(
-            queue_name=QUEUE_STORAGE,
-            binding_keys=("storage.kv.*", "storage.table.*"),
-            callback=self._on_message,
-            durable=True,
-        )
+        for lane in STORAGE_LANES:
+            await self._bus_client.consume(
+                queue_name=lane.queue_name,
+                binding_keys=lane.binding_keys,
+                callback=self._on_message,
+                durable=True,
+                prefetch_count=lane.prefetch_count,
+            )
+
+        self._bus_client.register_local_handler(STORAGE_ROUTING_KEYS, self.handle_request)
 
     async def stop(self) -> None:
-        return
+        self._bus_client.unregister_local_handler(STORAGE_ROUTING_KEYS, self.handle_request)
+
+    async def handle_request(self, request: StorageRpcRequest) -> dict[str, Any]:
+        return await self._handle(
+            plugin_id=request.plugin_id,
+            message_type=f"storage.{request.op}",
+            raw_payload=_request_model(request),
+        )
 
     async def _on_message(self, incoming: IncomingMessage) -> None:
         async with incoming.process(ignore_processed=True):
-            message = BusMessageV1.model_validate_json(incoming.body.decode("utf-8"))
+            body = decode_body(incoming)
+            message = decode_typed_message(body, _STORAGE_MESSAGES)
             correlation_id = message.correlation_id or str(message.id)
 
             try:
-                result = await self._handle_message(message)
+                result = await self._handle(
+                    plugin_id=message.plugin_id,
+                    message_type=message.type,
+                    raw_payload=message.payload,
+                    size_bound=len(body),
+                )
                 reply = BusReplyV1(correlation_id=correlation_id, ok=True, result=result)
             except StorageError as exc:
                 reply = BusReplyV1(correlation_id=correlation_id, ok=False, error=_error_payload(exc))
@@ -255,50 +329,58 @@ class StorageBusConsumer:
 
             await self._bus_client.reply(incoming, reply)
 
-    async def _handle_message(self, message: BusMessageV1) -> dict[str, Any]:
-        limits, table_specs = self._resolve_plugin(message.plugin_id)
-        self._enforce_capability(plugin_id=message.plugin_id, op=message.type)
-        self._quota.enforce_qps(plugin_id=message.plugin_id, message_type=message.type, limits=limits)
-
-        if message.type == "storage.kv.get":
-            payload = StorageKvGetPayload.model_validate(message.payload)
-            value = await self._storage.kv_get(plugin_id=message.plugin_id, key=payload.key, secret=payload.secret)
+    async def _handle(
+        self,
+        *,
+        plugin_id: str,
+        message_type: str,
+        raw_payload: BaseModel | Mapping[str, Any],
+        size_bound: int | None = None,
+    ) -> dict[str, Any]:
+        limits, table_specs = self._resolve_plugin(plugin_id)
+        self._enforce_capability(plugin_id=plugin_id, op=message_type)
+        if self._enforce_qps:
+            await self._quota.enforce_qps(plugin_id=plugin_id, message_type=message_type, limits=limits)
+
+        if message_type == "storage.kv.get":
+            payload = typed_payload(StorageKvGetPayload, raw_payload)
+            value = await self._storage.kv_get(plugin_id=plugin_id, key=payload.key, secret=payload.secret)
             return {"value": value}
 
-        if message.type == "storage.kv.set":
-            payload = StorageKvSetPayload.model_validate(message.payload)
-            self._quota.enforce_kv_bytes(value=payload.value, limits=limits)
+        if message_type == "storage.kv.set":
+            payload = typed_payload(StorageKvSetPayload, raw_payload)
+            self._quota.enforce_kv_bytes(value=payload.value, limits=limits, size_bound=size_bound)
             await self._storage.kv_set(
-                plugin_id=message.plugin_id,
+                plugin_id=plugin_id,
                 key=payload.key,
                 value=payload.value,
                 secret=payload.secret,
             )
             return {"ok": True}
 
-        if message.type == "storage.kv.delete":
-            payload = StorageKvDeletePayload.model_validate(message.payload)
-            deleted = await self._storage.kv_delete(plugin_id=message.plugin_id, key=payload.key)
+        if message_type == "storage.kv.delete":
+            payload = typed_payload(StorageKvDeletePayload, raw_payload)
+            deleted = await self._storage.kv_delete(plugin_id=plugin_id, key=payload.key)
             return {"deleted": deleted}
 
-        if message.type == "storage.table.get":
-            payload = StorageTableGetPayload.model_validate(message.payload)
-            row = await self._storage.table_get(plugin_id=message.plugin_id, table=payload.table, pk=payload.key)
+        if message_type == "storage.table.get":
+            payload = typed_payload(StorageTableGetPayload, raw_payload)
+            row = await self._storage.table_get(plugin_id=plugin_id, table=payload.table, pk=payload.key)
             return {"row": row}
 
-        if message.type == "storage.table.upsert":
-            payload = StorageTableUpsertPayload.model_validate(message.payload)
-            self._quota.enforce_row_bytes(row=dict(payload.row), limits=limits)
-            row = await self._storage.table_upsert(plugin_id=message.plugin_id, table=payload.table, row=payload.row)
+        if message_type == "storage.table.upsert":
+            payload = typed_payload(StorageTableUpsertPayload, raw_payload)
+            self._quota.enforce_row_bytes(row=payload.row, limits=limits, size_bound=size_bound)
+            row = await self._storage.table_upsert(plugin_id=plugin_id, table=payload.table, row=payload.row)
             return {"row": row}
 
-        if message.type == "storage.table.delete":
-            payload = StorageTableDeletePayload.model_validate(message.payload)
-            deleted = await self._storage.table_delete(plugin_id=message.plugin_id, table=payload.table, pk=payload.key)
+        if message_type == "storage.table.delete":
+            payload = typed_payload(StorageTableDeletePayload, raw_payload)
+            deleted = await self._storage.table_delete(plugin_id=plugin_id, table=payload.table, pk=payload.key)
             return {"deleted": deleted}
 
-        if message.type == "storage.table.query":
-            payload = StorageTableQueryPayload.model_validate(message.payload)
+        if message_type == "storage.table.query":
+            payload = typed_payload(StorageTableQueryPayload, raw_payload)
             self._enforce_table_query_policy(
                 table=payload.table,
                 where=payload.where,
@@ -306,14 +388,34 @@ class StorageBusConsumer:
             )
             limit = self._quota.clamp_query_limit(requested=payload.limit, limits=limits)
             rows = await self._storage.table_query(
-                plugin_id=message.plugin_id,
+                plugin_id=plugin_id,
                 table=payload.table,
                 where=payload.where,
                 limit=limit,
             )
             return {"rows": rows}
 
-        raise StorageQueryNotAllowed(f"Unsupported storage operation: {message.type}")
+        if message_type == "storage.table.scan":
+            payload = typed_payload(StorageTableScanPayload, raw_payload)
+            self._enforce_table_scan_policy(
+                table=payload.table,
+                where=payload.where,
+                order_by=payload.order_by,
+                table_specs=table_specs,
+            )
+            limit = self._quota.clamp_query_limit(requested=payload.limit, limits=limits, op="table.scan")
+            rows, next_cursor = await self._storage.table_scan(
+                plugin_id=plugin_id,
+                table=payload.table,
+                where=payload.where,
+                order_by=payload.order_by,
+                descending=payload.descending,
+                cursor=payload.cursor,
+                limit=limit,
+            )
+            return {"rows": rows, "next_cursor": next_cursor}
+
+        raise StorageQueryNotAllowed(f"Unsupported storage operation: {message_type}")
 
     def _resolve_plugin(self, plugin_id: str) -> tuple[StorageLimits, dict[str, StorageTableSpec]]:
         config = self._plugin_configs.get(plugin_id)
@@ -340,14 +442,25 @@ class StorageBusConsumer:
         if not where:
             raise StorageQueryNotAllowed("table_query requires non-empty where")
         spec = table_specs.get(table)
+        if spec is None:
+            raise StorageQueryNotAllowed(f"Table '{table}' is not allowed")
+        parse_where(where, allowed_fields={spec.primary_key, *spec.indexes}, table=table)
+
+    @staticmethod
+    def _enforce_table_scan_policy(
+        *,
+        table: str,
+        where: Mapping[str, Any],
+        order_by: str | None,
+        table_specs: Mapping[str, StorageTableSpec],
+    ) -> None:
+        spec = table_specs.get(table)
         if spec is None:
             raise StorageQueryNotAllowed(f"Table '{table}' is not allowed")
         allowed_fields = {spec.primary_key, *spec.indexes}
-        for field, value in where.items():
-            if field not in allowed_fields:
-                raise StorageQueryNotAllowed(f"Field '{field}' is not indexed or primary key")
-            if not (value is None or isinstance(value, str | int | float | bool)):
-                raise StorageQueryNotAllowed("table_query supports scalar equality only")
+        parse_where(where, allowed_fields=allowed_fields, table=table)
+        if order_by is not None and order_by not in allowed_fields:
+            raise StorageQueryNotAllowed(f"Field '{order_by}' is not indexed or primary key")
 
 
 __all__ = ["BrokerStorageRPC", "StorageBusConsumer"]
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+ValueT = TypeVar("ValueT")
+
+_WORD_WILDCARD = "*"
+_TAIL_WILDCARD = "#"
+
+
+@dataclass(eq=False)
+class _TopicNode(Generic[ValueT]):
+    children: dict[str, _TopicNode[ValueT]] = field(default_factory=dict)
+    values: dict[ValueT, int] = field(default_factory=dict)
+    hash_child: _TopicNode[ValueT] | None = None
+    is_hash: bool = False
+
+
+class TopicTrie(Generic[ValueT]):
+    """AMQP topic bindings compiled into a trie: ``*`` matches one word, ``#`` zero or more.
+
+    Matching walks the routing key once and does not depend on the number of bindings; results
+    are cached per routing key until the bindings change.
+    """
+
+    def __init__(self, *, cache_size: int = 4096) -> None:
+        self._root: _TopicNode[ValueT] = _TopicNode()
+        self._cache: dict[str, tuple[ValueT, ...]] = {}
+        self._cache_size = max(0, cache_size)
+
+    def add(self, pattern: str, value: ValueT) -> None:
+        node = self._root
+        for word in pattern.split("."):
+            node = self._child(node, word)
+        node.values[value] = node.values.get(value, 0) + 1
+        self._cache.clear()
+
+    def discard(self, pattern: str, value: ValueT) -> None:
+        path = [self._root]
+        for word in pattern.split("."):
+            child = path[-1].hash_child if word == _TAIL_WILDCARD else path[-1].children.get(word)
+            if child is None:
+                return
+            path.append(child)
+        count = path[-1].values.pop(value, 0)
+        if count > 1:
+            path[-1].values[value] = count - 1
+        self._prune(path, pattern.split("."))
+        self._cache.clear()
+
+    def match(self, routing_key: str) -> tuple[ValueT, ...]:
+        cached = self._cache.get(routing_key)
+        if cached is not None:
+            return cached
+        matched: dict[ValueT, None] = {}
+        for node in self._walk(routing_key):
+            matched.update(dict.fromkeys(node.values))
+        result = tuple(matched)
+        if self._cache_size:
+            if len(self._cache) >= self._cache_size:
+                self._cache.clear()
+            self._cache[routing_key] = result
+        return result
+
+    def _walk(self, routing_key: str) -> list[_TopicNode[ValueT]]:
+        states = _closure([self._root])
+        for word in routing_key.split("."):
+            advanced: list[_TopicNode[ValueT]] = []
+            for node in states:
+                if node.is_hash:
+                    advanced.append(node)
+                exact = node.children.get(word)
+                if exact is not None:
+                    advanced.append(exact)
+                star = node.children.get(_WORD_WILDCARD)
+                if star is not None:
+                    advanced.append(star)
+            if not advanced:
+                return []
+            states = _closure(advanced)
+        return states
+
+    @staticmethod
+    def _child(node: _TopicNode[ValueT], word: str) -> _TopicNode[ValueT]:
+        if word == _TAIL_WILDCARD:
+            if node.hash_child is None:
+                node.hash_child = _TopicNode(is_hash=True)
+            return node.hash_child
+        child = node.children.get(word)
+        if child is None:
+            child = node.children[word] = _TopicNode()
+        return child
+
+    @staticmethod
+    def _prune(path: list[_TopicNode[ValueT]], words: list[str]) -> None:
+        for parent, node, word in zip(reversed(path[:-1]), reversed(path[1:]), reversed(words), strict=True):
+            if node.values or node.children or node.hash_child is not None:
+                return
+            if word == _TAIL_WILDCARD:
+                parent.hash_child = None
+            else:
+                del parent.children[word]
+
+
+def _closure(nodes: list[_TopicNode[ValueT]]) -> list[_TopicNode[ValueT]]:
+    # ``#`` may match zero words, so entering a node also enters its ``#`` child.
+    seen: dict[int, _TopicNode[ValueT]] = {}
+    stack = list(nodes)
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen[id(node)] = node
+        if node.hash_child is not None:
+            stack.append(node.hash_child)
+    return list(seen.values())
+
+
+def routing_key_matches(pattern: str, key: str) -> bool:
+    return _words_match(pattern.split("."), key.split("."))
+
+
+def _words_match(pattern: list[str], key: list[str]) -> bool:
+    if not pattern:
+        return not key
+    head, rest = pattern[0], pattern[1:]
+    if head == _TAIL_WILDCARD:
+        return any(_words_match(rest, key[index:]) for index in range(len(key) + 1))
+    if not key:
+        return False
+    return head in (_WORD_WILDCARD, key[0]) and _words_match(rest, key[1:])
+
+
+__all__ = ["TopicTrie", "routing_key_matches"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .broker import BrokerConfigChangeNotifier, ConfigChangedConsumer
 from .service import ConfigService
 
-__all__ = ["ConfigService"]
+__all__ = ["BrokerConfigChangeNotifier", "ConfigChangedConsumer", "ConfigService"]
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from aio_pika import IncomingMessage
+from core.bus.client import BusClient
+from core.bus.codec import decode_message
+from core.bus.constants import QUEUE_CONFIG_CHANGED, ROUTING_CONFIG_CHANGED
+from core.contracts.bus import BusMessageV1, ConfigChangedPayload
+from core.contracts.models import ActiveState
+from core.storage.repositories import ConfigRepository
+
+
+class BrokerConfigChangeNotifier:
+    def __init__(self, *, bus_client: BusClient) -> None:
+        self._bus_client = bus_client
+
+    async def notify(self, active_state: ActiveState) -> None:
+        await self._bus_client.emit(
+            message=BusMessageV1(
+                type="config.changed",
+                plugin_id="core",
+                payload=ConfigChangedPayload(
+                    active_revision=active_state.active_revision,
+                    state_seq=active_state.state_seq,
+                ).model_dump(mode="json"),
+            ),
+            routing_key=ROUTING_CONFIG_CHANGED,
+        )
+
+
+class ConfigChangedConsumer:
+    def __init__(self, *, bus_client: BusClient, repository: ConfigRepository) -> None:
+        self._bus_client = bus_client
+        self._repository = repository
+
+    async def start(self) -> None:
+        await self._bus_client.consume(
+            queue_name=QUEUE_CONFIG_CHANGED,
+            binding_keys=(ROUTING_CONFIG_CHANGED,),
+            callback=self._on_message,
+            durable=False,
+            exclusive=True,
+            prefetch_count=1,
+        )
+
+    async def stop(self) -> None:
+        return
+
+    async def _on_message(self, incoming: IncomingMessage) -> None:
+        async with incoming.process(ignore_processed=True):
+            message = decode_message(incoming)
+            if message.type != "config.changed":
+                return
+            payload = ConfigChangedPayload.model_validate(message.payload)
+            self._repository.invalidate_active_cache(state_seq=payload.state_seq)
+
+
+__all__ = ["BrokerConfigChangeNotifier", "ConfigChangedConsumer"]
@@ -8,8 +8,10 @@ from typing import Any
 import yaml
 from core.contracts.errors import ApiError
 from core.contracts.models import (
+    ConfigFragment,
     ConfigImportRequest,
     ConfigPatchRequest,
+    ConfigRevision,
     ConfigRollbackRequest,
     ConfigStateResponse,
     ConfigValidateRequest,
@@ -17,7 +19,11 @@ from core.contracts.models import (
     WidgetRegistryEntry,
 )
 from core.events.protocols import EventPublisher
-from core.storage.repositories import ActiveConfigSnapshot, ConfigRepository
+from core.storage.config_pointer import parse_pointer, resolve_pointer
+from core.storage.config_views import ConfigViews
+from core.storage.repositories import ActiveConfigSnapshot, ConfigConflictError, ConfigRepository
+
+from .broker import BrokerConfigChangeNotifier
 
 
 class ConfigService:
@@ -27,10 +33,12 @@ class ConfigService:
         repository: ConfigRepository,
         event_bus: EventPublisher,
         bootstrap_file: Path,
+        change_notifier: BrokerConfigChangeNotifier | None = None,
     ) -> None:
         self._repository = repository
         self._event_bus = event_bus
         self._bootstrap_file = bootstrap_file
+        self._change_notifier = change_notifier
 
     async def startup_bootstrap(self) -> ConfigStateResponse:
         active = await self._repository.fetch_active()
@@ -69,15 +77,24 @@ class ConfigService:
         revisions = await self._repository.list_revisions(limit=limit)
         return [revision.model_dump(mode="json") for revision in revisions]
 
+    async def get_revision(self, revision: int) -> ConfigRevision:
+        found = await self._repository.fetch_revision(revision)
+        if found is None:
+            raise ApiError(status_code=404, code="revision_not_found", message=f"Revision {revision} was not found")
+        return found
+
     async def import_config(self, *, request: ConfigImportRequest, actor: str) -> ConfigStateResponse:
         parsed = self._parse_text(request.payload, request.format)
         self._validate_payload(parsed)
-        snapshot = await self._repository.create_revision(
-            payload=parsed,
-            source=request.source if request.source in {"bootstrap", "import", "api"} else "import",
-            actor=actor,
-            reason="config_import",
-        )
+        try:
+            snapshot = await self._repository.create_revision(
+                payload=parsed,
+                source=request.source if request.source in {"bootstrap", "import", "api"} else "import",
+                actor=actor,
+                reason="config_import",
+            )
+        except ConfigConflictError as exc:
+            raise self._conflict(exc, precondition=False) from exc
         return await self._emit_and_respond(snapshot=snapshot, event_type="core.config.imported")
 
     def validate_config(self, *, request: ConfigValidateRequest) -> ConfigValidationResponse:
@@ -97,14 +114,23 @@ class ConfigService:
             )
         return ConfigValidationResponse(valid=True, issues=[], config=parsed)
 
-    async def patch_config(self, *, request: ConfigPatchRequest, actor: str) -> ConfigStateResponse:
+    async def patch_config(
+        self,
+        *,
+        request: ConfigPatchRequest,
+        actor: str,
+        expected_revision: int | None = None,
+    ) -> ConfigStateResponse:
         self._validate_patch(request.patch)
         try:
             snapshot = await self._repository.patch_active(
                 patch=request.patch,
                 actor=actor,
                 source=request.source if request.source in {"patch", "api"} else "patch",
+                expected_revision=expected_revision,
             )
+        except ConfigConflictError as exc:
+            raise self._conflict(exc, precondition=expected_revision is not None) from exc
         except ValueError as exc:
             raise ApiError(status_code=422, code="patch_invalid", message=str(exc)) from exc
         self._validate_payload(snapshot.revision.payload)
@@ -117,6 +143,8 @@ class ConfigService:
                 actor=actor,
                 source=request.source if request.source in {"rollback", "api"} else "rollback",
             )
+        except ConfigConflictError as exc:
+            raise self._conflict(exc, precondition=False) from exc
         except KeyError as exc:
             raise ApiError(
                 status_code=404,
@@ -125,33 +153,138 @@ class ConfigService:
             ) from exc
         return await self._emit_and_respond(snapshot=snapshot, event_type="core.config.rolled_back")
 
-    async def widgets_registry(self) -> list[WidgetRegistryEntry]:
+    async def get_config_fragment(
+        self,
+        *,
+        path: str | None = None,
+        group_id: str | None = None,
+        item_id: str | None = None,
+    ) -> ConfigFragment:
         snapshot = await self._repository.fetch_active()
         if snapshot is None:
-            return []
+            raise ApiError(status_code=500, code="config_missing", message="Active config is not initialized")
+        pointer = await self._select_pointer(path=path, group_id=group_id, item_id=item_id)
+        try:
+            value = resolve_pointer(snapshot.revision.payload, pointer)
+        except ValueError as exc:
+            raise ApiError(status_code=422, code="config_path_invalid", message=str(exc)) from exc
+        except KeyError as exc:
+            raise ApiError(
+                status_code=404,
+                code="config_path_not_found",
+                message=f"Config path '{pointer}' was not found",
+            ) from exc
+        return ConfigFragment(
+            revision=snapshot.revision.revision,
+            sha256=snapshot.revision.sha256,
+            path=pointer,
+            value=value,
+        )
+
+    async def patch_config_fragment(
+        self,
+        *,
+        request: ConfigPatchRequest,
+        actor: str,
+        path: str | None = None,
+        group_id: str | None = None,
+        item_id: str | None = None,
+        expected_revision: int | None = None,
+    ) -> ConfigFragment:
+        self._validate_patch(request.patch)
+        self._validate_selectors(path=path, group_id=group_id, item_id=item_id)
+        located: list[str] = []
+
+        def _locate(views: ConfigViews) -> str:
+            # Item/group pointers are array indexes: resolve them against the revision being patched.
+            located.append(
+                path if path is not None else self._pointer_in_views(views, group_id=group_id, item_id=item_id)
+            )
+            return located[-1]
 
-        widgets = snapshot.revision.payload.get("widgets")
-        if not isinstance(widgets, list):
+        try:
+            snapshot = await self._repository.patch_active(
+                patch=request.patch,
+                actor=actor,
+                source=request.source if request.source in {"patch", "api"} else "patch",
+                locate=_locate,
+                expected_revision=expected_revision,
+            )
+        except ConfigConflictError as exc:
+            raise self._conflict(exc, precondition=expected_revision is not None) from exc
+        except KeyError as exc:
+            raise ApiError(
+                status_code=404,
+                code="config_path_not_found",
+                message=f"Config path '{located[-1] if located else path}' was not found",
+            ) from exc
+        except ValueError as exc:
+            raise ApiError(status_code=422, code="patch_invalid", message=str(exc)) from exc
+        pointer = located[-1]
+        self._validate_payload(snapshot.revision.payload)
+        await self._emit_and_respond(snapshot=snapshot, event_type="core.config.patched")
+        return ConfigFragment(
+            revision=snapshot.revision.revision,
+            sha256=snapshot.revision.sha256,
+            path=pointer,
+            value=resolve_pointer(snapshot.revision.payload, pointer),
+        )
+
+    async def derived_views(self) -> ConfigViews:
+        views = await self._repository.fetch_active_views()
+        if views is None:
+            raise ApiError(status_code=500, code="config_missing", message="Active config is not initialized")
+        return views
+
+    async def widgets_registry(self) -> list[WidgetRegistryEntry]:
+        views = await self._repository.fetch_active_views()
+        if views is None:
             return []
+        return list(views.widgets)
+
+    async def _select_pointer(self, *, path: str | None, group_id: str | None, item_id: str | None) -> str:
+        self._validate_selectors(path=path, group_id=group_id, item_id=item_id)
+        if path is not None:
+            return path
+        return self._pointer_in_views(await self.derived_views(), group_id=group_id, item_id=item_id)
 
-        seen: set[str] = set()
-        registry: list[WidgetRegistryEntry] = []
-        for widget in widgets:
-            if not isinstance(widget, dict):
-                continue
-            widget_type = widget.get("type")
-            if not isinstance(widget_type, str) or not widget_type or widget_type in seen:
-                continue
-            seen.add(widget_type)
-            registry.append(
-                WidgetRegistryEntry(
-                    type=widget_type,
-                    version="1.0",
-                    json_schema={},
-                    capabilities=["read.widget"],
-                )
+    @staticmethod
+    def _validate_selectors(*, path: str | None, group_id: str | None, item_id: str | None) -> None:
+        selectors = [value for value in (path, group_id, item_id) if value is not None]
+        if len(selectors) != 1:
+            raise ApiError(
+                status_code=422,
+                code="config_selector_invalid",
+                message="Exactly one of path, group or item must be provided",
             )
-        return registry
+        if path is not None:
+            try:
+                parse_pointer(path)
+            except ValueError as exc:
+                raise ApiError(status_code=422, code="config_path_invalid", message=str(exc)) from exc
+
+    @staticmethod
+    def _pointer_in_views(views: ConfigViews, *, group_id: str | None, item_id: str | None) -> str:
+        if group_id is not None:
+            pointer = views.group_pointers.get(group_id)
+            if pointer is None:
+                raise ApiError(status_code=404, code="config_group_not_found", message=f"Group '{group_id}' not found")
+            return pointer
+        ref = views.item_index.get(item_id or "")
+        if ref is None:
+            raise ApiError(status_code=404, code="config_item_not_found", message=f"Item '{item_id}' not found")
+        return ref.pointer
+
+    @staticmethod
+    def _conflict(exc: ConfigConflictError, *, precondition: bool) -> ApiError:
+        if precondition:
+            return ApiError(status_code=412, code="config_revision_conflict", message=str(exc))
+        return ApiError(
+            status_code=409,
+            code="config_write_conflict",
+            message="Active config kept changing concurrently; re-read and retry",
+            retryable=True,
+        )
 
     @staticmethod
     def _parse_text(payload: str, source_format: str) -> dict[str, Any]:
@@ -187,6 +320,8 @@ class ConfigService:
 
     async def _emit_and_respond(self, *, snapshot: ActiveConfigSnapshot, event_type: str) -> ConfigStateResponse:
         response = self._to_response(snapshot)
+        if self._change_notifier is not None:
+            await self._change_notifier.notify(response.active_state)
         await self._event_bus.publish(
             event_type=event_type,
             source="core.config",
@@ -194,7 +329,6 @@ class ConfigService:
                 "active_revision": response.active_state.active_revision,
                 "state_seq": response.active_state.state_seq,
             },
-            revision=response.active_state.state_seq,
         )
         return response
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from .bus import (
+    ActionBusMessageV1,
     ActionExecutePayload,
     BusMessageType,
     BusMessageV1,
@@ -9,12 +10,14 @@ from .bus import (
     EventPublishPayload,
     HealthCheckRequestPayload,
     HealthCheckResultPayload,
+    StorageBusMessageV1,
     StorageKvDeletePayload,
     StorageKvGetPayload,
     StorageKvSetPayload,
     StorageTableDeletePayload,
     StorageTableGetPayload,
     StorageTableQueryPayload,
+    StorageTableScanPayload,
     StorageTableUpsertPayload,
 )
 from .errors import ApiError, ErrorModel
@@ -55,6 +58,7 @@ from .storage import (
 )
 
 __all__ = [
+    "ActionBusMessageV1",
     "ActionEnvelope",
     "ActionExecutePayload",
     "ActionExecutionResponse",
@@ -81,6 +85,7 @@ __all__ = [
     "HealthCheckRequestPayload",
     "HealthCheckResultPayload",
     "PluginStorageConfig",
+    "StorageBusMessageV1",
     "StorageDDLColumnSpec",
     "StorageDDLIndexSpec",
     "StorageDDLSpec",
@@ -100,6 +105,7 @@ __all__ = [
     "StorageTableDeletePayload",
     "StorageTableGetPayload",
     "StorageTableQueryPayload",
+    "StorageTableScanPayload",
     "StorageTableSpec",
     "StorageTableUpsertPayload",
     "WidgetRegistryEntry",
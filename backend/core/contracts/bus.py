@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
 
+from .models import ActionEnvelope
+
 BusMessageType = Literal[
     "storage.kv.get",
     "storage.kv.set",
@@ -14,8 +16,11 @@ BusMessageType = Literal[
     "storage.table.upsert",
     "storage.table.delete",
     "storage.table.query",
+    "storage.table.scan",
     "action.execute",
+    "action.execute.batch",
     "event.publish",
+    "config.changed",
     "health.check.request",
     "health.check.result",
 ]
@@ -81,11 +86,99 @@ class StorageTableQueryPayload(BaseModel):
     limit: int | None = Field(default=None, ge=1)
 
 
+class StorageTableScanPayload(BaseModel):
+    table: str = Field(min_length=1, max_length=128)
+    where: dict[str, Any] = Field(default_factory=dict)
+    order_by: str | None = Field(default=None, min_length=1, max_length=128)
+    descending: bool = False
+    cursor: str | None = Field(default=None, min_length=1)
+    limit: int | None = Field(default=None, ge=1)
+
+
 class ActionExecutePayload(BaseModel):
-    action: dict[str, Any]
+    action: ActionEnvelope
     actor: str = Field(min_length=1, max_length=128)
 
 
+class ActionExecuteBatchPayload(BaseModel):
+    actions: list[ActionEnvelope] = Field(min_length=1, max_length=100)
+    actor: str = Field(min_length=1, max_length=128)
+
+
+class _TypedBusMessageV1(BaseModel):
+    id: UUID = Field(default_factory=uuid4)
+    ts: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    plugin_id: str = Field(min_length=1, max_length=128)
+    reply_to: str | None = None
+    correlation_id: str | None = None
+    trace: BusTraceV1 | None = None
+
+
+class StorageKvGetMessageV1(_TypedBusMessageV1):
+    type: Literal["storage.kv.get"]
+    payload: StorageKvGetPayload
+
+
+class StorageKvSetMessageV1(_TypedBusMessageV1):
+    type: Literal["storage.kv.set"]
+    payload: StorageKvSetPayload
+
+
+class StorageKvDeleteMessageV1(_TypedBusMessageV1):
+    type: Literal["storage.kv.delete"]
+    payload: StorageKvDeletePayload
+
+
+class StorageTableGetMessageV1(_TypedBusMessageV1):
+    type: Literal["storage.table.get"]
+    payload: StorageTableGetPayload
+
+
+class StorageTableUpsertMessageV1(_TypedBusMessageV1):
+    type: Literal["storage.table.upsert"]
+    payload: StorageTableUpsertPayload
+
+
+class StorageTableDeleteMessageV1(_TypedBusMessageV1):
+    type: Literal["storage.table.delete"]
+    payload: StorageTableDeletePayload
+
+
+class StorageTableQueryMessageV1(_TypedBusMessageV1):
+    type: Literal["storage.table.query"]
+    payload: StorageTableQueryPayload
+
+
+class StorageTableScanMessageV1(_TypedBusMessageV1):
+    type: Literal["storage.table.scan"]
+    payload: StorageTableScanPayload
+
+
+class ActionExecuteMessageV1(_TypedBusMessageV1):
+    type: Literal["action.execute"]
+    payload: ActionExecutePayload
+
+
+class ActionExecuteBatchMessageV1(_TypedBusMessageV1):
+    type: Literal["action.execute.batch"]
+    payload: ActionExecuteBatchPayload
+
+
+# Decoded straight from the body in one pass, discriminated by ``type``.
+StorageBusMessageV1 = Annotated[
+    StorageKvGetMessageV1
+    | StorageKvSetMessageV1
+    | StorageKvDeleteMessageV1
+    | StorageTableGetMessageV1
+    | StorageTableUpsertMessageV1
+    | StorageTableDeleteMessageV1
+    | StorageTableQueryMessageV1
+    | StorageTableScanMessageV1,
+    Field(discriminator="type"),
+]
+ActionBusMessageV1 = Annotated[ActionExecuteMessageV1 | ActionExecuteBatchMessageV1, Field(discriminator="type")]
+
+
 class EventPublishPayload(BaseModel):
     event_type: str = Field(min_length=1)
     source: str = Field(min_length=1)
@@ -94,6 +187,11 @@ class EventPublishPayload(BaseModel):
     revision: int | None = Field(default=None, ge=1)
 
 
+class ConfigChangedPayload(BaseModel):
+    active_revision: int = Field(ge=1)
+    state_seq: int = Field(ge=1)
+
+
 class HealthCheckRequestPayload(BaseModel):
     schema_version: Literal["v1"] = "v1"
     service_id: str = Field(min_length=1, max_length=36)
@@ -119,19 +217,34 @@ class HealthCheckResultPayload(BaseModel):
 
 
 __all__ = [
+    "ActionBusMessageV1",
+    "ActionExecuteBatchMessageV1",
+    "ActionExecuteBatchPayload",
+    "ActionExecuteMessageV1",
     "ActionExecutePayload",
     "BusMessageType",
     "BusMessageV1",
     "BusReplyV1",
     "BusTraceV1",
+    "ConfigChangedPayload",
     "EventPublishPayload",
     "HealthCheckRequestPayload",
     "HealthCheckResultPayload",
+    "StorageBusMessageV1",
+    "StorageKvDeleteMessageV1",
     "StorageKvDeletePayload",
+    "StorageKvGetMessageV1",
     "StorageKvGetPayload",
+    "StorageKvSetMessageV1",
     "StorageKvSetPayload",
+    "StorageTableDeleteMessageV1",
     "StorageTableDeletePayload",
+    "StorageTableGetMessageV1",
     "StorageTableGetPayload",
+    "StorageTableQueryMessageV1",
     "StorageTableQueryPayload",
+    "StorageTableScanMessageV1",
+    "StorageTableScanPayload",
+    "StorageTableUpsertMessageV1",
     "StorageTableUpsertPayload",
 ]
@@ -7,16 +7,19 @@ from uuid import UUID, uuid4
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
-class ConfigRevision(BaseModel):
+class ConfigRevisionMeta(BaseModel):
     revision: int = Field(ge=1)
     parent_revision: int | None = Field(default=None, ge=1)
     sha256: str = Field(pattern=r"^[a-f0-9]{64}$")
     source: Literal["bootstrap", "import", "patch", "rollback", "api", "system"]
-    payload: dict[str, Any]
     created_at: datetime
     created_by: str | None = None
 
 
+class ConfigRevision(ConfigRevisionMeta):
+    payload: dict[str, Any]
+
+
 class ActiveState(BaseModel):
     active_revision: int = Field(ge=1)
     state_seq: int = Field(ge=1)
@@ -30,6 +33,13 @@ class ConfigStateResponse(BaseModel):
     revision: ConfigRevision
 
 
+class ConfigFragment(BaseModel):
+    revision: int = Field(ge=1)
+    sha256: str = Field(pattern=r"^[a-f0-9]{64}$")
+    path: str
+    value: Any = None
+
+
 class ConfigImportRequest(BaseModel):
     format: Literal["yaml", "json", "toml"] = "yaml"
     payload: str = Field(min_length=1)
@@ -78,9 +88,16 @@ class ActionStatus(BaseModel):
     status: Literal["queued", "validated", "running", "succeeded", "failed", "cancelled", "blocked"]
     dry_run: bool
     result: dict[str, Any] | None = None
+    result_bytes: int | None = None
+    result_truncated: bool = False
     error: dict[str, Any] | None = None
 
 
+class ActionHistoryPage(BaseModel):
+    items: list[ActionStatus] = Field(default_factory=list)
+    next_cursor: str | None = None
+
+
 class ActionValidationResponse(BaseModel):
     action_id: UUID
     valid: bool
@@ -93,6 +110,18 @@ class ActionExecutionResponse(BaseModel):
     result: dict[str, Any] | None = None
 
 
+class ActionBatchExecuteRequest(BaseModel):
+    actions: list[ActionEnvelope] = Field(min_length=1, max_length=100)
+
+
+class ActionBatchItemResult(ActionExecutionResponse):
+    error: dict[str, Any] | None = None
+
+
+class ActionBatchExecuteResponse(BaseModel):
+    results: list[ActionBatchItemResult] = Field(default_factory=list)
+
+
 class ActionRegistryEntry(BaseModel):
     type: str
     capability: str
@@ -109,11 +138,21 @@ class WidgetRegistryEntry(BaseModel):
     capabilities: list[str] = Field(default_factory=list)
 
 
+class DashboardBootstrapResponse(BaseModel):
+    event_revision: int = Field(ge=0)
+    active_state: ActiveState
+    config: dict[str, Any]
+    widgets: list[WidgetRegistryEntry] = Field(default_factory=list)
+    plugins: list[dict[str, Any]] = Field(default_factory=list)
+    health: list[dict[str, Any]] = Field(default_factory=list)
+
+
 class EventEnvelope(BaseModel):
     id: UUID = Field(default_factory=uuid4)
     type: str = Field(min_length=1)
     event_version: int = Field(default=1, ge=1)
-    revision: int = Field(ge=1)
+    # Published events start at 1; 0 only marks snapshots taken before any event.
+    revision: int = Field(ge=0)
     ts: datetime = Field(default_factory=lambda: datetime.now(UTC))
     source: str = Field(min_length=1)
     correlation_id: str | None = None
@@ -183,20 +222,27 @@ class StorageMigrationResult(BaseModel):
 
 
 __all__ = [
+    "ActionBatchExecuteRequest",
+    "ActionBatchExecuteResponse",
+    "ActionBatchItemResult",
     "ActionEnvelope",
     "ActionExecutionResponse",
+    "ActionHistoryPage",
     "ActionRegistryEntry",
     "ActionStatus",
     "ActionValidationResponse",
     "ActiveState",
     "AuditEvent",
+    "ConfigFragment",
     "ConfigImportRequest",
     "ConfigPatchRequest",
     "ConfigRevision",
+    "ConfigRevisionMeta",
     "ConfigRollbackRequest",
     "ConfigStateResponse",
     "ConfigValidateRequest",
     "ConfigValidationResponse",
+    "DashboardBootstrapResponse",
     "EventEnvelope",
     "StorageMigrationActionPayload",
     "StorageMigrationPlanEntry",
@@ -153,6 +153,7 @@ StorageRpcOperation = Literal[
     "table.upsert",
     "table.delete",
     "table.query",
+    "table.scan",
 ]
 
 
@@ -167,6 +168,9 @@ class StorageRpcRequest(BaseModel):
     limit: int | None = Field(default=None, ge=1)
     row: dict[str, Any] | None = None
     secret: bool | None = None
+    order_by: str | None = Field(default=None, min_length=1, max_length=128)
+    descending: bool | None = None
+    cursor: str | None = Field(default=None, min_length=1)
 
 
 class StorageRpcResponse(BaseModel):
@@ -1,7 +1,15 @@
 from __future__ import annotations
 
 from .broker import BrokerEventPublisher, EventPublishConsumer
-from .bus import EventBus
+from .bus import RESYNC_EVENT_TYPE, EventBus, EventFilter, SubscriberStats
 from .protocols import EventPublisher
 
-__all__ = ["BrokerEventPublisher", "EventBus", "EventPublishConsumer", "EventPublisher"]
+__all__ = [
+    "RESYNC_EVENT_TYPE",
+    "BrokerEventPublisher",
+    "EventBus",
+    "EventFilter",
+    "EventPublishConsumer",
+    "EventPublisher",
+    "SubscriberStats",
+]
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import time
 from contextlib import suppress
 from datetime import UTC, datetime
 from uuid import uuid4
 
 from aio_pika import IncomingMessage
 from core.bus.client import BusClient
+from core.bus.codec import decode_message
 from core.bus.constants import QUEUE_EVENTS, ROUTING_EVENT_PUBLISH
 from core.contracts.bus import BusMessageV1, EventPublishPayload
 from core.contracts.models import EventEnvelope
@@ -27,7 +29,9 @@ class BrokerEventPublisher:
         correlation_id: str | None = None,
         revision: int | None = None,
     ) -> EventEnvelope:
-        self._revision = max(self._revision + 1, revision or 1)
+        # Hybrid logical clock: replicas receive events from several publishers, so revisions
+        # follow wall-clock milliseconds and only advance by one when events share a tick.
+        self._revision = max(self._revision + 1, revision or 1, time.time_ns() // 1_000_000)
         envelope = EventEnvelope(
             id=uuid4(),
             type=event_type,
@@ -68,7 +72,9 @@ class EventPublishConsumer:
             queue_name=self._queue_name,
             binding_keys=(ROUTING_EVENT_PUBLISH,),
             callback=self._on_message,
-            durable=True,
+            durable=False,
+            exclusive=True,
+            prefetch_count=1,
         )
         with suppress(Exception):
             self._consumer_tag = queue.consumer_tags[0] if queue.consumer_tags else None
@@ -78,7 +84,7 @@ class EventPublishConsumer:
 
     async def _on_message(self, incoming: IncomingMessage) -> None:
         async with incoming.process(ignore_processed=True):
-            message = BusMessageV1.model_validate_json(incoming.body.decode("utf-8"))
+            message = decode_message(incoming)
             if message.type != "event.publish":
                 return
             payload = EventPublishPayload.model_validate(message.payload)
@@ -1,18 +1,70 @@
 from __future__ import annotations
 
 import asyncio
-from contextlib import suppress
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from uuid import uuid4
 
 from core.contracts.models import EventEnvelope
 
+RESYNC_EVENT_TYPE = "events.resync"
+
+
+@dataclass(frozen=True, slots=True)
+class EventFilter:
+    types: frozenset[str] = frozenset()
+    prefixes: tuple[str, ...] = ()
+    item_ids: frozenset[str] = frozenset()
+
+    def matches(self, event: EventEnvelope) -> bool:
+        if (self.types or self.prefixes) and event.type not in self.types and not event.type.startswith(self.prefixes):
+            return False
+        if self.item_ids:
+            item_id = event.payload.get("item_id")
+            if item_id is not None and str(item_id) not in self.item_ids:
+                return False
+        return True
+
+
+@dataclass(frozen=True, slots=True)
+class SubscriberStats:
+    label: str
+    queue_size: int
+    lag: int
+    high_water: int
+    dropped: int
+    resyncs: int
+
+
+@dataclass(slots=True)
+class _Subscription:
+    event_filter: EventFilter | None
+    label: str = ""
+    high_water: int = 0
+    dropped: int = 0
+    resyncs: int = 0
+
 
 class EventBus:
-    def __init__(self) -> None:
-        self._subscribers: set[asyncio.Queue[EventEnvelope]] = set()
+    def __init__(self, *, replay_size: int = 512) -> None:
+        self._subscribers: dict[asyncio.Queue[EventEnvelope], _Subscription] = {}
         self._lock = asyncio.Lock()
         self._revision = 0
+        self._replay: deque[EventEnvelope] = deque(maxlen=max(1, replay_size))
+        self._evicted = False
+        self._listeners: list[Callable[[EventEnvelope], None]] = []
+        self._dropped = 0
+
+    @property
+    def revision(self) -> int:
+        """Revision of the last event delivered here: the cursor a client resumes from."""
+        return self._revision
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
 
     async def publish(
         self,
@@ -24,7 +76,10 @@ class EventBus:
         revision: int | None = None,
     ) -> EventEnvelope:
         async with self._lock:
-            self._revision = max(self._revision + 1, revision or 1)
+            # Revisions assigned by the publisher are kept as-is so every replica exposes the same ids;
+            # only events published straight into this bus get a local one.
+            previous = self._revision
+            self._revision = revision if revision is not None else previous + 1
             envelope = EventEnvelope(
                 id=uuid4(),
                 type=event_type,
@@ -35,23 +90,112 @@ class EventBus:
                 correlation_id=correlation_id,
                 payload=payload or {},
             )
-            for queue in tuple(self._subscribers):
-                if queue.full():
-                    with suppress(asyncio.QueueEmpty):
-                        queue.get_nowait()
-                try:
-                    queue.put_nowait(envelope)
-                except asyncio.QueueFull:
+            if len(self._replay) == self._replay.maxlen:
+                self._evicted = True
+            self._replay.append(envelope)
+            for listener in tuple(self._listeners):
+                listener(envelope)
+            for queue, subscription in tuple(self._subscribers.items()):
+                if subscription.event_filter is not None and not subscription.event_filter.matches(envelope):
                     continue
+                if queue.full():
+                    self._resync(queue, subscription, previous)
+                queue.put_nowait(envelope)
+                subscription.high_water = max(subscription.high_water, queue.qsize())
             return envelope
 
-    def subscribe(self, *, queue_size: int = 256) -> asyncio.Queue[EventEnvelope]:
-        queue: asyncio.Queue[EventEnvelope] = asyncio.Queue(maxsize=max(1, queue_size))
-        self._subscribers.add(queue)
+    def _resync(
+        self,
+        queue: asyncio.Queue[EventEnvelope],
+        subscription: _Subscription,
+        cursor: int,
+    ) -> None:
+        # A subscriber that fell a whole queue behind gets its backlog replaced by one marker;
+        # the stream answers it with a fresh snapshot instead of a stream with holes in it.
+        lost = 0
+        carried: int | None = None
+        while not queue.empty():
+            discarded = queue.get_nowait()
+            if discarded.type == RESYNC_EVENT_TYPE:
+                carried = int(str(discarded.payload.get("dropped", 0)))
+            else:
+                lost += 1
+        if carried is None:
+            subscription.resyncs += 1
+        subscription.dropped += lost
+        self._dropped += lost
+        queue.put_nowait(
+            EventEnvelope(
+                id=uuid4(),
+                type=RESYNC_EVENT_TYPE,
+                event_version=1,
+                revision=cursor,
+                source="core.events",
+                payload={"dropped": lost + (carried or 0)},
+            )
+        )
+
+    def add_listener(self, listener: Callable[[EventEnvelope], None]) -> None:
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[EventEnvelope], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def subscribe(
+        self,
+        *,
+        queue_size: int = 256,
+        event_filter: EventFilter | None = None,
+        label: str = "",
+    ) -> asyncio.Queue[EventEnvelope]:
+        queue: asyncio.Queue[EventEnvelope] = asyncio.Queue(maxsize=max(2, queue_size))
+        self._subscribers[queue] = _Subscription(event_filter=event_filter, label=label)
+        return queue
+
+    def resume(
+        self,
+        *,
+        since: int,
+        queue_size: int = 256,
+        event_filter: EventFilter | None = None,
+        label: str = "",
+    ) -> asyncio.Queue[EventEnvelope] | None:
+        # Replicas may receive events from several publishers in slightly different orders, so the
+        # cursor is a position in this replica's replay rather than a "greater than" bound. An id
+        # that is not in the buffer (evicted, foreign or ambiguous) means the client needs a snapshot.
+        if since == 0 and not self._evicted:
+            replay = list(self._replay)
+        else:
+            positions = [index for index, envelope in enumerate(self._replay) if envelope.revision == since]
+            if len(positions) != 1:
+                return None
+            replay = list(self._replay)[positions[0] + 1 :]
+        missed = [envelope for envelope in replay if event_filter is None or event_filter.matches(envelope)]
+        if len(missed) > max(1, queue_size):
+            return None
+        queue = self.subscribe(queue_size=queue_size, event_filter=event_filter, label=label)
+        for envelope in missed:
+            queue.put_nowait(envelope)
+        self._subscribers[queue].high_water = queue.qsize()
         return queue
 
     def unsubscribe(self, queue: asyncio.Queue[EventEnvelope]) -> None:
-        self._subscribers.discard(queue)
+        self._subscribers.pop(queue, None)
+
+    def subscriber_stats(self) -> list[SubscriberStats]:
+        return [
+            SubscriberStats(
+                label=subscription.label,
+                queue_size=queue.maxsize,
+                lag=queue.qsize(),
+                high_water=subscription.high_water,
+                dropped=subscription.dropped,
+                resyncs=subscription.resyncs,
+            )
+            for queue, subscription in tuple(self._subscribers.items())
+        ]
 
 
-__all__ = ["EventBus"]
+__all__ = ["RESYNC_EVENT_TYPE", "EventBus", "EventFilter", "SubscriberStats"]
@@ -1,13 +1,80 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Hashable
+from dataclasses import dataclass
 
 from core.contracts.models import EventEnvelope
 
+COALESCE_KEYED_TYPES = frozenset({"health.status.updated"})
+
 
 def format_sse_event(event: EventEnvelope) -> str:
     payload = json.dumps(event.model_dump(mode="json"), ensure_ascii=False, separators=(",", ":"))
     return f"id: {event.revision}\nevent: {event.type}\ndata: {payload}\n\n"
 
 
-__all__ = ["format_sse_event"]
+def format_sse_batch(events: list[EventEnvelope]) -> str:
+    if len(events) == 1:
+        return format_sse_event(events[0])
+    payload = json.dumps(
+        [event.model_dump(mode="json") for event in events],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return f"id: {events[-1].revision}\nevent: events.batch\ndata: {payload}\n\n"
+
+
+@dataclass
+class EventStreamStats:
+    events_in: int = 0
+    frames_out: int = 0
+
+    def record(self, *, events: int, frames: int = 1) -> None:
+        self.events_in += events
+        self.frames_out += frames
+
+    @property
+    def coalescing_ratio(self) -> float:
+        if self.frames_out == 0:
+            return 1.0
+        return round(self.events_in / self.frames_out, 3)
+
+
+class EventCoalescer:
+    def __init__(self) -> None:
+        self._pending: dict[Hashable, EventEnvelope] = {}
+        self._received = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def received(self) -> int:
+        return self._received
+
+    def add(self, event: EventEnvelope) -> None:
+        self._received += 1
+        item_id = event.payload.get("item_id")
+        if event.type in COALESCE_KEYED_TYPES and item_id is not None:
+            key: Hashable = (event.type, str(item_id))
+            # Re-insert so the batch stays ordered by the latest update of each key.
+            self._pending.pop(key, None)
+        else:
+            key = event.id
+        self._pending[key] = event
+
+    def drain(self) -> list[EventEnvelope]:
+        events = list(self._pending.values())
+        self._pending.clear()
+        self._received = 0
+        return events
+
+
+__all__ = [
+    "COALESCE_KEYED_TYPES",
+    "EventCoalescer",
+    "EventStreamStats",
+    "format_sse_batch",
+    "format_sse_event",
+]
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass
 from typing import Any
+from uuid import UUID
 
 from core.contracts.errors import ApiError
 from core.contracts.models import (
+    ActionBatchItemResult,
     ActionEnvelope,
     ActionExecutionResponse,
     ActionRegistryEntry,
@@ -16,6 +19,8 @@ from core.contracts.models import (
 from core.events.protocols import EventPublisher
 from core.storage.repositories import ActionRepository, AuditRepository
 
+_BLOCKED_ERROR_CODES = frozenset({"execute_disabled", "dry_run_not_supported"})
+
 ActionExecutor = Callable[[ActionEnvelope], Awaitable[dict[str, Any]] | dict[str, Any]]
 
 
@@ -36,11 +41,13 @@ class ActionGateway:
         audit: AuditRepository,
         events: EventPublisher,
         execute_enabled: bool,
+        batch_concurrency: int = 8,
     ) -> None:
         self._actions = actions
         self._audit = audit
         self._events = events
         self._execute_enabled = execute_enabled
+        self._batch_concurrency = max(1, batch_concurrency)
         self._registry: dict[str, RegisteredAction] = {}
 
     def register_action(
@@ -71,18 +78,18 @@ class ActionGateway:
             for entry in sorted(self._registry.values(), key=lambda value: value.type)
         ]
 
-    async def validate_action(self, *, action: ActionEnvelope, actor: str) -> ActionValidationResponse:
+    def _blocked_reason(self, *, action: ActionEnvelope, actor: str) -> str | None:
         registration = self._registry.get(action.type)
-        blocked_reason: str | None = None
-
         if registration is None:
-            blocked_reason = f"Unknown action type: {action.type}"
-        elif registration.capability != action.capability:
-            blocked_reason = (
-                f"Action capability mismatch. Expected '{registration.capability}', got '{action.capability}'"
-            )
-        elif action.requested_by != actor:
-            blocked_reason = "Actor mismatch between envelope and header"
+            return f"Unknown action type: {action.type}"
+        if registration.capability != action.capability:
+            return f"Action capability mismatch. Expected '{registration.capability}', got '{action.capability}'"
+        if action.requested_by != actor:
+            return "Actor mismatch between envelope and header"
+        return None
+
+    async def validate_action(self, *, action: ActionEnvelope, actor: str) -> ActionValidationResponse:
+        blocked_reason = self._blocked_reason(action=action, actor=actor)
 
         await self._actions.create_queued(action)
 
@@ -92,31 +99,11 @@ class ActionGateway:
                 status="blocked",
                 error={"reason": blocked_reason},
             )
-            await self._audit.append(
-                AuditEvent(
-                    actor=actor,
-                    action_id=action.id,
-                    capability=action.capability,
-                    resource=action.type,
-                    decision="deny",
-                    outcome="blocked",
-                    reason=blocked_reason,
-                )
-            )
+            await self._audit.append(_validation_audit(action=action, actor=actor, blocked_reason=blocked_reason))
             return ActionValidationResponse(action_id=action.id, valid=False, status="blocked")
 
         await self._actions.set_status(action_id=action.id, status="validated")
-        await self._audit.append(
-            AuditEvent(
-                actor=actor,
-                action_id=action.id,
-                capability=action.capability,
-                resource=action.type,
-                decision="allow",
-                outcome="validated",
-                reason=None,
-            )
-        )
+        await self._audit.append(_validation_audit(action=action, actor=actor, blocked_reason=None))
         return ActionValidationResponse(action_id=action.id, valid=True, status="validated")
 
     async def execute_action(self, *, action: ActionEnvelope, actor: str) -> ActionExecutionResponse:
@@ -134,18 +121,8 @@ class ActionGateway:
                 status="blocked",
                 error={"reason": "execute_disabled"},
             )
-            await self._audit.append(
-                AuditEvent(
-                    actor=actor,
-                    action_id=action.id,
-                    capability=action.capability,
-                    resource=action.type,
-                    decision="deny",
-                    outcome="blocked",
-                    reason="Kill switch is enabled",
-                )
-            )
-            raise ApiError(status_code=503, code="execute_disabled", message="Action execute is disabled")
+            await self._audit.append(_kill_switch_audit(action=action, actor=actor))
+            raise _execute_disabled_error()
 
         if action.dry_run and not registration.dry_run_supported:
             await self._actions.set_status(
@@ -153,8 +130,17 @@ class ActionGateway:
                 status="blocked",
                 error={"reason": "dry_run_not_supported"},
             )
-            raise ApiError(status_code=422, code="dry_run_not_supported", message="Action does not support dry-run")
+            raise _dry_run_not_supported_error()
+
+        return await self._run(action=action, registration=registration, actor=actor)
 
+    async def _run(
+        self,
+        *,
+        action: ActionEnvelope,
+        registration: RegisteredAction,
+        actor: str,
+    ) -> ActionExecutionResponse:
         await self._actions.set_status(action_id=action.id, status="running")
         await self._events.publish(
             event_type="core.action.running",
@@ -231,8 +217,111 @@ class ActionGateway:
             )
             raise ApiError(status_code=500, code="execution_failed", message=str(exc)) from exc
 
+    async def execute_batch(self, *, actions: Sequence[ActionEnvelope], actor: str) -> list[ActionBatchItemResult]:
+        """Execute ``actions`` with the validation done once for the whole batch.
+
+        Each distinct (type, capability, requester) is checked once, every action row is stored with
+        its validation outcome in one insert and the validation audit in one write; only the
+        executable actions then run, ``batch_concurrency`` at a time.
+        """
+        action_ids = [action.id for action in actions]
+        if len(set(action_ids)) != len(action_ids):
+            raise ApiError(status_code=422, code="duplicate_action_id", message="Batch contains duplicate action ids")
+
+        reasons: dict[tuple[str, str, str], str | None] = {}
+        entries: list[tuple[ActionEnvelope, str, dict[str, Any] | None]] = []
+        audit_events: list[AuditEvent] = []
+        outcomes: dict[UUID, ActionBatchItemResult] = {}
+        runnable: list[tuple[ActionEnvelope, RegisteredAction]] = []
+        for action in actions:
+            key = (action.type, action.capability, action.requested_by)
+            if key not in reasons:
+                reasons[key] = self._blocked_reason(action=action, actor=actor)
+            blocked_reason = reasons[key]
+            audit_events.append(_validation_audit(action=action, actor=actor, blocked_reason=blocked_reason))
+            registration = self._registry[action.type] if blocked_reason is None else None
+            if registration is None:
+                entries.append((action, "blocked", {"reason": blocked_reason}))
+                outcomes[action.id] = ActionBatchItemResult(action_id=action.id, status="blocked")
+            elif not self._execute_enabled:
+                entries.append((action, "blocked", {"reason": "execute_disabled"}))
+                audit_events.append(_kill_switch_audit(action=action, actor=actor))
+                outcomes[action.id] = _error_item(action, _execute_disabled_error())
+            elif action.dry_run and not registration.dry_run_supported:
+                entries.append((action, "blocked", {"reason": "dry_run_not_supported"}))
+                outcomes[action.id] = _error_item(action, _dry_run_not_supported_error())
+            else:
+                entries.append((action, "validated", None))
+                runnable.append((action, registration))
+
+        try:
+            await self._actions.create_batch(entries)
+            await self._audit.append_many(audit_events)
+        except Exception as exc:
+            # Without stored rows nothing can run; report it per item like any other failure.
+            error = {"code": "execution_failed", "message": str(exc), "status_code": 500}
+            return [ActionBatchItemResult(action_id=action.id, status="failed", error=error) for action in actions]
+
+        semaphore = asyncio.Semaphore(self._batch_concurrency)
+
+        async def _execute(action: ActionEnvelope, registration: RegisteredAction) -> None:
+            async with semaphore:
+                try:
+                    response = await self._run(action=action, registration=registration, actor=actor)
+                except ApiError as exc:
+                    outcomes[action.id] = _error_item(action, exc)
+                    return
+                except Exception as exc:
+                    # One broken item (e.g. a storage error mid-run) must not sink the batch.
+                    error = {"code": "execution_failed", "message": str(exc), "status_code": 500}
+                    outcomes[action.id] = ActionBatchItemResult(action_id=action.id, status="failed", error=error)
+                    return
+            outcomes[action.id] = ActionBatchItemResult.model_validate(response.model_dump())
+
+        await asyncio.gather(*(_execute(action, registration) for action, registration in runnable))
+        return [outcomes[action.id] for action in actions]
+
     async def history(self, *, limit: int = 100) -> list[dict[str, Any]]:
         return [row.model_dump(mode="json") for row in await self._actions.list_history(limit=limit)]
 
 
+def _validation_audit(*, action: ActionEnvelope, actor: str, blocked_reason: str | None) -> AuditEvent:
+    return AuditEvent(
+        actor=actor,
+        action_id=action.id,
+        capability=action.capability,
+        resource=action.type,
+        decision="deny" if blocked_reason else "allow",
+        outcome="blocked" if blocked_reason else "validated",
+        reason=blocked_reason,
+    )
+
+
+def _kill_switch_audit(*, action: ActionEnvelope, actor: str) -> AuditEvent:
+    return AuditEvent(
+        actor=actor,
+        action_id=action.id,
+        capability=action.capability,
+        resource=action.type,
+        decision="deny",
+        outcome="blocked",
+        reason="Kill switch is enabled",
+    )
+
+
+def _execute_disabled_error() -> ApiError:
+    return ApiError(status_code=503, code="execute_disabled", message="Action execute is disabled")
+
+
+def _dry_run_not_supported_error() -> ApiError:
+    return ApiError(status_code=422, code="dry_run_not_supported", message="Action does not support dry-run")
+
+
+def _error_item(action: ActionEnvelope, exc: ApiError) -> ActionBatchItemResult:
+    error = exc.error.model_dump(mode="json")
+    error["status_code"] = exc.status_code
+    status = "blocked" if exc.error.code in _BLOCKED_ERROR_CODES else "failed"
+    return ActionBatchItemResult(action_id=action.id, status=status, error=error)
+
+
 __all__ = ["ActionGateway", "RegisteredAction"]
@@ -76,6 +76,29 @@ class PluginService:
         """List all plugins."""
         return self.registry.list_plugins()
     
+    def registry_entries(self) -> list[dict[str, Any]]:
+        """Describe loaded plugins for the public registry."""
+        entries: list[dict[str, Any]] = []
+        for plugin in self.list_plugins():
+            entries.append(
+                {
+                    "id": plugin.id,
+                    "name": plugin.manifest.name,
+                    "version": plugin.manifest.version,
+                    "capabilities": list(plugin.manifest.capabilities),
+                    "actions": list(plugin.manifest.actions),
+                    "events": list(plugin.manifest.events),
+                    "ui_config": {
+                        "has_page": plugin.ui_config.has_page,
+                        "page_path": plugin.ui_config.page_path,
+                        "show_in_menu": plugin.ui_config.show_in_menu,
+                    }
+                    if plugin.ui_config
+                    else None,
+                }
+            )
+        return entries
+    
     def get_plugin(self, plugin_id: str) -> PluginInfo | None:
         """Get plugin by ID."""
         return self.registry.get_plugin(plugin_id)
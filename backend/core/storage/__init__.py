@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .cache import StorageReadCache
 from .ddl_loader import load_storage_ddl_specs
 from .errors import (
     StorageDdlNotAllowed,
@@ -10,17 +11,22 @@ from .errors import (
     StorageRpcTimeout,
 )
 from .models import (
+    ActionResultBlobRow,
     ActionRow,
     AppStateRow,
     AuditLogRow,
     ConfigRevisionRow,
     PluginIndexRow,
     PluginKvRow,
+    PluginQuotaWindowRow,
     PluginRow,
+    PluginStorageVersionRow,
 )
 from .physical import PhysicalStorage, SafeDdlEngine, physical_index_name, physical_table_name, sanitize_identifier
 from .protocols import PluginStorage, StorageRPC
+from .quota import LocalQuota, PluginQuota, SharedQuota
 from .repositories import ActionRepository, AuditRepository, ConfigRepository
+from .retention import HistoryRetentionWorker
 from .router import StorageModeRouter
 from .rpc import (
     STORAGE_RPC_QUEUE,
@@ -36,6 +42,7 @@ from .universal import UniversalStorage
 __all__ = [
     "STORAGE_RPC_QUEUE",
     "ActionRepository",
+    "ActionResultBlobRow",
     "ActionRow",
     "AppStateRow",
     "AuditLogRow",
@@ -43,13 +50,19 @@ __all__ = [
     "BusStorageRPC",
     "ConfigRepository",
     "ConfigRevisionRow",
+    "HistoryRetentionWorker",
     "InProcStorageRPC",
+    "LocalQuota",
     "PhysicalStorage",
     "PluginIndexRow",
     "PluginKvRow",
+    "PluginQuota",
+    "PluginQuotaWindowRow",
     "PluginRow",
     "PluginStorage",
+    "PluginStorageVersionRow",
     "SafeDdlEngine",
+    "SharedQuota",
     "StorageDdlNotAllowed",
     "StorageError",
     "StorageLimitExceeded",
@@ -57,6 +70,7 @@ __all__ = [
     "StorageQueryNotAllowed",
     "StorageRPC",
     "StorageRateLimited",
+    "StorageReadCache",
     "StorageRpcBus",
     "StorageRpcConsumer",
     "StorageRpcEnvelope",
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from .errors import StorageError
+from .models import PluginStorageVersionRow
+
+LOGGER = logging.getLogger(__name__)
+
+_BUMP_ATTEMPTS = 3
+
+
+@dataclass(slots=True)
+class _KnownVersion:
+    version: int
+    checked_at: float
+
+
+@dataclass(slots=True)
+class _CachedRead:
+    version: int
+    value: Any
+
+
+class StorageReadCache:
+    """Read-through cache for plugin storage, invalidated by per-(plugin, scope) version counters.
+
+    Every write bumps the scope's row in ``plugin_storage_versions`` after it commits, and a cached
+    read is served only while that version is unchanged. With ``revalidate_sec=0`` each read
+    re-checks the version, so writes from any process are visible immediately but every hit still
+    costs a primary-key lookup; this only pays off for reads heavier than that lookup. A positive
+    value trusts a known version for that long, bounding staleness from other processes while this
+    process's own writes stay visible at once. Concurrent loads of the same key and version share
+    one backend call.
+
+    A failed bump never fails the write that has already committed: this process drops its own
+    entries for the scope and retries the bump the next time the scope is read or written.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory: async_sessionmaker[AsyncSession],
+        max_entries: int = 4096,
+        revalidate_sec: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._session_factory = session_factory
+        self._max_entries = max(1, max_entries)
+        self._revalidate_sec = max(0.0, revalidate_sec)
+        self._clock = clock
+        self._versions: dict[tuple[str, str], _KnownVersion] = {}
+        self._entries: OrderedDict[tuple[str, str, Hashable], _CachedRead] = OrderedDict()
+        self._inflight: dict[tuple[tuple[str, str, Hashable], int], asyncio.Task[Any]] = {}
+        self._unbumped: set[tuple[str, str]] = set()
+
+    async def read(
+        self,
+        *,
+        plugin_id: str,
+        scope: str,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        if (plugin_id, scope) in self._unbumped:
+            await self.invalidate(plugin_id=plugin_id, scope=scope)
+        if (plugin_id, scope) in self._unbumped:
+            # Other processes may still trust the old version, so this one must not trust it either.
+            return await loader()
+        version = await self._version(plugin_id=plugin_id, scope=scope)
+        entry_key = (plugin_id, scope, key)
+        entry = self._entries.get(entry_key)
+        if entry is not None and entry.version == version:
+            self._entries.move_to_end(entry_key)
+            return copy.deepcopy(entry.value)
+
+        flight_key = (entry_key, version)
+        task = self._inflight.get(flight_key)
+        if task is None:
+            task = asyncio.ensure_future(loader())
+            self._inflight[flight_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(flight_key, None))
+        # Shielded so a cancelled caller does not fail the other callers waiting on the same load.
+        value = await asyncio.shield(task)
+
+        known = self._versions.get((plugin_id, scope))
+        if known is not None and known.version == version:
+            self._entries[entry_key] = _CachedRead(version=version, value=value)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return copy.deepcopy(value)
+
+    async def invalidate(self, *, plugin_id: str, scope: str) -> None:
+        """Record a committed write: bump the shared version so every process drops its cached reads."""
+        try:
+            version = await self._bump(plugin_id=plugin_id, scope=scope)
+        except (StorageError, SQLAlchemyError):
+            LOGGER.warning(
+                "Failed to bump storage version for plugin '%s' scope '%s'; will retry",
+                plugin_id,
+                scope,
+                exc_info=True,
+            )
+            self._unbumped.add((plugin_id, scope))
+            self.forget(plugin_id=plugin_id, scope=scope)
+            return
+        self._unbumped.discard((plugin_id, scope))
+        self._remember_version(plugin_id=plugin_id, scope=scope, version=version)
+
+    def forget(self, *, plugin_id: str, scope: str) -> None:
+        """Drop this process's cached reads for ``scope`` without touching the shared version."""
+        for entry_key in [entry_key for entry_key in self._entries if entry_key[:2] == (plugin_id, scope)]:
+            del self._entries[entry_key]
+
+    async def _version(self, *, plugin_id: str, scope: str) -> int:
+        known = self._versions.get((plugin_id, scope))
+        if known is not None and self._clock() - known.checked_at < self._revalidate_sec:
+            return known.version
+        async with self._session_factory() as session:
+            version = await session.scalar(
+                select(PluginStorageVersionRow.version).where(
+                    PluginStorageVersionRow.plugin_id == plugin_id,
+                    PluginStorageVersionRow.scope == scope,
+                )
+            )
+        return self._remember_version(plugin_id=plugin_id, scope=scope, version=int(version or 0))
+
+    def _remember_version(self, *, plugin_id: str, scope: str, version: int) -> int:
+        known = self._versions.get((plugin_id, scope))
+        if known is not None and known.version > version:
+            # A slower probe must not roll back a version this process has already seen.
+            return known.version
+        self._versions[(plugin_id, scope)] = _KnownVersion(version=version, checked_at=self._clock())
+        return version
+
+    async def _bump(self, *, plugin_id: str, scope: str) -> int:
+        condition = (PluginStorageVersionRow.plugin_id == plugin_id, PluginStorageVersionRow.scope == scope)
+        for _ in range(_BUMP_ATTEMPTS):
+            try:
+                async with self._session_factory() as session, session.begin():
+                    result = await session.execute(
+                        update(PluginStorageVersionRow)
+                        .where(*condition)
+                        .values(version=PluginStorageVersionRow.version + 1)
+                    )
+                    if result.rowcount == 0:
+                        session.add(PluginStorageVersionRow(plugin_id=plugin_id, scope=scope, version=1))
+                        await session.flush()
+                        return 1
+                    return int(await session.scalar(select(PluginStorageVersionRow.version).where(*condition)))
+            except IntegrityError:
+                continue
+        raise StorageError(f"Failed to bump storage version for plugin '{plugin_id}' scope '{scope}'")
+
+
+__all__ = ["StorageReadCache"]
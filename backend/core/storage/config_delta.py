@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+DeltaOp = dict[str, Any]
+
+
+def diff_payload(old: Any, new: Any) -> list[DeltaOp]:
+    ops: list[DeltaOp] = []
+    _diff(old, new, [], ops)
+    return ops
+
+
+def apply_delta(base: Any, ops: list[DeltaOp]) -> Any:
+    result = copy.deepcopy(base)
+    for op in ops:
+        path = list(op.get("path") or [])
+        kind = op.get("op")
+        if kind == "set":
+            if not path:
+                result = copy.deepcopy(op.get("value"))
+                continue
+            parent = _resolve(result, path[:-1])
+            key = path[-1]
+            value = copy.deepcopy(op.get("value"))
+            if isinstance(parent, list) and key == len(parent):
+                parent.append(value)
+            else:
+                parent[key] = value
+        elif kind == "del":
+            parent = _resolve(result, path[:-1])
+            parent.pop(path[-1])
+        elif kind == "splice":
+            target = _resolve(result, path)
+            index = int(op["index"])
+            target[index : index + int(op["delete"])] = copy.deepcopy(op.get("items") or [])
+        else:
+            raise ValueError(f"Unsupported config delta op: {kind}")
+    return result
+
+
+def _resolve(node: Any, path: list[Any]) -> Any:
+    for key in path:
+        node = node[key]
+    return node
+
+
+def _same(old: Any, new: Any) -> bool:
+    return type(old) is type(new) and old == new
+
+
+def _diff(old: Any, new: Any, path: list[Any], ops: list[DeltaOp]) -> None:
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append({"op": "del", "path": [*path, key]})
+        for key, value in new.items():
+            if key in old:
+                _diff(old[key], value, [*path, key], ops)
+            else:
+                ops.append({"op": "set", "path": [*path, key], "value": value})
+        return
+
+    if isinstance(old, list) and isinstance(new, list):
+        if len(old) == len(new):
+            for index, (old_item, new_item) in enumerate(zip(old, new, strict=True)):
+                _diff(old_item, new_item, [*path, index], ops)
+            return
+        shortest = min(len(old), len(new))
+        prefix = 0
+        while prefix < shortest and _same(old[prefix], new[prefix]):
+            prefix += 1
+        suffix = 0
+        while suffix < shortest - prefix and _same(old[-1 - suffix], new[-1 - suffix]):
+            suffix += 1
+        ops.append(
+            {
+                "op": "splice",
+                "path": path,
+                "index": prefix,
+                "delete": len(old) - prefix - suffix,
+                "items": new[prefix : len(new) - suffix],
+            }
+        )
+        return
+
+    if not _same(old, new):
+        ops.append({"op": "set", "path": path, "value": new})
+
+
+__all__ = ["DeltaOp", "apply_delta", "diff_payload"]
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import Any
+
+
+def parse_pointer(pointer: str) -> list[str]:
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"JSON pointer must start with '/': {pointer!r}")
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def format_pointer(tokens: list[Any]) -> str:
+    return "".join("/" + str(token).replace("~", "~0").replace("/", "~1") for token in tokens)
+
+
+def resolve_pointer(document: Any, pointer: str) -> Any:
+    node = document
+    for token in parse_pointer(pointer):
+        node = _child(node, token, pointer)
+    return node
+
+
+def replace_at_pointer(document: Any, pointer: str, value: Any) -> Any:
+    """Return a copy of ``document`` with ``value`` at ``pointer``; only containers on the path are copied."""
+    tokens = parse_pointer(pointer)
+    if not tokens:
+        return value
+
+    parents: list[Any] = []
+    node = document
+    for token in tokens[:-1]:
+        parents.append(node)
+        node = _child(node, token, pointer)
+    parents.append(node)
+
+    for token in reversed(tokens):
+        parent = parents.pop()
+        if isinstance(parent, dict):
+            copied: Any = dict(parent)
+            copied[token] = value
+        elif isinstance(parent, list):
+            copied = list(parent)
+            copied[_index(parent, token, pointer)] = value
+        else:
+            raise KeyError(pointer)
+        value = copied
+    return value
+
+
+def _child(node: Any, token: str, pointer: str) -> Any:
+    if isinstance(node, dict):
+        if token not in node:
+            raise KeyError(pointer)
+        return node[token]
+    if isinstance(node, list):
+        return node[_index(node, token, pointer)]
+    raise KeyError(pointer)
+
+
+def _index(node: list[Any], token: str, pointer: str) -> int:
+    if not token.isdigit() or (len(token) > 1 and token.startswith("0")):
+        raise KeyError(pointer)
+    index = int(token)
+    if index >= len(node):
+        raise KeyError(pointer)
+    return index
+
+
+__all__ = ["format_pointer", "parse_pointer", "replace_at_pointer", "resolve_pointer"]
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import ipaddress
+from collections.abc import Callable, Hashable, Iterator, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, TypeVar
+from urllib.parse import urlsplit
+
+from core.contracts.models import ConfigRevision, WidgetRegistryEntry
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigItemRef:
+    group_id: str
+    subgroup_id: str
+    item: Mapping[str, Any]
+    pointer: str = ""
+
+    @property
+    def item_id(self) -> str:
+        return str(self.item.get("id") or "").strip()
+
+
+def iter_config_items(payload: Mapping[str, Any]) -> Iterator[ConfigItemRef]:
+    groups = payload.get("groups")
+    if not isinstance(groups, (list, tuple)):
+        return
+    for group_index, group in enumerate(groups):
+        if not isinstance(group, Mapping):
+            continue
+        group_id = str(group.get("id") or "")
+        subgroups = group.get("subgroups")
+        if not isinstance(subgroups, (list, tuple)):
+            continue
+        for subgroup_index, subgroup in enumerate(subgroups):
+            if not isinstance(subgroup, Mapping):
+                continue
+            subgroup_id = str(subgroup.get("id") or "")
+            items = subgroup.get("items")
+            if not isinstance(items, (list, tuple)):
+                continue
+            for item_index, item in enumerate(items):
+                if isinstance(item, Mapping):
+                    yield ConfigItemRef(
+                        group_id=group_id,
+                        subgroup_id=subgroup_id,
+                        item=item,
+                        pointer=f"/groups/{group_index}/subgroups/{subgroup_index}/items/{item_index}",
+                    )
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class ConfigViews:
+    """Projections of one config revision, each computed at most once."""
+
+    def __init__(self, revision: ConfigRevision) -> None:
+        self._revision = revision
+        self._projections: dict[Hashable, Any] = {}
+
+    @property
+    def revision(self) -> int:
+        return self._revision.revision
+
+    @property
+    def sha256(self) -> str:
+        return self._revision.sha256
+
+    def matches(self, revision: ConfigRevision) -> bool:
+        return self._revision.revision == revision.revision and self._revision.sha256 == revision.sha256
+
+    def projection(self, key: Hashable, build: Callable[[], T]) -> T:
+        if key not in self._projections:
+            self._projections[key] = build()
+        return self._projections[key]
+
+    @property
+    def items(self) -> tuple[ConfigItemRef, ...]:
+        return self.projection("items", self._build_items)
+
+    @property
+    def item_index(self) -> Mapping[str, ConfigItemRef]:
+        return self.projection("item_index", self._build_item_index)
+
+    @property
+    def group_pointers(self) -> Mapping[str, str]:
+        return self.projection("group_pointers", self._build_group_pointers)
+
+    @property
+    def widgets(self) -> tuple[WidgetRegistryEntry, ...]:
+        # Pydantic models are mutable, so callers get copies of the cached entries.
+        return tuple(entry.model_copy(deep=True) for entry in self.projection("widgets", self._build_widgets))
+
+    @property
+    def ip_index(self) -> Mapping[str, tuple[ConfigItemRef, ...]]:
+        """Items grouped by the IP literal in their URL host."""
+        return self.projection("host_indexes", self._build_host_indexes)[0]
+
+    @property
+    def hostname_index(self) -> Mapping[str, tuple[ConfigItemRef, ...]]:
+        """Items whose URL host is a name; consumers resolve each name once."""
+        return self.projection("host_indexes", self._build_host_indexes)[1]
+
+    def _build_items(self) -> tuple[ConfigItemRef, ...]:
+        return tuple(
+            ConfigItemRef(
+                group_id=ref.group_id,
+                subgroup_id=ref.subgroup_id,
+                item=_freeze(ref.item),
+                pointer=ref.pointer,
+            )
+            for ref in iter_config_items(self._revision.payload)
+        )
+
+    def _build_item_index(self) -> Mapping[str, ConfigItemRef]:
+        index: dict[str, ConfigItemRef] = {}
+        for ref in self.items:
+            item_id = ref.item_id
+            if item_id and item_id not in index:
+                index[item_id] = ref
+        return MappingProxyType(index)
+
+    def _build_group_pointers(self) -> Mapping[str, str]:
+        groups = self._revision.payload.get("groups")
+        pointers: dict[str, str] = {}
+        if isinstance(groups, list):
+            for index, group in enumerate(groups):
+                if not isinstance(group, dict):
+                    continue
+                group_id = str(group.get("id") or "").strip()
+                if group_id and group_id not in pointers:
+                    pointers[group_id] = f"/groups/{index}"
+        return MappingProxyType(pointers)
+
+    def _build_widgets(self) -> tuple[WidgetRegistryEntry, ...]:
+        widgets = self._revision.payload.get("widgets")
+        if not isinstance(widgets, list):
+            return ()
+
+        seen: set[str] = set()
+        registry: list[WidgetRegistryEntry] = []
+        for widget in widgets:
+            if not isinstance(widget, dict):
+                continue
+            widget_type = widget.get("type")
+            if not isinstance(widget_type, str) or not widget_type or widget_type in seen:
+                continue
+            seen.add(widget_type)
+            registry.append(
+                WidgetRegistryEntry(
+                    type=widget_type,
+                    version="1.0",
+                    json_schema={},
+                    capabilities=["read.widget"],
+                )
+            )
+        return tuple(registry)
+
+    def _build_host_indexes(
+        self,
+    ) -> tuple[Mapping[str, tuple[ConfigItemRef, ...]], Mapping[str, tuple[ConfigItemRef, ...]]]:
+        by_ip: dict[str, list[ConfigItemRef]] = {}
+        by_name: dict[str, list[ConfigItemRef]] = {}
+        for ref in self.items:
+            try:
+                host = urlsplit(str(ref.item.get("url") or "")).hostname
+            except ValueError:
+                continue
+            if not host:
+                continue
+            host = host.rstrip(".").lower()
+            try:
+                by_ip.setdefault(str(ipaddress.ip_address(host)), []).append(ref)
+            except ValueError:
+                by_name.setdefault(host, []).append(ref)
+        return (
+            MappingProxyType({ip: tuple(refs) for ip, refs in by_ip.items()}),
+            MappingProxyType({name: tuple(refs) for name, refs in by_name.items()}),
+        )
+
+
+__all__ = ["ConfigItemRef", "ConfigViews", "iter_config_items"]
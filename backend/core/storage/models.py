@@ -3,7 +3,19 @@ from __future__ import annotations
 from datetime import UTC, datetime
 
 from db.base import Base
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, PrimaryKeyConstraint, String, Text, func
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    PrimaryKeyConstraint,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -18,11 +30,15 @@ class ConfigRevisionRow(Base):
     revision: Mapped[int] = mapped_column(Integer, nullable=False, unique=True)
     parent_revision: Mapped[int | None] = mapped_column(Integer, nullable=True)
     payload_json: Mapped[str] = mapped_column(Text, nullable=False)
+    payload_encoding: Mapped[str] = mapped_column(String(16), nullable=False, default="full")
+    base_revision: Mapped[int | None] = mapped_column(Integer, nullable=True)
     payload_sha256: Mapped[str] = mapped_column(String(64), nullable=False)
     source: Mapped[str] = mapped_column(String(32), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=utc_now)
     created_by: Mapped[str | None] = mapped_column(String(128), nullable=True)
 
+    __table_args__ = (Index("ix_config_revisions_encoding_revision", "payload_encoding", "revision"),)
+
 
 class AppStateRow(Base):
     __tablename__ = "app_state"
@@ -47,6 +63,8 @@ class ActionRow(Base):
     payload_json: Mapped[str] = mapped_column(Text, nullable=False)
     dry_run: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     result_json: Mapped[str | None] = mapped_column(Text, nullable=True)
+    result_bytes: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    result_external: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     error_json: Mapped[str | None] = mapped_column(Text, nullable=True)
     idempotency_key: Mapped[str | None] = mapped_column(String(128), nullable=True)
     trace_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
@@ -55,12 +73,23 @@ class ActionRow(Base):
     finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     __table_args__ = (
-        Index("ix_actions_created_at", "created_at"),
-        Index("ix_actions_type_status", "type", "status"),
+        Index("ix_actions_created_at", "created_at", "id"),
+        Index("ix_actions_type_status", "type", "status", "created_at", "id"),
+        Index("ix_actions_status_created_at", "status", "created_at", "id"),
         Index("ix_actions_idempotency_key", "idempotency_key"),
     )
 
 
+class ActionResultBlobRow(Base):
+    __tablename__ = "action_result_blobs"
+
+    action_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    encoding: Mapped[str] = mapped_column(String(16), nullable=False)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    raw_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=utc_now)
+
+
 class AuditLogRow(Base):
     __tablename__ = "audit_log"
 
@@ -109,6 +138,7 @@ class PluginRow(Base):
     plugin_id: Mapped[str] = mapped_column(String(128), nullable=False)
     table_name: Mapped[str] = mapped_column("table", String(128), nullable=False)
     pk: Mapped[str] = mapped_column(String(255), nullable=False)
+    sort_key: Mapped[str | None] = mapped_column(String(512), nullable=True)
     row_json: Mapped[str] = mapped_column(Text, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=utc_now)
     row_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -117,6 +147,7 @@ class PluginRow(Base):
         PrimaryKeyConstraint("plugin_id", "table", "pk", name="pk_plugin_rows"),
         Index("ix_plugin_rows_plugin_table", "plugin_id", "table"),
         Index("ix_plugin_rows_plugin_table_updated", "plugin_id", "table", "updated_at"),
+        Index("ix_plugin_rows_sort", "plugin_id", "table", "sort_key", "pk"),
     )
 
 
@@ -127,6 +158,7 @@ class PluginIndexRow(Base):
     table_name: Mapped[str] = mapped_column("table", String(128), nullable=False)
     index_name: Mapped[str] = mapped_column(String(128), nullable=False)
     index_value: Mapped[str] = mapped_column(String(512), nullable=False)
+    sort_key: Mapped[str | None] = mapped_column(String(512), nullable=True)
     pk: Mapped[str] = mapped_column(String(255), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=utc_now)
 
@@ -134,15 +166,43 @@ class PluginIndexRow(Base):
         PrimaryKeyConstraint("plugin_id", "table", "index_name", "pk", name="pk_plugin_indexes"),
         Index("ix_plugin_indexes_lookup", "plugin_id", "table", "index_name", "index_value"),
         Index("ix_plugin_indexes_pk", "plugin_id", "table", "pk"),
+        Index("ix_plugin_indexes_sort", "plugin_id", "table", "index_name", "sort_key", "pk"),
     )
 
 
+class PluginQuotaWindowRow(Base):
+    __tablename__ = "plugin_quota_windows"
+
+    plugin_id: Mapped[str] = mapped_column(String(128), nullable=False)
+    op: Mapped[str] = mapped_column(String(64), nullable=False)
+    window_start: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    used: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        PrimaryKeyConstraint("plugin_id", "op", "window_start", name="pk_plugin_quota_windows"),
+        Index("ix_plugin_quota_windows_start", "window_start"),
+    )
+
+
+class PluginStorageVersionRow(Base):
+    __tablename__ = "plugin_storage_versions"
+
+    plugin_id: Mapped[str] = mapped_column(String(128), nullable=False)
+    scope: Mapped[str] = mapped_column(String(128), nullable=False)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    __table_args__ = (PrimaryKeyConstraint("plugin_id", "scope", name="pk_plugin_storage_versions"),)
+
+
 __all__ = [
+    "ActionResultBlobRow",
     "ActionRow",
     "AppStateRow",
     "AuditLogRow",
     "ConfigRevisionRow",
     "PluginIndexRow",
     "PluginKvRow",
+    "PluginQuotaWindowRow",
     "PluginRow",
+    "PluginStorageVersionRow",
 ]
@@ -7,7 +7,6 @@ import threading
 from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from time import monotonic
 from typing import Any
 
 from core.contracts.storage import (
@@ -21,6 +20,7 @@ from core.contracts.storage import (
 from sqlalchemy import (
     Boolean,
     Column,
+    ColumnElement,
     DateTime,
     Float,
     Index,
@@ -28,13 +28,13 @@ from sqlalchemy import (
     MetaData,
     Table,
     Text,
-    and_,
     delete,
     func,
     insert,
     inspect,
     select,
     text,
+    tuple_,
     update,
 )
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
@@ -44,9 +44,10 @@ from .errors import (
     StorageDdlNotAllowed,
     StorageLimitExceeded,
     StorageQueryNotAllowed,
-    StorageRateLimited,
 )
 from .models import PluginKvRow
+from .query import ScanPredicate, decode_scan_cursor, encode_scan_cursor, parse_where
+from .quota import LocalQuota, PluginQuota
 
 _IDENTIFIER_RE = re.compile(r"[^a-z0-9_]+")
 _UNDERSCORE_RE = re.compile(r"_+")
@@ -90,39 +91,6 @@ def physical_index_name(*, physical_table: str, logical_index_name: str) -> str:
     return sanitize_identifier(base, max_length=120)
 
 
-@dataclass
-class _TokenBucket:
-    tokens: float
-    updated_at: float
-
-
-class _RateLimiter:
-    def __init__(self) -> None:
-        self._buckets: dict[tuple[str, str], _TokenBucket] = {}
-        self._lock = threading.Lock()
-
-    def consume(self, *, plugin_id: str, op: str, qps: float) -> None:
-        key = (plugin_id, op)
-        now = monotonic()
-        capacity = max(1.0, qps)
-
-        with self._lock:
-            bucket = self._buckets.get(key)
-            if bucket is None:
-                self._buckets[key] = _TokenBucket(tokens=capacity - 1.0, updated_at=now)
-                return
-
-            elapsed = max(0.0, now - bucket.updated_at)
-            bucket.tokens = min(capacity, bucket.tokens + elapsed * qps)
-            bucket.updated_at = now
-
-            if bucket.tokens < 1.0:
-                raise StorageRateLimited(
-                    f"Rate limit exceeded for plugin '{plugin_id}' operation '{op}' (max_qps={qps})"
-                )
-            bucket.tokens -= 1.0
-
-
 class SafeDdlEngine:
     def __init__(
         self,
@@ -291,6 +259,7 @@ class PhysicalStorage:
         *,
         session_factory: async_sessionmaker[AsyncSession],
         plugin_configs: Mapping[str, PluginStorageConfig],
+        quota: PluginQuota | None = None,
     ) -> None:
         self._session_factory = session_factory
         engine = session_factory.kw.get("bind")
@@ -313,7 +282,7 @@ class PhysicalStorage:
         self._migrated_plugins: set[str] = set()
         self._migrate_lock = threading.Lock()
         self._table_cache: dict[tuple[str, str], Table] = {}
-        self._rate_limiter = _RateLimiter()
+        self._quota = quota or LocalQuota()
 
     async def install_all(self) -> None:
         await self._ddl_engine.install_all()
@@ -327,7 +296,7 @@ class PhysicalStorage:
 
     async def kv_get(self, *, plugin_id: str, key: str, secret: bool = False) -> Any | None:
         limits = self._limits_for(plugin_id)
-        self._enforce_rate_limit(plugin_id=plugin_id, op="kv.get", limits=limits)
+        await self._enforce_rate_limit(plugin_id=plugin_id, op="kv.get", limits=limits)
 
         async with self._session_factory() as session:
             row = await session.scalar(
@@ -344,7 +313,7 @@ class PhysicalStorage:
 
     async def kv_set(self, *, plugin_id: str, key: str, value: Any, secret: bool = False) -> None:
         limits = self._limits_for(plugin_id)
-        self._enforce_rate_limit(plugin_id=plugin_id, op="kv.set", limits=limits)
+        await self._enforce_rate_limit(plugin_id=plugin_id, op="kv.set", limits=limits)
 
         serialized = _canonical_json(value)
         value_bytes = _as_bytes(serialized)
@@ -378,7 +347,7 @@ class PhysicalStorage:
 
     async def kv_delete(self, *, plugin_id: str, key: str) -> bool:
         limits = self._limits_for(plugin_id)
-        self._enforce_rate_limit(plugin_id=plugin_id, op="kv.delete", limits=limits)
+        await self._enforce_rate_limit(plugin_id=plugin_id, op="kv.delete", limits=limits)
 
         async with self._session_factory() as session, session.begin():
             row = await session.scalar(
@@ -394,7 +363,7 @@ class PhysicalStorage:
 
     async def table_get(self, *, plugin_id: str, table: str, pk: Any) -> dict[str, Any] | None:
         limits = self._limits_for(plugin_id)
-        self._enforce_rate_limit(plugin_id=plugin_id, op="table.get", limits=limits)
+        await self._enforce_rate_limit(plugin_id=plugin_id, op="table.get", limits=limits)
 
         table_obj, table_spec, ddl_table = await self._resolve_table(plugin_id=plugin_id, table=table)
         pk_value = self._serialize_column_value(ddl_table.columns_map[table_spec.primary_key], pk, for_query=True)
@@ -439,7 +408,7 @@ class PhysicalStorage:
     ) -> dict[str, Any]:
         limits = self._limits_for(plugin_id)
         if enforce_rate_limit:
-            self._enforce_rate_limit(plugin_id=plugin_id, op="table.upsert", limits=limits)
+            await self._enforce_rate_limit(plugin_id=plugin_id, op="table.upsert", limits=limits)
 
         table_obj, table_spec, ddl_table = await self._resolve_table(plugin_id=plugin_id, table=table)
         payload = self._normalize_payload(ddl_table=ddl_table, payload=dict(row), require_all_required=True)
@@ -475,7 +444,7 @@ class PhysicalStorage:
 
     async def table_delete(self, *, plugin_id: str, table: str, pk: Any) -> bool:
         limits = self._limits_for(plugin_id)
-        self._enforce_rate_limit(plugin_id=plugin_id, op="table.delete", limits=limits)
+        await self._enforce_rate_limit(plugin_id=plugin_id, op="table.delete", limits=limits)
 
         table_obj, table_spec, ddl_table = await self._resolve_table(plugin_id=plugin_id, table=table)
         pk_value = self._serialize_column_value(ddl_table.columns_map[table_spec.primary_key], pk, for_query=True)
@@ -495,37 +464,121 @@ class PhysicalStorage:
         limit: int | None = None,
     ) -> list[dict[str, Any]]:
         limits = self._limits_for(plugin_id)
-        self._enforce_rate_limit(plugin_id=plugin_id, op="table.query", limits=limits)
+        await self._enforce_rate_limit(plugin_id=plugin_id, op="table.query", limits=limits)
 
         table_obj, table_spec, ddl_table = await self._resolve_table(plugin_id=plugin_id, table=table)
-        predicates = dict(where)
-        if not predicates:
+        if not where:
             raise StorageQueryNotAllowed("table_query requires non-empty where")
+        predicates = parse_where(where, allowed_fields={table_spec.primary_key, *table_spec.indexes}, table=table)
+
+        pk_column = table_obj.c[table_spec.primary_key]
+        statement = (
+            select(table_obj)
+            .where(*self._scan_conditions(table_obj=table_obj, ddl_table=ddl_table, predicates=predicates))
+            .order_by(pk_column)
+            .limit(self._clamp_query_limit(limit=limit, limits=limits))
+        )
 
+        async with self._session_factory() as session:
+            rows = (await session.execute(statement)).mappings().all()
+            return [self._decode_row(ddl_table=ddl_table, row=dict(row)) for row in rows]
+
+    async def table_scan(
+        self,
+        *,
+        plugin_id: str,
+        table: str,
+        where: Mapping[str, Any] | None = None,
+        order_by: str | None = None,
+        descending: bool = False,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        limits = self._limits_for(plugin_id)
+        await self._enforce_rate_limit(plugin_id=plugin_id, op="table.scan", limits=limits)
+
+        table_obj, table_spec, ddl_table = await self._resolve_table(plugin_id=plugin_id, table=table)
         allowed_fields = {table_spec.primary_key, *table_spec.indexes}
-        conditions = []
-        for field, value in predicates.items():
-            if field not in allowed_fields:
-                raise StorageQueryNotAllowed(f"Field '{field}' is not queryable for table '{table}'")
-            if not _is_scalar(value):
-                raise StorageQueryNotAllowed("table_query supports equality AND on scalar values only")
-            column_spec = ddl_table.columns_map.get(field)
-            if column_spec is None:
-                raise StorageQueryNotAllowed(f"Field '{field}' is missing in DDL for table '{table}'")
-            encoded = self._serialize_column_value(column_spec, value, for_query=True)
-            conditions.append(table_obj.c[field] == encoded)
+        predicates = parse_where(where or {}, allowed_fields=allowed_fields, table=table)
+        order_field = order_by or table_spec.primary_key
+        if order_field not in allowed_fields:
+            raise StorageQueryNotAllowed(f"Field '{order_field}' is not orderable for table '{table}'")
 
-        clamped_limit = self._clamp_query_limit(limit=limit, limits=limits)
+        pk_field = table_spec.primary_key
+        pk_column = table_obj.c[pk_field]
+        order_column = table_obj.c[order_field]
+        conditions = self._scan_conditions(table_obj=table_obj, ddl_table=ddl_table, predicates=predicates)
+        # Keyset pagination (and NULL ordering) is only portable over non-null values.
+        if order_field != pk_field:
+            conditions.append(order_column.is_not(None))
+        if cursor is not None:
+            after_value, after_pk = decode_scan_cursor(cursor, order_by=order_field)
+            encoded_pk = self._serialize_column_value(ddl_table.columns_map[pk_field], after_pk, for_query=True)
+            if order_field == pk_field:
+                conditions.append(pk_column < encoded_pk if descending else pk_column > encoded_pk)
+            else:
+                encoded_value = self._serialize_column_value(
+                    ddl_table.columns_map[order_field], after_value, for_query=True
+                )
+                current_key = tuple_(order_column, pk_column)
+                cursor_key = tuple_(encoded_value, encoded_pk)
+                conditions.append(current_key < cursor_key if descending else current_key > cursor_key)
+
+        order_columns = [order_column] if order_field == pk_field else [order_column, pk_column]
+        page_size = self._clamp_query_limit(limit=limit, limits=limits)
         statement = (
             select(table_obj)
-            .where(and_(*conditions))
-            .order_by(table_obj.c[table_spec.primary_key])
-            .limit(clamped_limit)
+            .where(*conditions)
+            .order_by(*(column.desc() if descending else column for column in order_columns))
+            .limit(page_size + 1)
         )
 
         async with self._session_factory() as session:
             rows = (await session.execute(statement)).mappings().all()
-            return [self._decode_row(ddl_table=ddl_table, row=dict(row)) for row in rows]
+
+        page = [self._decode_row(ddl_table=ddl_table, row=dict(row)) for row in rows[:page_size]]
+        next_cursor = None
+        if len(rows) > page_size:
+            last = page[-1]
+            next_cursor = encode_scan_cursor(order_by=order_field, value=last[order_field], pk=last[pk_field])
+        return page, next_cursor
+
+    def _scan_conditions(
+        self,
+        *,
+        table_obj: Table,
+        ddl_table: _PhysicalTableSpec,
+        predicates: list[ScanPredicate],
+    ) -> list[ColumnElement[bool]]:
+        conditions: list[ColumnElement[bool]] = []
+        for predicate in predicates:
+            column_spec = ddl_table.columns_map.get(predicate.field)
+            if column_spec is None:
+                raise StorageQueryNotAllowed(
+                    f"Field '{predicate.field}' is missing in DDL for table '{ddl_table.name}'"
+                )
+            column = table_obj.c[predicate.field]
+            if predicate.op == "prefix":
+                if column_spec.type != "string":
+                    raise StorageQueryNotAllowed(f"Operator 'prefix' requires string field, '{predicate.field}' is not")
+                conditions.append(column.startswith(predicate.value, autoescape=True))
+                continue
+            if predicate.op != "eq" and column_spec.type in {"boolean", "json"}:
+                raise StorageQueryNotAllowed(
+                    f"Operator '{predicate.op}' is not supported for {column_spec.type} field '{predicate.field}'"
+                )
+            encoded = self._serialize_column_value(column_spec, predicate.value, for_query=True)
+            if predicate.op == "eq":
+                conditions.append(column == encoded)
+            elif predicate.op == "gt":
+                conditions.append(column > encoded)
+            elif predicate.op == "gte":
+                conditions.append(column >= encoded)
+            elif predicate.op == "lt":
+                conditions.append(column < encoded)
+            else:
+                conditions.append(column <= encoded)
+        return conditions
 
     async def count_table_rows(self, *, plugin_id: str, table: str) -> int:
         table_obj, _, _ = await self._resolve_table(plugin_id=plugin_id, table=table)
@@ -630,8 +683,8 @@ class PhysicalStorage:
             return limits.max_query_limit
         return max(1, min(limit, limits.max_query_limit))
 
-    def _enforce_rate_limit(self, *, plugin_id: str, op: str, limits: StorageLimits) -> None:
-        self._rate_limiter.consume(plugin_id=plugin_id, op=op, qps=limits.max_qps)
+    async def _enforce_rate_limit(self, *, plugin_id: str, op: str, limits: StorageLimits) -> None:
+        await self._quota.acquire(plugin_id=plugin_id, op=op, qps=limits.max_qps)
 
     def _normalize_payload(
         self,
@@ -28,6 +28,18 @@ class PluginStorage(Protocol):
         limit: int | None = None,
     ) -> list[dict[str, Any]]: ...
 
+    async def table_scan(
+        self,
+        *,
+        plugin_id: str,
+        table: str,
+        where: Mapping[str, Any] | None = None,
+        order_by: str | None = None,
+        descending: bool = False,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]: ...
+
 
 class StorageRPC(Protocol):
     async def call(self, request: StorageRpcRequest) -> StorageRpcResponse: ...
@@ -53,5 +65,17 @@ class StorageRPC(Protocol):
         limit: int | None = None,
     ) -> list[dict[str, Any]]: ...
 
+    async def table_scan(
+        self,
+        *,
+        plugin_id: str,
+        table: str,
+        where: Mapping[str, Any] | None = None,
+        order_by: str | None = None,
+        descending: bool = False,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]: ...
+
 
 __all__ = ["PluginStorage", "StorageRPC"]
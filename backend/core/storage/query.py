@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import base64
+import json
+from collections.abc import Collection, Mapping
+from dataclasses import dataclass
+from typing import Any, Literal, cast
+
+from .errors import StorageQueryNotAllowed
+
+ScanOperator = Literal["eq", "gt", "gte", "lt", "lte", "prefix"]
+
+_RANGE_OPERATORS = frozenset({"gt", "gte", "lt", "lte"})
+_OPERATORS = frozenset({"eq", "between", "prefix", *_RANGE_OPERATORS})
+
+
+@dataclass(frozen=True, slots=True)
+class ScanPredicate:
+    field: str
+    op: ScanOperator
+    value: Any
+
+
+def _is_scalar(value: Any) -> bool:
+    return value is None or isinstance(value, str | int | float | bool)
+
+
+def parse_where(where: Mapping[str, Any], *, allowed_fields: Collection[str], table: str) -> list[ScanPredicate]:
+    """Parse ``where`` into AND-ed predicates.
+
+    A scalar value means equality; a mapping applies operators to the field, e.g.
+    ``{"requested_at": {"gte": "2026-01-01", "lt": "2026-02-01"}}``, ``{"port": {"between": [1, 1024]}}``
+    or ``{"hostname": {"prefix": "nas"}}``. ``between`` is inclusive on both ends.
+    """
+    predicates: list[ScanPredicate] = []
+    for field, condition in where.items():
+        if field not in allowed_fields:
+            raise StorageQueryNotAllowed(f"Field '{field}' is not queryable for table '{table}'")
+        if not isinstance(condition, Mapping):
+            if not _is_scalar(condition):
+                raise StorageQueryNotAllowed(f"Field '{field}' supports scalar values or operator objects only")
+            predicates.append(ScanPredicate(field=field, op="eq", value=condition))
+            continue
+        if not condition:
+            raise StorageQueryNotAllowed(f"Field '{field}' operator object is empty")
+        for op, value in condition.items():
+            predicates.extend(_parse_operator(field=field, op=op, value=value))
+    return predicates
+
+
+def _parse_operator(*, field: str, op: str, value: Any) -> list[ScanPredicate]:
+    if op not in _OPERATORS:
+        raise StorageQueryNotAllowed(f"Unsupported operator '{op}' for field '{field}'")
+    if op == "eq":
+        if not _is_scalar(value):
+            raise StorageQueryNotAllowed(f"Operator 'eq' for field '{field}' expects a scalar value")
+        return [ScanPredicate(field=field, op="eq", value=value)]
+    if op == "between":
+        if not isinstance(value, list | tuple) or len(value) != 2:
+            raise StorageQueryNotAllowed(f"Operator 'between' for field '{field}' expects [low, high]")
+        low, high = value
+        return [*_parse_operator(field=field, op="gte", value=low), *_parse_operator(field=field, op="lte", value=high)]
+    if op == "prefix":
+        if not isinstance(value, str) or not value:
+            raise StorageQueryNotAllowed(f"Operator 'prefix' for field '{field}' expects a non-empty string")
+        return [ScanPredicate(field=field, op="prefix", value=value)]
+    if value is None or not _is_scalar(value) or isinstance(value, bool):
+        raise StorageQueryNotAllowed(f"Operator '{op}' for field '{field}' expects a string or number")
+    return [ScanPredicate(field=field, op=cast(ScanOperator, op), value=value)]
+
+
+def encode_scan_cursor(*, order_by: str, value: Any, pk: Any) -> str:
+    token = json.dumps([order_by, value, pk], ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(token.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_scan_cursor(cursor: str, *, order_by: str) -> tuple[Any, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        field, value, pk = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except (ValueError, TypeError, UnicodeError) as exc:
+        raise StorageQueryNotAllowed("Invalid table scan cursor") from exc
+    if field != order_by or not _is_scalar(value) or pk is None or not _is_scalar(pk):
+        raise StorageQueryNotAllowed("Table scan cursor does not match the requested order")
+    return value, pk
+
+
+__all__ = ["ScanOperator", "ScanPredicate", "decode_scan_cursor", "encode_scan_cursor", "parse_where"]
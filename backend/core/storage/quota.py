@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Protocol
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from .errors import StorageRateLimited
+from .models import PluginQuotaWindowRow
+
+_EVICT_THRESHOLD = 4096
+_WINDOW_RETENTION_SEC = 60
+
+
+class PluginQuota(Protocol):
+    async def acquire(self, *, plugin_id: str, op: str, qps: float) -> None: ...
+
+
+def _rate_limited(*, plugin_id: str, op: str, qps: float) -> StorageRateLimited:
+    return StorageRateLimited(f"Rate limit exceeded for plugin '{plugin_id}' operation '{op}' (max_qps={qps})")
+
+
+@dataclass(slots=True)
+class _TokenBucket:
+    tokens: float
+    updated_at: float
+    full_at: float
+
+
+class LocalQuota:
+    """Per-process token buckets: ``max_qps`` holds for this process only."""
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._buckets: dict[tuple[str, str], _TokenBucket] = {}
+        self._clock = clock
+
+    async def acquire(self, *, plugin_id: str, op: str, qps: float) -> None:
+        self.consume(plugin_id=plugin_id, op=op, qps=qps)
+
+    def consume(self, *, plugin_id: str, op: str, qps: float) -> None:
+        key = (plugin_id, op)
+        now = self._clock()
+        capacity = max(1.0, qps)
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= _EVICT_THRESHOLD:
+                self._evict_full(now=now)
+            self._buckets[key] = _TokenBucket(tokens=capacity - 1.0, updated_at=now, full_at=now + 1.0 / qps)
+            return
+
+        bucket.tokens = min(capacity, bucket.tokens + max(0.0, now - bucket.updated_at) * qps)
+        bucket.updated_at = now
+        if bucket.tokens < 1.0:
+            raise _rate_limited(plugin_id=plugin_id, op=op, qps=qps)
+        bucket.tokens -= 1.0
+        bucket.full_at = now + (capacity - bucket.tokens) / qps
+
+    def _evict_full(self, *, now: float) -> None:
+        # A bucket that has refilled completely behaves exactly like a missing one.
+        self._buckets = {key: bucket for key, bucket in self._buckets.items() if bucket.full_at > now}
+
+
+@dataclass(slots=True)
+class _Lease:
+    window_start: int
+    tokens: int
+    exhausted: bool = False
+
+
+class SharedQuota:
+    """Cluster-wide quota: replicas lease tokens in batches from a shared per-window counter.
+
+    Each ``(plugin_id, op)`` gets ``max_qps`` operations per window (one second, or ``1/max_qps``
+    seconds for sub-1 rates) across all processes. A process claims ``lease_fraction`` of the
+    window's allowance (at least ``min_lease`` tokens) at a time with a conditional increment on
+    ``plugin_quota_windows`` and spends it locally, so only one operation per lease pays a database
+    round trip. A claim is refused only once the window's allowance is really used up.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory: async_sessionmaker[AsyncSession],
+        lease_fraction: float = 0.1,
+        min_lease: int = 4,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._session_factory = session_factory
+        self._lease_fraction = min(1.0, max(0.0, lease_fraction))
+        self._min_lease = max(1, min_lease)
+        self._clock = clock
+        self._leases: dict[tuple[str, str], _Lease] = {}
+        self._next_prune_at = 0
+
+    async def acquire(self, *, plugin_id: str, op: str, qps: float) -> None:
+        key = (plugin_id, op)
+        window_sec, allowance = _window(qps)
+        window_start = int(self._clock() // window_sec) * window_sec
+
+        lease = self._leases.get(key)
+        if lease is not None and lease.window_start == window_start:
+            if lease.tokens > 0:
+                lease.tokens -= 1
+                return
+            if lease.exhausted:
+                raise _rate_limited(plugin_id=plugin_id, op=op, qps=qps)
+
+        lease_size = min(allowance, max(self._min_lease, math.ceil(allowance * self._lease_fraction)))
+        granted = await self._claim(
+            plugin_id=plugin_id,
+            op=op,
+            window_start=window_start,
+            requested=lease_size,
+            allowance=allowance,
+        )
+        lease = self._leases.get(key)
+        if lease is None or lease.window_start != window_start:
+            if len(self._leases) >= _EVICT_THRESHOLD:
+                self._leases = {
+                    lease_key: item for lease_key, item in self._leases.items() if item.window_start >= window_start
+                }
+            lease = self._leases[key] = _Lease(window_start=window_start, tokens=0)
+        if granted <= 0:
+            lease.exhausted = True
+            raise _rate_limited(plugin_id=plugin_id, op=op, qps=qps)
+        lease.tokens += granted - 1
+
+    async def _claim(self, *, plugin_id: str, op: str, window_start: int, requested: int, allowance: int) -> int:
+        window = (
+            PluginQuotaWindowRow.plugin_id == plugin_id,
+            PluginQuotaWindowRow.op == op,
+            PluginQuotaWindowRow.window_start == window_start,
+        )
+        while True:
+            try:
+                async with self._session_factory() as session, session.begin():
+                    await self._prune(session, window_start=window_start)
+                    while True:
+                        # Atomic in both SQLite and Postgres: the guard is re-checked against the row being updated.
+                        result = await session.execute(
+                            update(PluginQuotaWindowRow)
+                            .where(*window, PluginQuotaWindowRow.used + requested <= allowance)
+                            .values(used=PluginQuotaWindowRow.used + requested)
+                        )
+                        if result.rowcount == 1:
+                            return requested
+                        used = await session.scalar(select(PluginQuotaWindowRow.used).where(*window))
+                        if used is None:
+                            granted = min(requested, allowance)
+                            session.add(
+                                PluginQuotaWindowRow(
+                                    plugin_id=plugin_id, op=op, window_start=window_start, used=granted
+                                )
+                            )
+                            await session.flush()
+                            return granted
+                        if used >= allowance:
+                            return 0
+                        # Less than a full lease is left: take what remains instead of failing the caller.
+                        requested = allowance - used
+            except IntegrityError:
+                # Another process created the window row first; its increment path handles the retry.
+                continue
+
+    async def _prune(self, session: AsyncSession, *, window_start: int) -> None:
+        if window_start < self._next_prune_at:
+            return
+        cutoff = window_start - _WINDOW_RETENTION_SEC
+        await session.execute(delete(PluginQuotaWindowRow).where(PluginQuotaWindowRow.window_start < cutoff))
+        self._next_prune_at = window_start + _WINDOW_RETENTION_SEC
+
+
+def _window(qps: float) -> tuple[int, int]:
+    window_sec = max(1, math.ceil(1.0 / qps)) if qps > 0 else 1
+    return window_sec, max(1, math.floor(qps * window_sec))
+
+
+__all__ = ["LocalQuota", "PluginQuota", "SharedQuota"]
@@ -1,17 +1,42 @@
 from __future__ import annotations
 
+import asyncio
+import base64
 import hashlib
 import json
+import time
+import zlib
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
-from core.contracts.models import ActionEnvelope, ActionStatus, ActiveState, AuditEvent, ConfigRevision
-from sqlalchemy import func, select
+from core.contracts.models import (
+    ActionEnvelope,
+    ActionStatus,
+    ActiveState,
+    AuditEvent,
+    ConfigRevision,
+    ConfigRevisionMeta,
+)
+from sqlalchemy import delete, func, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import defer
 
-from .models import ActionRow, AppStateRow, AuditLogRow, ConfigRevisionRow
+from .config_delta import apply_delta, diff_payload
+from .config_pointer import replace_at_pointer, resolve_pointer
+from .config_views import ConfigViews
+from .models import ActionResultBlobRow, ActionRow, AppStateRow, AuditLogRow, ConfigRevisionRow
+
+ACTION_RESULT_INLINE_MAX_BYTES = 16_384
+ACTION_RESULT_BLOB_ENCODING = "zlib"
+CONFIG_SNAPSHOT_INTERVAL = 16
+CONFIG_ENCODING_FULL = "full"
+CONFIG_ENCODING_DELTA = "delta"
+_CONFIG_WRITE_ATTEMPTS = 3
+# Retention never purges actions that may still be picked up or reported on.
+_TERMINAL_ACTION_STATUSES = ("succeeded", "failed", "cancelled", "blocked")
 
 
 @dataclass(frozen=True)
@@ -20,13 +45,22 @@ class ActiveConfigSnapshot:
     revision: ConfigRevision
 
 
+class ConfigConflictError(RuntimeError):
+    """The active config changed between the caller's read and its write."""
+
+    def __init__(self, *, expected_revision: int | None, actual_revision: int | None) -> None:
+        super().__init__(f"Active config revision is {actual_revision}, expected {expected_revision}")
+        self.expected_revision = expected_revision
+        self.actual_revision = actual_revision
+
+
 def _as_utc(value: datetime) -> datetime:
     if value.tzinfo is None:
         return value.replace(tzinfo=UTC)
     return value.astimezone(UTC)
 
 
-def _canonical_json(payload: dict[str, Any]) -> str:
+def _canonical_json(payload: Any) -> str:
     return json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
 
 
@@ -34,6 +68,22 @@ def _sha256(serialized: str) -> str:
     return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
 
 
+def _encode_history_cursor(created_at: datetime, action_id: str) -> str:
+    token = f"{_as_utc(created_at).isoformat()}|{action_id}"
+    return base64.urlsafe_b64encode(token.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_history_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at_raw, action_id = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8").split("|", 1)
+        created_at = _as_utc(datetime.fromisoformat(created_at_raw))
+        UUID(action_id)
+    except (ValueError, UnicodeError) as exc:
+        raise ValueError("Invalid history cursor") from exc
+    return created_at, action_id
+
+
 def _merge_patch(base: Any, patch: Any) -> Any:
     if not isinstance(patch, dict):
         return patch
@@ -53,10 +103,60 @@ def _merge_patch(base: Any, patch: Any) -> Any:
 
 
 class ConfigRepository:
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        cache_revalidate_sec: float = 30.0,
+        snapshot_interval: int = CONFIG_SNAPSHOT_INTERVAL,
+    ):
         self._session_factory = session_factory
+        self._cache_revalidate_sec = max(0.0, cache_revalidate_sec)
+        self._snapshot_interval = max(1, snapshot_interval)
+        self._active_cache: ActiveConfigSnapshot | None = None
+        self._active_cache_checked_at = 0.0
+        self._active_cache_generation = 0
+        self._active_views: ConfigViews | None = None
 
     async def fetch_active(self) -> ActiveConfigSnapshot | None:
+        cached = self._active_cache
+        generation = self._active_cache_generation
+        if cached is not None:
+            if time.monotonic() - self._active_cache_checked_at < self._cache_revalidate_sec:
+                return cached
+            async with self._session_factory() as session:
+                state_seq = await session.scalar(select(AppStateRow.state_seq).where(AppStateRow.id == 1))
+            if state_seq is not None and int(state_seq) == cached.active_state.state_seq:
+                if generation == self._active_cache_generation:
+                    self._active_cache_checked_at = time.monotonic()
+                return cached
+
+        snapshot = await self._load_active()
+        if snapshot is not None and generation == self._active_cache_generation:
+            self._remember_active(snapshot)
+        return snapshot
+
+    async def fetch_active_views(self) -> ConfigViews | None:
+        snapshot = await self.fetch_active()
+        if snapshot is None:
+            return None
+        return self._views_for(snapshot.revision)
+
+    def _views_for(self, revision: ConfigRevision) -> ConfigViews:
+        views = self._active_views
+        if views is None or not views.matches(revision):
+            views = ConfigViews(revision)
+            self._active_views = views
+        return views
+
+    def invalidate_active_cache(self, *, state_seq: int | None = None) -> None:
+        cached = self._active_cache
+        if cached is not None and state_seq is not None and cached.active_state.state_seq >= state_seq:
+            return
+        self._active_cache_generation += 1
+        self._active_cache = None
+
+    async def _load_active(self) -> ActiveConfigSnapshot | None:
         async with self._session_factory() as session:
             state = await session.get(AppStateRow, 1)
             if state is None:
@@ -68,25 +168,52 @@ class ConfigRepository:
                 return None
             return ActiveConfigSnapshot(
                 active_state=self._to_active_state(state),
-                revision=self._to_config_revision(revision_row),
+                revision=self._to_config_revision(revision_row, await self._decode_payload(session, revision_row)),
             )
 
+    def _remember_active(self, snapshot: ActiveConfigSnapshot) -> None:
+        cached = self._active_cache
+        if cached is not None and cached.active_state.state_seq > snapshot.active_state.state_seq:
+            return
+        self._active_cache = snapshot
+        self._active_cache_checked_at = time.monotonic()
+
     async def fetch_revision(self, revision: int) -> ConfigRevision | None:
+        cached = self._active_cache
+        if cached is not None and cached.revision.revision == revision:
+            return cached.revision
         async with self._session_factory() as session:
             row = await session.scalar(select(ConfigRevisionRow).where(ConfigRevisionRow.revision == revision))
             if row is None:
                 return None
-            return self._to_config_revision(row)
+            return self._to_config_revision(row, await self._decode_payload(session, row))
 
-    async def list_revisions(self, *, limit: int = 100) -> list[ConfigRevision]:
+    async def list_revisions(self, *, limit: int = 100) -> list[ConfigRevisionMeta]:
         statement = (
-            select(ConfigRevisionRow)
+            select(
+                ConfigRevisionRow.revision,
+                ConfigRevisionRow.parent_revision,
+                ConfigRevisionRow.payload_sha256,
+                ConfigRevisionRow.source,
+                ConfigRevisionRow.created_at,
+                ConfigRevisionRow.created_by,
+            )
             .order_by(ConfigRevisionRow.revision.desc(), ConfigRevisionRow.id.desc())
             .limit(max(1, limit))
         )
         async with self._session_factory() as session:
-            rows = (await session.scalars(statement)).all()
-            return [self._to_config_revision(row) for row in rows]
+            rows = (await session.execute(statement)).all()
+        return [
+            ConfigRevisionMeta(
+                revision=int(row.revision),
+                parent_revision=int(row.parent_revision) if row.parent_revision is not None else None,
+                sha256=row.payload_sha256,
+                source=row.source,
+                created_at=_as_utc(row.created_at),
+                created_by=row.created_by,
+            )
+            for row in rows
+        ]
 
     async def create_revision(
         self,
@@ -95,50 +222,184 @@ class ConfigRepository:
         source: str,
         actor: str | None,
         reason: str | None = None,
+        expected_revision: int | None = None,
+    ) -> ActiveConfigSnapshot:
+        """Store ``payload`` as a new revision and activate it.
+
+        Without ``expected_revision`` a lost race on the active state is retried, since the payload
+        replaces the active one whatever it became; with it, any mismatch raises ``ConfigConflictError``.
+        """
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                async with self._session_factory() as session, session.begin():
+                    active = await self._lock_active(session, expected_revision=expected_revision)
+                    snapshot = await self._write_revision(
+                        session,
+                        active=active,
+                        payload=payload,
+                        source=source,
+                        actor=actor,
+                        reason=reason,
+                    )
+            except ConfigConflictError:
+                if expected_revision is not None or attempts >= _CONFIG_WRITE_ATTEMPTS:
+                    raise
+                continue
+            self._active_cache_generation += 1
+            self._remember_active(snapshot)
+            return snapshot
+
+    async def _lock_active(self, session: AsyncSession, *, expected_revision: int | None) -> AppStateRow | None:
+        active = await session.get(AppStateRow, 1, with_for_update=True, populate_existing=True)
+        if expected_revision is not None:
+            actual = int(active.active_revision) if active is not None else None
+            if actual != expected_revision:
+                raise ConfigConflictError(expected_revision=expected_revision, actual_revision=actual)
+        return active
+
+    async def _write_revision(
+        self,
+        session: AsyncSession,
+        *,
+        active: AppStateRow | None,
+        payload: dict[str, Any],
+        source: str,
+        actor: str | None,
+        reason: str | None,
     ) -> ActiveConfigSnapshot:
         serialized = _canonical_json(payload)
         payload_hash = _sha256(serialized)
+        stored_payload = json.loads(serialized)
         now = datetime.now(UTC)
 
-        async with self._session_factory() as session, session.begin():
-            active = await session.get(AppStateRow, 1)
-            max_revision = await session.scalar(select(func.max(ConfigRevisionRow.revision)))
-            next_revision = int(max_revision or 0) + 1
-            parent_revision = active.active_revision if active is not None else None
-
-            row = ConfigRevisionRow(
-                revision=next_revision,
-                parent_revision=parent_revision,
-                payload_json=serialized,
-                payload_sha256=payload_hash,
-                source=source,
-                created_at=now,
-                created_by=actor,
+        max_revision = await session.scalar(select(func.max(ConfigRevisionRow.revision)))
+        next_revision = int(max_revision or 0) + 1
+        parent_revision = int(active.active_revision) if active is not None else None
+        encoding, encoded, base_revision = await self._encode_payload(
+            session,
+            previous_revision=int(max_revision) if max_revision is not None else None,
+            payload=stored_payload,
+            serialized=serialized,
+            next_revision=next_revision,
+        )
+
+        row = ConfigRevisionRow(
+            revision=next_revision,
+            parent_revision=parent_revision,
+            payload_json=encoded,
+            payload_encoding=encoding,
+            base_revision=base_revision,
+            payload_sha256=payload_hash,
+            source=source,
+            created_at=now,
+            created_by=actor,
+        )
+        session.add(row)
+        await session.flush()
+
+        if active is None:
+            state = AppStateRow(
+                id=1,
+                active_revision=next_revision,
+                state_seq=1,
+                updated_at=now,
+                updated_by=actor,
+                reason=reason,
             )
-            session.add(row)
+            session.add(state)
             await session.flush()
+        else:
+            # Compare-and-set on state_seq: databases without row locks (SQLite) still reject a
+            # writer whose view of the active state went stale since it was read.
+            seen_seq = int(active.state_seq)
+            state_values = {
+                "active_revision": next_revision,
+                "state_seq": max(1, seen_seq + 1),
+                "updated_at": now,
+                "updated_by": actor,
+                "reason": reason,
+            }
+            result = await session.execute(
+                update(AppStateRow)
+                .where(AppStateRow.id == 1, AppStateRow.state_seq == seen_seq)
+                .values(**state_values)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount != 1:
+                raise ConfigConflictError(expected_revision=parent_revision, actual_revision=None)
+            state = AppStateRow(id=1, **state_values)
+        return ActiveConfigSnapshot(
+            active_state=self._to_active_state(state),
+            revision=self._to_config_revision(row, stored_payload),
+        )
 
-            if active is None:
-                state = AppStateRow(
-                    id=1,
-                    active_revision=next_revision,
-                    state_seq=1,
-                    updated_at=now,
-                    updated_by=actor,
-                    reason=reason,
+    async def _encode_payload(
+        self,
+        session: AsyncSession,
+        *,
+        previous_revision: int | None,
+        payload: dict[str, Any],
+        serialized: str,
+        next_revision: int,
+    ) -> tuple[str, str, int | None]:
+        if previous_revision is None:
+            return CONFIG_ENCODING_FULL, serialized, None
+        last_full = await session.scalar(
+            select(func.max(ConfigRevisionRow.revision)).where(
+                ConfigRevisionRow.payload_encoding == CONFIG_ENCODING_FULL
+            )
+        )
+        if last_full is None or next_revision - int(last_full) >= self._snapshot_interval:
+            return CONFIG_ENCODING_FULL, serialized, None
+
+        cached = self._active_cache
+        if cached is not None and cached.revision.revision == previous_revision:
+            previous_payload = cached.revision.payload
+        else:
+            previous_row = await session.scalar(
+                select(ConfigRevisionRow).where(ConfigRevisionRow.revision == previous_revision)
+            )
+            if previous_row is None:
+                return CONFIG_ENCODING_FULL, serialized, None
+            previous_payload = await self._decode_payload(session, previous_row)
+
+        delta = _canonical_json(diff_payload(previous_payload, payload))
+        if len(delta) >= len(serialized):
+            return CONFIG_ENCODING_FULL, serialized, None
+        return CONFIG_ENCODING_DELTA, delta, previous_revision
+
+    async def _decode_payload(self, session: AsyncSession, row: ConfigRevisionRow) -> dict[str, Any]:
+        if row.payload_encoding != CONFIG_ENCODING_DELTA:
+            payload = json.loads(row.payload_json)
+        else:
+            snapshot_revision = await session.scalar(
+                select(func.max(ConfigRevisionRow.revision)).where(
+                    ConfigRevisionRow.payload_encoding == CONFIG_ENCODING_FULL,
+                    ConfigRevisionRow.revision < row.revision,
                 )
-                session.add(state)
-            else:
-                active.active_revision = next_revision
-                active.state_seq = max(1, int(active.state_seq) + 1)
-                active.updated_at = now
-                active.updated_by = actor
-                active.reason = reason
-
-        snapshot = await self.fetch_active()
-        if snapshot is None:
-            raise RuntimeError("Active config state is not initialized after create_revision")
-        return snapshot
+            )
+            if snapshot_revision is None:
+                raise ValueError(f"Config revision {row.revision} has no base snapshot")
+            chain = (
+                await session.scalars(
+                    select(ConfigRevisionRow)
+                    .where(
+                        ConfigRevisionRow.revision >= snapshot_revision,
+                        ConfigRevisionRow.revision <= row.revision,
+                    )
+                    .order_by(ConfigRevisionRow.revision)
+                )
+            ).all()
+            payload = json.loads(chain[0].payload_json)
+            for link in chain[1:]:
+                payload = apply_delta(payload, json.loads(link.payload_json))
+            if _sha256(_canonical_json(payload)) != row.payload_sha256:
+                raise ValueError(f"Config revision {row.revision} failed checksum after delta decode")
+        if not isinstance(payload, dict):
+            raise ValueError("Stored config revision payload must be an object")
+        return payload
 
     async def patch_active(
         self,
@@ -146,14 +407,61 @@ class ConfigRepository:
         patch: dict[str, Any],
         actor: str | None,
         source: str = "patch",
+        path: str | None = None,
+        locate: Callable[[ConfigViews], str] | None = None,
+        expected_revision: int | None = None,
     ) -> ActiveConfigSnapshot:
-        active = await self.fetch_active()
-        if active is None:
-            raise RuntimeError("Cannot patch config without active revision")
-        merged = _merge_patch(active.revision.payload, patch)
-        if not isinstance(merged, dict):
-            raise ValueError("Config patch result must be an object")
-        return await self.create_revision(payload=merged, source=source, actor=actor, reason="config_patch")
+        """Merge ``patch`` into the active revision (or the object at ``path``) and activate the result.
+
+        The merge base is read inside the write transaction, never from the process cache, so a
+        concurrent write cannot be overwritten. ``locate`` resolves the target pointer against that
+        same revision (for item/group selectors). Without ``expected_revision`` a lost race is retried
+        on the new state; with it, any mismatch raises ``ConfigConflictError``.
+        """
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                async with self._session_factory() as session, session.begin():
+                    active = await self._lock_active(session, expected_revision=expected_revision)
+                    if active is None:
+                        raise RuntimeError("Cannot patch config without active revision")
+                    current = await self._revision_in_session(session, int(active.active_revision))
+                    pointer = locate(self._views_for(current)) if locate is not None else path
+                    if pointer is None:
+                        merged = _merge_patch(current.payload, patch)
+                    else:
+                        target = resolve_pointer(current.payload, pointer)
+                        if not isinstance(target, dict):
+                            raise ValueError(f"Config patch target {pointer!r} must be an object")
+                        merged = replace_at_pointer(current.payload, pointer, _merge_patch(target, patch))
+                    if not isinstance(merged, dict):
+                        raise ValueError("Config patch result must be an object")
+                    snapshot = await self._write_revision(
+                        session,
+                        active=active,
+                        payload=merged,
+                        source=source,
+                        actor=actor,
+                        reason="config_patch",
+                    )
+            except ConfigConflictError:
+                if expected_revision is not None or attempts >= _CONFIG_WRITE_ATTEMPTS:
+                    raise
+                continue
+            self._active_cache_generation += 1
+            self._remember_active(snapshot)
+            return snapshot
+
+    async def _revision_in_session(self, session: AsyncSession, revision: int) -> ConfigRevision:
+        cached = self._active_cache
+        if cached is not None and cached.revision.revision == revision:
+            # Revisions are immutable, so a cached payload for the locked revision is current.
+            return cached.revision
+        row = await session.scalar(select(ConfigRevisionRow).where(ConfigRevisionRow.revision == revision))
+        if row is None:
+            raise RuntimeError(f"Active config revision {revision} is missing")
+        return self._to_config_revision(row, await self._decode_payload(session, row))
 
     async def rollback_to(self, *, revision: int, actor: str | None, source: str = "rollback") -> ActiveConfigSnapshot:
         target = await self.fetch_revision(revision)
@@ -177,10 +485,7 @@ class ConfigRepository:
         )
 
     @staticmethod
-    def _to_config_revision(row: ConfigRevisionRow) -> ConfigRevision:
-        payload = json.loads(row.payload_json)
-        if not isinstance(payload, dict):
-            raise ValueError("Stored config revision payload must be an object")
+    def _to_config_revision(row: ConfigRevisionRow, payload: dict[str, Any]) -> ConfigRevision:
         return ConfigRevision(
             revision=int(row.revision),
             parent_revision=int(row.parent_revision) if row.parent_revision is not None else None,
@@ -193,8 +498,14 @@ class ConfigRepository:
 
 
 class ActionRepository:
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        result_inline_max_bytes: int = ACTION_RESULT_INLINE_MAX_BYTES,
+    ):
         self._session_factory = session_factory
+        self._result_inline_max_bytes = max(0, int(result_inline_max_bytes))
 
     async def create_queued(self, action: ActionEnvelope) -> ActionStatus:
         now = datetime.now(UTC)
@@ -221,6 +532,35 @@ class ActionRepository:
             raise RuntimeError("Action was not persisted")
         return status
 
+    async def create_batch(self, entries: Sequence[tuple[ActionEnvelope, str, dict[str, Any] | None]]) -> None:
+        """Insert ``(action, status, error)`` rows in one transaction, skipping ids that already exist."""
+        if not entries:
+            return
+        now = datetime.now(UTC)
+        ids = [str(action.id) for action, _, _ in entries]
+        async with self._session_factory() as session, session.begin():
+            existing = set((await session.scalars(select(ActionRow.id).where(ActionRow.id.in_(ids)))).all())
+            for action, status, error in entries:
+                if str(action.id) in existing:
+                    continue
+                session.add(
+                    ActionRow(
+                        id=str(action.id),
+                        type=action.type,
+                        capability=action.capability,
+                        requested_by=action.requested_by,
+                        requested_at=_as_utc(action.requested_at),
+                        status=status,
+                        payload_json=_canonical_json(action.payload),
+                        dry_run=bool(action.dry_run),
+                        idempotency_key=action.idempotency_key,
+                        trace_id=action.trace_id,
+                        error_json=_canonical_json(error) if error is not None else None,
+                        created_at=now,
+                        finished_at=now if status == "blocked" else None,
+                    )
+                )
+
     async def set_status(
         self,
         *,
@@ -240,13 +580,10 @@ class ActionRepository:
             if status in {"succeeded", "failed", "cancelled", "blocked"}:
                 row.finished_at = now
             if result is not None:
-                row.result_json = _canonical_json(result)
+                await self._store_result(session, row=row, result=result, now=now)
             if error is not None:
                 row.error_json = _canonical_json(error)
-
-        updated = await self.get(action_id)
-        if updated is None:
-            raise RuntimeError("Action disappeared after status update")
+            updated = self._to_action_status(row, result=result)
         return updated
 
     async def get(self, action_id: UUID) -> ActionStatus | None:
@@ -254,17 +591,111 @@ class ActionRepository:
             row = await session.get(ActionRow, str(action_id))
             if row is None:
                 return None
-            return self._to_action_status(row)
+            result = await self._load_external_result(session, row) if row.result_external else None
+            return self._to_action_status(row, result=result)
 
     async def list_history(self, *, limit: int = 100) -> list[ActionStatus]:
-        statement = select(ActionRow).order_by(ActionRow.created_at.desc()).limit(max(1, limit))
+        statement = (
+            select(ActionRow)
+            .options(defer(ActionRow.payload_json))
+            .order_by(ActionRow.created_at.desc())
+            .limit(max(1, limit))
+        )
         async with self._session_factory() as session:
             rows = (await session.scalars(statement)).all()
             return [self._to_action_status(row) for row in rows]
 
+    async def list_history_page(
+        self,
+        *,
+        limit: int = 100,
+        action_type: str | None = None,
+        status: str | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[ActionStatus], str | None]:
+        page_size = max(1, limit)
+        statement = select(ActionRow).options(defer(ActionRow.payload_json))
+        if action_type is not None:
+            statement = statement.where(ActionRow.type == action_type)
+        if status is not None:
+            statement = statement.where(ActionRow.status == status)
+        if cursor:
+            created_at, action_id = _decode_history_cursor(cursor)
+            statement = statement.where(tuple_(ActionRow.created_at, ActionRow.id) < tuple_(created_at, action_id))
+        statement = statement.order_by(ActionRow.created_at.desc(), ActionRow.id.desc()).limit(page_size + 1)
+
+        async with self._session_factory() as session:
+            rows = (await session.scalars(statement)).all()
+            items = [self._to_action_status(row) for row in rows[:page_size]]
+            next_cursor = None
+            if len(rows) > page_size:
+                last = rows[page_size - 1]
+                next_cursor = _encode_history_cursor(last.created_at, last.id)
+        return items, next_cursor
+
+    async def delete_older_than(self, cutoff: datetime, *, batch_size: int = 1000) -> int:
+        chunk = max(1, batch_size)
+        statement = (
+            select(ActionRow.id)
+            .where(ActionRow.created_at < _as_utc(cutoff), ActionRow.status.in_(_TERMINAL_ACTION_STATUSES))
+            .order_by(ActionRow.created_at, ActionRow.id)
+            .limit(chunk)
+        )
+        deleted = 0
+        while True:
+            async with self._session_factory() as session, session.begin():
+                ids = list((await session.scalars(statement)).all())
+                if not ids:
+                    return deleted
+                await session.execute(delete(ActionResultBlobRow).where(ActionResultBlobRow.action_id.in_(ids)))
+                await session.execute(delete(ActionRow).where(ActionRow.id.in_(ids)))
+            deleted += len(ids)
+            if len(ids) < chunk:
+                return deleted
+            await asyncio.sleep(0)
+
+    async def _store_result(
+        self,
+        session: AsyncSession,
+        *,
+        row: ActionRow,
+        result: dict[str, Any],
+        now: datetime,
+    ) -> None:
+        encoded = _canonical_json(result).encode("utf-8")
+        row.result_bytes = len(encoded)
+        if len(encoded) <= self._result_inline_max_bytes:
+            if row.result_external:
+                await session.execute(delete(ActionResultBlobRow).where(ActionResultBlobRow.action_id == row.id))
+            row.result_json = encoded.decode("utf-8")
+            row.result_external = False
+            return
+
+        blob = await session.get(ActionResultBlobRow, row.id)
+        if blob is None:
+            blob = ActionResultBlobRow(action_id=row.id, created_at=now)
+            session.add(blob)
+        blob.encoding = ACTION_RESULT_BLOB_ENCODING
+        blob.data = zlib.compress(encoded)
+        blob.raw_bytes = len(encoded)
+        row.result_json = None
+        row.result_external = True
+
     @staticmethod
-    def _to_action_status(row: ActionRow) -> ActionStatus:
-        result = json.loads(row.result_json) if row.result_json else None
+    async def _load_external_result(session: AsyncSession, row: ActionRow) -> dict[str, Any] | None:
+        blob = await session.get(ActionResultBlobRow, row.id)
+        if blob is None:
+            return None
+        if blob.encoding != ACTION_RESULT_BLOB_ENCODING:
+            raise ValueError(f"Unsupported action result encoding: {blob.encoding}")
+        decoded = json.loads(zlib.decompress(blob.data).decode("utf-8"))
+        return decoded if isinstance(decoded, dict) else None
+
+    @staticmethod
+    def _to_action_status(row: ActionRow, *, result: dict[str, Any] | None = None) -> ActionStatus:
+        if result is None and row.result_json:
+            loaded = json.loads(row.result_json)
+            result = loaded if isinstance(loaded, dict) else None
         error = json.loads(row.error_json) if row.error_json else None
         return ActionStatus(
             id=UUID(row.id),
@@ -274,7 +705,9 @@ class ActionRepository:
             requested_at=_as_utc(row.requested_at),
             status=row.status,
             dry_run=bool(row.dry_run),
-            result=result if isinstance(result, dict) else None,
+            result=result,
+            result_bytes=row.result_bytes,
+            result_truncated=bool(row.result_external) and result is None,
             error=error if isinstance(error, dict) else None,
         )
 
@@ -284,8 +717,13 @@ class AuditRepository:
         self._session_factory = session_factory
 
     async def append(self, event: AuditEvent) -> None:
+        await self.append_many([event])
+
+    async def append_many(self, events: Sequence[AuditEvent]) -> None:
+        if not events:
+            return
         async with self._session_factory() as session, session.begin():
-            session.add(
+            session.add_all(
                 AuditLogRow(
                     ts=_as_utc(event.ts),
                     actor=event.actor,
@@ -297,7 +735,28 @@ class AuditRepository:
                     reason=event.reason,
                     metadata_json=_canonical_json(event.metadata),
                 )
+                for event in events
             )
 
-
-__all__ = ["ActionRepository", "ActiveConfigSnapshot", "AuditRepository", "ConfigRepository"]
+    async def delete_older_than(self, cutoff: datetime, *, batch_size: int = 1000) -> int:
+        chunk = max(1, batch_size)
+        statement = (
+            select(AuditLogRow.id)
+            .where(AuditLogRow.ts < _as_utc(cutoff))
+            .order_by(AuditLogRow.ts, AuditLogRow.id)
+            .limit(chunk)
+        )
+        deleted = 0
+        while True:
+            async with self._session_factory() as session, session.begin():
+                ids = list((await session.scalars(statement)).all())
+                if not ids:
+                    return deleted
+                await session.execute(delete(AuditLogRow).where(AuditLogRow.id.in_(ids)))
+            deleted += len(ids)
+            if len(ids) < chunk:
+                return deleted
+            await asyncio.sleep(0)
+
+
+__all__ = ["ActionRepository", "ActiveConfigSnapshot", "AuditRepository", "ConfigConflictError", "ConfigRepository"]
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import UTC, datetime, timedelta
+
+from .repositories import ActionRepository, AuditRepository
+
+LOGGER = logging.getLogger(__name__)
+
+
+class HistoryRetentionWorker:
+    def __init__(
+        self,
+        *,
+        action_repository: ActionRepository,
+        audit_repository: AuditRepository,
+        actions_retention_days: int,
+        audit_retention_days: int,
+        batch_size: int,
+        interval_sec: float,
+    ) -> None:
+        self._action_repository = action_repository
+        self._audit_repository = audit_repository
+        self._actions_retention_days = max(1, actions_retention_days)
+        self._audit_retention_days = max(1, audit_retention_days)
+        self._batch_size = max(1, batch_size)
+        self._interval_sec = max(1.0, interval_sec)
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = asyncio.Event()
+
+    async def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._run(), name="history-retention")
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._task = None
+
+    async def run_once(self, *, now: datetime | None = None) -> tuple[int, int]:
+        current = now or datetime.now(UTC)
+        actions_pruned = await self._action_repository.delete_older_than(
+            current - timedelta(days=self._actions_retention_days),
+            batch_size=self._batch_size,
+        )
+        audit_pruned = await self._audit_repository.delete_older_than(
+            current - timedelta(days=self._audit_retention_days),
+            batch_size=self._batch_size,
+        )
+        return actions_pruned, audit_pruned
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                actions_pruned, audit_pruned = await self.run_once()
+                if actions_pruned or audit_pruned:
+                    LOGGER.info("History retention pruned actions=%d audit=%d", actions_pruned, audit_pruned)
+            except Exception:
+                LOGGER.exception("History retention pass failed")
+
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self._interval_sec)
+            except TimeoutError:
+                continue
+
+
+__all__ = ["HistoryRetentionWorker"]
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import json
 from collections.abc import Mapping
+from functools import partial
 from threading import Lock
 from typing import Any
 
 from core.contracts.storage import PluginStorageConfig
 
+from .cache import StorageReadCache
 from .errors import StorageQueryNotAllowed
 from .protocols import PluginStorage
 
+# Table names are non-empty identifiers, so the empty scope cannot collide with a table.
+_KV_SCOPE = ""
+
 
 class StorageModeRouter:
     def __init__(
@@ -18,39 +24,57 @@ class StorageModeRouter:
         universal_storage: PluginStorage,
         physical_storage: PluginStorage,
         lock_manager: Any | None = None,
+        read_cache: StorageReadCache | None = None,
     ) -> None:
         self._plugin_configs = dict(plugin_configs)
         self._universal_storage = universal_storage
         self._physical_storage = physical_storage
         self._lock_manager = lock_manager
+        self._read_cache = read_cache
         self._table_mode_overrides: dict[tuple[str, str], str] = {}
         self._guard = Lock()
 
     async def kv_get(self, *, plugin_id: str, key: str, secret: bool = False) -> Any | None:
         storage = self._storage_for(plugin_id, table=None)
-        return await storage.kv_get(plugin_id=plugin_id, key=key, secret=secret)
+        loader = partial(storage.kv_get, plugin_id=plugin_id, key=key, secret=secret)
+        # Decrypted secrets are never kept in memory.
+        if self._read_cache is None or secret:
+            return await loader()
+        return await self._read_cache.read(plugin_id=plugin_id, scope=_KV_SCOPE, key=("kv", key), loader=loader)
 
     async def kv_set(self, *, plugin_id: str, key: str, value: Any, secret: bool = False) -> None:
         storage = self._storage_for(plugin_id, table=None)
         await storage.kv_set(plugin_id=plugin_id, key=key, value=value, secret=secret)
+        await self._invalidate(plugin_id=plugin_id, scope=_KV_SCOPE)
 
     async def kv_delete(self, *, plugin_id: str, key: str) -> bool:
         storage = self._storage_for(plugin_id, table=None)
-        return await storage.kv_delete(plugin_id=plugin_id, key=key)
+        deleted = await storage.kv_delete(plugin_id=plugin_id, key=key)
+        if deleted:
+            await self._invalidate(plugin_id=plugin_id, scope=_KV_SCOPE)
+        return deleted
 
     async def table_get(self, *, plugin_id: str, table: str, pk: Any) -> dict[str, Any] | None:
         storage = self._storage_for(plugin_id, table=table)
-        return await storage.table_get(plugin_id=plugin_id, table=table, pk=pk)
+        loader = partial(storage.table_get, plugin_id=plugin_id, table=table, pk=pk)
+        if self._read_cache is None:
+            return await loader()
+        return await self._read_cache.read(plugin_id=plugin_id, scope=table, key=("get", _key_part(pk)), loader=loader)
 
     async def table_upsert(self, *, plugin_id: str, table: str, row: Mapping[str, Any]) -> dict[str, Any]:
         self._ensure_write_allowed(plugin_id=plugin_id, table=table, operation="table_upsert")
         storage = self._storage_for(plugin_id, table=table)
-        return await storage.table_upsert(plugin_id=plugin_id, table=table, row=row)
+        stored = await storage.table_upsert(plugin_id=plugin_id, table=table, row=row)
+        await self._invalidate(plugin_id=plugin_id, scope=table)
+        return stored
 
     async def table_delete(self, *, plugin_id: str, table: str, pk: Any) -> bool:
         self._ensure_write_allowed(plugin_id=plugin_id, table=table, operation="table_delete")
         storage = self._storage_for(plugin_id, table=table)
-        return await storage.table_delete(plugin_id=plugin_id, table=table, pk=pk)
+        deleted = await storage.table_delete(plugin_id=plugin_id, table=table, pk=pk)
+        if deleted:
+            await self._invalidate(plugin_id=plugin_id, scope=table)
+        return deleted
 
     async def table_query(
         self,
@@ -61,7 +85,38 @@ class StorageModeRouter:
         limit: int | None = None,
     ) -> list[dict[str, Any]]:
         storage = self._storage_for(plugin_id, table=table)
-        return await storage.table_query(plugin_id=plugin_id, table=table, where=where, limit=limit)
+        loader = partial(storage.table_query, plugin_id=plugin_id, table=table, where=where, limit=limit)
+        if self._read_cache is None:
+            return await loader()
+        key = ("query", _key_part(where), limit)
+        return await self._read_cache.read(plugin_id=plugin_id, scope=table, key=key, loader=loader)
+
+    async def table_scan(
+        self,
+        *,
+        plugin_id: str,
+        table: str,
+        where: Mapping[str, Any] | None = None,
+        order_by: str | None = None,
+        descending: bool = False,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        storage = self._storage_for(plugin_id, table=table)
+        loader = partial(
+            storage.table_scan,
+            plugin_id=plugin_id,
+            table=table,
+            where=where,
+            order_by=order_by,
+            descending=descending,
+            cursor=cursor,
+            limit=limit,
+        )
+        if self._read_cache is None:
+            return await loader()
+        key = ("scan", _key_part(where or {}), order_by, descending, cursor, limit)
+        return await self._read_cache.read(plugin_id=plugin_id, scope=table, key=key, loader=loader)
 
     def set_table_mode(self, *, plugin_id: str, table: str, mode: str) -> None:
         normalized_mode = mode.strip()
@@ -69,6 +124,8 @@ class StorageModeRouter:
             raise StorageQueryNotAllowed(f"Unsupported storage mode '{mode}'")
         with self._guard:
             self._table_mode_overrides[(plugin_id, table)] = normalized_mode
+        if self._read_cache is not None:
+            self._read_cache.forget(plugin_id=plugin_id, scope=table)
 
     def get_plugin_config(self, plugin_id: str) -> PluginStorageConfig:
         config = self._plugin_configs.get(plugin_id)
@@ -79,6 +136,8 @@ class StorageModeRouter:
     def clear_table_mode_override(self, *, plugin_id: str, table: str) -> None:
         with self._guard:
             self._table_mode_overrides.pop((plugin_id, table), None)
+        if self._read_cache is not None:
+            self._read_cache.forget(plugin_id=plugin_id, scope=table)
 
     def get_table_mode(self, *, plugin_id: str, table: str) -> str:
         config = self._plugin_configs.get(plugin_id)
@@ -106,6 +165,10 @@ class StorageModeRouter:
 
         raise StorageQueryNotAllowed(f"Unsupported storage mode '{resolved_mode}' for plugin '{plugin_id}'")
 
+    async def _invalidate(self, *, plugin_id: str, scope: str) -> None:
+        if self._read_cache is not None:
+            await self._read_cache.invalidate(plugin_id=plugin_id, scope=scope)
+
     def _ensure_write_allowed(self, *, plugin_id: str, table: str, operation: str) -> None:
         if self._lock_manager is None:
             return
@@ -116,4 +179,8 @@ class StorageModeRouter:
             )
 
 
+def _key_part(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
 __all__ = ["StorageModeRouter"]
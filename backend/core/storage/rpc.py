@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Mapping
 from contextlib import suppress
 from dataclasses import dataclass
@@ -8,7 +9,7 @@ from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from core.contracts.storage import StorageRpcRequest, StorageRpcResponse
+from core.contracts.storage import PluginStorageConfig, StorageRpcRequest, StorageRpcResponse
 
 from .errors import (
     StorageDdlNotAllowed,
@@ -133,6 +134,19 @@ class InProcStorageRPC:
             )
             return {"rows": rows}
 
+        if request.op == "table.scan":
+            table = _require_text(request.table, "table")
+            rows, next_cursor = await self._storage.table_scan(
+                plugin_id=request.plugin_id,
+                table=table,
+                where=request.where,
+                order_by=request.order_by,
+                descending=bool(request.descending),
+                cursor=request.cursor,
+                limit=request.limit,
+            )
+            return {"rows": rows, "next_cursor": next_cursor}
+
         raise StorageQueryNotAllowed(f"Unsupported storage operation: {request.op}")
 
     async def kv_get(self, *, plugin_id: str, key: str, secret: bool = False) -> Any | None:
@@ -242,6 +256,31 @@ class InProcStorageRPC:
                 normalized_rows.append(item)
         return normalized_rows
 
+    async def table_scan(
+        self,
+        *,
+        plugin_id: str,
+        table: str,
+        where: Mapping[str, Any] | None = None,
+        order_by: str | None = None,
+        descending: bool = False,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        response = await self.call(
+            StorageRpcRequest(
+                plugin_id=plugin_id,
+                op="table.scan",
+                table=table,
+                where=dict(where or {}),
+                order_by=order_by,
+                descending=descending,
+                cursor=cursor,
+                limit=limit,
+            )
+        )
+        return _scan_page(_ensure_ok(response))
+
 
 class BusStorageRPC:
     def __init__(
@@ -266,7 +305,10 @@ class BusStorageRPC:
         )
 
         try:
-            await self._bus.publish(queue_name=self._queue_name, message=envelope)
+            try:
+                await self._bus.publish(queue_name=self._queue_name, message=envelope)
+            except StorageError as exc:
+                return StorageRpcResponse(id=request.id, ok=False, error=_error_payload(exc))
             while True:
                 try:
                     message = await asyncio.wait_for(queue.get(), timeout=self._timeout_sec)
@@ -391,8 +433,42 @@ class BusStorageRPC:
                 normalized_rows.append(item)
         return normalized_rows
 
+    async def table_scan(
+        self,
+        *,
+        plugin_id: str,
+        table: str,
+        where: Mapping[str, Any] | None = None,
+        order_by: str | None = None,
+        descending: bool = False,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        response = await self.call(
+            StorageRpcRequest(
+                plugin_id=plugin_id,
+                op="table.scan",
+                table=table,
+                where=dict(where or {}),
+                order_by=order_by,
+                descending=descending,
+                cursor=cursor,
+                limit=limit,
+            )
+        )
+        return _scan_page(_ensure_ok(response))
+
 
 class StorageRpcConsumer:
+    """Serves storage RPC concurrently while keeping requests for the same plugin key in order.
+
+    Requests are grouped into lanes by ``(plugin_id, table, key)``; each lane runs serially, lanes run in
+    parallel up to ``concurrency`` (size it to the DB pool). Upserts are keyed by the row's primary key from
+    ``plugin_configs``; for tables without a known spec every keyed table operation shares the table lane.
+    A plugin may hold at most ``max_inflight_per_plugin`` of those slots, so one noisy plugin cannot starve
+    the rest. Once ``max_pending`` requests are waiting, new ones are rejected with ``StorageRateLimited``.
+    """
+
     def __init__(
         self,
         *,
@@ -400,6 +476,10 @@ class StorageRpcConsumer:
         storage: PluginStorage,
         queue_name: str = STORAGE_RPC_QUEUE,
         capabilities: Mapping[str, set[str]] | None = None,
+        concurrency: int = 8,
+        max_inflight_per_plugin: int | None = None,
+        max_pending: int = 1024,
+        plugin_configs: Mapping[str, PluginStorageConfig] | None = None,
     ) -> None:
         self._bus = bus
         self._queue_name = queue_name
@@ -407,6 +487,20 @@ class StorageRpcConsumer:
         self._inproc = InProcStorageRPC(storage=storage)
         self._task: asyncio.Task[None] | None = None
         self._ready = asyncio.Event()
+        self._concurrency = max(1, concurrency)
+        self._max_inflight_per_plugin = max(1, min(max_inflight_per_plugin or self._concurrency, self._concurrency))
+        self._max_pending = max(1, max_pending)
+        self._slots = asyncio.Semaphore(self._concurrency)
+        self._plugin_slots: dict[str, asyncio.Semaphore] = {}
+        self._plugin_lanes: dict[str, int] = {}
+        self._primary_keys = {
+            (plugin_id, table.name): table.primary_key
+            for plugin_id, config in (plugin_configs or {}).items()
+            for table in config.tables
+        }
+        self._lanes: dict[tuple[str, str | None, str | None], deque[StorageRpcEnvelope]] = {}
+        self._lane_tasks: set[asyncio.Task[None]] = set()
+        self._pending = 0
 
     async def start(self) -> None:
         if self._task is not None and not self._task.done():
@@ -422,10 +516,18 @@ class StorageRpcConsumer:
     async def stop(self) -> None:
         if self._task is None:
             return
-        self._task.cancel()
-        with suppress(asyncio.CancelledError):
-            await self._task
+        tasks = [self._task, *self._lane_tasks]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
         self._task = None
+        self._lane_tasks.clear()
+        self._lanes.clear()
+        self._plugin_slots.clear()
+        self._plugin_lanes.clear()
+        self._pending = 0
         self._ready = asyncio.Event()
 
     async def _run(self) -> None:
@@ -436,12 +538,60 @@ class StorageRpcConsumer:
                 envelope = await queue.get()
                 if not isinstance(envelope, StorageRpcEnvelope):
                     continue
-                response = await self._handle_request(envelope.request)
-                reply = StorageRpcReply(correlation_id=envelope.correlation_id, response=response)
-                await self._bus.publish(queue_name=envelope.reply_to, message=reply)
+                if self._pending >= self._max_pending:
+                    error = StorageRateLimited(f"Storage RPC consumer is saturated ({self._pending} pending)")
+                    response = StorageRpcResponse(id=envelope.request.id, ok=False, error=_error_payload(error))
+                    await self._reply(envelope, response)
+                    continue
+                self._enqueue(envelope)
         finally:
             self._bus.unsubscribe(queue_name=self._queue_name, queue=queue)
 
+    def _enqueue(self, envelope: StorageRpcEnvelope) -> None:
+        self._pending += 1
+        lane_key = _ordering_key(envelope.request, self._primary_keys)
+        lane = self._lanes.get(lane_key)
+        if lane is not None:
+            lane.append(envelope)
+            return
+        self._lanes[lane_key] = deque((envelope,))
+        plugin_id = lane_key[0]
+        self._plugin_lanes[plugin_id] = self._plugin_lanes.get(plugin_id, 0) + 1
+        if plugin_id not in self._plugin_slots:
+            self._plugin_slots[plugin_id] = asyncio.Semaphore(self._max_inflight_per_plugin)
+        task = asyncio.create_task(self._drain_lane(lane_key), name="storage-rpc-lane")
+        self._lane_tasks.add(task)
+        task.add_done_callback(self._lane_tasks.discard)
+
+    async def _drain_lane(self, lane_key: tuple[str, str | None, str | None]) -> None:
+        lane = self._lanes[lane_key]
+        plugin_id = lane_key[0]
+        plugin_slots = self._plugin_slots[plugin_id]
+        try:
+            while lane:
+                envelope = lane[0]
+                # Plugin slot first: a plugin at its cap waits without holding a shared slot.
+                async with plugin_slots, self._slots:
+                    response = await self._handle_request(envelope.request)
+                await self._reply(envelope, response)
+                lane.popleft()
+                self._pending -= 1
+        finally:
+            self._pending -= len(lane)
+            self._lanes.pop(lane_key, None)
+            # Only lanes hold plugin slots, so the semaphore is idle once the plugin's last lane ends.
+            remaining = self._plugin_lanes.get(plugin_id, 1) - 1
+            if remaining > 0:
+                self._plugin_lanes[plugin_id] = remaining
+            else:
+                self._plugin_lanes.pop(plugin_id, None)
+                self._plugin_slots.pop(plugin_id, None)
+
+    async def _reply(self, envelope: StorageRpcEnvelope, response: StorageRpcResponse) -> None:
+        reply = StorageRpcReply(correlation_id=envelope.correlation_id, response=response)
+        with suppress(StorageError):
+            await self._bus.publish(queue_name=envelope.reply_to, message=reply)
+
     async def _handle_request(self, request: StorageRpcRequest) -> StorageRpcResponse:
         if not self._is_allowed(plugin_id=request.plugin_id, op=request.op):
             error = StorageQueryNotAllowed(f"Operation '{request.op}' is not allowed for plugin '{request.plugin_id}'")
@@ -457,6 +607,24 @@ class StorageRpcConsumer:
         return op in allowed
 
 
+def _ordering_key(
+    request: StorageRpcRequest, primary_keys: Mapping[tuple[str, str], str]
+) -> tuple[str, str | None, str | None]:
+    # Table queries and scans have no key; they share one lane per table.
+    if request.table is None:
+        return request.plugin_id, None, None if request.key is None else str(request.key)
+    if request.op in ("table.query", "table.scan"):
+        return request.plugin_id, request.table, None
+    primary_key = primary_keys.get((request.plugin_id, request.table))
+    if primary_key is None:
+        # Without the table spec an upsert's key is unknown, so keyed operations cannot be split by it.
+        return request.plugin_id, request.table, None
+    if request.op == "table.upsert":
+        row = request.row or {}
+        return request.plugin_id, request.table, None if row.get(primary_key) is None else str(row[primary_key])
+    return request.plugin_id, request.table, None if request.key is None else str(request.key)
+
+
 def _require_text(value: Any | None, field: str) -> str:
     if value is None:
         raise StorageQueryNotAllowed(f"Storage request field '{field}' is required")
@@ -478,6 +646,14 @@ def _require_value(value: Any | None, field: str) -> Any:
     return value
 
 
+def _scan_page(payload: Mapping[str, Any]) -> tuple[list[dict[str, Any]], str | None]:
+    rows = payload.get("rows", [])
+    next_cursor = payload.get("next_cursor")
+    if not isinstance(rows, list) or not (next_cursor is None or isinstance(next_cursor, str)):
+        raise StorageError("Invalid table.scan response payload")
+    return [item for item in rows if isinstance(item, dict)], next_cursor
+
+
 def _ensure_ok(response: StorageRpcResponse) -> Mapping[str, Any]:
     if response.ok:
         result = response.result or {}
@@ -1,26 +1,22 @@
 from __future__ import annotations
 
 import asyncio
-from contextlib import suppress
 from typing import Any
 
+from .errors import StorageRateLimited
+
 
 class StorageRpcBus:
     def __init__(self) -> None:
         self._queues: dict[str, set[asyncio.Queue[Any]]] = {}
-        self._lock = asyncio.Lock()
 
     async def publish(self, *, queue_name: str, message: Any) -> None:
-        async with self._lock:
-            subscribers = tuple(self._queues.get(queue_name, ()))
-            for queue in subscribers:
-                if queue.full():
-                    with suppress(asyncio.QueueEmpty):
-                        queue.get_nowait()
-                try:
-                    queue.put_nowait(message)
-                except asyncio.QueueFull:
-                    continue
+        subscribers = tuple(self._queues.get(queue_name, ()))
+        # Reject instead of evicting: a dropped request would only surface as a caller timeout.
+        if any(queue.full() for queue in subscribers):
+            raise StorageRateLimited(f"Storage RPC queue '{queue_name}' is saturated")
+        for queue in subscribers:
+            queue.put_nowait(message)
 
     def subscribe(self, *, queue_name: str, queue_size: int = 256) -> asyncio.Queue[Any]:
         queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=max(1, queue_size))
@@ -1,19 +1,25 @@
 from __future__ import annotations
 
 import json
-import threading
+import struct
 from collections.abc import Mapping
-from dataclasses import dataclass
 from datetime import UTC, datetime
-from time import monotonic
+from functools import cache
 from typing import Any
 
 from core.contracts.storage import PluginStorageConfig, StorageLimits, StorageTableSpec
-from sqlalchemy import delete, func, select
+from sqlalchemy import ColumnElement, Select, and_, delete, exists, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import aliased
 
-from .errors import StorageLimitExceeded, StorageQueryNotAllowed, StorageRateLimited
+from .errors import StorageLimitExceeded, StorageQueryNotAllowed
 from .models import PluginIndexRow, PluginKvRow, PluginRow
+from .query import ScanPredicate, decode_scan_cursor, encode_scan_cursor, parse_where
+from .quota import LocalQuota, PluginQuota
+
+_SORT_TAG_BOOL = "1"
+_SORT_TAG_NUMBER = "2"
+_SORT_TAG_STRING = "3"
 
 
 def _utc_now() -> datetime:
@@ -47,39 +53,21 @@ def _encode_pk(value: Any) -> str:
     return _canonical_json(value)
 
 
-@dataclass
-class _TokenBucket:
-    tokens: float
-    updated_at: float
-
-
-class _RateLimiter:
-    def __init__(self) -> None:
-        self._buckets: dict[tuple[str, str], _TokenBucket] = {}
-        self._lock = threading.Lock()
-
-    def consume(self, *, plugin_id: str, op: str, qps: float) -> None:
-        key = (plugin_id, op)
-        now = monotonic()
-        capacity = max(1.0, qps)
-        refill_rate = qps
-
-        with self._lock:
-            bucket = self._buckets.get(key)
-            if bucket is None:
-                self._buckets[key] = _TokenBucket(tokens=capacity - 1.0, updated_at=now)
-                return
-
-            elapsed = max(0.0, now - bucket.updated_at)
-            bucket.tokens = min(capacity, bucket.tokens + elapsed * refill_rate)
-            bucket.updated_at = now
-
-            if bucket.tokens < 1.0:
-                raise StorageRateLimited(
-                    f"Rate limit exceeded for plugin '{plugin_id}' operation '{op}' (max_qps={qps})"
-                )
+def _encode_sort_key(value: Any) -> str:
+    """Order-preserving text form of an indexed scalar: ranges and ``ORDER BY`` work on plain string comparison.
 
-            bucket.tokens -= 1.0
+    Values of different types order by type (booleans, then numbers, then strings); numbers use the
+    IEEE 754 bit pattern flipped so that its hex digits sort numerically.
+    """
+    if isinstance(value, bool):
+        return f"{_SORT_TAG_BOOL}{int(value)}"
+    if isinstance(value, int | float):
+        bits = struct.unpack(">Q", struct.pack(">d", float(value)))[0]
+        bits = bits ^ 0xFFFF_FFFF_FFFF_FFFF if bits >> 63 else bits | 1 << 63
+        return f"{_SORT_TAG_NUMBER}{bits:016x}"
+    if isinstance(value, str):
+        return f"{_SORT_TAG_STRING}{value}"
+    raise StorageQueryNotAllowed("Indexed fields support only scalar values")
 
 
 class UniversalStorage:
@@ -88,6 +76,7 @@ class UniversalStorage:
         *,
         session_factory: async_sessionmaker[AsyncSession],
         plugin_configs: Mapping[str, PluginStorageConfig],
+        quota: PluginQuota | None = None,
     ) -> None:
         self._session_factory = session_factory
         self._plugin_configs = dict(plugin_configs)
@@ -95,11 +84,11 @@ class UniversalStorage:
             plugin_id: {table.name: table for table in config.tables}
             for plugin_id, config in self._plugin_configs.items()
         }
-        self._rate_limiter = _RateLimiter()
+        self._quota = quota or LocalQuota()
 
     async def kv_get(self, *, plugin_id: str, key: str, secret: bool = False) -> Any | None:
         limits = self._limits_for(plugin_id)
-        self._enforce_rate_limit(plugin_id=plugin_id, op="kv.get", limits=limits)
+        await self._enforce_rate_limit(plugin_id=plugin_id, op="kv.get", limits=limits)
 
         async with self._session_factory() as session:
             row = await session.scalar(
@@ -116,7 +105,7 @@ class UniversalStorage:
 
     async def kv_set(self, *, plugin_id: str, key: str, value: Any, secret: bool = False) -> None:
         limits = self._limits_for(plugin_id)
-        self._enforce_rate_limit(plugin_id=plugin_id, op="kv.set", limits=limits)
+        await self._enforce_rate_limit(plugin_id=plugin_id, op="kv.set", limits=limits)
 
         serialized = _canonical_json(value)
         value_bytes = _as_bytes(serialized)
@@ -150,7 +139,7 @@ class UniversalStorage:
 
     async def kv_delete(self, *, plugin_id: str, key: str) -> bool:
         limits = self._limits_for(plugin_id)
-        self._enforce_rate_limit(plugin_id=plugin_id, op="kv.delete", limits=limits)
+        await self._enforce_rate_limit(plugin_id=plugin_id, op="kv.delete", limits=limits)
 
         async with self._session_factory() as session, session.begin():
             row = await session.scalar(
@@ -166,7 +155,7 @@ class UniversalStorage:
 
     async def table_get(self, *, plugin_id: str, table: str, pk: Any) -> dict[str, Any] | None:
         limits = self._limits_for(plugin_id)
-        self._enforce_rate_limit(plugin_id=plugin_id, op="table.get", limits=limits)
+        await self._enforce_rate_limit(plugin_id=plugin_id, op="table.get", limits=limits)
         _ = self._table_spec(plugin_id=plugin_id, table=table)
 
         encoded_pk = _encode_pk(pk)
@@ -212,7 +201,7 @@ class UniversalStorage:
     ) -> dict[str, Any]:
         limits = self._limits_for(plugin_id)
         if enforce_rate_limit:
-            self._enforce_rate_limit(plugin_id=plugin_id, op="table.upsert", limits=limits)
+            await self._enforce_rate_limit(plugin_id=plugin_id, op="table.upsert", limits=limits)
 
         table_spec = self._table_spec(plugin_id=plugin_id, table=table)
         payload = dict(row)
@@ -223,6 +212,7 @@ class UniversalStorage:
             )
 
         encoded_pk = _encode_pk(payload[table_spec.primary_key])
+        pk_sort_key = _encode_sort_key(payload[table_spec.primary_key])
         serialized = _canonical_json(payload)
         row_bytes = _as_bytes(serialized)
         if row_bytes > limits.max_row_bytes:
@@ -259,12 +249,14 @@ class UniversalStorage:
                         plugin_id=plugin_id,
                         table_name=table,
                         pk=encoded_pk,
+                        sort_key=pk_sort_key,
                         row_json=serialized,
                         updated_at=now,
                         row_bytes=row_bytes,
                     )
                 )
             else:
+                existing.sort_key = pk_sort_key
                 existing.row_json = serialized
                 existing.updated_at = now
                 existing.row_bytes = row_bytes
@@ -289,6 +281,7 @@ class UniversalStorage:
                         table_name=table,
                         index_name=field,
                         index_value=_encode_index_value(value),
+                        sort_key=_encode_sort_key(value),
                         pk=encoded_pk,
                         updated_at=now,
                     )
@@ -298,7 +291,7 @@ class UniversalStorage:
 
     async def table_delete(self, *, plugin_id: str, table: str, pk: Any) -> bool:
         limits = self._limits_for(plugin_id)
-        self._enforce_rate_limit(plugin_id=plugin_id, op="table.delete", limits=limits)
+        await self._enforce_rate_limit(plugin_id=plugin_id, op="table.delete", limits=limits)
         _ = self._table_spec(plugin_id=plugin_id, table=table)
 
         encoded_pk = _encode_pk(pk)
@@ -332,70 +325,164 @@ class UniversalStorage:
         limit: int | None = None,
     ) -> list[dict[str, Any]]:
         limits = self._limits_for(plugin_id)
-        self._enforce_rate_limit(plugin_id=plugin_id, op="table.query", limits=limits)
+        await self._enforce_rate_limit(plugin_id=plugin_id, op="table.query", limits=limits)
 
         table_spec = self._table_spec(plugin_id=plugin_id, table=table)
-        predicates = dict(where)
-        if not predicates:
+        if not where:
             raise StorageQueryNotAllowed("table_query requires non-empty where")
+        predicates = parse_where(where, allowed_fields={table_spec.primary_key, *table_spec.indexes}, table=table)
 
-        allowed_fields = {table_spec.primary_key, *table_spec.indexes}
-        for field, value in predicates.items():
-            if field not in allowed_fields:
-                raise StorageQueryNotAllowed(f"Field '{field}' is not queryable for table '{table}'")
-            if not _is_scalar(value):
-                raise StorageQueryNotAllowed("table_query supports equality AND on scalar values only")
-
-        clamped_limit = self._clamp_query_limit(limit=limit, limits=limits)
+        statement = self._scan_statement(
+            plugin_id=plugin_id,
+            table_spec=table_spec,
+            predicates=predicates,
+            order_by=table_spec.primary_key,
+            descending=False,
+            after=None,
+        )
+        rows = await self._load_rows(statement.limit(self._clamp_query_limit(limit=limit, limits=limits)))
+        return [row for _, row in rows]
 
-        async with self._session_factory() as session:
-            candidate_sets: list[set[str]] = []
+    async def table_scan(
+        self,
+        *,
+        plugin_id: str,
+        table: str,
+        where: Mapping[str, Any] | None = None,
+        order_by: str | None = None,
+        descending: bool = False,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        limits = self._limits_for(plugin_id)
+        await self._enforce_rate_limit(plugin_id=plugin_id, op="table.scan", limits=limits)
 
-            for field, value in predicates.items():
-                if field == table_spec.primary_key:
-                    candidate_sets.append({_encode_pk(value)})
-                    continue
+        table_spec = self._table_spec(plugin_id=plugin_id, table=table)
+        allowed_fields = {table_spec.primary_key, *table_spec.indexes}
+        predicates = parse_where(where or {}, allowed_fields=allowed_fields, table=table)
+        order_field = order_by or table_spec.primary_key
+        if order_field not in allowed_fields:
+            raise StorageQueryNotAllowed(f"Field '{order_field}' is not orderable for table '{table}'")
+        after = None if cursor is None else decode_scan_cursor(cursor, order_by=order_field)
+
+        page_size = self._clamp_query_limit(limit=limit, limits=limits)
+        statement = self._scan_statement(
+            plugin_id=plugin_id,
+            table_spec=table_spec,
+            predicates=predicates,
+            order_by=order_field,
+            descending=descending,
+            after=after,
+        )
+        rows = await self._load_rows(statement.limit(page_size + 1))
+        page = [row for _, row in rows[:page_size]]
+        next_cursor = None
+        if len(rows) > page_size:
+            last = page[-1]
+            next_cursor = encode_scan_cursor(
+                order_by=order_field,
+                value=last.get(order_field),
+                pk=last.get(table_spec.primary_key),
+            )
+        return page, next_cursor
 
-                pks = set(
-                    (
-                        await session.scalars(
-                            select(PluginIndexRow.pk).where(
-                                PluginIndexRow.plugin_id == plugin_id,
-                                PluginIndexRow.table_name == table,
-                                PluginIndexRow.index_name == field,
-                                PluginIndexRow.index_value == _encode_index_value(value),
-                            )
-                        )
-                    ).all()
+    def _scan_statement(
+        self,
+        *,
+        plugin_id: str,
+        table_spec: StorageTableSpec,
+        predicates: list[ScanPredicate],
+        order_by: str,
+        descending: bool,
+        after: tuple[Any, Any] | None,
+    ) -> Select[tuple[str, str]]:
+        """One keyset-paginated statement over ``plugin_rows``.
+
+        An equality predicate on an indexed field drives the scan through its ``index_value`` lookup
+        and the matching rows are sorted; without one, the order field drives it: ordering by the
+        primary key walks ``plugin_rows`` by its ``sort_key``, ordering by an indexed field walks its
+        ``plugin_indexes`` entries by ``sort_key``. Either way rows without a value for an indexed
+        order field are not returned, and range predicates on other fields are ``EXISTS`` probes.
+        """
+        table = table_spec.name
+        statement = select(PluginRow.pk, PluginRow.row_json).where(
+            PluginRow.plugin_id == plugin_id,
+            PluginRow.table_name == table,
+        )
+        driven = any(
+            predicate.op == "eq" and predicate.field not in (table_spec.primary_key, order_by)
+            for predicate in predicates
+        )
+        driver: Any = None
+        if order_by == table_spec.primary_key:
+            order_key: Any = PluginRow.sort_key
+            tie_key: Any = PluginRow.pk
+        else:
+            driver = _index_alias(0)
+            statement = statement.join(
+                driver,
+                and_(
+                    driver.plugin_id == PluginRow.plugin_id,
+                    driver.table_name == PluginRow.table_name,
+                    driver.pk == PluginRow.pk,
+                    driver.index_name == order_by,
+                ),
+            )
+            order_key = driver.sort_key
+            tie_key = driver.pk
+        if driven:
+            # SQLite has no statistics to tell a selective lookup from an ordered walk and prefers the
+            # walk; ordering by an expression instead of the indexed column leaves it the lookup.
+            order_key = order_key.concat("")
+        if after is not None:
+            cursor_value = after[1] if order_by == table_spec.primary_key else after[0]
+            cursor_key = tuple_(_encode_sort_key(cursor_value), _encode_pk(after[1]))
+            current_key = tuple_(order_key, tie_key)
+            statement = statement.where(current_key < cursor_key if descending else current_key > cursor_key)
+
+        for slot, predicate in enumerate(predicates, start=1):
+            if predicate.field == table_spec.primary_key:
+                statement = statement.where(_pk_condition(predicate))
+            elif predicate.field == order_by:
+                statement = statement.where(_index_condition(driver, predicate))
+            elif predicate.op == "eq":
+                # A join rather than an ``EXISTS`` probe, so the ``index_value`` lookup can drive the scan.
+                match = _index_alias(slot)
+                statement = statement.join(
+                    match,
+                    and_(
+                        match.plugin_id == PluginRow.plugin_id,
+                        match.table_name == PluginRow.table_name,
+                        match.pk == PluginRow.pk,
+                        match.index_name == predicate.field,
+                        _index_condition(match, predicate),
+                    ),
                 )
-                candidate_sets.append(pks)
-
-            if not candidate_sets:
-                raise StorageQueryNotAllowed("table_query requires at least one predicate")
-
-            candidate_pks = set.intersection(*candidate_sets) if candidate_sets else set()
-            if not candidate_pks:
-                return []
-
-            rows = (
-                await session.scalars(
-                    select(PluginRow)
-                    .where(
-                        PluginRow.plugin_id == plugin_id,
-                        PluginRow.table_name == table,
-                        PluginRow.pk.in_(candidate_pks),
+            else:
+                probe = _index_alias(slot)
+                statement = statement.where(
+                    exists().where(
+                        probe.plugin_id == plugin_id,
+                        probe.table_name == table,
+                        probe.pk == PluginRow.pk,
+                        probe.index_name == predicate.field,
+                        _index_condition(probe, predicate),
                     )
-                    .order_by(PluginRow.pk)
-                    .limit(clamped_limit)
                 )
-            ).all()
 
-            results: list[dict[str, Any]] = []
-            for row in rows:
-                payload = json.loads(row.row_json)
-                if isinstance(payload, dict):
-                    results.append(payload)
-            return results
+        if descending:
+            return statement.order_by(order_key.desc(), tie_key.desc())
+        return statement.order_by(order_key, tie_key)
+
+    async def _load_rows(self, statement: Select[tuple[str, str]]) -> list[tuple[str, dict[str, Any]]]:
+        async with self._session_factory() as session:
+            rows = (await session.execute(statement)).all()
+        result: list[tuple[str, dict[str, Any]]] = []
+        for pk, row_json in rows:
+            payload = json.loads(str(row_json))
+            if isinstance(payload, dict):
+                result.append((str(pk), payload))
+        return result
 
     async def count_table_rows(self, *, plugin_id: str, table: str) -> int:
         _ = self._table_spec(plugin_id=plugin_id, table=table)
@@ -463,8 +550,8 @@ class UniversalStorage:
             return limits.max_query_limit
         return max(1, min(limit, limits.max_query_limit))
 
-    def _enforce_rate_limit(self, *, plugin_id: str, op: str, limits: StorageLimits) -> None:
-        self._rate_limiter.consume(plugin_id=plugin_id, op=op, qps=limits.max_qps)
+    async def _enforce_rate_limit(self, *, plugin_id: str, op: str, limits: StorageLimits) -> None:
+        await self._quota.acquire(plugin_id=plugin_id, op=op, qps=limits.max_qps)
 
     async def _ensure_table_count_limit(
         self,
@@ -496,4 +583,35 @@ class UniversalStorage:
             )
 
 
+@cache
+def _index_alias(slot: int) -> Any:
+    # Built once per slot: aliasing on every scan costs more than a selective query itself.
+    return aliased(PluginIndexRow, name=f"plugin_indexes_{slot}")
+
+
+def _sort_key_condition(sort_key: Any, predicate: ScanPredicate) -> ColumnElement[bool]:
+    if predicate.op == "prefix":
+        return sort_key.startswith(_encode_sort_key(predicate.value), autoescape=True)
+    # Bound the range to the value's type so that e.g. ``gt: 5`` never matches strings.
+    encoded = _encode_sort_key(predicate.value)
+    type_tag = encoded[0]
+    if predicate.op in ("gt", "gte"):
+        lower = sort_key > encoded if predicate.op == "gt" else sort_key >= encoded
+        return and_(lower, sort_key < chr(ord(type_tag) + 1))
+    upper = sort_key < encoded if predicate.op == "lt" else sort_key <= encoded
+    return and_(upper, sort_key >= type_tag)
+
+
+def _index_condition(index: Any, predicate: ScanPredicate) -> ColumnElement[bool]:
+    if predicate.op == "eq":
+        return index.index_value == _encode_index_value(predicate.value)
+    return _sort_key_condition(index.sort_key, predicate)
+
+
+def _pk_condition(predicate: ScanPredicate) -> ColumnElement[bool]:
+    if predicate.op == "eq":
+        return PluginRow.pk == _encode_pk(predicate.value)
+    return _sort_key_condition(PluginRow.sort_key, predicate)
+
+
 __all__ = ["UniversalStorage"]
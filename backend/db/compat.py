@@ -22,6 +22,37 @@ async def ensure_runtime_schema_compatibility(engine: AsyncEngine) -> None:
         await connection.execute(text("ALTER TABLE monitored_service ADD COLUMN IF NOT EXISTS tls_verify BOOLEAN"))
         await connection.execute(text("UPDATE monitored_service SET tls_verify = TRUE WHERE tls_verify IS NULL"))
         await connection.execute(text("ALTER TABLE monitored_service ALTER COLUMN tls_verify SET NOT NULL"))
+        await connection.execute(text("ALTER TABLE actions ADD COLUMN IF NOT EXISTS result_bytes INTEGER"))
+        await connection.execute(
+            text("ALTER TABLE actions ADD COLUMN IF NOT EXISTS result_external BOOLEAN NOT NULL DEFAULT FALSE")
+        )
+        await connection.execute(
+            text(
+                "ALTER TABLE config_revisions "
+                "ADD COLUMN IF NOT EXISTS payload_encoding VARCHAR(16) NOT NULL DEFAULT 'full'"
+            )
+        )
+        await connection.execute(text("ALTER TABLE config_revisions ADD COLUMN IF NOT EXISTS base_revision INTEGER"))
+        await connection.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_config_revisions_encoding_revision "
+                "ON config_revisions (payload_encoding, revision)"
+            )
+        )
+        await connection.execute(
+            text("CREATE INDEX IF NOT EXISTS ix_actions_status_created_at ON actions (status, created_at, id)")
+        )
+        await connection.execute(text("ALTER TABLE plugin_indexes ADD COLUMN IF NOT EXISTS sort_key VARCHAR(512)"))
+        await connection.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_plugin_indexes_sort "
+                'ON plugin_indexes (plugin_id, "table", index_name, sort_key, pk)'
+            )
+        )
+        await connection.execute(text("ALTER TABLE plugin_rows ADD COLUMN IF NOT EXISTS sort_key VARCHAR(512)"))
+        await connection.execute(
+            text('CREATE INDEX IF NOT EXISTS ix_plugin_rows_sort ON plugin_rows (plugin_id, "table", sort_key, pk)')
+        )
 
 
 __all__ = ["ensure_runtime_schema_compatibility"]
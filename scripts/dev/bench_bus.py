@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import timeit
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+
+def _project_root() -> Path:
+    return Path(__file__).resolve().parents[2]
+
+
+sys.path.insert(0, str(_project_root() / "backend"))
+
+from core.bus.codec import BusCodec  # noqa: E402
+from core.bus.topic import TopicTrie, routing_key_matches  # noqa: E402
+from core.contracts.bus import (  # noqa: E402
+    BusMessageV1,
+    StorageBusMessageV1,
+    StorageKvDeletePayload,
+    StorageKvGetPayload,
+    StorageKvSetPayload,
+    StorageTableDeletePayload,
+    StorageTableGetPayload,
+    StorageTableQueryPayload,
+    StorageTableScanPayload,
+    StorageTableUpsertPayload,
+)
+from core.storage.models import PluginQuotaWindowRow  # noqa: E402
+from core.storage.quota import LocalQuota, SharedQuota  # noqa: E402
+from db.base import Base  # noqa: E402
+from db.session import build_async_engine  # noqa: E402
+from pydantic import BaseModel, TypeAdapter  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker  # noqa: E402
+
+_HOSTS = [
+    {"ip": f"10.0.{index // 250}.{index % 250}", "hostname": f"host-{index}.lan", "open_ports": [22, 80, 443]}
+    for index in range(50)
+]
+
+STORAGE_SAMPLES: dict[str, tuple[type[BaseModel], dict[str, Any]]] = {
+    "storage.kv.get": (StorageKvGetPayload, {"key": "last_scan"}),
+    "storage.kv.set": (StorageKvSetPayload, {"key": "last_scan", "value": {"hosts": _HOSTS}}),
+    "storage.kv.delete": (StorageKvDeletePayload, {"key": "last_scan"}),
+    "storage.table.get": (StorageTableGetPayload, {"table": "devices", "key": "n1"}),
+    "storage.table.upsert": (StorageTableUpsertPayload, {"table": "devices", "row": _HOSTS[0]}),
+    "storage.table.delete": (StorageTableDeletePayload, {"table": "devices", "key": "n1"}),
+    "storage.table.query": (StorageTableQueryPayload, {"table": "devices", "where": {"ip": "10.0.0.1"}, "limit": 50}),
+    "storage.table.scan": (
+        StorageTableScanPayload,
+        {"table": "devices", "where": {"ip": {"prefix": "10.0."}}, "order_by": "ip", "limit": 50},
+    ),
+}
+
+
+def _two_pass(body: bytes, payload_model: type[BaseModel]) -> None:
+    message = BusMessageV1.model_validate_json(body)
+    payload = payload_model.model_validate(message.payload)
+    sized = getattr(payload, "value", None) or getattr(payload, "row", None)
+    if sized is not None:
+        _ = len(json.dumps(sized, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def _per_call_us(fn: Callable[[], object], *, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def bench_decode(*, number: int) -> None:
+    adapter: TypeAdapter[StorageBusMessageV1] = TypeAdapter(StorageBusMessageV1)
+    codec = BusCodec()
+    print(f"{'op':<24}{'bytes':>8}{'two-pass us':>14}{'one-pass us':>14}{'speedup':>10}")
+    for op, (payload_model, payload) in STORAGE_SAMPLES.items():
+        body = codec.encode(BusMessageV1(type=op, plugin_id="bench", payload=payload)).body
+        two_us = _per_call_us(partial(_two_pass, body, payload_model), number=number)
+        one_us = _per_call_us(partial(adapter.validate_json, body), number=number)
+        print(f"{op:<24}{len(body):>8}{two_us:>14.2f}{one_us:>14.2f}{two_us / one_us:>9.2f}x")
+
+
+def _binding_patterns(count: int) -> list[str]:
+    shapes = ("plugin{index}.state.changed", "plugin{index}.*.changed", "plugin{index}.#", "*.item{index}.health")
+    return [shapes[index % len(shapes)].format(index=index) for index in range(count)]
+
+
+def bench_routing(*, number: int, bindings: int) -> None:
+    patterns = _binding_patterns(bindings)
+    trie: TopicTrie[int] = TopicTrie()
+    uncached: TopicTrie[int] = TopicTrie(cache_size=0)
+    for index, pattern in enumerate(patterns):
+        trie.add(pattern, index)
+        uncached.add(pattern, index)
+    routing_keys = ("plugin1.state.changed", "plugin2.config.changed", "health.item43.health", "storage.kv.get")
+
+    def _scan(routing_key: str) -> list[int]:
+        return [index for index, pattern in enumerate(patterns) if routing_key_matches(pattern, routing_key)]
+
+    scan_number = max(1, number // 100)
+    print(f"bindings={bindings}")
+    print(f"{'routing key':<24}{'scan us':>12}{'trie us':>12}{'cached us':>12}{'matches':>9}")
+    for routing_key in routing_keys:
+        assert sorted(uncached.match(routing_key)) == _scan(routing_key)
+        scan_us = _per_call_us(partial(_scan, routing_key), number=scan_number)
+        trie_us = _per_call_us(partial(uncached.match, routing_key), number=number)
+        cached_us = _per_call_us(partial(trie.match, routing_key), number=number)
+        matches = len(trie.match(routing_key))
+        print(f"{routing_key:<24}{scan_us:>12.2f}{trie_us:>12.2f}{cached_us:>12.3f}{matches:>9}")
+
+
+async def _acquire_us(quota: LocalQuota | SharedQuota, *, number: int, plugins: int) -> float:
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for index in range(number):
+        await quota.acquire(plugin_id=f"plugin-{index % plugins}", op="kv.get", qps=1e9)
+    return (loop.time() - started) / number * 1e6
+
+
+async def _bench_quota(*, number: int, plugins: int) -> None:
+    _ = PluginQuotaWindowRow
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_async_engine(f"sqlite+aiosqlite:///{Path(tmp) / 'quota.sqlite3'}")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        try:
+            local_us = await _acquire_us(LocalQuota(), number=number, plugins=plugins)
+            shared = SharedQuota(session_factory=session_factory)
+            await _acquire_us(shared, number=plugins, plugins=plugins)
+            leased_us = await _acquire_us(shared, number=number, plugins=plugins)
+        finally:
+            await engine.dispose()
+    print(f"plugins={plugins}")
+    print(f"{'quota':<24}{'acquire us':>12}")
+    print(f"{'local':<24}{local_us:>12.2f}")
+    print(f"{'shared (leased)':<24}{leased_us:>12.2f}")
+
+
+def bench_quota(*, number: int, plugins: int) -> None:
+    asyncio.run(_bench_quota(number=number, plugins=plugins))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Oko internal bus microbenchmarks")
+    parser.add_argument("suite", choices=["decode", "routing", "quota"])
+    parser.add_argument("--number", type=int, default=2_000)
+    parser.add_argument("--bindings", type=int, default=5_000, help="routing: number of topic bindings")
+    parser.add_argument("--plugins", type=int, default=100, help="quota: number of distinct plugins")
+    args = parser.parse_args()
+
+    if args.suite == "decode":
+        bench_decode(number=args.number)
+    elif args.suite == "routing":
+        bench_routing(number=args.number, bindings=args.bindings)
+    elif args.suite == "quota":
+        bench_quota(number=args.number, plugins=args.plugins)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
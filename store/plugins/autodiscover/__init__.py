@@ -297,11 +297,13 @@ async def _resolve_latest_scan_id_from_runs() -> str | None:
     for status in ("completed", "synced"):
         rows: list[dict[str, Any]] = []
         with suppress(Exception):
-            rows = await _storage_rpc.table_query(
+            rows, _ = await _storage_rpc.table_scan(
                 plugin_id=PLUGIN_NAME,
                 table="scan_runs",
                 where={"status": status},
-                limit=250,
+                order_by="requested_at",
+                descending=True,
+                limit=1,
             )
         if not isinstance(rows, list):
             continue
@@ -311,11 +313,11 @@ async def _resolve_latest_scan_id_from_runs() -> str | None:
             scan_id = _as_optional_string(row.get("scan_id"))
             if not scan_id:
                 continue
-            generated_at = _generated_at_from_scan_run(row)
-            parsed_generated_at = _parse_datetime(generated_at)
-            if parsed_generated_at is None:
+            # Compare across statuses by the same field each scan was picked by.
+            parsed_requested_at = _parse_datetime(_as_optional_string(row.get("requested_at")))
+            if parsed_requested_at is None:
                 continue
-            candidates.append((parsed_generated_at, scan_id))
+            candidates.append((parsed_requested_at, scan_id))
 
     if not candidates:
         return None
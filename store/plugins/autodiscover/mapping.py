@@ -4,10 +4,12 @@ import contextlib
 import ipaddress
 import re
 import socket
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from typing import Any
 from urllib.parse import urlsplit
 
+from .schemas import DashboardIndex
+
 _HOSTNAME_TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z0-9._-]{1,62}")
 _HOSTNAME_STOPWORDS = {
     "api",
@@ -39,26 +41,21 @@ def _normalize_hostname_candidate(value: str, ip: str) -> str | None:
     return candidate
 
 
-def item_ip(item: Mapping[str, Any], resolve_cache: dict[str, str | None]) -> str | None:
-    host = urlsplit(str(item.get("url", ""))).hostname
-    if not host:
-        return None
-
+def _private_ipv4(value: str) -> str | None:
     with contextlib.suppress(ValueError):
-        parsed_ip = ipaddress.ip_address(host)
+        parsed_ip = ipaddress.ip_address(value)
         if isinstance(parsed_ip, ipaddress.IPv4Address) and parsed_ip.is_private:
             return str(parsed_ip)
-        return None
+    return None
+
 
+def _resolve_private_ipv4(host: str, resolve_cache: dict[str, str | None]) -> str | None:
     if host in resolve_cache:
         return resolve_cache[host]
 
     resolved_ip: str | None = None
     try:
-        candidate = socket.gethostbyname(host)
-        parsed_ip = ipaddress.ip_address(candidate)
-        if isinstance(parsed_ip, ipaddress.IPv4Address) and parsed_ip.is_private:
-            resolved_ip = str(parsed_ip)
+        resolved_ip = _private_ipv4(socket.gethostbyname(host))
     except OSError:
         resolved_ip = None
 
@@ -66,6 +63,18 @@ def item_ip(item: Mapping[str, Any], resolve_cache: dict[str, str | None]) -> st
     return resolved_ip
 
 
+def item_ip(item: Mapping[str, Any], resolve_cache: dict[str, str | None]) -> str | None:
+    host = urlsplit(str(item.get("url", ""))).hostname
+    if not host:
+        return None
+
+    with contextlib.suppress(ValueError):
+        ipaddress.ip_address(host)
+        return _private_ipv4(host)
+
+    return _resolve_private_ipv4(host, resolve_cache)
+
+
 def _iter_config_items(config_snapshot: Mapping[str, Any]) -> list[dict[str, Any]]:
     groups = config_snapshot.get("groups")
     if not isinstance(groups, list):
@@ -90,18 +99,44 @@ def _iter_config_items(config_snapshot: Mapping[str, Any]) -> list[dict[str, Any
     return items
 
 
-def dashboard_services_by_ip(config_snapshot: Mapping[str, Any] | None) -> dict[str, list[dict[str, Any]]]:
-    if config_snapshot is None:
-        return {}
+def _items_by_ip_from_index(index: DashboardIndex) -> Iterator[tuple[str, Mapping[str, Any]]]:
+    for ip, refs in index.ip_index.items():
+        private_ip = _private_ipv4(ip)
+        if private_ip is None:
+            continue
+        for ref in refs:
+            yield private_ip, ref.item
 
-    mapping: dict[str, list[dict[str, Any]]] = {}
     resolve_cache: dict[str, str | None] = {}
+    for host, refs in index.hostname_index.items():
+        resolved_ip = _resolve_private_ipv4(host, resolve_cache)
+        if resolved_ip is None:
+            continue
+        for ref in refs:
+            yield resolved_ip, ref.item
+
 
+def _items_by_ip_from_snapshot(config_snapshot: Mapping[str, Any]) -> Iterator[tuple[str, Mapping[str, Any]]]:
+    resolve_cache: dict[str, str | None] = {}
     for item in _iter_config_items(config_snapshot):
         ip = item_ip(item, resolve_cache)
-        if ip is None:
-            continue
+        if ip is not None:
+            yield ip, item
+
+
+def dashboard_services_by_ip(
+    config_snapshot: Mapping[str, Any] | DashboardIndex | None,
+) -> dict[str, list[dict[str, Any]]]:
+    if config_snapshot is None:
+        return {}
 
+    if isinstance(config_snapshot, Mapping):
+        items_by_ip = _items_by_ip_from_snapshot(config_snapshot)
+    else:
+        items_by_ip = _items_by_ip_from_index(config_snapshot)
+
+    mapping: dict[str, list[dict[str, Any]]] = {}
+    for ip, item in items_by_ip:
         item_id = str(item.get("id", "")).strip()
         title = str(item.get("title", "")).strip()
         url = str(item.get("url", "")).strip()
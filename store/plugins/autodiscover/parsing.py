@@ -13,7 +13,7 @@ from .constants import (
     DEFAULT_PORTS_RANGE,
     DEFAULT_RESULT_FILE,
 )
-from .schemas import ScanRequest
+from .schemas import DashboardIndex, ScanRequest
 
 
 def _safe_int(value: object, *, default: int, minimum: int, maximum: int) -> int:
@@ -177,7 +177,7 @@ def normalize_request(payload: Mapping[str, Any]) -> ScanRequest:
         result_file = None if not token else Path(token).expanduser()
 
     config_snapshot = payload.get("config_snapshot")
-    if config_snapshot is not None and not isinstance(config_snapshot, Mapping):
+    if config_snapshot is not None and not isinstance(config_snapshot, (Mapping, DashboardIndex)):
         raise ValueError("Field 'config_snapshot' must be an object")
 
     include_dashboard_items = bool(payload.get("include_dashboard_items", True))
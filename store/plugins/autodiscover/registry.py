@@ -217,7 +217,7 @@ async def _execute_autodiscover_scan(
     payload = dict(action.payload)
     if "config_snapshot" not in payload and config_service is not None:
         with suppress(Exception):
-            payload["config_snapshot"] = await config_service.get_active_revision()
+            payload["config_snapshot"] = await config_service.derived_views()
 
     async def _progress(event_type: str, payload_data: dict[str, Any]) -> None:
         if event_type == "host_found":
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable, Mapping
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Protocol, runtime_checkable
 
 
 @dataclass(frozen=True)
@@ -20,6 +20,17 @@ class EventContract:
     description: str
 
 
+@runtime_checkable
+class DashboardIndex(Protocol):
+    """Config items grouped by URL host, as projected by ``core.storage.config_views.ConfigViews``."""
+
+    @property
+    def ip_index(self) -> Mapping[str, Sequence[Any]]: ...
+
+    @property
+    def hostname_index(self) -> Mapping[str, Sequence[Any]]: ...
+
+
 @dataclass(frozen=True)
 class ScanRequest:
     hosts: tuple[str, ...]
@@ -34,7 +45,7 @@ class ScanRequest:
     include_http_services: bool
     include_dashboard_items: bool
     result_file: Path | None
-    config_snapshot: Mapping[str, Any] | None
+    config_snapshot: Mapping[str, Any] | DashboardIndex | None
 
 
 ProgressCallback = Callable[[str, dict[str, Any]], Awaitable[None] | None]
@@ -42,6 +53,7 @@ ProgressCallback = Callable[[str, dict[str, Any]], Awaitable[None] | None]
 
 __all__ = [
     "ActionContract",
+    "DashboardIndex",
     "EventContract",
     "ProgressCallback",
     "ScanRequest",
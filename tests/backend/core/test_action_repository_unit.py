@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import statistics
+import time
+import zlib
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+from core.contracts.models import ActionEnvelope, AuditEvent
+from core.storage.models import ActionResultBlobRow, ActionRow, AuditLogRow
+from core.storage.repositories import ActionRepository, AuditRepository
+from core.storage.retention import HistoryRetentionWorker
+from db.base import Base
+from db.session import build_async_engine
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _session_factory(tmp_path: Path) -> async_sessionmaker[AsyncSession]:
+    _ = (ActionRow, ActionResultBlobRow)
+    db_path = (tmp_path / "actions.sqlite3").resolve()
+    engine = build_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    return async_sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+
+
+async def _dispose(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    bind = session_factory.kw.get("bind")
+    if isinstance(bind, AsyncEngine):
+        await bind.dispose()
+
+
+def _action(action_type: str = "system.echo") -> ActionEnvelope:
+    return ActionEnvelope(type=action_type, requested_by="tester", capability="exec.system.echo")
+
+
+async def test_large_results_are_stored_out_of_line(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    repository = ActionRepository(session_factory, result_inline_max_bytes=256)
+    try:
+        small = _action()
+        large = _action()
+        await repository.create_queued(small)
+        await repository.create_queued(large)
+
+        big_result = {"rows": [{"index": index, "value": "x" * 32} for index in range(200)]}
+        updated = await repository.set_status(action_id=large.id, status="succeeded", result=big_result)
+        assert updated.result == big_result
+        assert updated.result_truncated is False
+
+        await repository.set_status(action_id=small.id, status="succeeded", result={"ok": True})
+
+        async with session_factory() as session:
+            row = await session.get(ActionRow, str(large.id))
+            blob = await session.get(ActionResultBlobRow, str(large.id))
+            assert row is not None and row.result_json is None and row.result_external is True
+            assert blob is not None and blob.encoding == "zlib"
+            assert len(blob.data) < blob.raw_bytes == row.result_bytes
+            assert zlib.decompress(blob.data)
+
+        history = {item.id: item for item in await repository.list_history(limit=10)}
+        assert history[large.id].result is None
+        assert history[large.id].result_truncated is True
+        assert history[large.id].result_bytes == row.result_bytes
+        assert history[small.id].result == {"ok": True}
+        assert history[small.id].result_truncated is False
+
+        fetched = await repository.get(large.id)
+        assert fetched is not None and fetched.result == big_result
+        fetched = await repository.get(small.id)
+        assert fetched is not None and fetched.result == {"ok": True}
+    finally:
+        await _dispose(session_factory)
+
+
+async def test_result_moves_back_inline_and_missing_action_is_none(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    repository = ActionRepository(session_factory, result_inline_max_bytes=256)
+    try:
+        action = _action()
+        await repository.create_queued(action)
+        await repository.set_status(action_id=action.id, status="running", result={"blob": "y" * 1024})
+        await repository.set_status(action_id=action.id, status="succeeded", result={"ok": True})
+
+        async with session_factory() as session:
+            assert await session.get(ActionResultBlobRow, str(action.id)) is None
+
+        status = await repository.get(action.id)
+        assert status is not None and status.result == {"ok": True}
+
+        assert await repository.get(_action().id) is None
+    finally:
+        await _dispose(session_factory)
+
+
+async def test_create_batch_stores_validation_outcomes_in_one_insert(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    repository = ActionRepository(session_factory)
+    audit = AuditRepository(session_factory)
+    try:
+        existing, validated, blocked = _action(), _action(), _action()
+        await repository.create_queued(existing)
+        await repository.create_batch(
+            [
+                (existing, "validated", None),
+                (validated, "validated", None),
+                (blocked, "blocked", {"reason": "execute_disabled"}),
+            ]
+        )
+        await audit.append_many(
+            [
+                AuditEvent(
+                    actor="tester",
+                    action_id=action.id,
+                    capability=action.capability,
+                    decision="allow",
+                    outcome="validated",
+                )
+                for action in (validated, blocked)
+            ]
+        )
+
+        stored = {action.id: await repository.get(action.id) for action in (existing, validated, blocked)}
+        assert stored[existing.id] is not None and stored[existing.id].status == "queued"
+        assert stored[validated.id] is not None and stored[validated.id].status == "validated"
+        assert stored[blocked.id] is not None and stored[blocked.id].status == "blocked"
+        assert stored[blocked.id].error == {"reason": "execute_disabled"}
+        async with session_factory() as session:
+            blocked_row = await session.get(ActionRow, str(blocked.id))
+            assert blocked_row is not None and blocked_row.finished_at is not None
+            assert await session.scalar(select(func.count()).select_from(AuditLogRow)) == 2
+    finally:
+        await _dispose(session_factory)
+
+
+async def _bulk_insert_actions(
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    start: int,
+    count: int,
+    base_ts: datetime,
+    status: str | None = None,
+) -> None:
+    rows = [
+        {
+            "id": str(UUID(int=start + index)),
+            "type": "system.echo" if index % 4 else "system.ping",
+            "capability": "exec.system.echo",
+            "requested_by": "tester",
+            "requested_at": base_ts + timedelta(seconds=start + index),
+            "status": status or ("succeeded" if index % 3 else "failed"),
+            "payload_json": "{}",
+            "dry_run": False,
+            "result_external": False,
+            "created_at": base_ts + timedelta(seconds=start + index),
+        }
+        for index in range(count)
+    ]
+    async with session_factory() as session, session.begin():
+        await session.execute(insert(ActionRow), rows)
+
+
+async def _median_page_latency(repository: ActionRepository) -> float:
+    timings: list[float] = []
+    for _ in range(15):
+        started = time.perf_counter()
+        items, cursor = await repository.list_history_page(limit=50, action_type="system.echo", status="succeeded")
+        await repository.list_history_page(limit=50, action_type="system.echo", status="succeeded", cursor=cursor)
+        timings.append(time.perf_counter() - started)
+        assert len(items) == 50
+    return statistics.median(timings)
+
+
+async def test_history_page_keyset_uses_index_and_latency_stays_flat(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    repository = ActionRepository(session_factory)
+    base_ts = datetime(2026, 1, 1, tzinfo=UTC)
+    try:
+        await _bulk_insert_actions(session_factory, start=0, count=2_000, base_ts=base_ts)
+        small = await _median_page_latency(repository)
+
+        await _bulk_insert_actions(session_factory, start=2_000, count=100_000, base_ts=base_ts)
+        large = await _median_page_latency(repository)
+        assert large < max(small * 5, 0.05)
+
+        async with session_factory() as session:
+            plan = (
+                await session.execute(
+                    text(
+                        "EXPLAIN QUERY PLAN SELECT id FROM actions "
+                        "WHERE type = 'system.echo' AND status = 'succeeded' AND (created_at, id) < ('2026', 'x') "
+                        "ORDER BY created_at DESC, id DESC LIMIT 51"
+                    )
+                )
+            ).all()
+        details = " ".join(str(row[-1]) for row in plan)
+        assert "ix_actions_type_status" in details
+        assert "TEMP B-TREE" not in details
+
+        async with session_factory() as session:
+            plan = (
+                await session.execute(
+                    text(
+                        "EXPLAIN QUERY PLAN SELECT id FROM actions "
+                        "WHERE status = 'failed' AND (created_at, id) < ('2026', 'x') "
+                        "ORDER BY created_at DESC, id DESC LIMIT 51"
+                    )
+                )
+            ).all()
+        details = " ".join(str(row[-1]) for row in plan)
+        assert "ix_actions_status_created_at" in details
+        assert "TEMP B-TREE" not in details
+
+        first, cursor = await repository.list_history_page(limit=3, action_type="system.echo", status="succeeded")
+        second, _ = await repository.list_history_page(
+            limit=3,
+            action_type="system.echo",
+            status="succeeded",
+            cursor=cursor,
+        )
+        assert cursor is not None
+        assert [item.requested_at for item in first] == sorted((item.requested_at for item in first), reverse=True)
+        assert first[-1].requested_at > second[0].requested_at
+        assert {item.id for item in first}.isdisjoint({item.id for item in second})
+
+        with pytest.raises(ValueError):
+            await repository.list_history_page(cursor="not-a-cursor")
+    finally:
+        await _dispose(session_factory)
+
+
+async def test_retention_deletes_in_chunks(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    actions = ActionRepository(session_factory, result_inline_max_bytes=256)
+    audit = AuditRepository(session_factory)
+    base_ts = datetime(2026, 1, 1, tzinfo=UTC)
+    try:
+        await _bulk_insert_actions(session_factory, start=0, count=25, base_ts=base_ts)
+        await _bulk_insert_actions(session_factory, start=25, count=1, base_ts=base_ts, status="running")
+        fresh = _action()
+        await actions.create_queued(fresh)
+        await actions.set_status(action_id=fresh.id, status="succeeded", result={"blob": "z" * 1024})
+        for offset in range(7):
+            await audit.append(
+                AuditEvent(
+                    ts=base_ts + timedelta(minutes=offset),
+                    actor="tester",
+                    capability="exec.system.echo",
+                    decision="allow",
+                    outcome="executed",
+                )
+            )
+        await audit.append(
+            AuditEvent(actor="tester", capability="exec.system.echo", decision="allow", outcome="executed")
+        )
+
+        worker = HistoryRetentionWorker(
+            action_repository=actions,
+            audit_repository=audit,
+            actions_retention_days=1,
+            audit_retention_days=1,
+            batch_size=10,
+            interval_sec=60,
+        )
+        assert await worker.run_once() == (25, 7)
+        assert await worker.run_once() == (0, 0)
+
+        remaining = await actions.list_history(limit=100)
+        assert [item.id for item in remaining] == [fresh.id, UUID(int=25)]
+        kept = await actions.get(fresh.id)
+        assert kept is not None and kept.result == {"blob": "z" * 1024}
+        async with session_factory() as session:
+            audit_count = await session.scalar(select(func.count()).select_from(AuditLogRow))
+        assert audit_count == 1
+
+        await worker.start()
+        await worker.start()
+        await worker.stop()
+        await worker.stop()
+    finally:
+        await _dispose(session_factory)
@@ -54,6 +54,26 @@ class _FakeStorageRpc:
             return rows
         return rows[: max(1, int(limit))]
 
+    async def table_scan(
+        self,
+        *,
+        plugin_id: str,
+        table: str,
+        where: Mapping[str, object] | None = None,
+        order_by: str | None = None,
+        descending: bool = False,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[dict[str, object]], str | None]:
+        _ = cursor
+        rows = await self.table_query(plugin_id=plugin_id, table=table, where=where or {})
+        if order_by is not None:
+            rows = [row for row in rows if row.get(order_by) is not None]
+            rows.sort(key=lambda row: str(row[order_by]), reverse=descending)
+        if limit is None:
+            return rows, None
+        return rows[: max(1, int(limit))], None
+
     async def table_get(self, *, plugin_id: str, table: str, pk: object) -> dict[str, object] | None:
         _ = plugin_id
         source = self.scan_runs if table == "scan_runs" else self.scan_services
@@ -108,6 +128,20 @@ class _TimeoutStorageRpc:
         _ = (plugin_id, table, where, limit)
         raise RuntimeError("storage timeout")
 
+    async def table_scan(
+        self,
+        *,
+        plugin_id: str,
+        table: str,
+        where: Mapping[str, object] | None = None,
+        order_by: str | None = None,
+        descending: bool = False,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[dict[str, object]], str | None]:
+        _ = (plugin_id, table, where, order_by, descending, cursor, limit)
+        raise RuntimeError("storage timeout")
+
     async def table_get(self, *, plugin_id: str, table: str, pk: object) -> dict[str, object] | None:
         _ = (plugin_id, table, pk)
         raise RuntimeError("storage timeout")
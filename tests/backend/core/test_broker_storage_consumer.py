@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 import pytest
-from core.bus import BrokerStorageRPC, BusClient, StorageBusConsumer
+from core.bus import BrokerActionRPC, BrokerStorageRPC, BusClient, MemoryBroker, StorageBusConsumer
+from core.bus.constants import ROUTING_ACTION_EXECUTE_BATCH
+from core.contracts.errors import ApiError
 from core.contracts.storage import PluginStorageConfig, StorageLimits, StorageTableSpec
-from core.storage import StorageQueryNotAllowed, StorageRpcTimeout, UniversalStorage
+from core.storage import StorageLimitExceeded, StorageQueryNotAllowed, StorageRpcTimeout, UniversalStorage
 from core.storage.models import PluginIndexRow, PluginKvRow, PluginRow
 from db.base import Base
 from db.session import build_async_engine
@@ -19,6 +22,7 @@ ALL_STORAGE_OPS = {
     "storage.table.upsert",
     "storage.table.delete",
     "storage.table.query",
+    "storage.table.scan",
 }
 
 
@@ -104,6 +108,35 @@ async def test_broker_storage_query_policy_and_index_rebuild(tmp_path: Path) ->
         )
         assert old_rows == []
         assert new_rows == [{"id": "n1", "ip": "10.0.0.9", "kind": "router"}]
+
+        await rpc.table_upsert(
+            plugin_id="autodiscover",
+            table="devices",
+            row={"id": "n2", "ip": "10.0.0.3", "kind": "router"},
+        )
+        rows, next_cursor = await rpc.table_scan(
+            plugin_id="autodiscover",
+            table="devices",
+            where={"kind": "router"},
+            order_by="ip",
+            descending=True,
+            limit=1,
+        )
+        assert [row["id"] for row in rows] == ["n1"]
+        rows, next_cursor = await rpc.table_scan(
+            plugin_id="autodiscover",
+            table="devices",
+            where={"kind": "router"},
+            order_by="ip",
+            descending=True,
+            cursor=next_cursor,
+            limit=1,
+        )
+        assert [row["id"] for row in rows] == ["n2"]
+        assert next_cursor is None
+
+        with pytest.raises(StorageQueryNotAllowed):
+            await rpc.table_scan(plugin_id="autodiscover", table="devices", order_by="hostname", limit=10)
     finally:
         await consumer.stop()
         await bus_client.close()
@@ -146,3 +179,88 @@ async def test_broker_storage_rpc_timeout_without_consumer() -> None:
             await rpc.kv_get(plugin_id="autodiscover", key="missing")
     finally:
         await bus_client.close()
+
+
+@pytest.mark.asyncio
+async def test_broker_storage_local_fast_path_skips_the_bus(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    session_factory = await _session_factory(tmp_path)
+    bus_client = BusClient(broker_url="memory://broker")
+    config = PluginStorageConfig(mode="core_universal", limits=StorageLimits(max_qps=1_000.0, max_kv_bytes=64))
+    consumer = StorageBusConsumer(
+        bus_client=bus_client,
+        storage=UniversalStorage(session_factory=session_factory, plugin_configs={"autodiscover": config}),
+        plugin_configs={"autodiscover": config},
+        capabilities={"autodiscover": {"storage.kv.get", "storage.kv.set"}},
+    )
+    rpc = BrokerStorageRPC(bus_client=bus_client, timeout_sec=0.05)
+
+    async def _no_bus(**kwargs):
+        raise AssertionError("co-located storage call went through the broker")
+
+    try:
+        await bus_client.connect()
+        await consumer.start()
+        monkeypatch.setattr(bus_client, "call", _no_bus)
+
+        await rpc.kv_set(plugin_id="autodiscover", key="cursor", value={"page": 2})
+        assert await rpc.kv_get(plugin_id="autodiscover", key="cursor") == {"page": 2}
+        with pytest.raises(StorageQueryNotAllowed):
+            await rpc.kv_delete(plugin_id="autodiscover", key="cursor")
+        with pytest.raises(StorageLimitExceeded):
+            await rpc.kv_set(plugin_id="autodiscover", key="blob", value="x" * 128)
+
+        await consumer.stop()
+        monkeypatch.undo()
+        assert bus_client.local_handler("storage.kv.get") is None
+        assert await rpc.kv_get(plugin_id="autodiscover", key="cursor") == {"page": 2}
+    finally:
+        await consumer.stop()
+        await bus_client.close()
+        await _dispose(session_factory)
+
+
+@pytest.mark.asyncio
+async def test_local_fast_paths_keep_the_rpc_timeouts() -> None:
+    bus_client = BusClient(broker_url="memory://broker")
+
+    async def _stuck(*args, **kwargs):
+        await asyncio.sleep(10)
+
+    bus_client.register_local_handler(("storage.kv.get", ROUTING_ACTION_EXECUTE_BATCH), _stuck)
+    storage_rpc = BrokerStorageRPC(bus_client=bus_client, timeout_sec=0.05)
+    action_rpc = BrokerActionRPC(bus_client=bus_client, timeout_sec=0.05)
+
+    with pytest.raises(StorageRpcTimeout):
+        await storage_rpc.kv_get(plugin_id="autodiscover", key="cursor")
+    with pytest.raises(ApiError) as error:
+        await action_rpc.execute_batch(actions=[], actor="tester")
+    assert error.value.status_code == 504
+    assert error.value.error.code == "action_rpc_timeout"
+    assert error.value.error.retryable is True
+
+
+@pytest.mark.asyncio
+async def test_broker_storage_remote_caller_goes_over_the_bus(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    broker = MemoryBroker()
+    worker = BusClient(broker_url="memory://broker", memory_broker=broker)
+    backend = BusClient(broker_url="memory://broker", memory_broker=broker)
+    consumer = StorageBusConsumer(
+        bus_client=worker,
+        storage=UniversalStorage(session_factory=session_factory, plugin_configs={"autodiscover": _plugin_config()}),
+        plugin_configs={"autodiscover": _plugin_config()},
+        capabilities={"autodiscover": set(ALL_STORAGE_OPS)},
+    )
+    rpc = BrokerStorageRPC(bus_client=backend, timeout_sec=0.5)
+
+    try:
+        await consumer.start()
+        assert backend.local_handler("storage.kv.set") is None
+
+        await rpc.kv_set(plugin_id="autodiscover", key="cursor", value=[1, 2])
+        assert await rpc.kv_get(plugin_id="autodiscover", key="cursor") == [1, 2]
+    finally:
+        await consumer.stop()
+        await backend.close()
+        await worker.close()
+        await _dispose(session_factory)
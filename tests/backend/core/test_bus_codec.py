@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import zlib
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from core.bus.codec import (
+    ACCEPT_ENCODING_HEADER,
+    DEFLATE_ENCODING,
+    BusCodec,
+    BusCodecError,
+    accepted_encoding,
+    decode_body,
+    decode_message,
+    decode_reply,
+    decode_typed_message,
+)
+from core.bus.quota import PluginQuotaGuard
+from core.contracts.bus import BusMessageV1, BusReplyV1, StorageBusMessageV1, StorageKvSetMessageV1
+from core.contracts.storage import StorageLimits
+from core.storage import StorageLimitExceeded
+from pydantic import TypeAdapter
+
+pytestmark = pytest.mark.asyncio
+
+
+def _scan_snapshot_message() -> BusMessageV1:
+    hosts = [
+        {
+            "ip": f"192.168.1.{index}",
+            "hostname": f"host-{index}.lan",
+            "mac_vendor": "Ubiquiti Networks Inc.",
+            "open_ports": [{"port": port, "service": "http", "title": "Grafana"} for port in (80, 443, 3000)],
+        }
+        for index in range(200)
+    ]
+    return BusMessageV1(
+        type="storage.kv.set",
+        plugin_id="autodiscover",
+        payload={"key": "last_scan", "value": {"hosts": hosts}},
+        correlation_id=str(uuid4()),
+    )
+
+
+def _incoming(encoded, headers=None) -> SimpleNamespace:
+    return SimpleNamespace(
+        body=encoded.body,
+        content_type=encoded.content_type,
+        content_encoding=encoded.content_encoding,
+        headers=headers or {},
+    )
+
+
+async def test_large_payloads_are_deflated_and_round_trip() -> None:
+    message = _scan_snapshot_message()
+    plain = BusCodec().encode(message)
+    compressed = BusCodec(compress_min_bytes=4096).encode(message, accept_encoding=DEFLATE_ENCODING)
+
+    assert plain.content_encoding is None
+    assert compressed.content_encoding == DEFLATE_ENCODING
+    assert len(compressed.body) * 10 < len(plain.body)
+    assert decode_message(_incoming(compressed)) == message
+    assert decode_message(_incoming(plain)) == message
+
+
+async def test_small_payloads_and_non_accepting_peers_stay_plain_json() -> None:
+    codec = BusCodec(compress_min_bytes=4096)
+    small = BusReplyV1(correlation_id="c1", ok=True, result={"value": 1})
+    assert codec.encode(small).content_encoding is None
+
+    reply = BusReplyV1(correlation_id="c1", ok=True, result=_scan_snapshot_message().payload)
+    assert codec.encode(reply, accept_encoding=None).content_encoding is None
+    negotiated = codec.encode(reply, accept_encoding=accepted_encoding({ACCEPT_ENCODING_HEADER: b"deflate"}))
+    assert negotiated.content_encoding == DEFLATE_ENCODING
+    assert decode_reply(_incoming(negotiated)) == reply
+
+
+async def test_requests_compress_only_when_enabled() -> None:
+    message = _scan_snapshot_message()
+    default = BusCodec(compress_min_bytes=4096)
+    enabled = BusCodec(compress_min_bytes=4096, compress_requests=True)
+
+    assert default.encode(message).content_encoding is None
+    assert default.encode(message, accept_encoding=default.request_encoding).content_encoding is None
+    assert default.accept_encoding == DEFLATE_ENCODING
+    assert enabled.encode(message, accept_encoding=enabled.request_encoding).content_encoding == DEFLATE_ENCODING
+    assert BusCodec(compress_requests=True).request_encoding is None
+
+
+async def test_unknown_codecs_are_rejected() -> None:
+    body = zlib.compress(b"{}")
+    with pytest.raises(BusCodecError):
+        decode_message(SimpleNamespace(body=body, content_type="application/json", content_encoding="br"))
+    with pytest.raises(BusCodecError):
+        decode_message(SimpleNamespace(body=body, content_type="application/x-msgpack", content_encoding=None))
+    with pytest.raises(BusCodecError):
+        decode_message(SimpleNamespace(body=b"not deflate", content_type=None, content_encoding="deflate"))
+
+
+async def test_storage_bodies_decode_into_typed_messages_in_one_pass() -> None:
+    adapter = TypeAdapter(StorageBusMessageV1)
+    encoded = BusCodec(compress_min_bytes=1024).encode(_scan_snapshot_message(), accept_encoding=DEFLATE_ENCODING)
+
+    message = decode_typed_message(decode_body(_incoming(encoded)), adapter)
+
+    assert isinstance(message, StorageKvSetMessageV1)
+    assert message.payload.key == "last_scan"
+    assert len(message.payload.value["hosts"]) == 200
+
+    invalid = BusMessageV1(type="storage.kv.get", plugin_id="autodiscover", payload={"key": ""})
+    fallback = decode_typed_message(BusCodec().encode(invalid).body, adapter)
+    assert type(fallback) is BusMessageV1
+    assert fallback.payload == {"key": ""}
+
+
+async def test_quota_size_bound_skips_serialization_only_when_it_fits() -> None:
+    limits = StorageLimits(max_kv_bytes=64)
+    unserializable = {1, 2}
+
+    PluginQuotaGuard.enforce_kv_bytes(value=unserializable, limits=limits, size_bound=64)
+    PluginQuotaGuard.enforce_kv_bytes(value="x" * 32, limits=limits, size_bound=4096)
+    with pytest.raises(StorageLimitExceeded):
+        PluginQuotaGuard.enforce_kv_bytes(value="x" * 128, limits=limits, size_bound=4096)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from core.bus.client import BusClient
+from core.config.broker import BrokerConfigChangeNotifier, ConfigChangedConsumer
+from core.storage.models import AppStateRow, ConfigRevisionRow
+from core.storage.repositories import ConfigConflictError, ConfigRepository
+from db.base import Base
+from db.session import build_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _session_factory(tmp_path: Path) -> async_sessionmaker[AsyncSession]:
+    _ = (AppStateRow, ConfigRevisionRow)
+    db_path = (tmp_path / "config.sqlite3").resolve()
+    engine = build_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    return async_sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+
+
+async def _dispose(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    bind = session_factory.kw.get("bind")
+    if isinstance(bind, AsyncEngine):
+        await bind.dispose()
+
+
+def _count_selects(session_factory: async_sessionmaker[AsyncSession]) -> list[str]:
+    statements: list[str] = []
+    bind = session_factory.kw["bind"]
+
+    @event.listens_for(bind.sync_engine, "before_cursor_execute")
+    def _on_execute(_conn, _cursor, statement, _parameters, _context, _executemany) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    return statements
+
+
+async def test_fetch_active_is_served_from_cache_until_revision_changes(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    repository = ConfigRepository(session_factory, cache_revalidate_sec=3600)
+    try:
+        assert await repository.fetch_active() is None
+        created = await repository.create_revision(
+            payload={"version": 1, "app": {"id": "oko"}},
+            source="import",
+            actor="tester",
+        )
+        selects = _count_selects(session_factory)
+
+        for _ in range(5):
+            snapshot = await repository.fetch_active()
+            assert snapshot is created
+        assert selects == []
+
+        patched = await repository.patch_active(patch={"app": {"title": "Patched"}}, actor="tester")
+        assert patched.active_state.state_seq == created.active_state.state_seq + 1
+        selects.clear()
+        assert await repository.fetch_active() is patched
+        assert selects == []
+
+        repository.invalidate_active_cache(state_seq=patched.active_state.state_seq)
+        assert await repository.fetch_active() is patched
+
+        repository.invalidate_active_cache()
+        reloaded = await repository.fetch_active()
+        assert reloaded is not None and reloaded is not patched
+        assert reloaded.revision.payload == patched.revision.payload
+        assert len(selects) == 2
+    finally:
+        await _dispose(session_factory)
+
+
+async def test_revalidation_checks_state_seq_only(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    writer = ConfigRepository(session_factory)
+    reader = ConfigRepository(session_factory, cache_revalidate_sec=0)
+    try:
+        await writer.create_revision(payload={"version": 1, "app": {"id": "a"}}, source="import", actor="tester")
+        first = await reader.fetch_active()
+        selects = _count_selects(session_factory)
+
+        assert await reader.fetch_active() is first
+        assert len(selects) == 1
+        assert "config_revisions" not in selects[0]
+
+        await writer.create_revision(payload={"version": 1, "app": {"id": "b"}}, source="import", actor="tester")
+        updated = await reader.fetch_active()
+        assert updated is not None and updated.revision.payload["app"]["id"] == "b"
+    finally:
+        await _dispose(session_factory)
+
+
+async def test_config_changed_bus_event_invalidates_other_replicas(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    bus_client = BusClient(broker_url="memory://config-cache")
+    writer = ConfigRepository(session_factory)
+    reader = ConfigRepository(session_factory, cache_revalidate_sec=3600)
+    consumer = ConfigChangedConsumer(bus_client=bus_client, repository=reader)
+    notifier = BrokerConfigChangeNotifier(bus_client=bus_client)
+    try:
+        await consumer.start()
+        await writer.create_revision(payload={"version": 1, "app": {"id": "a"}}, source="import", actor="tester")
+        stale = await reader.fetch_active()
+        assert stale is not None
+
+        updated = await writer.create_revision(
+            payload={"version": 1, "app": {"id": "b"}},
+            source="import",
+            actor="tester",
+        )
+        assert await reader.fetch_active() is stale
+
+        await notifier.notify(updated.active_state)
+        await bus_client.drain()
+        fresh = await reader.fetch_active()
+        assert fresh is not None and fresh.active_state.state_seq == updated.active_state.state_seq
+    finally:
+        await consumer.stop()
+        await bus_client.close()
+        await _dispose(session_factory)
+
+
+async def test_patches_from_stale_replicas_merge_into_the_latest_revision(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    first = ConfigRepository(session_factory, cache_revalidate_sec=3600)
+    second = ConfigRepository(session_factory, cache_revalidate_sec=3600)
+    items = [{"id": "grafana", "title": "Grafana"}]
+    payload = {
+        "version": 1,
+        "app": {"id": "oko"},
+        "groups": [{"id": "infra", "subgroups": [{"id": "monitoring", "items": items}]}],
+    }
+    try:
+        created = await first.create_revision(payload=payload, source="import", actor="tester")
+        assert await second.fetch_active() is not None
+
+        await first.patch_active(
+            patch={"items": [{"id": "prometheus", "title": "Prometheus"}, *items]},
+            actor="tester",
+            path="/groups/0/subgroups/0",
+        )
+        patched = await second.patch_active(
+            patch={"title": "Grafana OSS"},
+            actor="tester",
+            locate=lambda views: views.item_index["grafana"].pointer,
+        )
+        assert patched.revision.payload["groups"][0]["subgroups"][0]["items"] == [
+            {"id": "prometheus", "title": "Prometheus"},
+            {"id": "grafana", "title": "Grafana OSS"},
+        ]
+
+        with pytest.raises(ConfigConflictError) as conflict:
+            await first.patch_active(
+                patch={"app": {"title": "Lost"}},
+                actor="tester",
+                expected_revision=created.revision.revision,
+            )
+        assert conflict.value.actual_revision == patched.revision.revision
+    finally:
+        await _dispose(session_factory)
+
+
+async def test_imports_and_rollbacks_retry_a_lost_state_race(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    session_factory = await _session_factory(tmp_path)
+    repository = ConfigRepository(session_factory)
+    lock_active = repository._lock_active
+    calls = 0
+
+    async def _stale_on_first_attempt(session: AsyncSession, *, expected_revision: int | None) -> AppStateRow | None:
+        # Each write first sees a state another replica has since replaced, as on SQLite where
+        # the lock does not hold off a concurrent writer.
+        nonlocal calls
+        calls += 1
+        active = await lock_active(session, expected_revision=expected_revision)
+        if active is not None and calls % 2:
+            session.expunge(active)
+            active.state_seq -= 1
+        return active
+
+    try:
+        first = await repository.create_revision(payload={"version": 1, "app": {"id": "a"}}, source="import", actor="t")
+        monkeypatch.setattr(repository, "_lock_active", _stale_on_first_attempt)
+
+        imported = await repository.create_revision(
+            payload={"version": 1, "app": {"id": "b"}}, source="import", actor="tester"
+        )
+        assert imported.revision.payload["app"] == {"id": "b"}
+        rolled_back = await repository.rollback_to(revision=first.revision.revision, actor="tester")
+        assert rolled_back.revision.payload["app"] == {"id": "a"}
+        assert rolled_back.active_state.state_seq == first.active_state.state_seq + 2
+        assert calls == 4
+    finally:
+        await _dispose(session_factory)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import copy
+from pathlib import Path
+
+import pytest
+from core.storage.config_delta import apply_delta, diff_payload
+from core.storage.models import AppStateRow, ConfigRevisionRow
+from core.storage.repositories import ConfigRepository
+from db.base import Base
+from db.session import build_async_engine
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+
+async def _session_factory(tmp_path: Path) -> async_sessionmaker[AsyncSession]:
+    _ = (AppStateRow, ConfigRevisionRow)
+    db_path = (tmp_path / "config-deltas.sqlite3").resolve()
+    engine = build_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    return async_sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+
+
+async def _dispose(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    bind = session_factory.kw.get("bind")
+    if isinstance(bind, AsyncEngine):
+        await bind.dispose()
+
+
+def _dashboard(items: int) -> dict:
+    return {
+        "version": 1,
+        "app": {"id": "oko", "title": "Home"},
+        "groups": [
+            {
+                "id": f"group-{group}",
+                "subgroups": [
+                    {
+                        "id": f"sub-{group}",
+                        "items": [
+                            {"id": f"item-{group}-{index}", "url": f"https://svc-{group}-{index}.lan", "tags": ["a"]}
+                            for index in range(items)
+                        ],
+                    }
+                ],
+            }
+            for group in range(4)
+        ],
+    }
+
+
+def test_diff_and_apply_round_trip() -> None:
+    old = _dashboard(5)
+    new = copy.deepcopy(old)
+    new["app"]["title"] = "Renamed"
+    del new["app"]["id"]
+    new["groups"][1]["subgroups"][0]["items"].insert(2, {"id": "inserted"})
+    new["groups"][2]["subgroups"][0]["items"].pop(0)
+    new["groups"][3]["subgroups"][0]["items"][4]["tags"] = ["a", "b", None]
+    new["groups"].append({"id": "group-new", "enabled": False})
+    new["flags"] = {"beta": True, "count": 1}
+
+    ops = diff_payload(old, new)
+    assert apply_delta(old, ops) == new
+    assert old == _dashboard(5)
+    assert diff_payload(new, new) == []
+    assert apply_delta(old, [{"op": "set", "path": [], "value": {"x": 1}}]) == {"x": 1}
+
+    with pytest.raises(ValueError):
+        apply_delta(old, [{"op": "move", "path": []}])
+
+
+async def test_revisions_are_delta_encoded_with_bounded_chains(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    repository = ConfigRepository(session_factory, snapshot_interval=4)
+    payloads: list[dict] = []
+    try:
+        payload = _dashboard(40)
+        for step in range(10):
+            payload = copy.deepcopy(payload)
+            payload["groups"][step % 4]["subgroups"][0]["items"][step]["url"] = f"https://edited-{step}.lan"
+            payloads.append(payload)
+            await repository.create_revision(payload=payload, source="patch", actor="tester")
+
+        async with session_factory() as session:
+            rows = (await session.scalars(select(ConfigRevisionRow).order_by(ConfigRevisionRow.revision))).all()
+        assert [row.payload_encoding for row in rows] == ["full", "delta", "delta", "delta"] * 2 + ["full", "delta"]
+        full_size = len(rows[0].payload_json)
+        assert all(len(row.payload_json) * 20 < full_size for row in rows if row.payload_encoding == "delta")
+        assert [row.base_revision for row in rows[:3]] == [None, 1, 2]
+
+        reader = ConfigRepository(session_factory)
+        selects: list[str] = []
+
+        @event.listens_for(session_factory.kw["bind"].sync_engine, "before_cursor_execute")
+        def _on_execute(_conn, _cursor, statement, _parameters, _context, _executemany) -> None:
+            selects.append(statement)
+
+        for revision, expected in enumerate(payloads, start=1):
+            selects.clear()
+            fetched = await reader.fetch_revision(revision)
+            assert fetched is not None and fetched.payload == expected
+            assert len(selects) <= 3
+
+        active = await reader.fetch_active()
+        assert active is not None and active.revision.payload == payloads[-1]
+
+        metadata = await repository.list_revisions(limit=3)
+        assert [item.revision for item in metadata] == [10, 9, 8]
+        assert not hasattr(metadata[0], "payload")
+    finally:
+        await _dispose(session_factory)
+
+
+async def test_corrupted_delta_chain_is_detected(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    repository = ConfigRepository(session_factory, snapshot_interval=8)
+    try:
+        await repository.create_revision(payload=_dashboard(10), source="import", actor="tester")
+        changed = _dashboard(10)
+        changed["app"]["title"] = "Changed"
+        await repository.create_revision(payload=changed, source="patch", actor="tester")
+
+        async with session_factory() as session, session.begin():
+            row = await session.scalar(select(ConfigRevisionRow).where(ConfigRevisionRow.revision == 2))
+            assert row is not None and row.payload_encoding == "delta"
+            row.payload_sha256 = "0" * 64
+
+        with pytest.raises(ValueError):
+            await ConfigRepository(session_factory).fetch_revision(2)
+    finally:
+        await _dispose(session_factory)
@@ -16,7 +16,8 @@ from core.contracts.models import (
     ConfigRollbackRequest,
     ConfigValidateRequest,
 )
-from core.storage.repositories import ActiveConfigSnapshot
+from core.storage.config_views import ConfigViews
+from core.storage.repositories import ActiveConfigSnapshot, ConfigConflictError
 
 
 def _snapshot(*, revision: int = 1, payload: dict | None = None) -> ActiveConfigSnapshot:
@@ -182,6 +183,27 @@ async def test_import_validate_patch_and_rollback_paths() -> None:
     assert rollback_err.value.status_code == 404
 
 
+async def test_import_and_rollback_map_lost_write_races_to_409() -> None:
+    service, repository, event_bus = _service()
+    conflict = ConfigConflictError(expected_revision=1, actual_revision=None)
+    repository.create_revision = AsyncMock(side_effect=conflict)
+    repository.rollback_to = AsyncMock(side_effect=conflict)
+
+    with pytest.raises(ApiError) as import_err:
+        await service.import_config(
+            request=ConfigImportRequest(format="yaml", payload="version: 1\napp:\n  id: oko\n"),
+            actor="tester",
+        )
+    with pytest.raises(ApiError) as rollback_err:
+        await service.rollback(request=ConfigRollbackRequest(revision=1), actor="tester")
+
+    for error in (import_err.value, rollback_err.value):
+        assert error.status_code == 409
+        assert error.error.code == "config_write_conflict"
+        assert error.error.retryable is True
+    event_bus.publish.assert_not_awaited()
+
+
 async def test_widgets_registry_and_list_revisions() -> None:
     snapshot = _snapshot(
         revision=5,
@@ -200,6 +222,7 @@ async def test_widgets_registry_and_list_revisions() -> None:
     service, repository, _ = _service(
         repo=SimpleNamespace(
             fetch_active=AsyncMock(return_value=snapshot),
+            fetch_active_views=AsyncMock(return_value=ConfigViews(snapshot.revision)),
             create_revision=AsyncMock(return_value=snapshot),
             list_revisions=AsyncMock(return_value=[snapshot.revision]),
             patch_active=AsyncMock(return_value=snapshot),
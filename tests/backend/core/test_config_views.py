@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from apps.health.model.sqlalchemy import MonitoredServiceRow
+from apps.health.service.repository import HealthRepository
+from apps.health.worker.scheduler import HealthScheduler
+from core.bus.client import BusClient
+from core.storage import config_views
+from core.storage.config_pointer import format_pointer, replace_at_pointer, resolve_pointer
+from core.storage.models import AppStateRow, ConfigRevisionRow
+from core.storage.repositories import ConfigRepository
+from db.base import Base
+from db.session import build_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from store.plugins.autodiscover import mapping as autodiscover_mapping
+
+
+def _payload(*, title: str = "Grafana") -> dict:
+    return {
+        "version": 1,
+        "app": {"id": "oko"},
+        "widgets": [{"type": "health"}, {"type": "health"}, {"type": "ops"}],
+        "groups": [
+            {
+                "id": "core",
+                "subgroups": [
+                    {
+                        "id": "main",
+                        "items": [
+                            {
+                                "id": "grafana",
+                                "title": title,
+                                "url": "http://192.168.1.10:3000",
+                                "healthcheck": {"type": "http"},
+                            },
+                            {"id": "prometheus", "title": "Prometheus", "url": "http://192.168.1.10:9090"},
+                            {"id": "wiki", "title": "Wiki", "url": "https://Wiki.Local./home"},
+                        ],
+                    }
+                ],
+            }
+        ],
+    }
+
+
+async def _session_factory(tmp_path: Path) -> async_sessionmaker[AsyncSession]:
+    _ = (AppStateRow, ConfigRevisionRow, MonitoredServiceRow)
+    db_path = (tmp_path / "views.sqlite3").resolve()
+    engine = build_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    return async_sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+
+
+async def _dispose(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    bind = session_factory.kw.get("bind")
+    if isinstance(bind, AsyncEngine):
+        await bind.dispose()
+
+
+async def test_views_are_computed_once_per_revision(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    session_factory = await _session_factory(tmp_path)
+    repository = ConfigRepository(session_factory, cache_revalidate_sec=3600)
+    walks: list[int] = []
+    original_iter = config_views.iter_config_items
+
+    def _counting_iter(payload):
+        walks.append(1)
+        return original_iter(payload)
+
+    monkeypatch.setattr(config_views, "iter_config_items", _counting_iter)
+    try:
+        await repository.create_revision(payload=_payload(), source="import", actor="tester")
+
+        views = await repository.fetch_active_views()
+        assert views is not None
+        for _ in range(3):
+            again = await repository.fetch_active_views()
+            assert again is views
+            assert [ref.item_id for ref in again.items] == ["grafana", "prometheus", "wiki"]
+            assert again.item_index["wiki"].group_id == "core"
+            assert [entry.type for entry in again.widgets] == ["health", "ops"]
+            assert {ip: [ref.item_id for ref in refs] for ip, refs in again.ip_index.items()} == {
+                "192.168.1.10": ["grafana", "prometheus"]
+            }
+            assert [ref.item_id for ref in again.hostname_index["wiki.local"]] == ["wiki"]
+        assert len(walks) == 1
+
+        await repository.create_revision(payload=_payload(title="Grafana 2"), source="patch", actor="tester")
+        updated = await repository.fetch_active_views()
+        assert updated is not None
+        assert updated is not views
+        assert updated.item_index["grafana"].item["title"] == "Grafana 2"
+        assert len(walks) == 2
+    finally:
+        await _dispose(session_factory)
+
+
+async def test_views_hand_out_immutable_items(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    repository = ConfigRepository(session_factory)
+    try:
+        await repository.create_revision(payload=_payload(), source="import", actor="tester")
+        views = await repository.fetch_active_views()
+        assert views is not None
+
+        item = views.item_index["grafana"].item
+        with pytest.raises(TypeError):
+            item["title"] = "changed"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            item["healthcheck"]["type"] = "tcp"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            views.ip_index["10.0.0.1"] = ()  # type: ignore[index]
+
+        widget = views.widgets[0]
+        widget.capabilities.append("write.widget")
+        assert views.widgets[0].capabilities == ["read.widget"]
+    finally:
+        await _dispose(session_factory)
+
+
+async def test_autodiscover_maps_dashboard_items_from_the_ip_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    session_factory = await _session_factory(tmp_path)
+    repository = ConfigRepository(session_factory)
+    lookups: list[str] = []
+
+    def _resolve(host: str) -> str:
+        lookups.append(host)
+        return "192.168.1.20"
+
+    monkeypatch.setattr(autodiscover_mapping.socket, "gethostbyname", _resolve)
+    try:
+        payload = _payload()
+        payload["groups"][0]["subgroups"][0]["items"].append(
+            {"id": "wiki-admin", "title": "Wiki admin", "url": "https://wiki.local/admin"}
+        )
+        await repository.create_revision(payload=payload, source="import", actor="tester")
+        views = await repository.fetch_active_views()
+        assert views is not None
+
+        mapping = autodiscover_mapping.dashboard_services_by_ip(views)
+        assert {ip: [entry["id"] for entry in entries] for ip, entries in mapping.items()} == {
+            "192.168.1.10": ["grafana", "prometheus"],
+            "192.168.1.20": ["wiki", "wiki-admin"],
+        }
+        assert lookups == ["wiki.local"]
+        assert mapping == autodiscover_mapping.dashboard_services_by_ip(payload)
+    finally:
+        await _dispose(session_factory)
+
+
+async def test_scheduler_syncs_services_only_when_revision_changes(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    config_repository = ConfigRepository(session_factory, cache_revalidate_sec=3600)
+    health_repository = HealthRepository(session_factory)
+    sync_services = AsyncMock(wraps=health_repository.sync_services)
+    health_repository.sync_services = sync_services  # type: ignore[method-assign]
+    scheduler = HealthScheduler(
+        bus_client=BusClient(broker_url="memory://views"),
+        repository=health_repository,
+        config_repository=config_repository,
+        tick_sec=1,
+        heartbeat_sec=60,
+        window_size=10,
+        retention_days=7,
+        default_interval_sec=60,
+        default_timeout_ms=1500,
+        default_latency_threshold_ms=800,
+    )
+    try:
+        await config_repository.create_revision(payload=_payload(), source="import", actor="tester")
+        for _ in range(3):
+            await scheduler._sync_services_from_active_config()
+        assert sync_services.await_count == 1
+        assert [service.item_id for service in await health_repository.list_enabled_services()] == ["grafana"]
+
+        await config_repository.create_revision(payload=_payload(title="Grafana 2"), source="patch", actor="tester")
+        await scheduler._sync_services_from_active_config()
+        assert sync_services.await_count == 2
+        assert [service.name for service in await health_repository.list_enabled_services()] == ["Grafana 2"]
+    finally:
+        await _dispose(session_factory)
+
+
+def test_replace_at_pointer_copies_only_the_selected_path() -> None:
+    payload = _payload()
+    pointer = "/groups/0/subgroups/0/items/1"
+    updated = replace_at_pointer(payload, pointer, {"id": "prometheus", "title": "Prom"})
+
+    assert resolve_pointer(updated, pointer) == {"id": "prometheus", "title": "Prom"}
+    assert payload["groups"][0]["subgroups"][0]["items"][1]["title"] == "Prometheus"
+    assert updated["widgets"] is payload["widgets"]
+    assert updated["groups"][0]["subgroups"][0]["items"][0] is payload["groups"][0]["subgroups"][0]["items"][0]
+    assert resolve_pointer({"a/b": {"~": 1}}, format_pointer(["a/b", "~"])) == 1
+    with pytest.raises(KeyError):
+        resolve_pointer(payload, "/groups/01")
+    with pytest.raises(ValueError):
+        resolve_pointer(payload, "groups")
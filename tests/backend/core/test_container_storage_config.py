@@ -17,5 +17,5 @@ def test_default_plugin_storage_configs_normalize_ddl_indexes_to_columns() -> No
     assert autodiscover.tables
 
     scan_runs = next(table for table in autodiscover.tables if table.name == "scan_runs")
-    assert scan_runs.indexes == ["status", "dry_run"]
+    assert scan_runs.indexes == ["status", "dry_run", "requested_at"]
     assert all(isinstance(index_name, str) for index_name in scan_runs.indexes)
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import importlib
 import os
+import re
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from uuid import uuid4
 
 import httpx
 import pytest
+from core.events.bus import EventBus
 from fastapi import HTTPException
 from httpx import ASGITransport, AsyncClient
 
@@ -123,6 +126,14 @@ async def test_config_flow_import_patch_rollback(monkeypatch: pytest.MonkeyPatch
         assert revisions_response.status_code == httpx.codes.OK
         revisions = revisions_response.json()
         assert len(revisions) >= 3
+        assert "payload" not in revisions[0]
+
+        revision_response = await client.get(f"/api/v1/config/revisions/{imported_revision}", headers=headers)
+        assert revision_response.status_code == httpx.codes.OK
+        assert revision_response.json()["payload"]["app"]["title"] == "Imported"
+
+        missing_revision = await client.get("/api/v1/config/revisions/9999", headers=headers)
+        assert missing_revision.status_code == httpx.codes.NOT_FOUND
 
         rollback_response = await client.post(
             "/api/v1/config/rollback",
@@ -134,6 +145,165 @@ async def test_config_flow_import_patch_rollback(monkeypatch: pytest.MonkeyPatch
         assert rolled_payload["app"]["title"] == "Imported"
 
 
+async def test_config_endpoints_support_etags(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    db_path = (tmp_path / "oko.sqlite3").resolve()
+    bootstrap = (tmp_path / "bootstrap.yaml").resolve()
+    bootstrap.write_text(DEFAULT_BOOTSTRAP, encoding="utf-8")
+
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{db_path}")
+    monkeypatch.setenv("BROKER_URL", "memory://local")
+    monkeypatch.setenv("OKO_BOOTSTRAP_CONFIG_FILE", str(bootstrap))
+
+    main_module = _reload_main_module()
+    headers = _full_headers()
+
+    async for client in _client(main_module):
+        etags: dict[str, str] = {}
+        for path in ("/api/v1/state", "/api/v1/config", "/api/v1/widgets/registry"):
+            first = await client.get(path, headers=headers)
+            assert first.status_code == httpx.codes.OK
+            etag = first.headers["etag"]
+            assert etag.startswith('"') and not etag.startswith("W/")
+            etags[path] = etag
+
+            cached = await client.get(path, headers={**headers, "If-None-Match": etag})
+            assert cached.status_code == httpx.codes.NOT_MODIFIED
+            assert cached.headers["etag"] == etag
+            assert cached.content == b""
+
+        patch_response = await client.post(
+            "/api/v1/config/patch",
+            headers=headers,
+            json={"patch": {"app": {"title": "Patched"}}, "source": "patch"},
+        )
+        assert patch_response.status_code == httpx.codes.OK
+
+        for path, etag in etags.items():
+            refreshed = await client.get(path, headers={**headers, "If-None-Match": etag})
+            assert refreshed.status_code == httpx.codes.OK
+            assert refreshed.headers["etag"] != etag
+
+        config_response = await client.get("/api/v1/config", headers=headers)
+        assert config_response.json()["app"]["title"] == "Patched"
+
+
+GROUPED_BOOTSTRAP = """\
+version: 1
+app:
+  id: demo
+  title: Demo
+groups:
+  - id: infra
+    title: Infra
+    subgroups:
+      - id: monitoring
+        title: Monitoring
+        items:
+          - id: grafana
+            title: Grafana
+            url: http://192.168.1.10:3000
+          - id: prometheus
+            title: Prometheus
+            url: http://192.168.1.10:9090
+"""
+
+
+async def test_config_partial_fetch_and_patch(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    db_path = (tmp_path / "oko.sqlite3").resolve()
+    bootstrap = (tmp_path / "bootstrap.yaml").resolve()
+    bootstrap.write_text(GROUPED_BOOTSTRAP, encoding="utf-8")
+
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{db_path}")
+    monkeypatch.setenv("BROKER_URL", "memory://local")
+    monkeypatch.setenv("OKO_BOOTSTRAP_CONFIG_FILE", str(bootstrap))
+
+    main_module = _reload_main_module()
+    headers = _full_headers()
+
+    async for client in _client(main_module):
+        by_path = await client.get("/api/v1/config", headers=headers, params={"path": "/app/title"})
+        assert by_path.status_code == httpx.codes.OK
+        assert by_path.json()["value"] == "Demo"
+        etag = by_path.headers["etag"]
+        cached = await client.get(
+            "/api/v1/config",
+            headers={**headers, "If-None-Match": etag},
+            params={"path": "/app/title"},
+        )
+        assert cached.status_code == httpx.codes.NOT_MODIFIED
+
+        by_item = await client.get("/api/v1/config", headers=headers, params={"item": "prometheus"})
+        assert by_item.status_code == httpx.codes.OK
+        assert by_item.json()["path"] == "/groups/0/subgroups/0/items/1"
+        assert by_item.json()["value"]["url"] == "http://192.168.1.10:9090"
+
+        by_group = await client.get("/api/v1/config", headers=headers, params={"group": "infra"})
+        assert by_group.json()["value"]["title"] == "Infra"
+
+        missing = await client.get("/api/v1/config", headers=headers, params={"item": "missing"})
+        assert missing.status_code == httpx.codes.NOT_FOUND
+        invalid = await client.get("/api/v1/config", headers=headers, params={"path": "app"})
+        assert invalid.status_code == httpx.codes.UNPROCESSABLE_ENTITY
+        ambiguous = await client.get("/api/v1/config", headers=headers, params={"path": "/app", "item": "grafana"})
+        assert ambiguous.status_code == httpx.codes.UNPROCESSABLE_ENTITY
+
+        patched = await client.patch(
+            "/api/v1/config",
+            headers=headers,
+            params={"item": "grafana"},
+            json={"patch": {"title": "Grafana OSS", "url": None}, "source": "patch"},
+        )
+        assert patched.status_code == httpx.codes.OK
+        body = patched.json()
+        assert body["path"] == "/groups/0/subgroups/0/items/0"
+        assert body["value"] == {"id": "grafana", "title": "Grafana OSS"}
+        assert by_item.json()["revision"] < body["revision"]
+
+        full = await client.get("/api/v1/config", headers=headers)
+        items = full.json()["groups"][0]["subgroups"][0]["items"]
+        assert items[0] == {"id": "grafana", "title": "Grafana OSS"}
+        assert items[1]["title"] == "Prometheus"
+
+        not_object = await client.patch(
+            "/api/v1/config",
+            headers=headers,
+            params={"path": "/app/title"},
+            json={"patch": {"x": 1}},
+        )
+        assert not_object.status_code == httpx.codes.UNPROCESSABLE_ENTITY
+
+        root = await client.patch(
+            "/api/v1/config",
+            headers=headers,
+            params={"path": ""},
+            json={"patch": {"app": {"title": "Root patched"}}, "source": "patch"},
+        )
+        assert root.status_code == httpx.codes.OK
+        assert root.json()["path"] == ""
+        assert root.json()["value"]["app"] == {"id": "demo", "title": "Root patched"}
+        assert root.json()["value"]["groups"][0]["id"] == "infra"
+
+        stale_etag = by_path.headers["etag"]
+        stale = await client.patch(
+            "/api/v1/config",
+            headers={**headers, "If-Match": stale_etag},
+            params={"path": "/app"},
+            json={"patch": {"title": "Lost update"}},
+        )
+        assert stale.status_code == httpx.codes.PRECONDITION_FAILED
+        assert stale.json()["code"] == "config_revision_conflict"
+
+        current = await client.get("/api/v1/config", headers=headers)
+        fresh = await client.patch(
+            "/api/v1/config",
+            headers={**headers, "If-Match": current.headers["etag"]},
+            params={"path": "/app"},
+            json={"patch": {"title": "Renamed"}},
+        )
+        assert fresh.status_code == httpx.codes.OK
+        assert fresh.json()["value"]["title"] == "Renamed"
+
+
 async def test_config_validate_endpoint(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     db_path = (tmp_path / "oko.sqlite3").resolve()
     bootstrap = (tmp_path / "bootstrap.yaml").resolve()
@@ -209,6 +379,76 @@ async def test_actions_gateway_execute_and_history(monkeypatch: pytest.MonkeyPat
         history = history_response.json()
         assert len(history) >= 2
 
+        action_id = execute_response.json()["action_id"]
+        action_response = await client.get(f"/api/v1/actions/{action_id}", headers=headers)
+        assert action_response.status_code == httpx.codes.OK
+        assert action_response.json()["status"] == "succeeded"
+
+        missing_response = await client.get(f"/api/v1/actions/{uuid4()}", headers=headers)
+        assert missing_response.status_code == httpx.codes.NOT_FOUND
+
+        page_response = await client.get("/api/v1/actions/history/page", params={"limit": 1}, headers=headers)
+        assert page_response.status_code == httpx.codes.OK
+        page = page_response.json()
+        assert len(page["items"]) == 1
+        assert page["next_cursor"]
+
+        next_page_response = await client.get(
+            "/api/v1/actions/history/page",
+            params={"limit": 1, "cursor": page["next_cursor"]},
+            headers=headers,
+        )
+        assert next_page_response.status_code == httpx.codes.OK
+        assert next_page_response.json()["items"][0]["id"] != page["items"][0]["id"]
+
+        bad_cursor_response = await client.get(
+            "/api/v1/actions/history/page",
+            params={"cursor": "broken"},
+            headers=headers,
+        )
+        assert bad_cursor_response.status_code == httpx.codes.UNPROCESSABLE_ENTITY
+
+
+async def test_actions_batch_execute(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    db_path = (tmp_path / "oko.sqlite3").resolve()
+    bootstrap = (tmp_path / "bootstrap.yaml").resolve()
+    bootstrap.write_text(DEFAULT_BOOTSTRAP, encoding="utf-8")
+
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{db_path}")
+    monkeypatch.setenv("BROKER_URL", "memory://local")
+    monkeypatch.setenv("OKO_BOOTSTRAP_CONFIG_FILE", str(bootstrap))
+
+    main_module = _reload_main_module()
+    headers = _full_headers()
+
+    async for client in _client(main_module):
+        actions = [
+            {
+                "type": "system.echo",
+                "requested_by": "tester",
+                "capability": "exec.system.echo",
+                "payload": {"index": index},
+            }
+            for index in range(5)
+        ]
+        actions.append({"type": "unknown.action", "requested_by": "tester", "capability": "exec.unknown"})
+
+        response = await client.post("/api/v1/actions/execute/batch", headers=headers, json={"actions": actions})
+        assert response.status_code == httpx.codes.OK
+        results = response.json()["results"]
+        assert [item["status"] for item in results] == ["succeeded"] * 5 + ["blocked"]
+        assert [item["result"]["echo"]["index"] for item in results[:5]] == list(range(5))
+
+        empty_response = await client.post("/api/v1/actions/execute/batch", headers=headers, json={"actions": []})
+        assert empty_response.status_code == httpx.codes.UNPROCESSABLE_ENTITY
+
+        no_capability = await client.post(
+            "/api/v1/actions/execute/batch",
+            headers={"X-Oko-Actor": "tester"},
+            json={"actions": actions[:1]},
+        )
+        assert no_capability.status_code == httpx.codes.FORBIDDEN
+
 
 async def test_autodiscover_action_registry_and_dry_run(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     pytest.skip("autodiscover action not yet implemented")
@@ -306,6 +546,107 @@ async def test_events_stream_once_returns_snapshot(monkeypatch: pytest.MonkeyPat
             assert "event: core.state.snapshot" in payload
             assert "active_revision" in payload
 
+        # A bus that has not seen any event yet: snapshots are cursor 0, which resumes from the start.
+        container = main_module.app.state.container
+        container.event_bus = EventBus()
+        async with client.stream("GET", "/api/v1/events/stream?once=true", headers=headers) as response:
+            payload = ""
+            async for chunk in response.aiter_text():
+                payload += chunk
+        assert re.findall(r"^id: (\d+)$", payload, flags=re.MULTILINE) == ["0", "0"]
+
+        await container.event_bus.publish(event_type="core.config.patched", source="test")
+        async with client.stream(
+            "GET",
+            "/api/v1/events/stream?once=true",
+            headers={**headers, "Last-Event-ID": "0"},
+        ) as response:
+            payload = ""
+            async for chunk in response.aiter_text():
+                payload += chunk
+        assert "core.state.snapshot" not in payload
+        assert "id: 1\nevent: core.config.patched" in payload
+
+
+async def test_dashboard_bootstrap_and_stream_resume(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    db_path = (tmp_path / "oko.sqlite3").resolve()
+    bootstrap = (tmp_path / "bootstrap.yaml").resolve()
+    bootstrap.write_text(DEFAULT_BOOTSTRAP, encoding="utf-8")
+
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{db_path}")
+    monkeypatch.setenv("BROKER_URL", "memory://local")
+    monkeypatch.setenv("OKO_BOOTSTRAP_CONFIG_FILE", str(bootstrap))
+
+    main_module = _reload_main_module()
+    headers = _full_headers()
+
+    async for client in _client(main_module):
+        denied = await client.get(
+            "/api/v1/bootstrap",
+            headers={"X-Oko-Actor": "tester", "X-Oko-Capabilities": "read.state,read.config"},
+        )
+        assert denied.status_code == httpx.codes.FORBIDDEN
+
+        response = await client.get("/api/v1/bootstrap", headers=headers)
+        assert response.status_code == httpx.codes.OK
+        body = response.json()
+        assert body["config"]["app"]["id"] == "demo"
+        assert body["active_state"]["active_revision"] >= 1
+        assert [widget["type"] for widget in body["widgets"]] == ["system.status"]
+        assert isinstance(body["plugins"], list)
+        assert body["health"] == []
+        event_revision = body["event_revision"]
+
+        patch_response = await client.post(
+            "/api/v1/config/patch",
+            headers=headers,
+            json={"patch": {"app": {"title": "Patched"}}, "source": "patch"},
+        )
+        assert patch_response.status_code == httpx.codes.OK
+
+        async with client.stream(
+            "GET",
+            f"/api/v1/events/stream?once=true&since={event_revision}",
+            headers=headers,
+        ) as stream:
+            payload = ""
+            async for chunk in stream.aiter_text():
+                payload += chunk
+        assert "core.state.snapshot" not in payload
+        assert "event: core.config.patched" in payload
+
+        async with client.stream(
+            "GET",
+            f"/api/v1/events/stream?once=true&since={event_revision}&types=core.config.imported",
+            headers=headers,
+        ) as stream:
+            payload = ""
+            async for chunk in stream.aiter_text():
+                payload += chunk
+        assert "core.config.patched" not in payload
+
+        health = await client.get("/api/v1/health")
+        assert set(health.json()["events"]) == {
+            "dropped",
+            "coalesced_events",
+            "coalesced_frames",
+            "coalescing_ratio",
+            "subscribers",
+            "max_lag",
+            "resyncs",
+            "slow_subscribers",
+        }
+
+        async with client.stream(
+            "GET",
+            f"/api/v1/events/stream?once=true&since={event_revision + 1_000_000}",
+            headers=headers,
+        ) as stream:
+            payload = ""
+            async for chunk in stream.aiter_text():
+                payload += chunk
+        assert "event: core.state.snapshot" in payload
+
 
 async def test_favicon_proxy_success(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     db_path = (tmp_path / "oko.sqlite3").resolve()
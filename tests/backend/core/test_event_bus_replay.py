@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import pytest
+from core.events.bus import RESYNC_EVENT_TYPE, EventBus, EventFilter, SubscriberStats
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_resume_replays_events_after_revision() -> None:
+    bus = EventBus(replay_size=8)
+    for index in range(3):
+        await bus.publish(event_type=f"test.{index}", source="tests")
+    assert bus.revision == 3
+
+    queue = bus.resume(since=1)
+    assert queue is not None
+    assert [queue.get_nowait().type for _ in range(queue.qsize())] == ["test.1", "test.2"]
+
+    await bus.publish(event_type="test.live", source="tests")
+    assert queue.get_nowait().type == "test.live"
+    bus.unsubscribe(queue)
+
+    current = bus.resume(since=bus.revision)
+    assert current is not None and current.empty()
+    bus.unsubscribe(current)
+
+
+async def test_resume_refuses_gaps_and_unknown_revisions() -> None:
+    bus = EventBus(replay_size=2)
+    for index in range(5):
+        await bus.publish(event_type=f"test.{index}", source="tests")
+
+    assert bus.resume(since=1) is None
+    assert bus.resume(since=99) is None
+    assert bus.resume(since=4, queue_size=2) is not None
+    assert bus.resume(since=3, queue_size=1) is None
+
+
+async def test_publisher_revisions_are_kept_and_resumed_by_position() -> None:
+    replicas = [EventBus(replay_size=8) for _ in range(2)]
+    # Two publishers' events reach the replicas in different orders.
+    for bus, order in zip(replicas, ((2000, 1000, 3000), (1000, 2000, 3000)), strict=True):
+        for revision in order:
+            await bus.publish(event_type=f"test.{revision}", source="tests", revision=revision)
+
+    assert [bus.revision for bus in replicas] == [3000, 3000]
+    first = replicas[0].resume(since=2000)
+    assert first is not None
+    assert [first.get_nowait().revision for _ in range(first.qsize())] == [1000, 3000]
+    second = replicas[1].resume(since=2000)
+    assert second is not None
+    assert [second.get_nowait().revision for _ in range(second.qsize())] == [3000]
+
+    await replicas[0].publish(event_type="test.clash", source="tests", revision=1000)
+    assert replicas[0].resume(since=1000) is None
+    assert replicas[0].resume(since=4242) is None
+
+
+async def test_filtered_subscribers_only_receive_matching_events() -> None:
+    bus = EventBus()
+    health = bus.subscribe(event_filter=EventFilter(prefixes=("health.",), item_ids=frozenset({"grafana"})))
+    exact = bus.subscribe(event_filter=EventFilter(types=frozenset({"core.config.patched"})))
+    everything = bus.subscribe()
+
+    await bus.publish(event_type="health.status.updated", source="tests", payload={"item_id": "grafana"})
+    await bus.publish(event_type="health.status.updated", source="tests", payload={"item_id": "wiki"})
+    await bus.publish(event_type="autodiscover.scan.progress", source="tests", payload={"done": 1})
+    await bus.publish(event_type="core.config.patched", source="tests")
+
+    assert [health.get_nowait().payload["item_id"] for _ in range(health.qsize())] == ["grafana"]
+    assert [exact.get_nowait().type for _ in range(exact.qsize())] == ["core.config.patched"]
+    assert everything.qsize() == 4
+
+    replayed = bus.resume(since=0, event_filter=EventFilter(prefixes=("autodiscover.",)))
+    assert replayed is not None
+    assert [replayed.get_nowait().type for _ in range(replayed.qsize())] == ["autodiscover.scan.progress"]
+
+
+async def test_overflow_replaces_backlog_with_resync_marker() -> None:
+    bus = EventBus()
+    queue = bus.subscribe(queue_size=2, label="slow")
+    quiet = bus.subscribe(queue_size=2, event_filter=EventFilter(types=frozenset({"rare"})), label="quiet")
+    for index in range(4):
+        await bus.publish(event_type=f"test.{index}", source="tests")
+
+    marker, latest = queue.get_nowait(), queue.get_nowait()
+    assert marker.type == RESYNC_EVENT_TYPE
+    assert marker.payload == {"dropped": 3}
+    assert latest.type == "test.3"
+    assert quiet.empty()
+    assert bus.dropped == 3
+
+    stats = {item.label: item for item in bus.subscriber_stats()}
+    assert stats["slow"] == SubscriberStats(label="slow", queue_size=2, lag=0, high_water=2, dropped=3, resyncs=1)
+    assert stats["quiet"].high_water == 0 and stats["quiet"].resyncs == 0
+
+    await bus.publish(event_type="test.4", source="tests")
+    assert queue.get_nowait().type == "test.4"
+    assert bus.subscriber_stats()[0].resyncs == 1
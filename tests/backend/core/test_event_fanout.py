@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from core.bus.client import BusClient, MemoryBroker
+from core.contracts.bus import BusMessageV1
+from core.events import BrokerEventPublisher, EventBus, EventPublishConsumer
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _replica(broker: MemoryBroker) -> tuple[BusClient, EventBus]:
+    bus_client = BusClient(broker_url="memory://cluster", memory_broker=broker)
+    event_bus = EventBus()
+    await EventPublishConsumer(bus_client=bus_client, event_bus=event_bus).start()
+    return bus_client, event_bus
+
+
+async def test_every_replica_receives_every_event_with_the_same_revision() -> None:
+    broker = MemoryBroker()
+    worker = BusClient(broker_url="memory://cluster", memory_broker=broker)
+    publisher = BrokerEventPublisher(bus_client=worker)
+    replicas = [await _replica(broker) for _ in range(3)]
+    queues = [event_bus.subscribe() for _, event_bus in replicas]
+
+    published = [
+        await publisher.publish(event_type="health.status.updated", source="tests", payload={"item_id": str(index)})
+        for index in range(5)
+    ]
+    await worker.drain()
+
+    for queue in queues:
+        received = [queue.get_nowait() for _ in range(queue.qsize())]
+        assert [event.revision for event in received] == [event.revision for event in published]
+        assert [event.payload["item_id"] for event in received] == ["0", "1", "2", "3", "4"]
+    assert len({event_bus.revision for _, event_bus in replicas}) == 1
+
+    stopped_client, stopped_bus = replicas[0]
+    await stopped_client.close()
+    await publisher.publish(event_type="core.state.changed", source="tests")
+    await worker.drain()
+    assert stopped_bus.revision == published[-1].revision
+    assert replicas[1][1].revision == replicas[2][1].revision > published[-1].revision
+
+
+async def test_shared_named_queue_keeps_competing_consumers() -> None:
+    broker = MemoryBroker()
+    deliveries: list[str] = []
+
+    def _handler(name: str):
+        async def _on_message(incoming) -> None:
+            deliveries.append(name)
+            await asyncio.sleep(0)
+
+        return _on_message
+
+    clients = [BusClient(broker_url="memory://cluster", memory_broker=broker) for _ in range(2)]
+    for index, client in enumerate(clients):
+        await client.consume(
+            queue_name="oko.bus.storage",
+            binding_keys=("storage.kv.*",),
+            callback=_handler(str(index)),
+            prefetch_count=1,
+        )
+    await asyncio.sleep(0)
+
+    for _ in range(4):
+        message = BusMessageV1(type="storage.kv.get", plugin_id="tests")
+        await clients[0].emit(message=message, routing_key="storage.kv.get")
+    await clients[0].drain()
+
+    assert len(deliveries) == 4
+    assert set(deliveries) == {"0", "1"}
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import json
+
+from core.contracts.models import EventEnvelope
+from core.events.sse import EventCoalescer, EventStreamStats, format_sse_batch
+
+
+def _event(revision: int, event_type: str, **payload: object) -> EventEnvelope:
+    return EventEnvelope(type=event_type, revision=revision, source="tests", payload=payload)
+
+
+def test_coalescer_keeps_latest_keyed_update_in_revision_order() -> None:
+    coalescer = EventCoalescer()
+    coalescer.add(_event(1, "health.status.updated", item_id="grafana", status="online"))
+    coalescer.add(_event(2, "health.status.updated", item_id="wiki", status="online"))
+    coalescer.add(_event(3, "health.status.changed", item_id="grafana", status="down"))
+    coalescer.add(_event(4, "health.status.updated", item_id="grafana", status="down"))
+    coalescer.add(_event(5, "core.config.patched"))
+
+    assert coalescer.received == 5
+    events = coalescer.drain()
+    assert [event.revision for event in events] == [2, 3, 4, 5]
+    assert len(coalescer) == 0 and coalescer.received == 0
+
+
+def test_batch_frame_format_and_stats() -> None:
+    single = format_sse_batch([_event(7, "core.config.patched")])
+    assert single.startswith("id: 7\nevent: core.config.patched\n")
+
+    frame = format_sse_batch([_event(8, "a"), _event(9, "b")])
+    header, data = frame.strip().split("\ndata: ")
+    assert header == "id: 9\nevent: events.batch"
+    assert [item["type"] for item in json.loads(data)] == ["a", "b"]
+
+    stats = EventStreamStats()
+    assert stats.coalescing_ratio == 1.0
+    stats.record(events=5)
+    stats.record(events=1)
+    assert stats.coalescing_ratio == 3.0
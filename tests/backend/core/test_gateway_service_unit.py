@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
@@ -14,10 +15,11 @@ pytestmark = pytest.mark.asyncio
 def _gateway(*, execute_enabled: bool = True) -> tuple[ActionGateway, SimpleNamespace, SimpleNamespace, SimpleNamespace]:
     actions = SimpleNamespace(
         create_queued=AsyncMock(),
+        create_batch=AsyncMock(),
         set_status=AsyncMock(),
         list_history=AsyncMock(return_value=[]),
     )
-    audit = SimpleNamespace(append=AsyncMock())
+    audit = SimpleNamespace(append=AsyncMock(), append_many=AsyncMock())
     events = SimpleNamespace(publish=AsyncMock())
     gateway = ActionGateway(actions=actions, audit=audit, events=events, execute_enabled=execute_enabled)
     return gateway, actions, audit, events
@@ -196,3 +198,121 @@ async def test_execute_action_failure_paths() -> None:
     assert actions.set_status.await_count >= 4
     assert audit.append.await_count >= 4
     assert events.publish.await_count >= 4
+
+
+async def test_execute_batch_limits_concurrency_and_collects_errors() -> None:
+    actions = SimpleNamespace(create_batch=AsyncMock(), set_status=AsyncMock())
+    gateway = ActionGateway(
+        actions=actions,
+        audit=SimpleNamespace(append=AsyncMock(), append_many=AsyncMock()),
+        events=SimpleNamespace(publish=AsyncMock()),
+        execute_enabled=True,
+        batch_concurrency=2,
+    )
+    in_flight = 0
+    peak = 0
+
+    async def _executor(action: ActionEnvelope) -> dict[str, int]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if action.payload.get("x") == 3:
+            raise ApiError(status_code=409, code="conflict", message="conflict")
+        return {"x": action.payload["x"]}
+
+    gateway.register_action(action_type="demo.action", capability="exec.demo", description="Demo", executor=_executor)
+    batch = [
+        ActionEnvelope(type="demo.action", requested_by="tester", capability="exec.demo", payload={"x": index})
+        for index in range(6)
+    ]
+
+    results = await gateway.execute_batch(actions=batch, actor="tester")
+    assert peak == 2
+    assert [item.action_id for item in results] == [action.id for action in batch]
+    assert [item.status for item in results] == ["succeeded"] * 3 + ["failed"] + ["succeeded"] * 2
+    assert results[3].error is not None and results[3].error["status_code"] == 409
+    assert results[0].result == {"x": 0}
+
+    with pytest.raises(ApiError) as duplicate:
+        await gateway.execute_batch(actions=[batch[0], batch[0]], actor="tester")
+    assert duplicate.value.error.code == "duplicate_action_id"
+
+
+async def test_execute_batch_reports_blocked_when_kill_switch_enabled() -> None:
+    gateway, _actions, _audit, _events = _gateway(execute_enabled=False)
+    gateway.register_action(
+        action_type="demo.action",
+        capability="exec.demo",
+        description="Demo",
+        executor=lambda _action: {"ok": True},
+    )
+    results = await gateway.execute_batch(actions=[_action()], actor="tester")
+    assert results[0].status == "blocked"
+    assert results[0].error is not None and results[0].error["code"] == "execute_disabled"
+
+
+async def test_execute_batch_turns_unexpected_errors_into_failed_items() -> None:
+    batch = [_action(), _action(), _action()]
+
+    async def _set_status(*, action_id: object, status: str, **_kwargs: object) -> None:
+        if action_id == batch[1].id and status == "running":
+            raise RuntimeError("database is locked")
+
+    actions = SimpleNamespace(create_batch=AsyncMock(), set_status=AsyncMock(side_effect=_set_status))
+    gateway = ActionGateway(
+        actions=actions,
+        audit=SimpleNamespace(append=AsyncMock(), append_many=AsyncMock()),
+        events=SimpleNamespace(publish=AsyncMock()),
+        execute_enabled=True,
+    )
+    gateway.register_action(
+        action_type="demo.action",
+        capability="exec.demo",
+        description="Demo",
+        executor=lambda _action: {"ok": True},
+    )
+
+    results = await gateway.execute_batch(actions=batch, actor="tester")
+    assert [item.status for item in results] == ["succeeded", "failed", "succeeded"]
+    assert results[1].error == {"code": "execution_failed", "message": "database is locked", "status_code": 500}
+
+    actions.create_batch.side_effect = RuntimeError("database is locked")
+    results = await gateway.execute_batch(actions=[_action(), _action()], actor="tester")
+    assert [item.status for item in results] == ["failed", "failed"]
+    assert results[0].error == {"code": "execution_failed", "message": "database is locked", "status_code": 500}
+
+
+async def test_execute_batch_validates_once_per_action_type_and_stores_in_bulk() -> None:
+    gateway, actions, audit, _events = _gateway()
+    gateway.register_action(
+        action_type="demo.action",
+        capability="exec.demo",
+        description="Demo",
+        executor=lambda _action: {"ok": True},
+    )
+    checks: list[str] = []
+    blocked_reason = gateway._blocked_reason
+
+    def _counting_blocked_reason(*, action: ActionEnvelope, actor: str) -> str | None:
+        checks.append(action.type)
+        return blocked_reason(action=action, actor=actor)
+
+    gateway._blocked_reason = _counting_blocked_reason  # type: ignore[method-assign]
+    batch = [_action() for _ in range(4)] + [_action(action_type="unknown"), _action(action_type="unknown")]
+
+    results = await gateway.execute_batch(actions=batch, actor="tester")
+
+    assert [item.status for item in results] == ["succeeded"] * 4 + ["blocked"] * 2
+    assert sorted(checks) == ["demo.action", "unknown"]
+    actions.create_queued.assert_not_awaited()
+    actions.create_batch.assert_awaited_once()
+    stored = actions.create_batch.await_args.args[0]
+    assert [(action.id, status) for action, status, _error in stored] == [
+        (action.id, "validated" if action.type == "demo.action" else "blocked") for action in batch
+    ]
+    assert stored[-1][2] == {"reason": "Unknown action type: unknown"}
+    audit.append.assert_awaited()
+    audit.append_many.assert_awaited_once()
+    assert [event.outcome for event in audit.append_many.await_args.args[0]] == ["validated"] * 4 + ["blocked"] * 2
@@ -13,6 +13,7 @@ from apps.health.model.contracts import (
     HealthCheckRequestedV1,
     HealthCheckResultV1,
     HealthSample,
+    HealthStatusChangedV1,
     MonitoredServiceSpec,
 )
 from apps.health.service.checkers import HealthChecker
@@ -21,6 +22,7 @@ from apps.health.service.repository import HealthRepository
 from apps.health.service.status import evaluate_health
 from apps.health.worker.scheduler import HealthScheduler
 from core.bus.client import BusClient
+from core.bus.memory import MemoryBroker
 from core.contracts.bus import BusMessageV1
 from core.events import BrokerEventPublisher, EventBus, EventPublishConsumer
 from core.storage.models import (
@@ -289,9 +291,9 @@ async def test_status_changes_publish_event(tmp_path: Path) -> None:
             ),
             routing_key="health.check.result",
         )
-        third_event = await asyncio.wait_for(queue.get(), timeout=2.0)
-        assert third_event.type == "health.status.updated"
-        assert third_event.payload["current_status"] == "down"
+        await asyncio.sleep(0.05)
+        assert queue.empty()
+        assert result_consumer.suppressed == 1
     finally:
         event_bus.unsubscribe(queue)
         await result_consumer.stop()
@@ -342,6 +344,173 @@ async def test_retention_deletes_old_samples(tmp_path: Path) -> None:
     await _dispose(session_factory)
 
 
+async def test_result_consumer_emits_updates_only_for_significant_moves(monkeypatch: pytest.MonkeyPatch) -> None:
+    consumer = HealthCheckResultConsumer(
+        bus_client=BusClient(broker_url="memory://health"),
+        repository=SimpleNamespace(),  # type: ignore[arg-type]
+        event_publisher=SimpleNamespace(),  # type: ignore[arg-type]
+        window_size=10,
+        latency_delta_ms=50,
+        success_rate_delta=0.1,
+        keepalive_sec=60,
+    )
+    clock = [1000.0]
+    monkeypatch.setattr("apps.health.bus_handlers.check_result_consumer.time.monotonic", lambda: clock[0])
+    base = HealthStatusChangedV1(
+        service_id=uuid4(),
+        item_id="svc",
+        current_status="online",
+        avg_latency_ms=100.0,
+        success_rate=1.0,
+        consecutive_failures=0,
+        window_size=10,
+    )
+
+    assert consumer._is_significant(base)
+    consumer._remember(base)
+    assert not consumer._is_significant(base.model_copy(update={"avg_latency_ms": 140.0}))
+    assert consumer._is_significant(base.model_copy(update={"avg_latency_ms": 151.0}))
+    assert not consumer._is_significant(base.model_copy(update={"success_rate": 0.95}))
+    assert consumer._is_significant(base.model_copy(update={"success_rate": 0.9}))
+    assert consumer._is_significant(base.model_copy(update={"avg_latency_ms": None}))
+
+    clock[0] += 61
+    assert consumer._is_significant(base)
+
+
+async def test_result_consumers_share_emitted_state_and_prune_it(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [1000.0]
+    monkeypatch.setattr("apps.health.bus_handlers.check_result_consumer.time.monotonic", lambda: clock[0])
+    event_bus = EventBus()
+    consumers = [
+        HealthCheckResultConsumer(
+            bus_client=BusClient(broker_url="memory://health-replicas"),
+            repository=SimpleNamespace(),  # type: ignore[arg-type]
+            event_publisher=SimpleNamespace(),  # type: ignore[arg-type]
+            window_size=10,
+            latency_delta_ms=50,
+            keepalive_sec=60,
+            event_bus=event_bus,
+        )
+        for _ in range(2)
+    ]
+    for consumer in consumers:
+        await consumer.start()
+    base = HealthStatusChangedV1(
+        service_id=uuid4(),
+        item_id="svc",
+        current_status="online",
+        avg_latency_ms=100.0,
+        success_rate=1.0,
+        consecutive_failures=0,
+        window_size=10,
+    )
+    try:
+        await event_bus.publish(
+            event_type="health.status.updated",
+            source="apps.health.aggregator",
+            payload=base.model_dump(mode="json"),
+        )
+        # The replica that did not publish still suppresses an insignificant move.
+        assert not consumers[1]._is_significant(base.model_copy(update={"avg_latency_ms": 120.0}))
+
+        clock[0] += 61
+        other = base.model_copy(update={"service_id": uuid4()})
+        consumers[1]._remember(other)
+        assert set(consumers[1]._emitted) == {other.service_id}
+    finally:
+        for consumer in consumers:
+            await consumer.stop()
+
+
+async def test_worker_replicas_share_emitted_state_through_the_event_fanout(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    broker = MemoryBroker()
+    service_id = uuid4()
+    await HealthRepository(session_factory).sync_services(
+        [
+            MonitoredServiceSpec(
+                id=service_id,
+                item_id="svc-shared",
+                name="svc-shared",
+                check_type="http",
+                target="https://example.local",
+                interval_sec=300,
+                timeout_ms=1500,
+                latency_threshold_ms=800,
+                enabled=True,
+            )
+        ]
+    )
+    # Wired like the worker role: each replica has its own bus client, event bus and event fan-out.
+    workers = []
+    for _ in range(2):
+        bus_client = BusClient(broker_url="memory://health-workers", memory_broker=broker)
+        event_bus = EventBus()
+        workers.append(
+            (
+                bus_client,
+                event_bus,
+                EventPublishConsumer(bus_client=bus_client, event_bus=event_bus),
+                HealthCheckResultConsumer(
+                    bus_client=bus_client,
+                    repository=HealthRepository(session_factory),
+                    event_publisher=BrokerEventPublisher(bus_client=bus_client),
+                    window_size=1,
+                    event_bus=event_bus,
+                ),
+            )
+        )
+    queues = [event_bus.subscribe() for _, event_bus, _, _ in workers]
+    result = HealthCheckResultV1(
+        service_id=service_id,
+        item_id="svc-shared",
+        check_type="http",
+        target="https://example.local",
+        success=True,
+        latency_ms=120,
+        error_message=None,
+    )
+
+    async def _emit(latency_ms: int) -> None:
+        await workers[0][0].emit(
+            message=BusMessageV1(
+                type="health.check.result",
+                plugin_id="core.health",
+                payload=result.model_copy(update={"latency_ms": latency_ms}).model_dump(mode="json"),
+            ),
+            routing_key="health.check.result",
+        )
+
+    try:
+        for bus_client, _, event_publish_consumer, result_consumer in workers:
+            await bus_client.connect()
+            await event_publish_consumer.start()
+            await result_consumer.start()
+
+        await _emit(120)
+        for queue in queues:
+            assert (await asyncio.wait_for(queue.get(), timeout=2.0)).type == "health.status.changed"
+
+        for attempt, latency_ms in enumerate((125, 130, 135), start=1):
+            await _emit(latency_ms)
+            async with asyncio.timeout(2.0):
+                while sum(result_consumer.suppressed for *_, result_consumer in workers) < attempt:
+                    await asyncio.sleep(0.01)
+        assert all(result_consumer.suppressed > 0 for *_, result_consumer in workers)
+        await asyncio.sleep(0.05)
+        assert all(queue.empty() for queue in queues)
+    finally:
+        for (bus_client, event_bus, event_publish_consumer, result_consumer), queue in zip(
+            workers, queues, strict=True
+        ):
+            event_bus.unsubscribe(queue)
+            await result_consumer.stop()
+            await event_publish_consumer.stop()
+            await bus_client.close()
+        await _dispose(session_factory)
+
+
 async def test_disabled_service_not_scheduled(tmp_path: Path) -> None:
     session_factory = await _session_factory(tmp_path)
     repository = HealthRepository(session_factory)
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from apps.health.service.repository import build_snapshot_item
+from apps.health.service.snapshot import HealthSnapshotCache
+from core.events.bus import EventBus
+
+pytestmark = pytest.mark.asyncio
+
+
+class _SlowRepository:
+    def __init__(self, entries: list) -> None:
+        self.entries = entries
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def list_snapshot_entries(self) -> list:
+        self.calls += 1
+        await self.release.wait()
+        return list(self.entries)
+
+
+def _status_payload(service_id, *, item_id: str, status: str, latency: float | None = 12.4) -> dict:
+    return {
+        "service_id": str(service_id),
+        "item_id": item_id,
+        "previous_status": None,
+        "current_status": status,
+        "avg_latency_ms": latency,
+        "success_rate": 1.0,
+        "consecutive_failures": 0,
+        "window_size": 10,
+    }
+
+
+async def test_concurrent_connects_share_one_rebuild() -> None:
+    service_id = uuid4()
+    repository = _SlowRepository(
+        [
+            (
+                service_id,
+                build_snapshot_item(
+                    item_id="grafana",
+                    status="online",
+                    avg_latency=10.0,
+                    success_rate=1.0,
+                    consecutive_failures=0,
+                ),
+            )
+        ]
+    )
+    cache = HealthSnapshotCache(repository=repository, event_bus=EventBus())  # type: ignore[arg-type]
+
+    readers = [asyncio.create_task(cache.items()) for _ in range(1000)]
+    await asyncio.sleep(0)
+    repository.release.set()
+    results = await asyncio.gather(*readers)
+
+    assert repository.calls == 1
+    assert all(result == results[0] for result in results)
+    assert results[0][0]["item_id"] == "grafana"
+
+    await cache.items()
+    assert repository.calls == 1
+
+
+async def test_cache_applies_status_events_and_invalidates_on_config_change() -> None:
+    bus = EventBus()
+    known, fresh = uuid4(), uuid4()
+    repository = _SlowRepository(
+        [
+            (
+                known,
+                build_snapshot_item(
+                    item_id="grafana",
+                    status="online",
+                    avg_latency=10.0,
+                    success_rate=1.0,
+                    consecutive_failures=0,
+                ),
+            )
+        ]
+    )
+    repository.release.set()
+    cache = HealthSnapshotCache(repository=repository, event_bus=bus)  # type: ignore[arg-type]
+    await cache.start()
+    try:
+        await cache.items()
+        await bus.publish(
+            event_type="health.status.changed",
+            source="tests",
+            payload=_status_payload(known, item_id="grafana", status="down", latency=None),
+        )
+        await bus.publish(
+            event_type="health.status.updated",
+            source="tests",
+            payload=_status_payload(fresh, item_id="wiki", status="degraded"),
+        )
+        await bus.publish(event_type="autodiscover.scan.progress", source="tests", payload={"service_id": "x"})
+
+        items = {item["item_id"]: item for item in await cache.items()}
+        assert repository.calls == 1
+        assert items["grafana"]["status"] == "down"
+        assert items["grafana"]["error"] == "check failed"
+        assert items["wiki"]["latency_ms"] == 12
+        assert items["wiki"]["ok"] is True
+
+        await bus.publish(event_type="core.config.patched", source="tests", payload={})
+        await cache.items()
+        assert repository.calls == 2
+    finally:
+        await cache.stop()
+
+
+async def test_events_during_rebuild_are_not_lost() -> None:
+    bus = EventBus()
+    service_id = uuid4()
+    repository = _SlowRepository(
+        [
+            (
+                service_id,
+                build_snapshot_item(
+                    item_id="grafana",
+                    status="online",
+                    avg_latency=10.0,
+                    success_rate=1.0,
+                    consecutive_failures=0,
+                ),
+            )
+        ]
+    )
+    cache = HealthSnapshotCache(repository=repository, event_bus=bus)  # type: ignore[arg-type]
+    await cache.start()
+    try:
+        reader = asyncio.create_task(cache.items())
+        await asyncio.sleep(0)
+        await bus.publish(
+            event_type="health.status.changed",
+            source="tests",
+            payload=_status_payload(service_id, item_id="grafana", status="down"),
+        )
+        repository.release.set()
+        items = await reader
+        assert items[0]["status"] == "down"
+    finally:
+        await cache.stop()
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from core.bus.client import BusClient, BusRpcTimeoutError, MemoryBroker
+from core.bus.constants import QUEUE_STORAGE, STORAGE_BULK_ROUTING_KEYS, STORAGE_INTERACTIVE_ROUTING_KEYS
+from core.bus.policy import STORAGE_LANES, DeliveryPolicy, delivery_policy_for
+from core.bus.topic import TopicTrie, routing_key_matches
+from core.contracts.bus import BusMessageV1, BusReplyV1
+
+pytestmark = pytest.mark.asyncio
+
+
+def _message() -> BusMessageV1:
+    return BusMessageV1(type="health.check.request", plugin_id="tests")
+
+
+def _storage_get(correlation_id: str) -> BusMessageV1:
+    return BusMessageV1(type="storage.kv.get", plugin_id="tests", correlation_id=correlation_id)
+
+
+async def test_emit_does_not_wait_for_consumers_and_prefetch_bounds_concurrency() -> None:
+    bus_client = BusClient(broker_url="memory://bench")
+    release = asyncio.Event()
+    running = 0
+    peak = 0
+    handled = 0
+
+    async def _slow(incoming) -> None:
+        nonlocal running, peak, handled
+        running += 1
+        peak = max(peak, running)
+        await release.wait()
+        running -= 1
+        handled += 1
+
+    await bus_client.consume(
+        queue_name="test.slow",
+        binding_keys=("health.check.*",),
+        callback=_slow,
+        prefetch_count=3,
+    )
+    try:
+        for _ in range(10):
+            await asyncio.wait_for(bus_client.emit(message=_message(), routing_key="health.check.request"), 0.5)
+        await asyncio.sleep(0.01)
+        assert handled == 0
+        assert peak == 3
+
+        release.set()
+        await bus_client.drain()
+        assert handled == 10
+        assert peak == 3
+    finally:
+        await bus_client.close()
+
+
+async def test_default_consumer_keeps_order_and_can_publish_into_its_own_full_queue() -> None:
+    bus_client = BusClient(broker_url="memory://bench", memory_queue_size=2)
+    seen: list[str] = []
+
+    async def _handler(incoming) -> None:
+        message = BusMessageV1.model_validate_json(incoming.body)
+        seen.append(message.correlation_id or "")
+        await asyncio.sleep(0)
+        if message.correlation_id == "0":
+            for index in range(3):
+                echo = BusMessageV1(type="health.check.request", plugin_id="tests", correlation_id=f"echo-{index}")
+                await bus_client.emit(message=echo, routing_key="health.check.request")
+
+    await bus_client.consume(queue_name="test.ordered", binding_keys=("health.check.*",), callback=_handler)
+    try:
+        for index in range(3):
+            message = BusMessageV1(type="health.check.request", plugin_id="tests", correlation_id=str(index))
+            await bus_client.emit(message=message, routing_key="health.check.request")
+        await asyncio.wait_for(bus_client.drain(), 1.0)
+
+        assert seen[:3] == ["0", "1", "2"]
+        assert sorted(seen[3:]) == ["echo-0", "echo-1", "echo-2"]
+    finally:
+        await bus_client.close()
+
+
+async def test_full_queue_applies_backpressure_to_publishers() -> None:
+    bus_client = BusClient(broker_url="memory://bench", memory_queue_size=2)
+    release = asyncio.Event()
+
+    async def _blocked(incoming) -> None:
+        await release.wait()
+
+    await bus_client.consume(
+        queue_name="test.blocked",
+        binding_keys=("health.check.request",),
+        callback=_blocked,
+        prefetch_count=1,
+    )
+    try:
+        for _ in range(3):
+            await bus_client.emit(message=_message(), routing_key="health.check.request")
+            await asyncio.sleep(0)
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(bus_client.emit(message=_message(), routing_key="health.check.request"), 0.05)
+
+        release.set()
+        await asyncio.wait_for(bus_client.emit(message=_message(), routing_key="health.check.request"), 0.5)
+        await bus_client.drain()
+    finally:
+        await bus_client.close()
+
+
+async def test_delivery_policies_follow_the_topology() -> None:
+    assert delivery_policy_for("health.check.request") == DeliveryPolicy(persistent=False, ttl_sec=30.0)
+    assert delivery_policy_for("storage.table.query").persistent is False
+    assert delivery_policy_for("plugin.custom.topic") == DeliveryPolicy()
+    assert set(STORAGE_INTERACTIVE_ROUTING_KEYS).isdisjoint(STORAGE_BULK_ROUTING_KEYS)
+
+
+async def test_requests_expire_once_the_caller_gave_up() -> None:
+    broker = MemoryBroker()
+    bus_client = BusClient(broker_url="memory://bench", memory_broker=broker)
+    release = asyncio.Event()
+    handled: list[str] = []
+
+    async def _handler(incoming) -> None:
+        await release.wait()
+        handled.append(str(incoming.correlation_id))
+        await bus_client.reply(incoming, BusReplyV1(correlation_id=str(incoming.correlation_id), ok=True))
+
+    await bus_client.consume(
+        queue_name=QUEUE_STORAGE,
+        binding_keys=STORAGE_INTERACTIVE_ROUTING_KEYS,
+        callback=_handler,
+        prefetch_count=1,
+    )
+    try:
+        first = asyncio.create_task(
+            bus_client.call(message=_storage_get("first"), routing_key="storage.kv.get", timeout_sec=1.0)
+        )
+        await asyncio.sleep(0)
+        with pytest.raises(BusRpcTimeoutError):
+            await bus_client.call(message=_storage_get("stale"), routing_key="storage.kv.get", timeout_sec=0.05)
+        release.set()
+        assert (await first).ok
+        await bus_client.drain()
+        assert handled == ["first"]
+        assert broker.expired == 1
+    finally:
+        await bus_client.close()
+
+
+async def test_interactive_storage_lane_is_not_blocked_by_bulk_traffic() -> None:
+    bus_client = BusClient(broker_url="memory://bench")
+    release = asyncio.Event()
+
+    async def _handler(incoming) -> None:
+        message = BusMessageV1.model_validate_json(incoming.body)
+        if message.type in STORAGE_BULK_ROUTING_KEYS:
+            await release.wait()
+        await bus_client.reply(incoming, BusReplyV1(correlation_id=str(incoming.correlation_id), ok=True))
+
+    for lane in STORAGE_LANES:
+        await bus_client.consume(
+            queue_name=lane.queue_name,
+            binding_keys=lane.binding_keys,
+            callback=_handler,
+            prefetch_count=lane.prefetch_count,
+        )
+    try:
+        bulk = [
+            asyncio.create_task(
+                bus_client.call(
+                    message=BusMessageV1(type="storage.table.query", plugin_id="tests"),
+                    routing_key="storage.table.query",
+                    timeout_sec=2.0,
+                )
+            )
+            for _ in range(20)
+        ]
+        await asyncio.sleep(0)
+        reply = await bus_client.call(message=_storage_get("fast"), routing_key="storage.kv.get", timeout_sec=0.5)
+        assert reply.ok
+        assert not any(task.done() for task in bulk)
+        release.set()
+        assert all(result.ok for result in await asyncio.gather(*bulk))
+    finally:
+        await bus_client.close()
+
+
+async def test_topic_trie_matches_amqp_wildcards() -> None:
+    trie: TopicTrie[str] = TopicTrie()
+    bindings = {
+        "exact": "storage.kv.get",
+        "star": "storage.*.get",
+        "tail": "storage.#",
+        "middle": "storage.#.query",
+        "everything": "#",
+        "other": "action.execute",
+    }
+    for name, pattern in bindings.items():
+        trie.add(pattern, name)
+
+    assert set(trie.match("storage.kv.get")) == {"exact", "star", "tail", "everything"}
+    assert set(trie.match("storage.table.query")) == {"tail", "middle", "everything"}
+    assert set(trie.match("storage.query")) == {"tail", "middle", "everything"}
+    assert set(trie.match("storage")) == {"tail", "everything"}
+    assert set(trie.match("action.execute.batch")) == {"everything"}
+    for routing_key in ("storage.kv.get", "storage.table.query", "storage", "action.execute.batch", "a.b"):
+        expected = {name for name, pattern in bindings.items() if routing_key_matches(pattern, routing_key)}
+        assert set(trie.match(routing_key)) == expected
+
+    trie.discard("#", "everything")
+    trie.discard("storage.#", "tail")
+    assert set(trie.match("storage.kv.get")) == {"exact", "star"}
+    assert trie.match("action.execute.batch") == ()
+
+
+async def test_memory_dispatch_stops_routing_to_closed_queues() -> None:
+    broker = MemoryBroker()
+    delivered: list[str] = []
+    clients = [BusClient(broker_url="memory://broker", memory_broker=broker) for _ in range(2)]
+
+    for index, client in enumerate(clients):
+
+        async def _on_message(incoming, name: str = str(index)) -> None:
+            delivered.append(name)
+
+        await client.consume(
+            queue_name=f"tests.{index}",
+            binding_keys=("health.#",),
+            callback=_on_message,
+            exclusive=True,
+        )
+
+    await clients[0].emit(message=_message(), routing_key="health.check.request")
+    await clients[0].drain()
+    await clients[1].close()
+    await clients[0].emit(message=_message(), routing_key="health.check.request")
+    await clients[0].drain()
+    await clients[0].close()
+
+    assert sorted(delivered) == ["0", "0", "1"]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
 import pytest
 from core.contracts.storage import PluginStorageConfig, StorageLimits, StorageTableSpec
@@ -8,6 +9,7 @@ from core.storage import StorageLimitExceeded, StorageQueryNotAllowed, StorageRa
 from core.storage.models import PluginIndexRow, PluginKvRow, PluginRow
 from db.base import Base
 from db.session import build_async_engine
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 
@@ -233,3 +235,199 @@ async def test_plugin_id_isolation(tmp_path: Path) -> None:
         assert rows_b == [{"id": "shared", "ip": "10.0.1.1", "kind": "sensor"}]
     finally:
         await _dispose(session_factory)
+
+
+@pytest.mark.asyncio
+async def test_table_scan_ranges_ordering_and_cursor(tmp_path: Path) -> None:
+    session_factory = await _build_session_factory(tmp_path)
+    config = PluginStorageConfig(
+        mode="core_universal",
+        limits=StorageLimits(max_qps=1000.0),
+        tables=[StorageTableSpec(name="services", primary_key="id", indexes=["host", "port"])],
+    )
+    storage = UniversalStorage(session_factory=session_factory, plugin_configs={"plugin.autodiscover": config})
+    try:
+        for index, (host, port) in enumerate(
+            [("nas", 22), ("nas-2", 443), ("router", 80), ("nas", 8080), ("printer", 9100), ("nas", -1)]
+        ):
+            await storage.table_upsert(
+                plugin_id="plugin.autodiscover",
+                table="services",
+                row={"id": f"s{index}", "host": host, "port": port},
+            )
+
+        rows, next_cursor = await storage.table_scan(
+            plugin_id="plugin.autodiscover",
+            table="services",
+            where={"port": {"between": [0, 1024]}},
+            order_by="port",
+        )
+        assert [row["port"] for row in rows] == [22, 80, 443]
+        assert next_cursor is None
+
+        rows, _ = await storage.table_scan(
+            plugin_id="plugin.autodiscover",
+            table="services",
+            where={"host": {"prefix": "nas"}},
+            order_by="port",
+            descending=True,
+        )
+        assert [row["port"] for row in rows] == [8080, 443, 22, -1]
+
+        pages: list[list[str]] = []
+        cursor = None
+        while True:
+            rows, cursor = await storage.table_scan(
+                plugin_id="plugin.autodiscover",
+                table="services",
+                where={"host": "nas"},
+                order_by="port",
+                descending=True,
+                cursor=cursor,
+                limit=2,
+            )
+            pages.append([row["id"] for row in rows])
+            if cursor is None:
+                break
+        assert pages == [["s3", "s0"], ["s5"]]
+
+        rows, pk_cursor = await storage.table_scan(
+            plugin_id="plugin.autodiscover",
+            table="services",
+            where={"id": {"gt": "s2"}},
+            limit=2,
+        )
+        assert [row["id"] for row in rows] == ["s3", "s4"]
+        assert pk_cursor is not None
+
+        with pytest.raises(StorageQueryNotAllowed):
+            await storage.table_scan(plugin_id="plugin.autodiscover", table="services", order_by="proto")
+        with pytest.raises(StorageQueryNotAllowed):
+            await storage.table_scan(
+                plugin_id="plugin.autodiscover",
+                table="services",
+                order_by="port",
+                cursor=pk_cursor,
+            )
+    finally:
+        await _dispose(session_factory)
+
+
+@pytest.mark.asyncio
+async def test_table_scan_orders_primary_keys_by_value(tmp_path: Path) -> None:
+    session_factory = await _build_session_factory(tmp_path)
+    config = PluginStorageConfig(
+        mode="core_universal",
+        limits=StorageLimits(max_qps=1000.0),
+        tables=[
+            StorageTableSpec(name="ports", primary_key="port"),
+            StorageTableSpec(name="hosts", primary_key="name"),
+        ],
+    )
+    storage = UniversalStorage(session_factory=session_factory, plugin_configs={"plugin.autodiscover": config})
+    try:
+        for port in (10, 2, 1, 443, 22):
+            await storage.table_upsert(plugin_id="plugin.autodiscover", table="ports", row={"port": port})
+        for name in ("ab c", "ab", "ab!"):
+            await storage.table_upsert(plugin_id="plugin.autodiscover", table="hosts", row={"name": name})
+
+        pages: list[list[int]] = []
+        cursor = None
+        while True:
+            rows, cursor = await storage.table_scan(
+                plugin_id="plugin.autodiscover", table="ports", cursor=cursor, limit=2
+            )
+            pages.append([row["port"] for row in rows])
+            if cursor is None:
+                break
+        assert pages == [[1, 2], [10, 22], [443]]
+
+        rows, _ = await storage.table_scan(
+            plugin_id="plugin.autodiscover", table="ports", where={"port": {"gt": 2}}, descending=True
+        )
+        assert [row["port"] for row in rows] == [443, 22, 10]
+
+        rows, _ = await storage.table_scan(plugin_id="plugin.autodiscover", table="hosts")
+        assert [row["name"] for row in rows] == ["ab", "ab c", "ab!"]
+        rows, _ = await storage.table_scan(
+            plugin_id="plugin.autodiscover", table="hosts", where={"name": {"lt": "ab c"}}
+        )
+        assert [row["name"] for row in rows] == ["ab"]
+    finally:
+        await _dispose(session_factory)
+
+
+@pytest.mark.asyncio
+async def test_equality_predicates_drive_queries_through_the_index_lookup(tmp_path: Path) -> None:
+    session_factory = await _build_session_factory(tmp_path)
+    config = PluginStorageConfig(
+        mode="core_universal",
+        limits=StorageLimits(max_qps=1000.0, max_rows_per_table=5000),
+        tables=[StorageTableSpec(name="runs", primary_key="id", indexes=["status", "requested_at"])],
+    )
+    storage = UniversalStorage(session_factory=session_factory, plugin_configs={"plugin.autodiscover": config})
+    engine = session_factory.kw["bind"]
+    statements: list[tuple[str, Any]] = []
+
+    def _capture(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        if statement.lstrip().upper().startswith("SELECT") and "plugin_rows.row_json" in statement:
+            statements.append((statement, parameters))
+
+    async def _plan() -> list[str]:
+        statement, parameters = statements.pop()
+        async with engine.connect() as connection:
+            result = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            return [str(row[-1]) for row in result.all()]
+
+    try:
+        async with session_factory() as session, session.begin():
+            for index in range(3000):
+                status = "completed" if index % 100 == 0 else "failed"
+                requested_at = f"2026-01-01T00:{index // 60 % 60:02d}:{index % 60:02d}"
+                session.add(
+                    PluginRow(
+                        plugin_id="plugin.autodiscover",
+                        table_name="runs",
+                        pk=f'"r{index:04d}"',
+                        sort_key=f"3r{index:04d}",
+                        row_json=f'{{"id":"r{index:04d}","requested_at":"{requested_at}","status":"{status}"}}',
+                        row_bytes=64,
+                    )
+                )
+                for name, value in (("status", status), ("requested_at", requested_at)):
+                    session.add(
+                        PluginIndexRow(
+                            plugin_id="plugin.autodiscover",
+                            table_name="runs",
+                            index_name=name,
+                            index_value=f'"{value}"',
+                            sort_key=f"3{value}",
+                            pk=f'"r{index:04d}"',
+                        )
+                    )
+        event.listen(engine.sync_engine, "before_cursor_execute", _capture)
+
+        rows = await storage.table_query(plugin_id="plugin.autodiscover", table="runs", where={"status": "completed"})
+        assert [row["id"] for row in rows][:3] == ["r0000", "r0100", "r0200"]
+        plan = await _plan()
+        assert "ix_plugin_indexes_lookup" in plan[0]
+        assert not any("ix_plugin_rows_sort" in step for step in plan)
+
+        rows, _ = await storage.table_scan(
+            plugin_id="plugin.autodiscover",
+            table="runs",
+            where={"status": "completed"},
+            order_by="requested_at",
+            descending=True,
+            limit=1,
+        )
+        assert [row["id"] for row in rows] == ["r2900"]
+        plan = await _plan()
+        assert "ix_plugin_indexes_lookup" in plan[0]
+        assert not any("ix_plugin_indexes_sort" in step for step in plan)
+
+        await storage.table_scan(plugin_id="plugin.autodiscover", table="runs", limit=1)
+        assert "ix_plugin_rows_sort" in (await _plan())[0]
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _capture)
+        await _dispose(session_factory)
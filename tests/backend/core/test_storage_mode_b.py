@@ -319,6 +319,67 @@ async def test_query_restrictions_and_limit_clamp(tmp_path: Path) -> None:
         await _dispose(session_factory)
 
 
+@pytest.mark.asyncio
+async def test_table_scan_orders_by_index_with_cursor(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    ddl = _ddl_v2()
+    ddl.tables[0].indexes.append(
+        StorageDDLIndexSpec(name="ix_scan_runs_status_requested_at", columns=["status", "requested_at"])
+    )
+    storage = PhysicalStorage(
+        session_factory=session_factory,
+        plugin_configs={"autodiscover": _config(ddl=ddl, indexes=["status", "requested_at"])},
+    )
+
+    try:
+        await storage.install_all()
+        for index, status in enumerate(["completed", "failed", "completed", "synced", "completed"]):
+            row = _scan_row(f"scan-{index}", status=status)
+            row["requested_at"] = f"2026-02-0{index + 1}T00:00:00+00:00"
+            await storage.table_upsert(plugin_id="autodiscover", table="scan_runs", row=row)
+
+        latest, _ = await storage.table_scan(
+            plugin_id="autodiscover",
+            table="scan_runs",
+            where={"status": "completed"},
+            order_by="requested_at",
+            descending=True,
+            limit=1,
+        )
+        assert [row["scan_id"] for row in latest] == ["scan-4"]
+
+        rows, next_cursor = await storage.table_scan(
+            plugin_id="autodiscover",
+            table="scan_runs",
+            where={"requested_at": {"between": ["2026-02-02T00:00:00+00:00", "2026-02-04T00:00:00+00:00"]}},
+            order_by="requested_at",
+            limit=2,
+        )
+        assert [row["scan_id"] for row in rows] == ["scan-1", "scan-2"]
+        rows, next_cursor = await storage.table_scan(
+            plugin_id="autodiscover",
+            table="scan_runs",
+            where={"requested_at": {"between": ["2026-02-02T00:00:00+00:00", "2026-02-04T00:00:00+00:00"]}},
+            order_by="requested_at",
+            cursor=next_cursor,
+            limit=2,
+        )
+        assert [row["scan_id"] for row in rows] == ["scan-3"]
+        assert next_cursor is None
+
+        rows, _ = await storage.table_scan(
+            plugin_id="autodiscover",
+            table="scan_runs",
+            where={"status": {"prefix": "sync"}, "scan_id": {"lte": "scan-3"}},
+        )
+        assert [row["scan_id"] for row in rows] == ["scan-3"]
+
+        with pytest.raises(StorageQueryNotAllowed):
+            await storage.table_scan(plugin_id="autodiscover", table="scan_runs", order_by="updated_at")
+    finally:
+        await _dispose(session_factory)
+
+
 @pytest.mark.asyncio
 async def test_storage_rpc_bus_mode_b_happy_and_timeout(tmp_path: Path) -> None:
     session_factory = await _session_factory(tmp_path)
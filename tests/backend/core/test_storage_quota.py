@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from core.storage import LocalQuota, SharedQuota, StorageRateLimited
+from core.storage.models import PluginQuotaWindowRow
+from db.base import Base
+from db.session import build_async_engine
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+pytestmark = pytest.mark.asyncio
+
+
+class _Clock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _session_factory(tmp_path: Path) -> async_sessionmaker[AsyncSession]:
+    _ = PluginQuotaWindowRow
+    engine = build_async_engine(f"sqlite+aiosqlite:///{(tmp_path / 'quota.sqlite3').resolve()}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    return async_sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+
+
+async def _dispose(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    bind = session_factory.kw.get("bind")
+    if isinstance(bind, AsyncEngine):
+        await bind.dispose()
+
+
+async def _admitted(quota: SharedQuota, attempts: int, *, qps: float) -> int:
+    admitted = 0
+    for _ in range(attempts):
+        try:
+            await quota.acquire(plugin_id="autodiscover", op="kv.set", qps=qps)
+        except StorageRateLimited:
+            continue
+        admitted += 1
+    return admitted
+
+
+async def test_shared_quota_holds_across_workers(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    clock = _Clock(1_700_000_000.25)
+    workers = [
+        SharedQuota(session_factory=session_factory, lease_fraction=0.3, min_lease=1, clock=clock) for _ in range(3)
+    ]
+
+    try:
+        admitted = [await _admitted(worker, 6, qps=10.0) for worker in workers]
+        assert sum(admitted) == 10
+        async with session_factory() as session:
+            assert await session.scalar(select(PluginQuotaWindowRow.used)) == 10
+
+        clock.now += 1.0
+        assert await _admitted(workers[0], 4, qps=10.0) == 4
+    finally:
+        await _dispose(session_factory)
+
+
+async def test_shared_quota_leases_tokens_in_batches(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    clock = _Clock(1_700_000_000.0)
+    sessions: list[AsyncSession] = []
+
+    def _counting_factory() -> AsyncSession:
+        sessions.append(session_factory())
+        return sessions[-1]
+
+    quota = SharedQuota(session_factory=_counting_factory, lease_fraction=0.1, clock=clock)
+
+    try:
+        for _ in range(25):
+            await quota.acquire(plugin_id="autodiscover", op="kv.get", qps=100.0)
+        assert len(sessions) == 3
+        async with session_factory() as session:
+            assert await session.scalar(select(PluginQuotaWindowRow.used)) == 30
+    finally:
+        await _dispose(session_factory)
+
+
+async def test_sub_one_qps_uses_longer_windows(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    clock = _Clock(1_700_000_000.0)
+    quota = SharedQuota(session_factory=session_factory, clock=clock)
+
+    try:
+        assert await _admitted(quota, 3, qps=0.5) == 1
+        clock.now += 1.0
+        assert await _admitted(quota, 1, qps=0.5) == 0
+        clock.now += 1.0
+        assert await _admitted(quota, 1, qps=0.5) == 1
+    finally:
+        await _dispose(session_factory)
+
+
+async def test_local_quota_evicts_refilled_buckets() -> None:
+    clock = _Clock(0.0)
+    quota = LocalQuota(clock=clock)
+
+    for index in range(4096):
+        quota.consume(plugin_id=f"plugin-{index}", op="kv.get", qps=10.0)
+    with pytest.raises(StorageRateLimited):
+        for _ in range(10):
+            quota.consume(plugin_id="plugin-0", op="kv.get", qps=10.0)
+
+    clock.now = 5.0
+    quota.consume(plugin_id="late", op="kv.get", qps=10.0)
+    assert len(quota._buckets) == 1
+
+
+async def test_concurrent_claims_spend_the_whole_window(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    clock = _Clock(1_700_000_000.0)
+    workers = [SharedQuota(session_factory=session_factory, clock=clock) for _ in range(4)]
+
+    try:
+        admitted = await asyncio.gather(*(_admitted(worker, 4, qps=16.0) for worker in workers))
+        assert admitted == [4, 4, 4, 4]
+        assert await _admitted(workers[0], 1, qps=16.0) == 0
+        async with session_factory() as session:
+            assert await session.scalar(select(PluginQuotaWindowRow.used)) == 16
+    finally:
+        await _dispose(session_factory)
+
+
+async def test_low_qps_leases_keep_a_minimum_size(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    clock = _Clock(1_700_000_000.0)
+    sessions: list[AsyncSession] = []
+
+    def _counting_factory() -> AsyncSession:
+        sessions.append(session_factory())
+        return sessions[-1]
+
+    quota = SharedQuota(session_factory=_counting_factory, clock=clock)
+
+    try:
+        assert await _admitted(quota, 8, qps=8.0) == 8
+        assert len(sessions) == 2
+    finally:
+        await _dispose(session_factory)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+import pytest
+from core.contracts.storage import PluginStorageConfig, StorageLimits, StorageTableSpec
+from core.storage import StorageError, StorageModeRouter, StorageReadCache, UniversalStorage
+from core.storage.models import PluginIndexRow, PluginKvRow, PluginRow, PluginStorageVersionRow
+from db.base import Base
+from db.session import build_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+pytestmark = pytest.mark.asyncio
+
+PLUGIN_ID = "autodiscover"
+
+
+class _CountingStorage(UniversalStorage):
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.reads: Counter[str] = Counter()
+
+    async def kv_get(self, *, plugin_id: str, key: str, secret: bool = False) -> Any | None:
+        self.reads["kv_get"] += 1
+        return await super().kv_get(plugin_id=plugin_id, key=key, secret=secret)
+
+    async def table_query(
+        self,
+        *,
+        plugin_id: str,
+        table: str,
+        where: Mapping[str, Any],
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        self.reads["table_query"] += 1
+        await asyncio.sleep(0.01)
+        return await super().table_query(plugin_id=plugin_id, table=table, where=where, limit=limit)
+
+
+async def _session_factory(tmp_path: Path) -> async_sessionmaker[AsyncSession]:
+    _ = (PluginKvRow, PluginRow, PluginIndexRow, PluginStorageVersionRow)
+    engine = build_async_engine(f"sqlite+aiosqlite:///{(tmp_path / 'cache.sqlite3').resolve()}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    return async_sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+
+
+async def _dispose(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    bind = session_factory.kw.get("bind")
+    if isinstance(bind, AsyncEngine):
+        await bind.dispose()
+
+
+def _router(
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    revalidate_sec: float = 0.0,
+) -> tuple[StorageModeRouter, _CountingStorage]:
+    configs = {
+        PLUGIN_ID: PluginStorageConfig(
+            mode="core_universal",
+            limits=StorageLimits(max_qps=1000.0),
+            tables=[StorageTableSpec(name="services", primary_key="id", indexes=["host"])],
+        )
+    }
+    storage = _CountingStorage(session_factory=session_factory, plugin_configs=configs)
+    router = StorageModeRouter(
+        plugin_configs=configs,
+        universal_storage=storage,
+        physical_storage=storage,
+        read_cache=StorageReadCache(session_factory=session_factory, revalidate_sec=revalidate_sec),
+    )
+    return router, storage
+
+
+async def test_cached_reads_see_own_writes(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    router, storage = _router(session_factory, revalidate_sec=60.0)
+    try:
+        await router.kv_set(plugin_id=PLUGIN_ID, key="settings", value={"interval": 30})
+        first = await router.kv_get(plugin_id=PLUGIN_ID, key="settings")
+        first["interval"] = 0
+        assert await router.kv_get(plugin_id=PLUGIN_ID, key="settings") == {"interval": 30}
+        assert storage.reads["kv_get"] == 1
+
+        await router.kv_set(plugin_id=PLUGIN_ID, key="settings", value={"interval": 60})
+        assert await router.kv_get(plugin_id=PLUGIN_ID, key="settings") == {"interval": 60}
+        assert storage.reads["kv_get"] == 2
+
+        await router.kv_set(plugin_id=PLUGIN_ID, key="token", value="s3cr3t", secret=True)
+        for _ in range(2):
+            assert await router.kv_get(plugin_id=PLUGIN_ID, key="token", secret=True) == "s3cr3t"
+        assert storage.reads["kv_get"] == 4
+    finally:
+        await _dispose(session_factory)
+
+
+async def test_writes_in_another_process_invalidate_cached_reads(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    reader, reader_storage = _router(session_factory)
+    writer, _ = _router(session_factory)
+    try:
+        await writer.table_upsert(plugin_id=PLUGIN_ID, table="services", row={"id": "s1", "host": "nas"})
+        for _ in range(3):
+            assert await reader.table_get(plugin_id=PLUGIN_ID, table="services", pk="s1") == {
+                "id": "s1",
+                "host": "nas",
+            }
+        assert await reader.kv_get(plugin_id=PLUGIN_ID, key="last_scan_id") is None
+
+        await writer.table_upsert(plugin_id=PLUGIN_ID, table="services", row={"id": "s1", "host": "router"})
+        assert await reader.table_get(plugin_id=PLUGIN_ID, table="services", pk="s1") == {
+            "id": "s1",
+            "host": "router",
+        }
+        assert await reader.kv_get(plugin_id=PLUGIN_ID, key="last_scan_id") is None
+        assert reader_storage.reads["kv_get"] == 1
+    finally:
+        await _dispose(session_factory)
+
+
+async def test_identical_concurrent_queries_share_one_load(tmp_path: Path) -> None:
+    session_factory = await _session_factory(tmp_path)
+    router, storage = _router(session_factory)
+    try:
+        await router.table_upsert(plugin_id=PLUGIN_ID, table="services", row={"id": "s1", "host": "nas"})
+        results = await asyncio.gather(
+            *(
+                router.table_query(plugin_id=PLUGIN_ID, table="services", where={"host": "nas"}, limit=10)
+                for _ in range(10)
+            )
+        )
+        assert all(result == [{"id": "s1", "host": "nas"}] for result in results)
+        assert storage.reads["table_query"] == 1
+
+        await router.table_query(plugin_id=PLUGIN_ID, table="services", where={"host": "nas"}, limit=5)
+        assert storage.reads["table_query"] == 2
+    finally:
+        await _dispose(session_factory)
+
+
+async def test_failed_version_bump_keeps_the_write_and_is_retried(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    session_factory = await _session_factory(tmp_path)
+    reader, _ = _router(session_factory)
+    writer, writer_storage = _router(session_factory)
+    writer_cache = writer._read_cache
+    assert writer_cache is not None
+    bump = writer_cache._bump
+
+    async def _failing_bump(*, plugin_id: str, scope: str) -> int:
+        raise StorageError("version table unavailable")
+
+    try:
+        await writer.kv_set(plugin_id=PLUGIN_ID, key="settings", value={"interval": 30})
+        assert await writer.kv_get(plugin_id=PLUGIN_ID, key="settings") == {"interval": 30}
+        assert await reader.kv_get(plugin_id=PLUGIN_ID, key="settings") == {"interval": 30}
+
+        monkeypatch.setattr(writer_cache, "_bump", _failing_bump)
+        await writer.kv_set(plugin_id=PLUGIN_ID, key="settings", value={"interval": 60})
+        assert await writer.kv_get(plugin_id=PLUGIN_ID, key="settings") == {"interval": 60}
+        assert await writer.kv_get(plugin_id=PLUGIN_ID, key="settings") == {"interval": 60}
+        assert writer_storage.reads["kv_get"] == 3
+
+        monkeypatch.setattr(writer_cache, "_bump", bump)
+        assert await writer.kv_get(plugin_id=PLUGIN_ID, key="settings") == {"interval": 60}
+        assert await reader.kv_get(plugin_id=PLUGIN_ID, key="settings") == {"interval": 60}
+    finally:
+        await _dispose(session_factory)
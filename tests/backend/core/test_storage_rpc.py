@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
+from typing import Any
 
 import pytest
 from core.contracts.storage import PluginStorageConfig, StorageLimits, StorageRpcRequest, StorageTableSpec
@@ -8,6 +10,7 @@ from core.storage import (
     STORAGE_RPC_QUEUE,
     BusStorageRPC,
     InProcStorageRPC,
+    StorageRateLimited,
     StorageRpcBus,
     StorageRpcConsumer,
     StorageRpcTimeout,
@@ -124,3 +127,130 @@ async def test_bus_storage_rpc_request_response_and_timeout(tmp_path: Path) -> N
             await rpc_timeout.kv_get(plugin_id="autodiscover", key="missing")
     finally:
         await _dispose(session_factory)
+
+
+class _GatedStorage:
+    def __init__(self) -> None:
+        self.gate = asyncio.Event()
+        self.writes: list[tuple[str, Any]] = []
+
+    async def kv_get(self, *, plugin_id: str, key: str, secret: bool = False) -> Any | None:
+        return plugin_id
+
+    async def kv_set(self, *, plugin_id: str, key: str, value: Any, secret: bool = False) -> None:
+        await asyncio.sleep(0.01 if value == 0 else 0)
+        self.writes.append((key, value))
+
+    async def table_query(
+        self, *, plugin_id: str, table: str, where: dict[str, Any], limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        await self.gate.wait()
+        return []
+
+
+@pytest.mark.asyncio
+async def test_storage_rpc_consumer_isolates_slow_plugins_and_keeps_key_order() -> None:
+    bus = StorageRpcBus()
+    storage = _GatedStorage()
+    consumer = StorageRpcConsumer(
+        bus=bus,
+        storage=storage,
+        capabilities={"noisy": {"table.query"}, "quiet": {"kv.get", "kv.set"}},
+        concurrency=4,
+        max_inflight_per_plugin=2,
+    )
+    rpc = BusStorageRPC(bus=bus, timeout_sec=0.5)
+
+    await consumer.start()
+    try:
+        slow = [
+            asyncio.create_task(rpc.table_query(plugin_id="noisy", table=f"t{index}", where={"id": 1}))
+            for index in range(6)
+        ]
+        await asyncio.sleep(0)
+
+        assert await asyncio.wait_for(rpc.kv_get(plugin_id="quiet", key="k"), 0.2) == "quiet"
+        await asyncio.gather(*(rpc.kv_set(plugin_id="quiet", key="k", value=index) for index in range(3)))
+        assert storage.writes == [("k", 0), ("k", 1), ("k", 2)]
+
+        storage.gate.set()
+        assert await asyncio.gather(*slow) == [[]] * 6
+    finally:
+        storage.gate.set()
+        await consumer.stop()
+
+
+@pytest.mark.asyncio
+async def test_storage_rpc_rejects_requests_when_saturated() -> None:
+    bus = StorageRpcBus()
+    storage = _GatedStorage()
+    consumer = StorageRpcConsumer(
+        bus=bus,
+        storage=storage,
+        capabilities={"noisy": {"table.query"}},
+        concurrency=1,
+        max_pending=1,
+    )
+    rpc = BusStorageRPC(bus=bus, timeout_sec=0.5)
+
+    await consumer.start()
+    try:
+        blocked = asyncio.create_task(rpc.table_query(plugin_id="noisy", table="t", where={"id": 1}))
+        await asyncio.sleep(0.01)
+        with pytest.raises(StorageRateLimited):
+            await rpc.table_query(plugin_id="noisy", table="t", where={"id": 2})
+        storage.gate.set()
+        assert await blocked == []
+    finally:
+        storage.gate.set()
+        await consumer.stop()
+
+    full = bus.subscribe(queue_name="tests.full", queue_size=1)
+    await bus.publish(queue_name="tests.full", message="first")
+    with pytest.raises(StorageRateLimited):
+        await bus.publish(queue_name="tests.full", message="second")
+    assert full.get_nowait() == "first"
+
+
+class _RowStorage:
+    def __init__(self) -> None:
+        self.rows: dict[str, dict[str, Any]] = {}
+        self.ops: list[tuple[str, str]] = []
+
+    async def table_upsert(self, *, plugin_id: str, table: str, row: dict[str, Any]) -> dict[str, Any]:
+        await asyncio.sleep(0.02)
+        self.rows[str(row["scan_id"])] = dict(row)
+        self.ops.append(("upsert", str(row["scan_id"])))
+        return dict(row)
+
+    async def table_delete(self, *, plugin_id: str, table: str, pk: Any) -> bool:
+        self.ops.append(("delete", str(pk)))
+        return self.rows.pop(str(pk), None) is not None
+
+
+@pytest.mark.asyncio
+async def test_storage_rpc_consumer_orders_upsert_and_delete_of_the_same_row() -> None:
+    bus = StorageRpcBus()
+    storage = _RowStorage()
+    consumer = StorageRpcConsumer(
+        bus=bus,
+        storage=storage,
+        capabilities={"autodiscover": set(ALL_OPS)},
+        plugin_configs={"autodiscover": _storage_config()},
+    )
+    rpc = BusStorageRPC(bus=bus, timeout_sec=0.5)
+
+    await consumer.start()
+    try:
+        upsert = asyncio.create_task(
+            rpc.table_upsert(plugin_id="autodiscover", table="scan_runs", row={"scan_id": "scan-1", "status": "new"})
+        )
+        await asyncio.sleep(0)
+        assert await rpc.table_delete(plugin_id="autodiscover", table="scan_runs", pk="scan-1") is True
+        await upsert
+
+        assert storage.ops == [("upsert", "scan-1"), ("delete", "scan-1")]
+        assert storage.rows == {}
+        assert consumer._plugin_slots == {}
+    finally:
+        await consumer.stop()